@@ -1809,10 +1809,14 @@ export async function registerRoutes(
     requireCsrf,
     operatorRateLimiter,
     async (req, res) => {
-      const { runAtlasBridge } = await import("./routes/operator");
+      const { runOperation } = await import("./routes/operator");
       const sessionId = String(req.params.id);
       try {
-        const { stdout } = await runAtlasBridge(["sessions", "stop", sessionId, "--json"]);
+        const { stdout } = await runOperation(
+          "sessions.stop",
+          { session_id: sessionId },
+          ["sessions", "stop", sessionId, "--json"],
+        );
         const parsed = JSON.parse(stdout.trim() || "{}");
         insertOperatorAuditLog({
           method: "POST",
@@ -1849,10 +1853,14 @@ export async function registerRoutes(
     requireCsrf,
     operatorRateLimiter,
     async (req, res) => {
-      const { runAtlasBridge } = await import("./routes/operator");
+      const { runOperation } = await import("./routes/operator");
       const sessionId = String(req.params.id);
       try {
-        const { stdout } = await runAtlasBridge(["sessions", "pause", sessionId, "--json"]);
+        const { stdout } = await runOperation(
+          "sessions.pause",
+          { session_id: sessionId },
+          ["sessions", "pause", sessionId, "--json"],
+        );
         const parsed = JSON.parse(stdout.trim() || "{}");
         insertOperatorAuditLog({
           method: "POST",
@@ -1885,10 +1893,14 @@ export async function registerRoutes(
     requireCsrf,
     operatorRateLimiter,
     async (req, res) => {
-      const { runAtlasBridge } = await import("./routes/operator");
+      const { runOperation } = await import("./routes/operator");
       const sessionId = String(req.params.id);
       try {
-        const { stdout } = await runAtlasBridge(["sessions", "resume", sessionId, "--json"]);
+        const { stdout } = await runOperation(
+          "sessions.resume",
+          { session_id: sessionId },
+          ["sessions", "resume", sessionId, "--json"],
+        );
         const parsed = JSON.parse(stdout.trim() || "{}");
         insertOperatorAuditLog({
           method: "POST",
@@ -1931,7 +1943,7 @@ export async function registerRoutes(
     requireCsrf,
     operatorRateLimiter,
     async (req, res) => {
-      const { runAtlasBridge } = await import("./routes/operator");
+      const { runOperation } = await import("./routes/operator");
       const { session_id, prompt_id, value } = req.body as {
         session_id?: string;
         prompt_id?: string;
@@ -1942,13 +1954,11 @@ export async function registerRoutes(
         return;
       }
       try {
-        const { stdout } = await runAtlasBridge([
-          "sessions",
-          "reply",
-          session_id,
-          prompt_id,
-          value,
-        ]);
+        const { stdout } = await runOperation(
+          "sessions.reply",
+          { session_id, prompt_id, value },
+          ["sessions", "reply", session_id, prompt_id, value],
+        );
         const parsed = JSON.parse(stdout.trim() || "{}");
         if (parsed.ok === false) {
           res.status(422).json({ error: parsed.error || "Reply failed" });
@@ -1978,7 +1988,7 @@ export async function registerRoutes(
     requireCsrf,
     operatorRateLimiter,
     async (req, res) => {
-      const { runAtlasBridge } = await import("./routes/operator");
+      const { runOperation } = await import("./routes/operator");
       const sessionId = String(req.params.id);
       const { text } = req.body as { text?: string };
       if (!text?.trim()) {
@@ -1986,12 +1996,11 @@ export async function registerRoutes(
         return;
       }
       try {
-        const { stdout } = await runAtlasBridge([
-          "sessions",
-          "message",
-          sessionId,
-          text as string,
-        ]);
+        const { stdout } = await runOperation(
+          "sessions.message",
+          { session_id: sessionId, text },
+          ["sessions", "message", sessionId, text as string],
+        );
         const parsed = JSON.parse(stdout.trim() || "{}");
         if (parsed.ok === false) {
           res.status(422).json({ error: parsed.error || "Message failed" });
@@ -1,7 +1,9 @@
 import type { Express } from "express";
 import { execFile } from "child_process";
 import { existsSync } from "node:fs";
+import net from "node:net";
 import path from "node:path";
+import { getAtlasBridgeDir } from "../config";
 import { requireCsrf } from "../middleware/csrf";
 import { operatorRateLimiter } from "../middleware/rate-limit";
 import { insertOperatorAuditLog, queryOperatorAuditLog } from "../db";
@@ -45,6 +47,76 @@ export function runAtlasBridge(args: string[]): Promise<{ stdout: string; stderr
   });
 }
 
+// ---------------------------------------------------------------------------
+// Daemon control socket — one JSON request/response per line
+// ---------------------------------------------------------------------------
+
+const CONTROL_SOCKET = "atlasbridge.ctl";
+
+export class DaemonUnavailableError extends Error {}
+
+// Exported for unit testing.
+export function callDaemon(
+  method: string,
+  params: Record<string, unknown> = {},
+  timeoutMs = 10_000,
+): Promise<any> {
+  const socketPath = path.join(getAtlasBridgeDir(), CONTROL_SOCKET);
+  return new Promise((resolve, reject) => {
+    let connected = false;
+    let buffer = "";
+    const sock = net.createConnection(socketPath);
+    const timer = setTimeout(() => {
+      sock.destroy();
+      reject(new Error(`Control request ${method} timed out`));
+    }, timeoutMs);
+    sock.on("connect", () => {
+      connected = true;
+      sock.write(JSON.stringify({ method, params }) + "\n");
+    });
+    sock.on("data", (data) => {
+      buffer += data.toString("utf8");
+      const newline = buffer.indexOf("\n");
+      if (newline < 0) return;
+      clearTimeout(timer);
+      sock.end();
+      let response: { ok?: boolean; result?: unknown; error?: string };
+      try {
+        response = JSON.parse(buffer.slice(0, newline));
+      } catch {
+        reject(new Error(`Malformed response to ${method}`));
+        return;
+      }
+      if (response.ok) resolve(response.result);
+      else reject(new Error(response.error || `Control request ${method} failed`));
+    });
+    sock.on("error", (err) => {
+      clearTimeout(timer);
+      reject(connected ? err : new DaemonUnavailableError(err.message));
+    });
+  });
+}
+
+// Run an operator action on the running daemon's control socket, falling back
+// to spawning the CLI when no daemon is listening. `result` is set when the
+// daemon handled it; `stdout` is then `format(result)` (JSON by default) so
+// callers that parse CLI output work unchanged.
+export async function runOperation(
+  method: string,
+  params: Record<string, unknown>,
+  cliArgs: string[],
+  format: (result: any) => string = (result) => JSON.stringify(result),
+): Promise<{ stdout: string; stderr: string; result?: any }> {
+  let result: any;
+  try {
+    result = await callDaemon(method, params);
+  } catch (err: any) {
+    if (err instanceof DaemonUnavailableError) return runAtlasBridge(cliArgs);
+    throw Object.assign(err, { stdout: "", stderr: err.message });
+  }
+  return { stdout: format(result), stderr: "", result };
+}
+
 export function registerOperatorRoutes(app: Express): void {
   // ---------------------------------------------------------------------------
   // Kill switch — disables autopilot immediately
@@ -56,7 +128,12 @@ export function registerOperatorRoutes(app: Express): void {
     async (req, res) => {
       const body = req.body as Record<string, unknown>;
       try {
-        const { stdout } = await runAtlasBridge(["autopilot", "disable"]);
+        const { stdout } = await runOperation(
+          "autopilot.disable",
+          {},
+          ["autopilot", "disable"],
+          (result) => result.message,
+        );
         insertOperatorAuditLog({
           method: "POST",
           path: "/api/operator/kill-switch",
@@ -99,7 +176,12 @@ export function registerOperatorRoutes(app: Express): void {
       }
 
       try {
-        const { stdout } = await runAtlasBridge(["autopilot", "mode", mode]);
+        const { stdout } = await runOperation(
+          "autopilot.mode",
+          { mode },
+          ["autopilot", "mode", mode],
+          (result) => result.message,
+        );
         insertOperatorAuditLog({
           method: "POST",
           path: "/api/operator/mode",
@@ -6,12 +6,25 @@ import { requireCsrf } from "../middleware/csrf";
 import { operatorRateLimiter } from "../middleware/rate-limit";
 import { insertOperatorAuditLog } from "../db";
 import { getAtlasBridgeDir, ensureDir } from "../config";
-import { runAtlasBridge } from "./operator";
+import { runOperation } from "./operator";
 
 // ---------------------------------------------------------------------------
 // Helpers
 // ---------------------------------------------------------------------------
 
+// Validate a policy file via the daemon (or the CLI when none is running).
+// Rejects with `stderr` set to the validation error.
+async function validatePolicyFile(policyPath: string): Promise<void> {
+  const { result } = await runOperation("policy.validate", { path: policyPath }, [
+    "policy",
+    "validate",
+    policyPath,
+  ]);
+  if (result && !result.valid) {
+    throw Object.assign(new Error("Policy validation failed"), { stderr: result.error });
+  }
+}
+
 function getPolicyPath(): string {
   return path.join(getAtlasBridgeDir(), "policy.yaml");
 }
@@ -193,7 +206,7 @@ export function registerPolicyRoutes(app: Express): void {
       try {
         // Validate via CLI
         try {
-          await runAtlasBridge(["policy", "validate", presetPath]);
+          await validatePolicyFile(presetPath);
         } catch (err: any) {
           res.status(422).json({
             error: "Policy validation failed",
@@ -263,7 +276,7 @@ export function registerPolicyRoutes(app: Express): void {
         fs.writeFileSync(tmpPath, yamlContent);
 
         try {
-          await runAtlasBridge(["policy", "validate", tmpPath]);
+          await validatePolicyFile(tmpPath);
         } catch (err: any) {
           fs.unlinkSync(tmpPath);
           res.status(422).json({
@@ -430,12 +443,12 @@ export function registerPolicyRoutes(app: Express): void {
       }
 
       try {
-        const { stdout } = await runAtlasBridge([
-          "policy", "test", policyPath,
-          "--prompt", prompt,
-          "--type", promptType,
-          "--confidence", confidence,
-        ]);
+        const { stdout } = await runOperation(
+          "policy.test",
+          { path: policyPath, prompt, prompt_type: promptType, confidence },
+          ["policy", "test", policyPath, "--prompt", prompt, "--type", promptType, "--confidence", confidence],
+          (result) => result.output,
+        );
 
         // Parse the CLI output for key fields
         const lines = stdout.trim().split("\n");
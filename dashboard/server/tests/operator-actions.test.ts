@@ -1,5 +1,9 @@
-import { describe, it, expect, vi, beforeEach } from "vitest";
+import { describe, it, expect, vi, beforeEach, afterEach } from "vitest";
 import { execFile } from "child_process";
+import fs from "node:fs";
+import net from "node:net";
+import os from "node:os";
+import path from "node:path";
 
 // ---------------------------------------------------------------------------
 // Mocks
@@ -63,6 +67,80 @@ describe("runAtlasBridge", () => {
   });
 });
 
+// ---------------------------------------------------------------------------
+// runOperation — daemon control socket with CLI fallback
+// ---------------------------------------------------------------------------
+
+describe("runOperation", () => {
+  let dir: string;
+  let server: net.Server | undefined;
+
+  beforeEach(() => {
+    dir = fs.mkdtempSync(path.join(os.tmpdir(), "ab-ctl-"));
+    process.env.ATLASBRIDGE_CONFIG = dir;
+  });
+
+  afterEach(async () => {
+    if (server) await new Promise((resolve) => server!.close(resolve));
+    server = undefined;
+    delete process.env.ATLASBRIDGE_CONFIG;
+    fs.rmSync(dir, { recursive: true, force: true });
+  });
+
+  function serveDaemon(reply: (request: any) => object): Promise<void> {
+    server = net.createServer((conn) => {
+      conn.on("data", (data) => {
+        conn.write(JSON.stringify(reply(JSON.parse(data.toString("utf8")))) + "\n");
+      });
+    });
+    return new Promise((resolve) => server!.listen(path.join(dir, "atlasbridge.ctl"), resolve));
+  }
+
+  it("sends the action to a listening daemon instead of spawning the CLI", async () => {
+    const requests: unknown[] = [];
+    await serveDaemon((request) => {
+      requests.push(request);
+      return { ok: true, result: { state: "paused", message: "Autopilot paused" } };
+    });
+    const { execFile: mocked } = await import("child_process");
+    vi.mocked(mocked).mockClear();
+    const { runOperation } = await import("../routes/operator");
+    const out = await runOperation(
+      "autopilot.disable",
+      {},
+      ["autopilot", "disable"],
+      (result) => result.message,
+    );
+    expect(out.stdout).toBe("Autopilot paused");
+    expect(out.result).toEqual({ state: "paused", message: "Autopilot paused" });
+    expect(requests).toEqual([{ method: "autopilot.disable", params: {} }]);
+    expect(vi.mocked(mocked)).not.toHaveBeenCalled();
+  });
+
+  it("rejects with the daemon's error in stderr", async () => {
+    await serveDaemon(() => ({ ok: false, error: "Session not found: abc" }));
+    const { runOperation } = await import("../routes/operator");
+    await expect(
+      runOperation("sessions.stop", { session_id: "abc" }, ["sessions", "stop", "abc", "--json"]),
+    ).rejects.toMatchObject({ stderr: "Session not found: abc" });
+  });
+
+  it("falls back to the CLI when no daemon is listening", async () => {
+    const { execFile: mocked } = await import("child_process");
+    vi.mocked(mocked).mockImplementation((_bin, _args, _opts, cb: any) => cb(null, "from cli\n", ""));
+    const { runOperation } = await import("../routes/operator");
+    const out = await runOperation("autopilot.disable", {}, ["autopilot", "disable"]);
+    expect(out.stdout).toBe("from cli\n");
+    expect(out.result).toBeUndefined();
+    expect(vi.mocked(mocked)).toHaveBeenCalledWith(
+      expect.any(String),
+      ["autopilot", "disable"],
+      expect.any(Object),
+      expect.any(Function),
+    );
+  });
+});
+
 // ---------------------------------------------------------------------------
 // requireCsrf middleware
 // ---------------------------------------------------------------------------
@@ -46,6 +46,11 @@ _NORMALISE: dict[str, dict[str, bytes]] = {
     # multiple_choice and free_text are handled dynamically
 }
 
+# Signal 3 threshold once the TTY probe has confirmed the child blocked on a
+# terminal read: silence then only fires while the child is actually waiting
+# for input, so it can be short.
+_PROBED_SILENCE_THRESHOLD_S = 1.5
+
 
 @AdapterRegistry.register("claude")
 @AdapterRegistry.register("claude-code")
@@ -107,16 +112,14 @@ class ClaudeCodeAdapter(BaseAdapter):
         tty = self._supervisors.get(session_id)
         if tty is None:
             return b""
-        # Read one chunk from the PTY
-        async for chunk in tty.read_output():
-            buf = self._output_buffers.get(session_id)
-            if buf is not None:
-                # Keep rolling buffer bounded at max_buffer_bytes
-                buf.extend(chunk)
-                if len(buf) > tty.config.max_buffer_bytes:
-                    del buf[: len(buf) - tty.config.max_buffer_bytes]
-            return chunk
-        return b""
+        chunk: bytes = await tty.read_chunk()
+        buf = self._output_buffers.get(session_id)
+        if chunk and buf is not None:
+            # Keep rolling buffer bounded at max_buffer_bytes
+            buf.extend(chunk)
+            if len(buf) > tty.config.max_buffer_bytes:
+                del buf[: len(buf) - tty.config.max_buffer_bytes]
+        return chunk
 
     async def inject_reply(self, session_id: str, value: str, prompt_type: str) -> None:
         tty = self._supervisors.get(session_id)
@@ -132,16 +135,24 @@ class ClaudeCodeAdapter(BaseAdapter):
 
     async def await_input_state(self, session_id: str) -> bool:
         """
-        Approximate TTY-blocked-on-read by checking if no output has arrived
-        for read_timeout_s seconds while the process is alive.
+        Return True if the CLI is blocked reading from its terminal.
 
-        A proper implementation would use select()/poll() on the PTY master fd.
-        This approximation is sufficient for Signal 2 detection in v0.2.0.
+        Uses the TTY's OS-level probe (Linux: /proc); where the platform
+        cannot tell, any live process is reported as possibly blocked.
         """
         tty = self._supervisors.get(session_id)
         if tty is None:
             return False
-        return tty.is_alive()
+        blocked = tty.input_blocked()
+        if blocked is None:
+            return bool(tty.is_alive())
+        if blocked:
+            # The probe saw the terminal in the child's wait set, so it can
+            # be trusted to tell input waits apart from other silences.
+            detector = self._detectors.get(session_id)
+            if detector is not None:
+                detector.silence_threshold_s = _PROBED_SILENCE_THRESHOLD_S
+        return bool(blocked)
 
     def snapshot_context(self, session_id: str) -> dict[str, Any]:
         tty = self._supervisors.get(session_id)
@@ -18,96 +18,97 @@ Registration key: "gemini" (``atlasbridge run gemini``)
 from __future__ import annotations
 
 import re
-from re import Pattern
 
 from atlasbridge.adapters.base import AdapterRegistry
 from atlasbridge.adapters.claude_code import ClaudeCodeAdapter
-from atlasbridge.core.prompt.detector import PromptDetector
-from atlasbridge.core.prompt.models import Confidence, PromptEvent, PromptType
+from atlasbridge.core.prompt.detector import GENERIC_SCANNER, PromptDetector
+from atlasbridge.core.prompt.models import Confidence, PromptType
+from atlasbridge.core.prompt.scanner import PatternTier, ScanRule
 
 # ---------------------------------------------------------------------------
 # Gemini CLI-specific patterns (supplement generic detector patterns)
 # ---------------------------------------------------------------------------
 
-_GEMINI_YES_NO: list[Pattern[str]] = [
-    re.compile(r"Do you want to (?:continue|proceed|apply)\? \(y/n\)", re.IGNORECASE),
-    re.compile(
-        r"Allow Gemini to (?:execute|run|apply) this\? \[(?:Yes|Y)/(?:No|N)\]", re.IGNORECASE
+_GEMINI_YES_NO: tuple[ScanRule, ...] = (
+    ScanRule(
+        re.compile(r"Do you want to (?:continue|proceed|apply)\? \(y/n\)", re.IGNORECASE),
+        (("do you want to ",), ("(y/n)",)),
     ),
-    re.compile(r"(?:Confirm|Approve) (?:action|change|operation)\? \[y/n\]", re.IGNORECASE),
-    re.compile(r"(?:Execute|Apply) this (?:code|change|command)\? \(yes/no\)", re.IGNORECASE),
-    re.compile(r"Save (?:this|the) (?:file|output)\? \[y/n\]", re.IGNORECASE),
-]
-
-_GEMINI_MULTIPLE_CHOICE: list[Pattern[str]] = [
-    re.compile(r"Select an? option:\s*\n\s*1[\)\.]\s+\S", re.IGNORECASE | re.DOTALL),
-    re.compile(r"Choose a model:\s*\n\s*\[1\]", re.IGNORECASE | re.DOTALL),
-    re.compile(
-        r"(?:^|\n)\s*\d+[\)\.]\s+(?:Generate|Explain|Refactor|Debug|Test)\b",
-        re.IGNORECASE | re.MULTILINE,
+    ScanRule(
+        re.compile(
+            r"Allow Gemini to (?:execute|run|apply) this\? \[(?:Yes|Y)/(?:No|N)\]", re.IGNORECASE
+        ),
+        (("allow gemini to ",),),
     ),
-    re.compile(r"gemini-\d+\.\d+-(?:pro|flash)\s*\n", re.IGNORECASE),
-]
+    ScanRule(
+        re.compile(r"(?:Confirm|Approve) (?:action|change|operation)\? \[y/n\]", re.IGNORECASE),
+        (("confirm", "approve"), ("[y/n]",)),
+    ),
+    ScanRule(
+        re.compile(r"(?:Execute|Apply) this (?:code|change|command)\? \(yes/no\)", re.IGNORECASE),
+        ((" this ",), ("(yes/no)",)),
+    ),
+    ScanRule(
+        re.compile(r"Save (?:this|the) (?:file|output)\? \[y/n\]", re.IGNORECASE),
+        (("save ",), ("[y/n]",)),
+    ),
+)
 
-_GEMINI_FREE_TEXT: list[Pattern[str]] = [
-    re.compile(
-        r"(?:Enter|Describe|Provide)\s+(?:(?:your|the|a|an)\s+)?(?:prompt|task|input|query)\s*:",
-        re.IGNORECASE,
+_GEMINI_MULTIPLE_CHOICE: tuple[ScanRule, ...] = (
+    ScanRule(
+        re.compile(r"Select an? option:\s*\n\s*1[\)\.]\s+\S", re.IGNORECASE | re.DOTALL),
+        (("select a",), ("option:",)),
+    ),
+    ScanRule(
+        re.compile(r"Choose a model:\s*\n\s*\[1\]", re.IGNORECASE | re.DOTALL),
+        (("choose a model:",),),
+    ),
+    ScanRule(
+        re.compile(
+            r"(?:^|\n)\s*\d+[\)\.]\s+(?:Generate|Explain|Refactor|Debug|Test)\b",
+            re.IGNORECASE | re.MULTILINE,
+        ),
+        (("generate", "explain", "refactor", "debug", "test"),),
+    ),
+    ScanRule(re.compile(r"gemini-\d+\.\d+-(?:pro|flash)\s*\n", re.IGNORECASE), (("gemini-",),)),
+)
+
+_GEMINI_FREE_TEXT: tuple[ScanRule, ...] = (
+    ScanRule(
+        re.compile(
+            r"(?:Enter|Describe|Provide)\s+(?:(?:your|the|a|an)\s+)?(?:prompt|task|input|query)\s*:",
+            re.IGNORECASE,
+        ),
+        (("prompt", "task", "input", "query"), ("enter", "describe", "provide")),
     ),
-    re.compile(
-        r"What (?:would you like|do you want) (?:Gemini|me) to (?:do|generate|write)\?",
-        re.IGNORECASE,
+    ScanRule(
+        re.compile(
+            r"What (?:would you like|do you want) (?:Gemini|me) to (?:do|generate|write)\?",
+            re.IGNORECASE,
+        ),
+        (("what would you like", "what do you want"),),
     ),
-    re.compile(r"Gemini>\s*$", re.MULTILINE),  # interactive REPL prompt
-]
+    ScanRule(re.compile(r"Gemini>\s*$", re.MULTILINE), (("gemini>",),)),  # interactive REPL prompt
+)
 
 
 class GeminiPromptDetector(PromptDetector):
     """
     PromptDetector extended with Gemini CLI-specific patterns.
 
-    Runs generic patterns first; falls back to Gemini-specific ones if no
-    generic match is found.
+    Generic patterns keep priority; Gemini-specific ones only win when no
+    generic pattern matches. Both run in the same compiled scanner.
     """
 
-    def _pattern_match(self, text: str) -> PromptEvent | None:
-        # Generic patterns first
-        event = super()._pattern_match(text)
-        if event:
-            return event
-
-        # Gemini-specific yes/no
-        for pat in _GEMINI_YES_NO:
-            if pat.search(text):
-                return PromptEvent.create(
-                    session_id=self.session_id,
-                    prompt_type=PromptType.TYPE_YES_NO,
-                    confidence=Confidence.HIGH,
-                    excerpt=text[-200:],
-                    choices=["y", "n"],
-                )
-
-        # Gemini-specific multiple choice
-        for pat in _GEMINI_MULTIPLE_CHOICE:
-            if pat.search(text):
-                return PromptEvent.create(
-                    session_id=self.session_id,
-                    prompt_type=PromptType.TYPE_MULTIPLE_CHOICE,
-                    confidence=Confidence.HIGH,
-                    excerpt=text[-200:],
-                )
-
-        # Gemini-specific free text
-        for pat in _GEMINI_FREE_TEXT:
-            if pat.search(text):
-                return PromptEvent.create(
-                    session_id=self.session_id,
-                    prompt_type=PromptType.TYPE_FREE_TEXT,
-                    confidence=Confidence.MED,
-                    excerpt=text[-200:],
-                )
-
-        return None
+    scanner = GENERIC_SCANNER.extend(
+        [
+            PatternTier(
+                PromptType.TYPE_YES_NO, Confidence.HIGH, _GEMINI_YES_NO, choices=("y", "n")
+            ),
+            PatternTier(PromptType.TYPE_MULTIPLE_CHOICE, Confidence.HIGH, _GEMINI_MULTIPLE_CHOICE),
+            PatternTier(PromptType.TYPE_FREE_TEXT, Confidence.MED, _GEMINI_FREE_TEXT),
+        ]
+    )
 
 
 @AdapterRegistry.register("gemini")
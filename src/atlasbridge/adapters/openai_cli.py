@@ -18,90 +18,88 @@ Registration key: "openai" (``atlasbridge run openai``)
 from __future__ import annotations
 
 import re
-from re import Pattern
 
 from atlasbridge.adapters.base import AdapterRegistry
 from atlasbridge.adapters.claude_code import ClaudeCodeAdapter
-from atlasbridge.core.prompt.detector import PromptDetector
-from atlasbridge.core.prompt.models import Confidence, PromptEvent, PromptType
+from atlasbridge.core.prompt.detector import GENERIC_SCANNER, PromptDetector
+from atlasbridge.core.prompt.models import Confidence, PromptType
+from atlasbridge.core.prompt.scanner import PatternTier, ScanRule
 
 # ---------------------------------------------------------------------------
 # Codex CLI-specific patterns (supplement generic detector patterns)
 # ---------------------------------------------------------------------------
 
-_CODEX_YES_NO: list[Pattern[str]] = [
-    re.compile(r"Apply (?:these )?changes\? \[y/n\]", re.IGNORECASE),
-    re.compile(r"Run (?:this )?command\? \[y/n\]", re.IGNORECASE),
-    re.compile(r"Approve this action\? \(yes/no\)", re.IGNORECASE),
-    re.compile(
-        r"(?:Proceed|Continue|Confirm) with (?:this|the) (?:change|action|operation)\?",
-        re.IGNORECASE,
+_CODEX_YES_NO: tuple[ScanRule, ...] = (
+    ScanRule(
+        re.compile(r"Apply (?:these )?changes\? \[y/n\]", re.IGNORECASE),
+        (("apply",), ("[y/n]",)),
     ),
-    re.compile(r"Allow Codex to .+\? \[y/n\]", re.IGNORECASE),
-]
-
-_CODEX_MULTIPLE_CHOICE: list[Pattern[str]] = [
-    re.compile(r"Select action:\s*\n\s*1\.", re.IGNORECASE | re.DOTALL),
-    re.compile(r"Choose model:\s*\[1\]", re.IGNORECASE),
-    re.compile(
-        r"(?:^|\n)\s*\d+\.\s+(?:Apply|Skip|Abort|Cancel|Retry)\b", re.IGNORECASE | re.MULTILINE
+    ScanRule(
+        re.compile(r"Run (?:this )?command\? \[y/n\]", re.IGNORECASE),
+        (("command?",), ("[y/n]",)),
     ),
-]
+    ScanRule(
+        re.compile(r"Approve this action\? \(yes/no\)", re.IGNORECASE),
+        (("approve this action?",),),
+    ),
+    ScanRule(
+        re.compile(
+            r"(?:Proceed|Continue|Confirm) with (?:this|the) (?:change|action|operation)\?",
+            re.IGNORECASE,
+        ),
+        (("proceed", "continue", "confirm"), (" with ",)),
+    ),
+    ScanRule(
+        re.compile(r"Allow Codex to .+\? \[y/n\]", re.IGNORECASE),
+        (("allow codex to ",), ("[y/n]",)),
+    ),
+)
 
-_CODEX_FREE_TEXT: list[Pattern[str]] = [
-    re.compile(
-        r"(?:Enter|Provide|Type)\s+(?:a\s+)?(?:description|context|message|name)\s*:", re.IGNORECASE
+_CODEX_MULTIPLE_CHOICE: tuple[ScanRule, ...] = (
+    ScanRule(
+        re.compile(r"Select action:\s*\n\s*1\.", re.IGNORECASE | re.DOTALL),
+        (("select action:",),),
+    ),
+    ScanRule(re.compile(r"Choose model:\s*\[1\]", re.IGNORECASE), (("choose model:",),)),
+    ScanRule(
+        re.compile(
+            r"(?:^|\n)\s*\d+\.\s+(?:Apply|Skip|Abort|Cancel|Retry)\b",
+            re.IGNORECASE | re.MULTILINE,
+        ),
+        (("apply", "skip", "abort", "cancel", "retry"),),
+    ),
+)
+
+_CODEX_FREE_TEXT: tuple[ScanRule, ...] = (
+    ScanRule(
+        re.compile(
+            r"(?:Enter|Provide|Type)\s+(?:a\s+)?(?:description|context|message|name)\s*:",
+            re.IGNORECASE,
+        ),
+        (("description", "context", "message", "name"), ("enter", "provide", "type")),
+    ),
+    ScanRule(
+        re.compile(r"What (?:do you want|should Codex) (?:to do|change)\?", re.IGNORECASE),
+        (("what do you want", "what should codex"),),
     ),
-    re.compile(r"What (?:do you want|should Codex) (?:to do|change)\?", re.IGNORECASE),
-]
+)
 
 
 class OpenAIPromptDetector(PromptDetector):
     """
     PromptDetector extended with Codex CLI-specific patterns.
 
-    Runs generic patterns first; falls back to Codex-specific ones if no
-    generic match is found.
+    Generic patterns keep priority; Codex-specific ones only win when no
+    generic pattern matches. Both run in the same compiled scanner.
     """
 
-    def _pattern_match(self, text: str) -> PromptEvent | None:
-        # Generic patterns first
-        event = super()._pattern_match(text)
-        if event:
-            return event
-
-        # Codex-specific yes/no
-        for pat in _CODEX_YES_NO:
-            if pat.search(text):
-                return PromptEvent.create(
-                    session_id=self.session_id,
-                    prompt_type=PromptType.TYPE_YES_NO,
-                    confidence=Confidence.HIGH,
-                    excerpt=text[-200:],
-                    choices=["y", "n"],
-                )
-
-        # Codex-specific multiple choice
-        for pat in _CODEX_MULTIPLE_CHOICE:
-            if pat.search(text):
-                return PromptEvent.create(
-                    session_id=self.session_id,
-                    prompt_type=PromptType.TYPE_MULTIPLE_CHOICE,
-                    confidence=Confidence.HIGH,
-                    excerpt=text[-200:],
-                )
-
-        # Codex-specific free text
-        for pat in _CODEX_FREE_TEXT:
-            if pat.search(text):
-                return PromptEvent.create(
-                    session_id=self.session_id,
-                    prompt_type=PromptType.TYPE_FREE_TEXT,
-                    confidence=Confidence.MED,
-                    excerpt=text[-200:],
-                )
-
-        return None
+    scanner = GENERIC_SCANNER.extend(
+        [
+            PatternTier(PromptType.TYPE_YES_NO, Confidence.HIGH, _CODEX_YES_NO, choices=("y", "n")),
+            PatternTier(PromptType.TYPE_MULTIPLE_CHOICE, Confidence.HIGH, _CODEX_MULTIPLE_CHOICE),
+            PatternTier(PromptType.TYPE_FREE_TEXT, Confidence.MED, _CODEX_FREE_TEXT),
+        ]
+    )
 
 
 @AdapterRegistry.register("openai")
@@ -6,11 +6,8 @@ Verifies hash chain integrity and exports events from the SQLite audit log.
 
 from __future__ import annotations
 
-import csv
-import io
-import json
 import sys
-from typing import Any
+from pathlib import Path
 
 import click
 
@@ -34,14 +31,22 @@ def audit_group() -> None:
     default=False,
     help="Output result as JSON.",
 )
-def audit_verify(session_id: str, as_json: bool) -> None:
+@click.option(
+    "--full",
+    is_flag=True,
+    default=False,
+    help="Re-hash the whole chain instead of resuming from the last verified event.",
+)
+def audit_verify(session_id: str, as_json: bool, full: bool) -> None:
     """Verify hash chain integrity of the audit event log.
 
     Reads the SQLite audit_events table and checks that each event's
     hash matches recomputation and that prev_hash links form an
     unbroken chain.  Exits 0 if valid, 1 if the chain is broken.
 
-    Use --session to scope verification to a single session.
+    A successful run records a checkpoint next to the database, and later
+    runs re-hash only events appended since.  Use --full to re-hash
+    everything.  Use --session to scope verification to a single session.
     """
     from atlasbridge.core.config import load_config
     from atlasbridge.core.exceptions import ConfigError, ConfigNotFoundError
@@ -62,12 +67,24 @@ def audit_verify(session_id: str, as_json: bool) -> None:
     db = Database(db_path)
     db.connect()
     try:
+        from atlasbridge.core.audit.checkpoint import checkpoint_path
         from atlasbridge.core.audit.verify import (
             format_verify_result,
             verify_audit_chain,
         )
 
-        result = verify_audit_chain(db, session_id=session_id or None)
+        def _progress(verified: int, total: int) -> None:
+            click.echo(f"\rVerified {verified}/{total} events", nl=False, err=True)
+
+        result = verify_audit_chain(
+            db,
+            session_id=session_id or None,
+            checkpoint_file=checkpoint_path(db_path),
+            full=full,
+            progress=_progress if full and not as_json else None,
+        )
+        if full and not as_json:
+            click.echo(err=True)
 
         if as_json:
             import json
@@ -78,6 +95,7 @@ def audit_verify(session_id: str, as_json: bool) -> None:
                         "valid": result.valid,
                         "total_events": result.total_events,
                         "verified_events": result.verified_events,
+                        "resumed_events": result.resumed_events,
                         "errors": result.errors,
                         "first_break_event_id": result.first_break_event_id,
                         "first_break_position": result.first_break_position,
@@ -93,23 +111,6 @@ def audit_verify(session_id: str, as_json: bool) -> None:
         db.close()
 
 
-def _row_to_dict(row: Any) -> dict:
-    """Convert a sqlite3.Row to a plain dict."""
-    return {k: row[k] for k in row.keys()}
-
-
-_EXPORT_COLUMNS = [
-    "id",
-    "event_type",
-    "session_id",
-    "prompt_id",
-    "payload",
-    "timestamp",
-    "prev_hash",
-    "hash",
-]
-
-
 @audit_group.command("export")
 @click.option(
     "--format",
@@ -122,10 +123,35 @@ _EXPORT_COLUMNS = [
 @click.option("--session", "session_id", default="", help="Filter by session ID.")
 @click.option("--since", default="", help="Include events from this ISO timestamp.")
 @click.option("--until", default="", help="Include events up to this ISO timestamp.")
-def audit_export(fmt: str, session_id: str, since: str, until: str) -> None:
+@click.option(
+    "--output",
+    "-o",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help="Write to this file instead of stdout (records progress for --resume).",
+)
+@click.option("--gzip", "use_gzip", is_flag=True, default=False, help="Gzip-compress the output.")
+@click.option(
+    "--resume",
+    is_flag=True,
+    default=False,
+    help="Continue an interrupted --output export (jsonl/csv, same options).",
+)
+def audit_export(
+    fmt: str,
+    session_id: str,
+    since: str,
+    until: str,
+    output: Path | None,
+    use_gzip: bool,
+    resume: bool,
+) -> None:
     """Export audit events for SIEM ingestion.
 
-    Writes events to stdout. Default format is JSONL (one JSON object per line).
+    Writes events to stdout, or to --output. Default format is JSONL (one
+    JSON object per line). Events are streamed in batches, so exports of
+    any size run in constant memory. An interrupted --output export can be
+    continued with --resume.
     """
     from atlasbridge.core.config import load_config
     from atlasbridge.core.exceptions import ConfigError, ConfigNotFoundError
@@ -137,32 +163,40 @@ def audit_export(fmt: str, session_id: str, since: str, until: str) -> None:
         click.echo(f"Cannot load config: {exc}", err=True)
         sys.exit(1)
 
+    if resume and output is None:
+        click.echo("--resume requires --output.", err=True)
+        sys.exit(1)
+
     if not db_path.exists():
         click.echo("No database found — nothing to export.", err=True)
         sys.exit(0)
 
+    from atlasbridge.core.audit.export import (
+        ExportOptions,
+        ExportResumeError,
+        export_audit_to_file,
+        stream_audit_export,
+    )
     from atlasbridge.core.store.database import Database
 
+    options = ExportOptions(fmt=fmt, gzip=use_gzip, session_id=session_id, since=since, until=until)
     db = Database(db_path)
     db.connect()
     try:
-        rows = db.get_audit_events_filtered(
-            session_id=session_id or None,
-            since=since or None,
-            until=until or None,
-        )
-
-        if fmt == "jsonl":
-            for row in rows:
-                click.echo(json.dumps(_row_to_dict(row), separators=(",", ":")))
-        elif fmt == "json":
-            click.echo(json.dumps([_row_to_dict(r) for r in rows], indent=2))
-        elif fmt == "csv":
-            buf = io.StringIO()
-            writer = csv.DictWriter(buf, fieldnames=_EXPORT_COLUMNS)
-            writer.writeheader()
-            for row in rows:
-                writer.writerow(_row_to_dict(row))
-            click.echo(buf.getvalue(), nl=False)
+        if output is None:
+            stream_audit_export(db, sys.stdout.buffer, options)
+            return
+
+        def _progress(exported: int, total: int) -> None:
+            click.echo(f"\rExported {exported}/{total} events", nl=False, err=True)
+
+        try:
+            result = export_audit_to_file(db, output, options, resume=resume, progress=_progress)
+        except ExportResumeError as exc:
+            click.echo(str(exc), err=True)
+            sys.exit(1)
+        click.echo(err=True)
+        resumed = " (resumed)" if result.resumed else ""
+        click.echo(f"Exported {result.count} events to {output}{resumed}", err=True)
     finally:
         db.close()
@@ -13,20 +13,24 @@ from __future__ import annotations
 
 import json
 import sys
+from collections.abc import Callable
 from pathlib import Path
+from typing import Any
 
 import click
 
-from atlasbridge.core.autopilot.engine import HISTORY_FILENAME, STATE_FILENAME, AutopilotState
-from atlasbridge.core.autopilot.trace import TRACE_FILENAME, DecisionTrace
-from atlasbridge.core.policy.parser import PolicyParseError, default_policy, load_policy
-
-
-def _state_path(data_dir: Path) -> Path:
-    return data_dir / STATE_FILENAME
+from atlasbridge.core.autopilot.state import HISTORY_FILENAME
+from atlasbridge.core.daemon.operations import (
+    read_autopilot_state,
+    set_autonomy_mode,
+    set_autopilot_enabled,
+)
+from atlasbridge.core.exceptions import AtlasBridgeError
 
 
 def _trace_path(data_dir: Path) -> Path:
+    from atlasbridge.core.autopilot.trace import TRACE_FILENAME
+
     return data_dir / TRACE_FILENAME
 
 
@@ -34,21 +38,25 @@ def _history_path(data_dir: Path) -> Path:
     return data_dir / HISTORY_FILENAME
 
 
-def _read_state(data_dir: Path) -> AutopilotState:
-    p = _state_path(data_dir)
-    if not p.exists():
-        return AutopilotState.RUNNING
-    try:
-        data = json.loads(p.read_text(encoding="utf-8"))
-        return AutopilotState(data.get("state", "running"))
-    except (OSError, json.JSONDecodeError, ValueError):
-        return AutopilotState.RUNNING
+def _run_action(
+    method: str, params: dict[str, Any], local: Callable[[Path], dict[str, Any]]
+) -> None:
+    """Run an autopilot action in the daemon if one is listening, else via *local*.
 
+    Prints the action's message; exits 1 if it is refused.
+    """
+    from atlasbridge.core.config import atlasbridge_dir
+    from atlasbridge.core.daemon.control import call_running_daemon
 
-def _write_state(data_dir: Path, state: AutopilotState) -> None:
-    p = _state_path(data_dir)
-    p.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
-    p.write_text(json.dumps({"state": state.value}), encoding="utf-8")
+    data_dir = atlasbridge_dir()
+    try:
+        result = call_running_daemon(data_dir, method, params)
+        if result is None:
+            result = local(data_dir)
+    except AtlasBridgeError as exc:
+        click.echo(str(exc), err=True)
+        sys.exit(1)
+    click.echo(result["message"])
 
 
 @click.group("autopilot")
@@ -60,45 +68,25 @@ def autopilot_group() -> None:
 @click.pass_context
 def autopilot_enable(ctx: click.Context) -> None:
     """Enable the autopilot engine (resume from paused state)."""
-    from atlasbridge.core.config import atlasbridge_dir
-
-    data_dir = atlasbridge_dir()
-    current = _read_state(data_dir)
-    if current == AutopilotState.RUNNING:
-        click.echo("Autopilot is already running.")
-        return
-    if current == AutopilotState.STOPPED:
-        click.echo("Autopilot is stopped (daemon not running). Start the daemon first.", err=True)
-        sys.exit(1)
-    _write_state(data_dir, AutopilotState.RUNNING)
-    click.echo("Autopilot enabled (state: running).")
+    _run_action("autopilot.enable", {}, lambda d: set_autopilot_enabled(d, True))
 
 
 @autopilot_group.command("disable")
 @click.pass_context
 def autopilot_disable(ctx: click.Context) -> None:
     """Pause the autopilot engine — all prompts will be forwarded to you."""
-    from atlasbridge.core.config import atlasbridge_dir
-
-    data_dir = atlasbridge_dir()
-    current = _read_state(data_dir)
-    if current == AutopilotState.PAUSED:
-        click.echo("Autopilot is already paused.")
-        return
-    if current == AutopilotState.STOPPED:
-        click.echo("Autopilot is stopped (daemon not running).", err=True)
-        sys.exit(1)
-    _write_state(data_dir, AutopilotState.PAUSED)
-    click.echo("Autopilot paused — all prompts will be forwarded to you.")
+    _run_action("autopilot.disable", {}, lambda d: set_autopilot_enabled(d, False))
 
 
 @autopilot_group.command("status")
 def autopilot_status() -> None:
     """Show autopilot state, active policy, and recent decisions."""
+    from atlasbridge.core.autopilot.trace_index import TraceReader
     from atlasbridge.core.config import atlasbridge_dir
+    from atlasbridge.core.policy.parser import PolicyParseError, default_policy, load_policy
 
     data_dir = atlasbridge_dir()
-    state = _read_state(data_dir)
+    state = read_autopilot_state(data_dir)
 
     state_emoji = {"running": "▶", "paused": "⏸", "stopped": "■"}.get(state.value, "?")
     click.echo(f"  State:        {state_emoji}  {state.value.upper()}")
@@ -119,8 +107,7 @@ def autopilot_status() -> None:
         click.echo(f"  Mode:         {p.autonomy_mode.value}")
 
     # Recent decisions
-    trace = DecisionTrace(_trace_path(data_dir))
-    recent = trace.tail(5)
+    recent = TraceReader(_trace_path(data_dir)).tail(5)
     if recent:
         click.echo(f"\n  Last {len(recent)} decision(s):")
         for entry in recent:
@@ -145,51 +132,7 @@ def autopilot_mode(mode: str) -> None:
     Requires a policy.yaml file in the AtlasBridge data directory.
     Edit the YAML directly for full control.
     """
-    from atlasbridge.core.config import atlasbridge_dir
-
-    data_dir = atlasbridge_dir()
-    policy_path = data_dir / "policy.yaml"
-    if not policy_path.exists():
-        click.echo(
-            f"No policy.yaml found at {policy_path}.\n"
-            "Create one first or copy from: atlasbridge policy validate --help",
-            err=True,
-        )
-        sys.exit(1)
-
-    # Simple in-place YAML field update (avoid full re-serialise to preserve comments)
-    try:
-        text = policy_path.read_text(encoding="utf-8")
-    except OSError as exc:
-        click.echo(f"Cannot read policy file: {exc}", err=True)
-        sys.exit(1)
-
-    import re
-
-    updated = re.sub(
-        r"^(autonomy_mode\s*:\s*).*$",
-        rf"\g<1>{mode}",
-        text,
-        flags=re.MULTILINE,
-    )
-    if updated == text:
-        # Field not found — append
-        updated = text.rstrip() + f"\nautonomy_mode: {mode}\n"
-
-    try:
-        policy_path.write_text(updated, encoding="utf-8")
-    except OSError as exc:
-        click.echo(f"Cannot write policy file: {exc}", err=True)
-        sys.exit(1)
-
-    # Validate after write
-    try:
-        load_policy(policy_path)
-    except PolicyParseError as exc:
-        click.echo(f"Policy is now invalid: {exc}", err=True)
-        sys.exit(1)
-
-    click.echo(f"Autonomy mode set to {mode!r} in {policy_path}")
+    _run_action("autopilot.mode", {"mode": mode}, lambda d: set_autonomy_mode(d, mode))
 
 
 @autopilot_group.command("explain")
@@ -197,11 +140,11 @@ def autopilot_mode(mode: str) -> None:
 @click.option("--json", "as_json", is_flag=True, help="Output as raw JSONL.")
 def autopilot_explain(last: int, as_json: bool) -> None:
     """Show the last N autopilot decisions from the decision trace."""
+    from atlasbridge.core.autopilot.trace_index import TraceReader
     from atlasbridge.core.config import atlasbridge_dir
 
     data_dir = atlasbridge_dir()
-    trace = DecisionTrace(_trace_path(data_dir))
-    entries = trace.tail(last)
+    entries = TraceReader(_trace_path(data_dir)).tail(last)
 
     if not entries:
         click.echo("No autopilot decisions recorded yet.")
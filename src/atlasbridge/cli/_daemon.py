@@ -17,9 +17,15 @@ console = Console()
 @click.option(
     "--foreground", "-f", is_flag=True, default=False, help="Run in foreground (do not daemonise)"
 )
-def start_cmd(foreground: bool) -> None:
+@click.option(
+    "--multi-session",
+    is_flag=True,
+    default=False,
+    help="Host many tool sessions in this daemon (see 'atlasbridge sessions start').",
+)
+def start_cmd(foreground: bool, multi_session: bool) -> None:
     """Start the AtlasBridge daemon."""
-    cmd_start(foreground=foreground, console=console)
+    cmd_start(foreground=foreground, console=console, multi_session=multi_session)
 
 
 @click.command("stop")
@@ -49,7 +55,7 @@ def _pid_alive(pid: int) -> bool:
         return False
 
 
-def cmd_start(foreground: bool, console: Console) -> None:
+def cmd_start(foreground: bool, console: Console, multi_session: bool = False) -> None:
     """Start the AtlasBridge daemon (foreground or background)."""
     from atlasbridge.core.config import load_config
     from atlasbridge.core.exceptions import ConfigError, ConfigNotFoundError
@@ -80,7 +86,7 @@ def cmd_start(foreground: bool, console: Console) -> None:
 
         from atlasbridge.core.daemon.manager import DaemonManager
 
-        cfg_dict = _build_daemon_config(config)
+        cfg_dict = _build_daemon_config(config, multi_session=multi_session)
         try:
             asyncio.run(DaemonManager(cfg_dict).start())
         except KeyboardInterrupt:
@@ -97,7 +103,7 @@ def cmd_start(foreground: bool, console: Console) -> None:
 
             from atlasbridge.core.daemon.manager import DaemonManager
 
-            cfg_dict = _build_daemon_config(config)
+            cfg_dict = _build_daemon_config(config, multi_session=multi_session)
             asyncio.run(DaemonManager(cfg_dict).start())
             sys.exit(0)
         else:
@@ -130,7 +136,7 @@ def cmd_stop(console: Console) -> None:
         sys.exit(1)
 
 
-def _build_daemon_config(config: object) -> dict:
+def _build_daemon_config(config: object, multi_session: bool = False) -> dict:
     """Convert AtlasBridgeConfig into DaemonManager config dict."""
     bot_token = config.telegram.bot_token.get_secret_value()
     allowed_users = config.telegram.allowed_users
@@ -148,4 +154,5 @@ def _build_daemon_config(config: object) -> dict:
             "timeout_seconds": config.prompts.timeout_seconds,
             "stuck_timeout_seconds": config.prompts.stuck_timeout_seconds,
         },
+        "multi_session": multi_session,
     }
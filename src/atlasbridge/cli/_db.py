@@ -77,6 +77,65 @@ def db_info(as_json: bool) -> None:
         conn.close()
 
 
+@db_group.command("stats")
+@click.option(
+    "--rebuild", is_flag=True, default=False, help="Recount the counters from the tables."
+)
+@click.option("--json", "as_json", is_flag=True, default=False)
+def db_stats(rebuild: bool, as_json: bool) -> None:
+    """Show the maintained session, prompt and audit counters.
+
+    The dashboard reads these instead of counting rows. --rebuild recounts
+    them from the tables and reports any drift it corrected.
+    """
+    from atlasbridge.core.config import atlasbridge_dir
+    from atlasbridge.core.constants import DB_FILENAME
+    from atlasbridge.core.store.database import Database
+
+    db_path = atlasbridge_dir() / DB_FILENAME
+
+    if not db_path.exists():
+        if as_json:
+            import json as _json
+
+            click.echo(_json.dumps({"status": "no_database", "path": str(db_path)}))
+        else:
+            console.print(f"Database does not exist yet: {db_path}")
+        return
+
+    db = Database(db_path)
+    db.connect()
+    try:
+        drift = db.rebuild_stats() if rebuild else {}
+        stats = db.get_stats()
+
+        if as_json:
+            import json as _json
+
+            data = dict(stats)
+            if rebuild:
+                data["drift"] = {f"{scope}:{key}": delta for (scope, key), delta in drift.items()}
+            click.echo(_json.dumps(data, indent=2))
+            return
+
+        console.print(f"Sessions:      {stats['sessions']} ({stats['active_sessions']} active)")
+        for status, count in sorted(stats["sessions_by_status"].items()):
+            console.print(f"  {status:<16} {count}")
+        console.print(f"Prompts:       {stats['prompts']}")
+        for prompt_type, count in sorted(stats["prompts_by_type"].items()):
+            console.print(f"  {prompt_type:<16} {count}")
+        console.print(f"Audit events:  {stats['audit_events']}")
+        if rebuild:
+            if drift:
+                console.print(f"\n[yellow]Corrected {len(drift)} drifted counter(s):[/yellow]")
+                for (scope, key), delta in sorted(drift.items()):
+                    console.print(f"  {scope}:{key} {delta:+d}")
+            else:
+                console.print("\n[green]Counters were accurate.[/green]")
+    finally:
+        db.close()
+
+
 @db_group.command("migrate")
 @click.option(
     "--dry-run", is_flag=True, default=False, help="Show pending migrations without applying them."
@@ -269,11 +328,18 @@ def db_archive(days: int, max_rows: int, dry_run: bool, as_json: bool) -> None:
 
         archive_path = archive_base.with_suffix(".1.db")
 
+        def _progress(moved: int, total: int) -> None:
+            click.echo(f"\rArchived {moved}/{total} events", nl=False, err=True)
+
+        progress = None if as_json else _progress
+
         # Use whichever threshold archives more events
         if size_archivable > age_archivable and max_rows > 0:
-            archived = db.archive_oldest_audit_events(archive_path, max_rows)
+            archived = db.archive_oldest_audit_events(archive_path, max_rows, progress=progress)
         else:
-            archived = db.archive_audit_events(archive_path, cutoff_str)
+            archived = db.archive_audit_events(archive_path, cutoff_str, progress=progress)
+        if archived and not as_json:
+            click.echo(err=True)
 
         remaining = db.count_audit_events()
 
@@ -0,0 +1,70 @@
+"""
+Lazily imported subcommands for the root ``atlasbridge`` group.
+
+Importing every ``cli/_*.py`` module up front pulls in rich, pydantic, the
+policy models and more before any command runs, and the dashboard and agent
+run the CLI for single, small actions. The root group instead keeps a
+``LazyCommands`` mapping of command name → ``"module:attribute"`` and imports
+a module the first time its command is looked up, so
+``atlasbridge sessions reply`` loads only the sessions module.
+
+The mapping behaves like ``Group.commands`` (a dict), so ``name in
+cli.commands`` and ``cli.commands.get(name)`` keep working. Only listing the
+values (e.g. ``--help``) imports everything.
+"""
+
+from __future__ import annotations
+
+import importlib
+from collections.abc import Collection, Iterator, MutableMapping
+
+import click
+
+
+class LazyCommands(MutableMapping[str, click.Command]):
+    """
+    Command registry that imports each command on first access.
+
+    Args:
+        specs:  command name → ``"package.module:attribute"``.
+        hidden: names to mark hidden once loaded (kept out of ``--help``).
+    """
+
+    def __init__(self, specs: dict[str, str], hidden: Collection[str] = ()) -> None:
+        self._specs = dict(specs)
+        self._hidden = frozenset(hidden)
+        self._loaded: dict[str, click.Command] = {}
+
+    def __getitem__(self, name: str) -> click.Command:
+        cmd = self._loaded.get(name)
+        if cmd is None:
+            module_name, _, attr = self._specs[name].partition(":")
+            cmd = getattr(importlib.import_module(module_name), attr)
+            if name in self._hidden:
+                cmd.hidden = True
+            self._loaded[name] = cmd
+        return cmd
+
+    def __setitem__(self, name: str, cmd: click.Command) -> None:
+        if name in self._hidden:
+            cmd.hidden = True
+        self._loaded[name] = cmd
+
+    def __delitem__(self, name: str) -> None:
+        if name not in self:
+            raise KeyError(name)
+        self._specs.pop(name, None)
+        self._loaded.pop(name, None)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._specs or name in self._loaded
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self._specs
+        yield from (name for name in self._loaded if name not in self._specs)
+
+    def __len__(self) -> int:
+        return len(self._specs.keys() | self._loaded.keys())
+
+    def is_loaded(self, name: str) -> bool:
+        return name in self._loaded
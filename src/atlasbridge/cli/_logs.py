@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
-import time
+from collections.abc import Callable
+from typing import Any
 
 import click
 from rich.console import Console
@@ -11,6 +13,10 @@ from rich.table import Table
 
 console = Console()
 
+# --tail without a daemon to push change notices: check for new rows this often
+_POLL_INTERVAL_S = 2.0
+_READ_BATCH = 500
+
 
 @click.command("logs")
 @click.option("--session", "session_id", default="", help="Filter by session ID prefix")
@@ -58,12 +64,27 @@ def cmd_logs(session_id: str, tail: bool, limit: int, as_json: bool, console: Co
         db.close()
 
 
-def _show_events(db: object, session_id: str, limit: int, as_json: bool, console: Console) -> None:
-    rows = db.get_recent_audit_events(limit=limit)
-    events = [dict(r) for r in rows]
+def _resolve_session(db: Any, session_id: str, console: Console) -> str | None:
+    """Expand a session ID prefix; ``""`` means all sessions, None means stop."""
+    if not session_id or db.get_session(session_id) is not None:
+        return session_id
+    matches = db.find_session_ids(session_id, limit=100)
+    if len(matches) > 1:
+        console.print(
+            f"[yellow]Ambiguous ID '{session_id}' matches "
+            f"{len(matches)} sessions. Use more characters.[/yellow]"
+        )
+        return None
+    # Unknown IDs are still matched exactly: audit events may outlive sessions.
+    return matches[0] if matches else session_id
 
-    if session_id:
-        events = [e for e in events if str(e.get("session_id", "")).startswith(session_id)]
+
+def _show_events(db: Any, session_id: str, limit: int, as_json: bool, console: Console) -> None:
+    resolved = _resolve_session(db, session_id, console)
+    if resolved is None:
+        return
+    rows = db.get_recent_audit_events(limit=limit, session_id=resolved or None)
+    events = [dict(r) for r in rows]
 
     if as_json:
         print(json.dumps(events, indent=2, default=str))
@@ -78,52 +99,85 @@ def _show_events(db: object, session_id: str, limit: int, as_json: bool, console
     _print_table(events, console)
 
 
-def _tail_loop(db: object, session_id: str, limit: int, as_json: bool, console: Console) -> None:
+def _tail_loop(db: Any, session_id: str, limit: int, as_json: bool, console: Console) -> None:
+    resolved = _resolve_session(db, session_id, console)
+    if resolved is None:
+        return
     if not as_json:
         console.print("[bold]Audit Log[/bold] [dim](following — Ctrl+C to stop)[/dim]\n")
 
-    last_timestamp = ""
-    # Show initial batch
-    rows = db.get_recent_audit_events(limit=limit)
-    events = [dict(r) for r in rows]
-    if session_id:
-        events = [e for e in events if str(e.get("session_id", "")).startswith(session_id)]
-
-    if events:
+    def emit(events: list[dict[str, Any]]) -> None:
         if as_json:
             for e in events:
-                print(json.dumps(e, default=str))
+                print(json.dumps(e, default=str), flush=True)
         else:
             _print_table(events, console)
-        last_timestamp = str(events[0].get("timestamp", ""))
+
+    # Show initial batch
+    rows = db.get_recent_audit_events(limit=limit, session_id=resolved or None)
+    events = [dict(r) for r in rows]
+    if events:
+        emit(events)
+    # Follow from the newest event shown; later reads fetch only seq > cursor
+    cursor = int(events[0]["seq"] or 0) if events else 0
 
     try:
-        while True:
-            time.sleep(2.0)
-            rows = db.get_recent_audit_events(limit=20)
-            new_events = []
-            for r in rows:
-                e = dict(r)
-                ts = str(e.get("timestamp", ""))
-                if ts > last_timestamp:
-                    new_events.append(e)
-            if session_id:
-                new_events = [
-                    e for e in new_events if str(e.get("session_id", "")).startswith(session_id)
-                ]
-            if new_events:
-                new_events.reverse()  # oldest first
-                if as_json:
-                    for e in new_events:
-                        print(json.dumps(e, default=str))
-                else:
-                    _print_table(new_events, console)
-                last_timestamp = str(new_events[-1].get("timestamp", ""))
+        asyncio.run(_follow(db, resolved or None, cursor, emit))
     except KeyboardInterrupt:
         if not as_json:
             console.print("\n[dim]Stopped.[/dim]")
 
 
+async def _follow(
+    db: Any,
+    session_id: str | None,
+    cursor: int,
+    emit: Callable[[list[dict[str, Any]]], None],
+    poll_interval: float = _POLL_INTERVAL_S,
+) -> None:
+    """Emit audit events past *cursor* as they are committed.
+
+    Waits on the daemon's change notices (``events.subscribe``) and reads
+    only rows after the cursor when the audit stream changes. Without a
+    daemon it checks every *poll_interval* seconds and retries the
+    subscription.
+    """
+    from atlasbridge.core.daemon.control import stream_daemon
+    from atlasbridge.core.exceptions import ControlError, DaemonUnavailableError
+    from atlasbridge.core.store.database import AUDIT_STREAM
+
+    while True:
+        try:
+            async for notice in stream_daemon(db.path.parent, "events.subscribe"):
+                # The first (empty) notice marks the subscription live:
+                # catch up on anything committed before it.
+                streams = (notice or {}).get("streams")
+                if not streams or AUDIT_STREAM in streams:
+                    cursor = _emit_after(db, session_id, cursor, emit)
+        except (DaemonUnavailableError, ControlError, OSError):
+            pass
+        cursor = _emit_after(db, session_id, cursor, emit)
+        await asyncio.sleep(poll_interval)
+
+
+def _emit_after(
+    db: Any,
+    session_id: str | None,
+    cursor: int,
+    emit: Callable[[list[dict[str, Any]]], None],
+) -> int:
+    """Emit every event with ``seq > cursor`` in batches; return the new cursor."""
+    while True:
+        rows = db.get_audit_events_after(cursor, session_id=session_id, limit=_READ_BATCH)
+        if not rows:
+            return cursor
+        events = [dict(r) for r in rows]
+        emit(events)
+        cursor = int(events[-1]["seq"])
+        if len(rows) < _READ_BATCH:
+            return cursor
+
+
 def _print_table(events: list[dict], console: Console) -> None:
     table = Table(show_header=True, header_style="bold")
     table.add_column("Timestamp", no_wrap=True)
@@ -9,14 +9,8 @@ import sys
 
 import click
 
-from atlasbridge.core.policy.evaluator import evaluate
-from atlasbridge.core.policy.explain import (
-    debug_policy,
-    explain_decision,
-    explain_policy,
-    full_explain,
-)
-from atlasbridge.core.policy.parser import PolicyParseError, load_policy
+from atlasbridge.core.daemon.operations import run_policy_test, validate_policy
+from atlasbridge.core.exceptions import OperationError
 
 
 @click.group("policy")
@@ -38,30 +32,26 @@ def policy_validate(policy_file: str, check_overlaps: bool = False) -> None:
 
     Exits 0 if valid, 1 if invalid.
     """
-    try:
-        policy = load_policy(policy_file)
-        version = getattr(policy, "policy_version", "?")
-        click.echo(
-            f"✓  Policy {policy.name!r} is valid "
-            f"(version={version}, "
-            f"{len(policy.rules)} rule(s), mode={policy.autonomy_mode.value}, "
-            f"hash={policy.content_hash()})"
-        )
-
-        if check_overlaps:
-            from atlasbridge.core.policy.overlap import detect_overlaps
-
-            warnings = detect_overlaps(policy)
-            if warnings:
-                click.echo(f"\n⚠  {len(warnings)} overlap warning(s):")
-                for w in warnings:
-                    click.echo(f"  - {w}")
-            else:
-                click.echo("\n✓  No overlapping rules detected.")
-    except PolicyParseError as exc:
-        click.echo(str(exc), err=True)
+    result = validate_policy(policy_file, check_overlaps=check_overlaps)
+    if not result["valid"]:
+        click.echo(result["error"], err=True)
         sys.exit(1)
 
+    click.echo(
+        f"✓  Policy {result['name']!r} is valid "
+        f"(version={result['version']}, "
+        f"{result['rules']} rule(s), mode={result['mode']}, "
+        f"hash={result['hash']})"
+    )
+    if check_overlaps:
+        warnings = result["overlaps"]
+        if warnings:
+            click.echo(f"\n⚠  {len(warnings)} overlap warning(s):")
+            for w in warnings:
+                click.echo(f"  - {w}")
+        else:
+            click.echo("\n✓  No overlapping rules detected.")
+
 
 @policy_group.command("test")
 @click.argument("policy_file", type=click.Path(exists=True, dir_okay=False))
@@ -123,52 +113,21 @@ def policy_test(
             --prompt "Deploy?" --session-tag ci --explain
     """
     try:
-        policy = load_policy(policy_file)
-    except PolicyParseError as exc:
+        result = run_policy_test(
+            policy_file,
+            prompt_text,
+            prompt_type=prompt_type,
+            confidence=confidence,
+            tool_id=tool_id,
+            repo=repo,
+            session_tag=session_tag,
+            explain=explain,
+            debug=debug,
+        )
+    except OperationError as exc:
         click.echo(str(exc), err=True)
         sys.exit(1)
-
-    if debug:
-        click.echo(
-            debug_policy(
-                policy=policy,
-                prompt_text=prompt_text,
-                prompt_type=prompt_type,
-                confidence=confidence,
-                tool_id=tool_id,
-                repo=repo,
-                session_tag=session_tag,
-            )
-        )
-        return
-
-    if explain:
-        click.echo(
-            explain_policy(
-                policy=policy,
-                prompt_text=prompt_text,
-                prompt_type=prompt_type,
-                confidence=confidence,
-                tool_id=tool_id,
-                repo=repo,
-                session_tag=session_tag,
-            )
-        )
-        click.echo("")
-
-    decision = evaluate(
-        policy=policy,
-        prompt_text=prompt_text,
-        prompt_type=prompt_type,
-        confidence=confidence,
-        prompt_id="test-prompt",
-        session_id="test-session",
-        tool_id=tool_id,
-        repo=repo,
-        session_tag=session_tag,
-    )
-
-    click.echo(explain_decision(decision))
+    click.echo(result["output"])
 
 
 @policy_group.command("migrate")
@@ -207,6 +166,7 @@ def policy_migrate(policy_file: str, output: str, dry_run: bool) -> None:
     from pathlib import Path
 
     from atlasbridge.core.policy.migrate import MigrateError, migrate_v0_to_v1_text
+    from atlasbridge.core.policy.parser import PolicyParseError, load_policy, parse_policy
 
     src = Path(policy_file)
     try:
@@ -230,8 +190,6 @@ def policy_migrate(policy_file: str, output: str, dry_run: bool) -> None:
 
     # Validate the migrated content
     try:
-        from atlasbridge.core.policy.parser import parse_policy
-
         migrated_policy = parse_policy(new_text, source=f"{policy_file} (migrated)")
     except PolicyParseError as exc:
         click.echo(f"Migrated content failed validation: {exc}", err=True)
@@ -276,6 +234,7 @@ def policy_coverage(policy_file: str) -> None:
         atlasbridge policy coverage ~/.atlasbridge/policy.yaml
     """
     from atlasbridge.core.policy.coverage import analyze_coverage, format_coverage
+    from atlasbridge.core.policy.parser import PolicyParseError, load_policy
 
     try:
         policy = load_policy(policy_file)
@@ -343,6 +302,9 @@ def policy_explain_cmd(
             --prompt "Deploy to prod? [y/n]" --type yes_no \\
             --branch main --ci-status failing --json
     """
+    from atlasbridge.core.policy.explain import full_explain
+    from atlasbridge.core.policy.parser import PolicyParseError, load_policy
+
     try:
         policy = load_policy(policy_file)
     except PolicyParseError as exc:
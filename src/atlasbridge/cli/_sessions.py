@@ -4,9 +4,10 @@ from __future__ import annotations
 
 import json
 import os
-import signal
 import subprocess
 import sys
+from collections.abc import Callable
+from typing import Any, NoReturn
 
 import click
 from rich.console import Console
@@ -56,6 +57,41 @@ def sessions_trace(session_id: str, as_json: bool = False, event_type: str | Non
     )
 
 
+@sessions_group.command("search")
+@click.argument("query")
+@click.option(
+    "--kind",
+    type=click.Choice(["transcript", "prompt", "audit"]),
+    default=None,
+    help="Only search one source.",
+)
+@click.option("--session", "session_id", default=None, help="Only search one session (ID prefix).")
+@click.option("--limit", default=20, show_default=True, help="Max results to show")
+@click.option("--offset", default=0, show_default=True, help="Skip this many results")
+@click.option("--json", "as_json", is_flag=True, default=False, help="Output as JSON")
+@click.option("--reindex", is_flag=True, default=False, help="Rebuild the search index first.")
+def sessions_search(
+    query: str,
+    kind: str | None = None,
+    session_id: str | None = None,
+    limit: int = 20,
+    offset: int = 0,
+    as_json: bool = False,
+    reindex: bool = False,
+) -> None:
+    """Full-text search over transcripts, prompts and audit events."""
+    cmd_sessions_search(
+        query=query,
+        kind=kind,
+        session_id=session_id,
+        limit=limit,
+        offset=offset,
+        as_json=as_json,
+        reindex=reindex,
+        console=console,
+    )
+
+
 def _open_db():
     """Open the AtlasBridge database if it exists, or return None."""
     from atlasbridge.core.config import load_config
@@ -174,10 +210,9 @@ def cmd_sessions_show(
         row = db.get_session(session_id)
         if row is None:
             # Try prefix match
-            all_rows = db.list_sessions(limit=500)
-            matches = [r for r in all_rows if r["id"].startswith(session_id)]
+            matches = db.find_session_ids(session_id, limit=100)
             if len(matches) == 1:
-                row = db.get_session(matches[0]["id"])
+                row = db.get_session(matches[0])
             elif len(matches) > 1:
                 console.print(
                     f"[yellow]Ambiguous ID '{session_id}' matches "
@@ -253,6 +288,7 @@ def cmd_sessions_trace(
     console: Console,
 ) -> None:
     """Render the governance trace timeline for a session."""
+    from atlasbridge.core.daemon.operations import resolve_session_id
     from atlasbridge.core.session.trace import (
         build_session_trace,
         format_trace,
@@ -266,7 +302,7 @@ def cmd_sessions_trace(
 
     try:
         # Support short IDs via prefix match
-        full_id = _resolve_session_id(db, session_id)
+        full_id = resolve_session_id(db, session_id)
         if full_id is None:
             console.print(f"[red]Session not found: {session_id}[/red]")
             sys.exit(1)
@@ -289,17 +325,83 @@ def cmd_sessions_trace(
         db.close()
 
 
-def _resolve_session_id(db, session_id: str) -> str | None:
-    """Resolve a short or full session ID to a full session ID."""
-    row = db.get_session(session_id)
-    if row is not None:
-        return row["id"]
-    # Try prefix match
-    all_rows = db.list_sessions(limit=500)
-    matches = [r for r in all_rows if r["id"].startswith(session_id)]
-    if len(matches) == 1:
-        return matches[0]["id"]
-    return None
+# ------------------------------------------------------------------
+# sessions search
+# ------------------------------------------------------------------
+
+
+def cmd_sessions_search(
+    *,
+    query: str,
+    kind: str | None,
+    session_id: str | None,
+    limit: int,
+    offset: int,
+    as_json: bool,
+    reindex: bool,
+    console: Console,
+) -> None:
+    """Rank full-text matches for *query* and print one page of them."""
+    from rich.markup import escape
+
+    from atlasbridge.core.daemon.operations import resolve_session_id
+    from atlasbridge.core.store.search import SearchUnavailableError
+
+    db = _open_db()
+    if db is None:
+        console.print("[red]No database found.[/red]")
+        sys.exit(1)
+
+    try:
+        if reindex:
+            count = db.rebuild_search_index()
+            if not as_json:
+                console.print(f"[dim]Indexed {count} rows.[/dim]")
+        if session_id:
+            full_id = resolve_session_id(db, session_id)
+            if full_id is None:
+                console.print(f"[red]Session not found: {session_id}[/red]")
+                sys.exit(1)
+            session_id = full_id
+        try:
+            hits, total = db.search(
+                query, kind=kind, session_id=session_id, limit=limit, offset=offset
+            )
+        except ValueError as exc:
+            console.print(f"[red]{exc}[/red]")
+            sys.exit(1)
+        except SearchUnavailableError as exc:
+            console.print(f"[red]{exc}[/red] (this SQLite build has no FTS5 support)")
+            sys.exit(1)
+
+        if as_json:
+            data = {"results": [h.to_dict() for h in hits], "total": total}
+            print(json.dumps(data, indent=2, default=str))
+            return
+
+        if not hits:
+            console.print(f"[dim]No matches for {escape(query)!r}.[/dim]")
+            return
+
+        table = Table(title=f"Search: {escape(query)}", show_lines=False)
+        table.add_column("Kind", style="bold")
+        table.add_column("Session", style="cyan", no_wrap=True)
+        table.add_column("Ref", style="dim", no_wrap=True)
+        table.add_column("When", style="dim")
+        table.add_column("Match")
+        for hit in hits:
+            snippet = escape(" ".join(hit.snippet.split()))
+            snippet = snippet.replace("«", "[bold yellow]").replace("»", "[/bold yellow]")
+            table.add_row(hit.kind, hit.session_id[:8], hit.ref[:12], hit.created_at[:19], snippet)
+        console.print(table)
+        shown = offset + len(hits)
+        if shown < total:
+            console.print(
+                f"[dim]Showing {offset + 1}-{shown} of {total}; "
+                f"use --offset {shown} for more.[/dim]"
+            )
+    finally:
+        db.close()
 
 
 # ------------------------------------------------------------------
@@ -347,9 +449,11 @@ def sessions_start(
 ) -> None:
     """Start a new session in the background.
 
-    Launches ``atlasbridge run`` as a detached child process so the dashboard
-    can start sessions without blocking.  The session ID is written to stdout
-    so callers can poll the sessions list.
+    If a multi-session daemon (``atlasbridge start --multi-session``) is
+    running, the session is submitted to it over the control socket and its
+    session ID is returned. Otherwise ``atlasbridge run`` is launched as a
+    detached child process so the dashboard can start sessions without
+    blocking; callers then poll the sessions list.
 
     To monitor any CLI tool, use ``--adapter custom --custom-command <cmd>``.
     The generic adapter works with any interactive CLI.
@@ -365,6 +469,31 @@ def sessions_start(
     tool_to_run = custom_command.split()[0] if custom_command else adapter
     extra_tool_args = custom_command.split()[1:] if custom_command else []
 
+    # Profiles can carry their own policy file, which needs a daemon of its own.
+    if not profile_name:
+        try:
+            started = _start_in_daemon(
+                tool_to_run, [tool_to_run] + extra_tool_args, mode, cwd, session_label
+            )
+        except Exception as exc:  # noqa: BLE001
+            if as_json:
+                print(json.dumps({"ok": False, "error": str(exc)}))
+            else:
+                console.print(f"[red]Failed to start session:[/red] {exc}")
+            sys.exit(1)
+        if started is not None:
+            if as_json:
+                print(json.dumps({"ok": True, "adapter": adapter, "mode": mode, **started}))
+            else:
+                console.print(
+                    f"[green]Session started[/green] {started['session_id'][:8]} "
+                    f"in daemon (PID {started['daemon_pid']})"
+                )
+                console.print(f"  Adapter: {adapter}  Mode: {mode}")
+                if cwd:
+                    console.print(f"  CWD:     {cwd}")
+            return
+
     if atlas_bin:
         args = [atlas_bin, "run", tool_to_run, "--mode", mode] + extra_tool_args
     else:
@@ -414,6 +543,41 @@ def sessions_start(
         sys.exit(1)
 
 
+def _data_dir():
+    """Return the data directory the daemon serves (for its sockets)."""
+    from atlasbridge.core.config import load_config
+    from atlasbridge.core.constants import _default_data_dir
+    from atlasbridge.core.exceptions import ConfigError, ConfigNotFoundError
+
+    try:
+        return load_config().db_path.parent
+    except (ConfigNotFoundError, ConfigError):
+        return _default_data_dir()
+
+
+def _start_in_daemon(tool: str, command: list[str], mode: str, cwd: str, label: str) -> dict | None:
+    """Submit a session to a running multi-session daemon.
+
+    Returns the daemon's reply, or None when no multi-session daemon is
+    listening. Raises ControlError if the daemon rejects the session.
+    """
+    from atlasbridge.core.daemon.control import call_daemon
+    from atlasbridge.core.exceptions import DaemonUnavailableError
+
+    data_dir = _data_dir()
+    try:
+        status = call_daemon(data_dir, "daemon.status", timeout=2.0)
+    except DaemonUnavailableError:
+        return None
+    if not status.get("multi_session"):
+        return None
+    return call_daemon(
+        data_dir,
+        "sessions.start",
+        {"tool": tool, "command": command, "mode": mode, "cwd": cwd, "label": label},
+    )
+
+
 # ------------------------------------------------------------------
 # sessions reply
 # ------------------------------------------------------------------
@@ -425,74 +589,14 @@ def sessions_start(
 @click.argument("value")
 def sessions_reply(session_id: str, prompt_id: str, value: str) -> None:
     """Inject a reply for a pending prompt in an active session."""
-    db = _open_db()
-    if db is None:
-        print(json.dumps({"ok": False, "error": "Database not found"}))
-        sys.exit(1)
-
-    try:
-        # Resolve short session ID
-        full_session_id = _resolve_session_id(db, session_id)
-        if full_session_id is None:
-            print(json.dumps({"ok": False, "error": f"Session not found: {session_id}"}))
-            sys.exit(1)
-
-        # Resolve short prompt ID (prefix match against pending prompts)
-        prompt = db.get_prompt(prompt_id)
-        if prompt is None:
-            pending = db.list_pending_prompts(full_session_id)
-            matches = [p for p in pending if p["id"].startswith(prompt_id)]
-            if len(matches) == 1:
-                prompt = db.get_prompt(matches[0]["id"])
-            elif len(matches) > 1:
-                print(json.dumps({"ok": False, "error": f"Ambiguous prompt ID: {prompt_id}"}))
-                sys.exit(1)
-
-        if prompt is None:
-            print(json.dumps({"ok": False, "error": f"Prompt not found: {prompt_id}"}))
-            sys.exit(1)
-
-        if prompt["status"] != "awaiting_reply":
-            print(
-                json.dumps(
-                    {
-                        "ok": False,
-                        "error": f"Prompt is not awaiting reply (status: {prompt['status']})",
-                    }
-                )
-            )
-            sys.exit(1)
-
-        if prompt["session_id"] != full_session_id:
-            print(json.dumps({"ok": False, "error": "Prompt does not belong to this session"}))
-            sys.exit(1)
-
-        nonce = prompt["nonce"]
-        full_prompt_id = prompt["id"]
-
-        rows_updated = db.decide_prompt(
-            prompt_id=full_prompt_id,
-            new_status="reply_received",
-            channel_identity="dashboard",
-            response_normalized=value,
-            nonce=nonce,
-        )
-
-        if rows_updated == 0:
-            print(
-                json.dumps(
-                    {
-                        "ok": False,
-                        "error": "Prompt could not be claimed (expired or already resolved)",
-                    }
-                )
-            )
-            sys.exit(1)
+    from atlasbridge.core.daemon.operations import reply_to_prompt
 
-        print(json.dumps({"ok": True, "prompt_id": full_prompt_id, "session_id": full_session_id}))
-
-    finally:
-        db.close()
+    result = _run_session_action(
+        "sessions.reply",
+        {"session_id": session_id, "prompt_id": prompt_id, "value": value},
+        lambda db: reply_to_prompt(db, session_id, prompt_id, value),
+    )
+    print(json.dumps(result))
 
 
 # ------------------------------------------------------------------
@@ -505,30 +609,18 @@ def sessions_reply(session_id: str, prompt_id: str, value: str) -> None:
 @click.argument("text")
 def sessions_message(session_id: str, text: str) -> None:
     """Send a free-text message to a running session's agent."""
-    db = _open_db()
-    if db is None:
-        print(json.dumps({"ok": False, "error": "Database not found"}))
-        sys.exit(1)
-
-    try:
-        full_session_id = _resolve_session_id(db, session_id)
-        if full_session_id is None:
-            print(json.dumps({"ok": False, "error": f"Session not found: {session_id}"}))
-            sys.exit(1)
+    from atlasbridge.core.daemon.operations import message_session
 
-        row = db.get_session(full_session_id)
-        if row is None or row["status"] not in ("running", "starting", "awaiting_reply"):
-            print(json.dumps({"ok": False, "error": "Session is not running"}))
-            sys.exit(1)
-
-        directive_id = db.insert_operator_directive(full_session_id, text)
-        print(json.dumps({"ok": True, "directive_id": directive_id, "session_id": full_session_id}))
-    finally:
-        db.close()
+    result = _run_session_action(
+        "sessions.message",
+        {"session_id": session_id, "text": text},
+        lambda db: message_session(db, session_id, text),
+    )
+    print(json.dumps(result))
 
 
 # ------------------------------------------------------------------
-# sessions stop
+# sessions stop / pause / resume
 # ------------------------------------------------------------------
 
 
@@ -537,95 +629,15 @@ def sessions_message(session_id: str, text: str) -> None:
 @click.option("--json", "as_json", is_flag=True, default=False, help="Output result as JSON.")
 def sessions_stop(session_id: str, as_json: bool = False) -> None:
     """Stop a running session by sending SIGTERM to its process."""
-    db = _open_db()
-    if db is None:
-        if as_json:
-            print(json.dumps({"ok": False, "error": "Database not found"}))
-        else:
-            console.print("[red]No database found.[/red]")
-        sys.exit(1)
-
-    try:
-        full_id = _resolve_session_id(db, session_id)
-        if full_id is None:
-            if as_json:
-                print(json.dumps({"ok": False, "error": f"Session not found: {session_id}"}))
-            else:
-                console.print(f"[red]Session not found:[/red] {session_id}")
-            sys.exit(1)
-
-        row = db.get_session(full_id)
-        if row is None:
-            if as_json:
-                print(json.dumps({"ok": False, "error": "Session not found"}))
-            else:
-                console.print(f"[red]Session not found:[/red] {session_id}")
-            sys.exit(1)
-
-        pid = row["pid"]
-        status = row["status"]
-
-        if status in ("completed", "crashed", "canceled"):
-            if as_json:
-                print(json.dumps({"ok": False, "error": f"Session already {status}"}))
-            else:
-                console.print(f"[yellow]Session already {status}.[/yellow]")
-            return
-
-        if not pid:
-            # No PID means the session never fully started — mark it canceled.
-            db.update_session(full_id, status="canceled")
-            if as_json:
-                print(json.dumps({"ok": True, "session_id": full_id, "action": "canceled"}))
-            else:
-                console.print(
-                    f"[yellow]No PID recorded — marked session {full_id[:8]} as canceled.[/yellow]"
-                )
-            return
-
-        try:
-            os.kill(pid, signal.SIGTERM)
-            # Also update DB directly — the daemon's finally block may not run
-            # if the parent process is killed or crashes.
-            db.update_session(full_id, status="canceled")
-            if as_json:
-                print(
-                    json.dumps({"ok": True, "session_id": full_id, "pid": pid, "signal": "SIGTERM"})
-                )
-            else:
-                console.print(f"[green]SIGTERM sent[/green] to PID {pid} (session {full_id[:8]})")
-        except ProcessLookupError:
-            # Process already gone — mark as canceled
-            db.update_session(full_id, status="canceled")
-            if as_json:
-                print(
-                    json.dumps(
-                        {
-                            "ok": True,
-                            "session_id": full_id,
-                            "action": "canceled",
-                            "note": f"Process {pid} not found (already stopped)",
-                        }
-                    )
-                )
-            else:
-                console.print(
-                    f"[yellow]Process {pid} not found — marked session as canceled.[/yellow]"
-                )
-        except PermissionError:
-            if as_json:
-                print(json.dumps({"ok": False, "error": f"Permission denied to stop PID {pid}"}))
-            else:
-                console.print(f"[red]Permission denied:[/red] cannot stop PID {pid}")
-            sys.exit(1)
-
-    finally:
-        db.close()
-
+    from atlasbridge.core.daemon.operations import stop_session
 
-# ------------------------------------------------------------------
-# sessions pause
-# ------------------------------------------------------------------
+    result = _run_session_action(
+        "sessions.stop",
+        {"session_id": session_id},
+        lambda db: stop_session(db, session_id),
+        as_json=as_json,
+    )
+    _print_signal_result(result, as_json)
 
 
 @sessions_group.command("pause")
@@ -633,80 +645,15 @@ def sessions_stop(session_id: str, as_json: bool = False) -> None:
 @click.option("--json", "as_json", is_flag=True, default=False, help="Output result as JSON.")
 def sessions_pause(session_id: str, as_json: bool = False) -> None:
     """Pause a running session by sending SIGSTOP to its process."""
-    db = _open_db()
-    if db is None:
-        if as_json:
-            print(json.dumps({"ok": False, "error": "Database not found"}))
-        else:
-            console.print("[red]No database found.[/red]")
-        sys.exit(1)
-
-    try:
-        full_id = _resolve_session_id(db, session_id)
-        if full_id is None:
-            if as_json:
-                print(json.dumps({"ok": False, "error": f"Session not found: {session_id}"}))
-            else:
-                console.print(f"[red]Session not found:[/red] {session_id}")
-            sys.exit(1)
-
-        row = db.get_session(full_id)
-        if row is None:
-            if as_json:
-                print(json.dumps({"ok": False, "error": "Session not found"}))
-            else:
-                console.print(f"[red]Session not found:[/red] {session_id}")
-            sys.exit(1)
+    from atlasbridge.core.daemon.operations import pause_session
 
-        pid = row["pid"]
-        status = row["status"]
-
-        if status not in ("running", "awaiting_reply"):
-            if as_json:
-                print(
-                    json.dumps({"ok": False, "error": f"Cannot pause session in '{status}' state"})
-                )
-            else:
-                console.print(f"[yellow]Cannot pause — session is {status}.[/yellow]")
-            return
-
-        if not pid:
-            if as_json:
-                print(json.dumps({"ok": False, "error": "No PID recorded for session"}))
-            else:
-                console.print("[red]No PID recorded for this session.[/red]")
-            sys.exit(1)
-
-        try:
-            os.kill(pid, signal.SIGSTOP)
-            db.update_session(full_id, status="paused")
-            if as_json:
-                print(
-                    json.dumps({"ok": True, "session_id": full_id, "pid": pid, "signal": "SIGSTOP"})
-                )
-            else:
-                console.print(
-                    f"[green]SIGSTOP sent[/green] to PID {pid} (session {full_id[:8]}) — paused"
-                )
-        except ProcessLookupError:
-            if as_json:
-                print(json.dumps({"ok": False, "error": f"Process {pid} not found"}))
-            else:
-                console.print(f"[yellow]Process {pid} not found.[/yellow]")
-        except PermissionError:
-            if as_json:
-                print(json.dumps({"ok": False, "error": f"Permission denied to pause PID {pid}"}))
-            else:
-                console.print(f"[red]Permission denied:[/red] cannot pause PID {pid}")
-            sys.exit(1)
-
-    finally:
-        db.close()
-
-
-# ------------------------------------------------------------------
-# sessions resume
-# ------------------------------------------------------------------
+    result = _run_session_action(
+        "sessions.pause",
+        {"session_id": session_id},
+        lambda db: pause_session(db, session_id),
+        as_json=as_json,
+    )
+    _print_signal_result(result, as_json, " — paused")
 
 
 @sessions_group.command("resume")
@@ -714,72 +661,65 @@ def sessions_pause(session_id: str, as_json: bool = False) -> None:
 @click.option("--json", "as_json", is_flag=True, default=False, help="Output result as JSON.")
 def sessions_resume(session_id: str, as_json: bool = False) -> None:
     """Resume a paused session by sending SIGCONT to its process."""
-    db = _open_db()
-    if db is None:
-        if as_json:
-            print(json.dumps({"ok": False, "error": "Database not found"}))
-        else:
-            console.print("[red]No database found.[/red]")
-        sys.exit(1)
+    from atlasbridge.core.daemon.operations import resume_session
 
-    try:
-        full_id = _resolve_session_id(db, session_id)
-        if full_id is None:
-            if as_json:
-                print(json.dumps({"ok": False, "error": f"Session not found: {session_id}"}))
-            else:
-                console.print(f"[red]Session not found:[/red] {session_id}")
-            sys.exit(1)
-
-        row = db.get_session(full_id)
-        if row is None:
-            if as_json:
-                print(json.dumps({"ok": False, "error": "Session not found"}))
-            else:
-                console.print(f"[red]Session not found:[/red] {session_id}")
-            sys.exit(1)
+    result = _run_session_action(
+        "sessions.resume",
+        {"session_id": session_id},
+        lambda db: resume_session(db, session_id),
+        as_json=as_json,
+    )
+    _print_signal_result(result, as_json, " — resumed")
 
-        pid = row["pid"]
-        status = row["status"]
 
-        if status != "paused":
-            if as_json:
-                print(
-                    json.dumps({"ok": False, "error": f"Session is not paused (status: {status})"})
-                )
-            else:
-                console.print(f"[yellow]Session is not paused — status is {status}.[/yellow]")
-            return
+def _run_session_action(
+    method: str,
+    params: dict[str, Any],
+    local: Callable[[Any], dict[str, Any]],
+    as_json: bool = True,
+) -> dict[str, Any]:
+    """Run a session action in the daemon if one is listening, else on the local DB.
 
-        if not pid:
-            if as_json:
-                print(json.dumps({"ok": False, "error": "No PID recorded for session"}))
-            else:
-                console.print("[red]No PID recorded for this session.[/red]")
-            sys.exit(1)
+    Reports a refused action and exits 1.
+    """
+    from atlasbridge.core.daemon.control import call_running_daemon
+    from atlasbridge.core.exceptions import AtlasBridgeError
 
+    try:
+        result = call_running_daemon(_data_dir(), method, params)
+        if result is not None:
+            return result
+        db = _open_db()
+        if db is None:
+            _fail("Database not found", as_json, "No database found.")
         try:
-            os.kill(pid, signal.SIGCONT)
-            db.update_session(full_id, status="running")
-            if as_json:
-                print(
-                    json.dumps({"ok": True, "session_id": full_id, "pid": pid, "signal": "SIGCONT"})
-                )
-            else:
-                console.print(
-                    f"[green]SIGCONT sent[/green] to PID {pid} (session {full_id[:8]}) — resumed"
-                )
-        except ProcessLookupError:
-            if as_json:
-                print(json.dumps({"ok": False, "error": f"Process {pid} not found"}))
-            else:
-                console.print(f"[yellow]Process {pid} not found.[/yellow]")
-        except PermissionError:
-            if as_json:
-                print(json.dumps({"ok": False, "error": f"Permission denied to resume PID {pid}"}))
-            else:
-                console.print(f"[red]Permission denied:[/red] cannot resume PID {pid}")
-            sys.exit(1)
+            return local(db)
+        finally:
+            db.close()
+    except AtlasBridgeError as exc:
+        _fail(str(exc), as_json)
 
-    finally:
-        db.close()
+
+def _fail(error: str, as_json: bool, message: str = "") -> NoReturn:
+    if as_json:
+        print(json.dumps({"ok": False, "error": error}))
+    else:
+        console.print(f"[red]{message or error}[/red]")
+    sys.exit(1)
+
+
+def _print_signal_result(result: dict[str, Any], as_json: bool, outcome: str = "") -> None:
+    if as_json:
+        print(json.dumps(result))
+    elif not result["ok"]:
+        console.print(f"[yellow]{result['error']}.[/yellow]")
+    elif result.get("action") == "canceled":
+        note = f" — {result['note']}" if "note" in result else ""
+        console.print(
+            f"[yellow]Marked session {result['session_id'][:8]} as canceled{note}.[/yellow]"
+        )
+    else:
+        console.print(
+            f"[green]{result['signal']} sent[/green] to PID {result['pid']} "
+            f"(session {result['session_id'][:8]}){outcome}"
+        )
@@ -26,12 +26,19 @@ def trace_group() -> None:
     default="",
     help="Path to trace JSONL file (default: auto-detect from config).",
 )
-def trace_integrity_check(trace_path: str) -> None:
+@click.option(
+    "--full",
+    is_flag=True,
+    default=False,
+    help="Re-hash the whole file instead of resuming from the last verified entry.",
+)
+def trace_integrity_check(trace_path: str, full: bool) -> None:
     """Verify hash chain integrity of the decision trace.
 
     Reads the JSONL trace file, verifies that each entry's prev_hash
     matches the previous entry's hash, and that each hash matches the
     recomputed value.  Exits 0 if valid, 1 if the chain is broken.
+    Entries verified by an earlier run are skipped unless --full is given.
     """
     from pathlib import Path
 
@@ -51,7 +58,11 @@ def trace_integrity_check(trace_path: str) -> None:
         console.print("[green]No entries to verify — OK.[/green]")
         sys.exit(0)
 
-    valid, errors = DecisionTrace.verify_integrity(path)
+    from atlasbridge.core.audit.checkpoint import checkpoint_path
+
+    valid, errors = DecisionTrace.verify_integrity(
+        path, checkpoint_file=checkpoint_path(path), full=full
+    )
 
     # Count entries
     entry_count = 0
@@ -14,6 +14,48 @@ import sys
 import click
 
 from atlasbridge import __version__
+from atlasbridge.cli._lazy import LazyCommands
+
+# ---------------------------------------------------------------------------
+# Subcommands (imported on first use — see _lazy.py)
+# ---------------------------------------------------------------------------
+
+_SUBCOMMANDS: dict[str, str] = {
+    "setup": "atlasbridge.cli._setup:setup_cmd",
+    "start": "atlasbridge.cli._daemon:start_cmd",
+    "stop": "atlasbridge.cli._daemon:stop_cmd",
+    "status": "atlasbridge.cli._status:status_cmd",
+    "run": "atlasbridge.cli._run:run_cmd",
+    "sessions": "atlasbridge.cli._sessions:sessions_group",
+    "logs": "atlasbridge.cli._logs:logs_cmd",
+    "doctor": "atlasbridge.cli._doctor:doctor_cmd",
+    "debug": "atlasbridge.cli._debug:debug_group",
+    "channel": "atlasbridge.cli._channel:channel_group",
+    "adapter": "atlasbridge.cli._adapter:adapter_group",
+    "version": "atlasbridge.cli._version:version_cmd",
+    "db": "atlasbridge.cli._db:db_group",
+    "config": "atlasbridge.cli._config_cmd:config_group",
+    "policy": "atlasbridge.cli._policy_cmd:policy_group",
+    "profile": "atlasbridge.cli._profile:profile_group",
+    "autopilot": "atlasbridge.cli._autopilot:autopilot_group",
+    "cloud": "atlasbridge.cli._enterprise:cloud_group",
+    "trace": "atlasbridge.cli._trace_cmd:trace_group",
+    "audit": "atlasbridge.cli._audit_cmd:audit_group",
+    "lab": "atlasbridge.cli._lab:lab_group",
+    "dashboard": "atlasbridge.cli._dashboard:dashboard_group",
+    "console": "atlasbridge.cli._console:console_cmd",
+    "replay": "atlasbridge.cli._replay:replay_group",
+    "risk": "atlasbridge.cli._risk:risk_group",
+    "chat": "atlasbridge.cli._chat:chat_cmd",
+    "workspace": "atlasbridge.cli._workspace:workspace_group",
+    "providers": "atlasbridge.cli._providers:providers_group",
+    "agent": "atlasbridge.cli._agent:agent_group",
+    "monitor": "atlasbridge.cli._monitor:monitor_group",
+}
+
+# All management is via the dashboard UI.
+# Commands stay registered (dashboard spawns them internally) but hidden from --help.
+_HIDDEN = (_SUBCOMMANDS.keys() - {"version"}) | {"ui"}
 
 # ---------------------------------------------------------------------------
 # Root group
@@ -21,6 +63,7 @@ from atlasbridge import __version__
 
 
 @click.group(
+    commands=LazyCommands(_SUBCOMMANDS, hidden=_HIDDEN),
     invoke_without_command=True,
     context_settings={"help_option_names": ["-h", "--help"]},
 )
@@ -67,78 +110,6 @@ def ui() -> None:
     tui_run()
 
 
-# ---------------------------------------------------------------------------
-# Register all subcommands from extracted modules
-# ---------------------------------------------------------------------------
-
-from atlasbridge.cli._adapter import adapter_group  # noqa: E402
-from atlasbridge.cli._agent import agent_group  # noqa: E402
-from atlasbridge.cli._audit_cmd import audit_group  # noqa: E402
-from atlasbridge.cli._autopilot import autopilot_group  # noqa: E402
-from atlasbridge.cli._channel import channel_group  # noqa: E402
-from atlasbridge.cli._chat import chat_cmd  # noqa: E402
-from atlasbridge.cli._config_cmd import config_group  # noqa: E402
-from atlasbridge.cli._console import console_cmd  # noqa: E402
-from atlasbridge.cli._daemon import start_cmd, stop_cmd  # noqa: E402
-from atlasbridge.cli._dashboard import dashboard_group  # noqa: E402
-from atlasbridge.cli._db import db_group  # noqa: E402
-from atlasbridge.cli._debug import debug_group  # noqa: E402
-from atlasbridge.cli._doctor import doctor_cmd  # noqa: E402
-from atlasbridge.cli._enterprise import cloud_group  # noqa: E402
-from atlasbridge.cli._lab import lab_group  # noqa: E402
-from atlasbridge.cli._logs import logs_cmd  # noqa: E402
-from atlasbridge.cli._monitor import monitor_group  # noqa: E402
-from atlasbridge.cli._policy_cmd import policy_group  # noqa: E402
-from atlasbridge.cli._profile import profile_group  # noqa: E402
-from atlasbridge.cli._providers import providers_group  # noqa: E402
-from atlasbridge.cli._replay import replay_group  # noqa: E402
-from atlasbridge.cli._risk import risk_group  # noqa: E402
-from atlasbridge.cli._run import run_cmd  # noqa: E402
-from atlasbridge.cli._sessions import sessions_group  # noqa: E402
-from atlasbridge.cli._setup import setup_cmd  # noqa: E402
-from atlasbridge.cli._status import status_cmd  # noqa: E402
-from atlasbridge.cli._trace_cmd import trace_group  # noqa: E402
-from atlasbridge.cli._version import version_cmd  # noqa: E402
-from atlasbridge.cli._workspace import workspace_group  # noqa: E402
-
-cli.add_command(setup_cmd)
-cli.add_command(start_cmd)
-cli.add_command(stop_cmd)
-cli.add_command(status_cmd)
-cli.add_command(run_cmd)
-cli.add_command(sessions_group)
-cli.add_command(logs_cmd)
-cli.add_command(doctor_cmd)
-cli.add_command(debug_group)
-cli.add_command(channel_group)
-cli.add_command(adapter_group, "adapter")
-cli.add_command(version_cmd, "version")
-cli.add_command(db_group, "db")
-cli.add_command(config_group)
-cli.add_command(policy_group)
-cli.add_command(profile_group)
-cli.add_command(autopilot_group)
-cli.add_command(cloud_group)
-cli.add_command(trace_group)
-cli.add_command(audit_group)
-cli.add_command(lab_group)
-cli.add_command(dashboard_group)
-cli.add_command(console_cmd)
-cli.add_command(replay_group)
-cli.add_command(risk_group)
-cli.add_command(chat_cmd)
-cli.add_command(workspace_group)
-cli.add_command(providers_group)
-cli.add_command(agent_group)
-cli.add_command(monitor_group)
-
-# All management is via the dashboard UI.
-# Commands stay registered (dashboard spawns them internally) but hidden from --help.
-for _name, _cmd in list(cli.commands.items()):
-    if _name != "version":
-        _cmd.hidden = True
-
-
 # ---------------------------------------------------------------------------
 # Entry point
 # ---------------------------------------------------------------------------
@@ -13,6 +13,8 @@ from __future__ import annotations
 
 import asyncio
 import json
+from collections.abc import Callable
+from pathlib import Path
 from typing import Any
 
 import structlog
@@ -110,7 +112,7 @@ async def _ab_get_audit_events(args: dict[str, Any]) -> str:
     session_id = args.get("session_id")
     since = args.get("since")
     until = args.get("until")
-    rows = _db.get_audit_events_filtered(session_id=session_id, since=since, until=until)
+    rows = _db.get_audit_events_filtered(session_id=session_id, since=since, until=until, limit=100)
     events = [
         {
             "id": r["id"],
@@ -119,7 +121,7 @@ async def _ab_get_audit_events(args: dict[str, Any]) -> str:
             "timestamp": r["timestamp"],
             "payload_preview": r["payload"][:200],
         }
-        for r in rows[:100]
+        for r in rows
     ]
     return _json_result("get_audit_events", count=len(events), events=events)
 
@@ -236,25 +238,11 @@ async def _ab_validate_policy(args: dict[str, Any]) -> str:
     policy_path = args.get("path", "")
     if not policy_path:
         return _json_result("validate_policy", error="path is required")
+    from atlasbridge.core.daemon.operations import validate_policy
+
     try:
-        proc = await asyncio.create_subprocess_exec(
-            "atlasbridge",
-            "policy",
-            "validate",
-            policy_path,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-        )
-        stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=10.0)
-        output = stdout.decode("utf-8", errors="replace")
-        err = stderr.decode("utf-8", errors="replace")
-        return _json_result(
-            "validate_policy",
-            path=policy_path,
-            valid=proc.returncode == 0,
-            output=output[:2000],
-            errors=err[:2000] if err else None,
-        )
+        result = await asyncio.to_thread(validate_policy, policy_path)
+        return _json_result("validate_policy", path=policy_path, **result)
     except Exception as exc:
         return _json_result("validate_policy", error=str(exc))
 
@@ -265,26 +253,13 @@ async def _ab_test_policy(args: dict[str, Any]) -> str:
     prompt_type = args.get("prompt_type", "yes_no")
     if not policy_path or not prompt:
         return _json_result("test_policy", error="path and prompt are required")
+    from atlasbridge.core.daemon.operations import run_policy_test
+
     try:
-        cmd = [
-            "atlasbridge",
-            "policy",
-            "test",
-            policy_path,
-            "--prompt",
-            prompt,
-            "--type",
-            prompt_type,
-            "--explain",
-        ]
-        proc = await asyncio.create_subprocess_exec(
-            *cmd,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
+        result = await asyncio.to_thread(
+            run_policy_test, policy_path, prompt, prompt_type=prompt_type, explain=True
         )
-        stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=10.0)
-        output = stdout.decode("utf-8", errors="replace")
-        return _json_result("test_policy", path=policy_path, output=output[:3000])
+        return _json_result("test_policy", path=policy_path, output=result["output"][:3000])
     except Exception as exc:
         return _json_result("test_policy", error=str(exc))
 
@@ -294,38 +269,45 @@ async def _ab_test_policy(args: dict[str, Any]) -> str:
 # ---------------------------------------------------------------------------
 
 
+async def _run_operation(
+    method: str, params: dict[str, Any], local: Callable[[Path], dict[str, Any]]
+) -> dict[str, Any]:
+    """Run an operator action on the daemon's control socket, or in-process.
+
+    Going through the daemon keeps its view of autopilot state current;
+    without one the action is applied to the data directory directly.
+    """
+    from atlasbridge.core.config import atlasbridge_dir
+    from atlasbridge.core.daemon.control import call_running_daemon
+
+    data_dir = atlasbridge_dir()
+    result = await asyncio.to_thread(call_running_daemon, data_dir, method, params)
+    return local(data_dir) if result is None else result
+
+
 async def _ab_set_mode(args: dict[str, Any]) -> str:
     mode = args.get("mode", "")
     if mode not in ("off", "assist", "full"):
         return _json_result("set_mode", error=f"Invalid mode: {mode}. Must be off/assist/full")
+    from atlasbridge.core.daemon.operations import set_autonomy_mode
+
     try:
-        proc = await asyncio.create_subprocess_exec(
-            "atlasbridge",
-            "autopilot",
-            "mode",
-            mode,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
+        result = await _run_operation(
+            "autopilot.mode", {"mode": mode}, lambda d: set_autonomy_mode(d, mode)
         )
-        stdout, _ = await asyncio.wait_for(proc.communicate(), timeout=10.0)
-        out = stdout.decode()[:500]
-        return _json_result("set_mode", mode=mode, success=proc.returncode == 0, output=out)
+        return _json_result("set_mode", mode=mode, success=True, output=result["message"])
     except Exception as exc:
         return _json_result("set_mode", error=str(exc))
 
 
 async def _ab_kill_switch(args: dict[str, Any]) -> str:
+    from atlasbridge.core.daemon.operations import set_autopilot_enabled
+
     try:
-        proc = await asyncio.create_subprocess_exec(
-            "atlasbridge",
-            "autopilot",
-            "disable",
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
+        result = await _run_operation(
+            "autopilot.disable", {}, lambda d: set_autopilot_enabled(d, False)
         )
-        stdout, _ = await asyncio.wait_for(proc.communicate(), timeout=10.0)
-        out = stdout.decode()[:500]
-        return _json_result("kill_switch", success=proc.returncode == 0, output=out)
+        return _json_result("kill_switch", success=True, output=result["message"])
     except Exception as exc:
         return _json_result("kill_switch", error=str(exc))
 
@@ -0,0 +1,74 @@
+"""
+Verification checkpoints for hash chains (audit log, decision trace).
+
+After a chain verifies, the verifier saves the position and hash of the
+last entry it checked to a small JSON file next to the chain
+(``<file>.verified``). The next run confirms that the entry at that
+position still carries that hash, then re-hashes only the entries
+appended after it, starting the chain from the saved hash.
+
+A checkpoint only records verification work that was already done.
+Someone able to rewrite the chain can rewrite the checkpoint too, so
+periodic full re-verification (``full=True``) is still what catches
+tampering before the checkpoint.
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+import structlog
+
+logger = structlog.get_logger()
+
+CHECKPOINT_SUFFIX = ".verified"
+
+
+@dataclass(frozen=True)
+class VerifyCheckpoint:
+    """The last entry of a chain known to verify."""
+
+    position: int  # audit: seq of the event; trace: byte offset just past its line
+    hash: str  # that entry's hash ("" if the chain had restarted there)
+    count: int  # entries verified up to and including it
+    verified_at: str = ""
+
+
+def checkpoint_path(chain_file: Path) -> Path:
+    """Checkpoint file for *chain_file* (``<name>.verified``)."""
+    return chain_file.with_name(chain_file.name + CHECKPOINT_SUFFIX)
+
+
+def load_checkpoint(path: Path) -> VerifyCheckpoint | None:
+    """Read a checkpoint; None if it is missing or malformed."""
+    try:
+        data = json.loads(path.read_bytes())
+        checkpoint = VerifyCheckpoint(
+            position=data["position"],
+            hash=data["hash"],
+            count=data["count"],
+            verified_at=data.get("verified_at", ""),
+        )
+    except (OSError, ValueError, TypeError, KeyError):
+        return None
+    if (
+        not isinstance(checkpoint.position, int)
+        or not isinstance(checkpoint.count, int)
+        or not isinstance(checkpoint.hash, str)
+        or checkpoint.position < 0
+    ):
+        return None
+    return checkpoint
+
+
+def save_checkpoint(path: Path, checkpoint: VerifyCheckpoint) -> None:
+    """Write a checkpoint atomically; a failure only costs the next run time."""
+    tmp = path.with_name(path.name + ".tmp")
+    try:
+        tmp.write_text(json.dumps(asdict(checkpoint)), encoding="utf-8")
+        tmp.replace(path)
+    except OSError as exc:
+        logger.warning("verify_checkpoint_write_failed", path=str(path), error=str(exc))
+        tmp.unlink(missing_ok=True)
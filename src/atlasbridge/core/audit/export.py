@@ -0,0 +1,283 @@
+"""
+Streaming audit export (``atlasbridge audit export``).
+
+Events are read from the database one page at a time in seq order and
+written as they are read, so memory stays flat however long the log is.
+JSONL and CSV can be gzip-compressed. Each page becomes its own gzip
+member. Gzip readers treat consecutive members as one stream, so a file
+can be cut back to the end of any page.
+
+An export to a file records its progress after every page in
+``<file>.export-state``: the options, the last seq written and the file
+size at that point. Running the same export again with ``resume=True``
+truncates the file to that size and continues after that seq. The state
+file is removed when the export completes.
+
+Usage::
+
+    options = ExportOptions(fmt="jsonl", gzip=True)
+    result = export_audit_to_file(db, Path("audit.jsonl.gz"), options)
+"""
+
+from __future__ import annotations
+
+import csv
+import gzip as gzip_module
+import io
+import json
+import textwrap
+from collections.abc import Callable, Iterator
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, BinaryIO
+
+import structlog
+
+logger = structlog.get_logger()
+
+EXPORT_FORMATS = ("jsonl", "json", "csv")
+RESUMABLE_FORMATS = ("jsonl", "csv")
+EXPORT_COLUMNS = [
+    "id",
+    "event_type",
+    "session_id",
+    "prompt_id",
+    "payload",
+    "timestamp",
+    "prev_hash",
+    "hash",
+    "seq",
+]
+STATE_SUFFIX = ".export-state"
+
+_PAGE_SIZE = 1000
+
+ProgressFn = Callable[[int, int], None]
+
+
+class ExportResumeError(ValueError):
+    """An export cannot be resumed (no state, or different options)."""
+
+
+@dataclass(frozen=True)
+class ExportOptions:
+    """What is exported; a resumed export must use the same options."""
+
+    fmt: str = "jsonl"
+    gzip: bool = False
+    session_id: str = ""
+    since: str = ""
+    until: str = ""
+
+
+@dataclass(frozen=True)
+class ExportState:
+    """Progress of an export to a file, saved after every page."""
+
+    options: ExportOptions
+    last_seq: int
+    count: int  # events written so far
+    offset: int  # file size after the last complete page
+
+
+@dataclass
+class ExportResult:
+    written: int = 0  # events written by this run
+    count: int = 0  # events in the file, including those of earlier runs
+    last_seq: int = 0
+    resumed: bool = False
+
+
+def export_state_path(output: Path) -> Path:
+    """State file for an export to *output* (``<name>.export-state``)."""
+    return output.with_name(output.name + STATE_SUFFIX)
+
+
+def load_export_state(path: Path) -> ExportState | None:
+    """Read an export state file; None if it is missing or malformed."""
+    try:
+        data = json.loads(path.read_bytes())
+        return ExportState(
+            options=ExportOptions(**data["options"]),
+            last_seq=int(data["last_seq"]),
+            count=int(data["count"]),
+            offset=int(data["offset"]),
+        )
+    except (OSError, ValueError, TypeError, KeyError):
+        return None
+
+
+def _save_export_state(path: Path, state: ExportState) -> None:
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(json.dumps(asdict(state)), encoding="utf-8")
+    tmp.replace(path)
+
+
+def row_to_dict(row: Any) -> dict[str, Any]:
+    """Convert a sqlite3.Row to a plain dict."""
+    return {k: row[k] for k in row.keys()}
+
+
+def iter_audit_pages(
+    db: Any, options: ExportOptions, after_seq: int = 0, page_size: int = _PAGE_SIZE
+) -> Iterator[list[Any]]:
+    """Yield matching audit rows in seq order, at most *page_size* per page."""
+    while True:
+        rows = db.get_audit_events_filtered(
+            session_id=options.session_id or None,
+            since=options.since or None,
+            until=options.until or None,
+            after_seq=after_seq,
+            limit=page_size,
+        )
+        if not rows:
+            return
+        yield rows
+        after_seq = rows[-1]["seq"]
+
+
+def _format_page(rows: list[Any], fmt: str, first: bool) -> str:
+    """Render one page; *first* is True if no event was written before it."""
+    if fmt == "jsonl":
+        return "".join(json.dumps(row_to_dict(r), separators=(",", ":")) + "\n" for r in rows)
+    if fmt == "csv":
+        buf = io.StringIO()
+        writer = csv.DictWriter(buf, fieldnames=EXPORT_COLUMNS, extrasaction="ignore")
+        for row in rows:
+            writer.writerow(row_to_dict(row))
+        return buf.getvalue()
+    items = (textwrap.indent(json.dumps(row_to_dict(r), indent=2), "  ") for r in rows)
+    return ("[\n" if first else ",\n") + ",\n".join(items)
+
+
+def _csv_header() -> str:
+    buf = io.StringIO()
+    csv.DictWriter(buf, fieldnames=EXPORT_COLUMNS).writeheader()
+    return buf.getvalue()
+
+
+def stream_audit_export(
+    db: Any,
+    out: BinaryIO,
+    options: ExportOptions,
+    *,
+    after_seq: int = 0,
+    fresh: bool = True,
+    total: int = 0,
+    progress: ProgressFn | None = None,
+    on_page: Callable[[int, int], None] | None = None,
+    page_size: int = _PAGE_SIZE,
+) -> ExportResult:
+    """Write matching events to *out* page by page.
+
+    *fresh* is False when appending to a resumed file (no CSV header).
+    ``on_page(last_seq, written)`` runs after each page is flushed;
+    ``progress(written, total)`` reports progress.
+    """
+
+    def write(text: str) -> None:
+        data = text.encode("utf-8")
+        out.write(gzip_module.compress(data) if options.gzip else data)
+
+    result = ExportResult(last_seq=after_seq)
+    if fresh and options.fmt == "csv":
+        write(_csv_header())
+    for rows in iter_audit_pages(db, options, after_seq, page_size):
+        write(_format_page(rows, options.fmt, first=result.written == 0))
+        out.flush()
+        result.written += len(rows)
+        result.last_seq = rows[-1]["seq"]
+        if on_page is not None:
+            on_page(result.last_seq, result.written)
+        if progress is not None:
+            progress(result.written, total)
+    if options.fmt == "json":
+        write("\n]\n" if result.written else "[]\n")
+        out.flush()
+    result.count = result.written
+    return result
+
+
+def export_audit_to_file(
+    db: Any,
+    output: Path,
+    options: ExportOptions,
+    *,
+    resume: bool = False,
+    progress: ProgressFn | None = None,
+    page_size: int = _PAGE_SIZE,
+) -> ExportResult:
+    """Export to *output*, saving resumable progress (see module docstring).
+
+    Raises ExportResumeError if *resume* is set and there is no matching
+    state to resume from.
+    """
+    state_file = export_state_path(output)
+    state: ExportState | None = None
+    if resume:
+        if options.fmt not in RESUMABLE_FORMATS:
+            raise ExportResumeError(f"{options.fmt} exports cannot be resumed")
+        state = load_export_state(state_file)
+        if state is None or not output.exists():
+            raise ExportResumeError(f"Nothing to resume: no progress recorded for {output}")
+        if state.options != options:
+            raise ExportResumeError(
+                "Export options differ from the interrupted run; use the same options"
+            )
+
+    total = (
+        db.count_audit_events(
+            session_id=options.session_id or None,
+            since=options.since or None,
+            until=options.until or None,
+        )
+        if progress is not None
+        else 0
+    )
+    base_count = state.count if state else 0
+    if state is None:
+        state_file.unlink(missing_ok=True)  # left by an abandoned export
+
+    with open(output, "r+b" if state else "wb") as out:
+        if state:
+            out.truncate(state.offset)
+            out.seek(state.offset)
+
+        def checkpoint(last_seq: int, written: int) -> None:
+            if options.fmt in RESUMABLE_FORMATS:
+                _save_export_state(
+                    state_file,
+                    ExportState(
+                        options=options,
+                        last_seq=last_seq,
+                        count=base_count + written,
+                        offset=out.tell(),
+                    ),
+                )
+
+        def report(written: int, total: int) -> None:
+            assert progress is not None
+            progress(base_count + written, total)
+
+        result = stream_audit_export(
+            db,
+            out,
+            options,
+            after_seq=state.last_seq if state else 0,
+            fresh=state is None,
+            total=total,
+            progress=report if progress is not None else None,
+            on_page=checkpoint,
+            page_size=page_size,
+        )
+    state_file.unlink(missing_ok=True)
+    result.count = base_count + result.written
+    result.resumed = state is not None
+    logger.info(
+        "audit_export_complete",
+        output=str(output),
+        written=result.written,
+        count=result.count,
+        resumed=result.resumed,
+    )
+    return result
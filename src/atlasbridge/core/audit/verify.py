@@ -6,20 +6,41 @@ The audit log uses SHA-256 hash chaining: each event stores ``prev_hash``
 
 1. Each event's hash matches recomputation from its fields
 2. Each event's prev_hash matches the previous event's hash
-3. No gaps in the chronological sequence
+3. No gaps in the chain order (the ``seq`` column)
+
+Verification streams rows from the cursor. When given a ``checkpoint_file``,
+a run over the whole chain that finds it intact saves a checkpoint (see
+``checkpoint``), and the next run re-hashes only events appended after the
+checkpointed one. ``full=True`` ignores the checkpoint. ``VerifyJob`` runs
+a full re-verification on a worker thread and reports progress.
 
 Usage::
 
     result = verify_audit_chain(db)
     result = verify_audit_chain(db, session_id="abc123")
+    result = verify_audit_chain(db, checkpoint_file=checkpoint_path(db.path))
 """
 
 from __future__ import annotations
 
 import hashlib
+import sqlite3
+import threading
+from collections.abc import Callable
 from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from atlasbridge.core.audit.checkpoint import VerifyCheckpoint, load_checkpoint, save_checkpoint
+
+if TYPE_CHECKING:
+    from atlasbridge.core.store.database import Database
+
+# progress(verified, total) — called every _PROGRESS_EVERY events and at the end
+ProgressFn = Callable[[int, int], None]
 
-from atlasbridge.core.store.database import Database
+_PROGRESS_EVERY = 1000
 
 
 @dataclass
@@ -32,34 +53,80 @@ class AuditVerifyResult:
     errors: list[str] = field(default_factory=list)
     first_break_event_id: str | None = None
     first_break_position: int | None = None
+    resumed_events: int = 0  # covered by the checkpoint, not re-hashed this run
 
 
 def verify_audit_chain(
     db: Database,
     session_id: str | None = None,
+    *,
+    checkpoint_file: Path | None = None,
+    full: bool = False,
+    progress: ProgressFn | None = None,
 ) -> AuditVerifyResult:
     """
     Verify the hash chain integrity of the audit log.
 
     If session_id is provided, only verifies events for that session.
-    Otherwise verifies the full chain.
+    Otherwise verifies the full chain, resuming from *checkpoint_file*
+    unless *full* is set.
     """
-    if session_id:
-        rows = db._db.execute(
-            "SELECT * FROM audit_events WHERE session_id = ? ORDER BY timestamp ASC",
-            (session_id,),
-        ).fetchall()
-    else:
-        rows = db._db.execute("SELECT * FROM audit_events ORDER BY timestamp ASC").fetchall()
+    return verify_audit_rows(
+        db._db,
+        session_id,
+        checkpoint_file=checkpoint_file,
+        full=full,
+        progress=progress,
+    )
 
-    total = len(rows)
-    result = AuditVerifyResult(valid=True, total_events=total)
 
-    if total == 0:
-        return result
+def verify_audit_rows(
+    conn: sqlite3.Connection,
+    session_id: str | None = None,
+    *,
+    order: str = "seq",
+    checkpoint_file: Path | None = None,
+    full: bool = False,
+    progress: ProgressFn | None = None,
+) -> AuditVerifyResult:
+    """
+    Verify the ``audit_events`` chain read through *conn*.
+
+    *order* is the chain-order column: ``seq``, or ``rowid`` for a database
+    that predates it. Session-scoped runs never use checkpoints, as they
+    see only part of the chain.
+    """
+    session_id = session_id or None
+    checkpoint = None
+    if session_id is None and checkpoint_file is not None and not full:
+        checkpoint = _anchored(conn, order, load_checkpoint(checkpoint_file))
+    after, prev_hash, base = (
+        (checkpoint.position, checkpoint.hash, checkpoint.count) if checkpoint else (0, "", 0)
+    )
 
-    prev_hash = ""
-    for i, row in enumerate(rows):
+    where = f"{order} > ?"
+    params: list[Any] = [after]
+    if session_id:
+        where += " AND session_id = ?"
+        params.append(session_id)
+    total = base
+    if progress is not None:
+        row = conn.execute(
+            f"SELECT count(*) FROM audit_events WHERE {where}",  # noqa: S608
+            params,
+        ).fetchone()
+        total += row[0] if row else 0
+    rows = conn.execute(
+        f"SELECT {order} AS chain_pos, * FROM audit_events "  # noqa: S608
+        f"WHERE {where} ORDER BY {order} ASC",
+        params,
+    )
+
+    result = AuditVerifyResult(
+        valid=True, total_events=base, verified_events=base, resumed_events=base
+    )
+    last_row = None
+    for i, row in enumerate(rows, start=base):
         event_id = row["id"]
         event_type = row["event_type"]
         payload_str = row["payload"] or ""
@@ -94,11 +161,126 @@ def verify_audit_chain(
                 result.first_break_position = i
 
         prev_hash = stored_hash
-        result.verified_events = i + 1
+        last_row = row
+        result.total_events = result.verified_events = i + 1
+        if progress is not None and (i + 1) % _PROGRESS_EVERY == 0:
+            progress(i + 1, max(total, i + 1))
 
+    if progress is not None:
+        progress(result.verified_events, result.total_events)
+    if result.valid and checkpoint_file is not None and session_id is None and last_row is not None:
+        save_checkpoint(
+            checkpoint_file,
+            VerifyCheckpoint(
+                position=last_row["chain_pos"],
+                hash=prev_hash,
+                count=result.verified_events,
+                verified_at=datetime.now(UTC).isoformat(),
+            ),
+        )
     return result
 
 
+def _anchored(
+    conn: sqlite3.Connection, order: str, checkpoint: VerifyCheckpoint | None
+) -> VerifyCheckpoint | None:
+    """Return *checkpoint* if it still describes this chain, else None.
+
+    The checkpointed event must still carry the recorded hash. If it is gone,
+    the checkpoint holds only when every event up to it is gone too (archived).
+    """
+    if checkpoint is None:
+        return None
+    row = conn.execute(
+        f"SELECT hash FROM audit_events WHERE {order} = ?",  # noqa: S608
+        (checkpoint.position,),
+    ).fetchone()
+    if row is not None:
+        return checkpoint if row["hash"] == checkpoint.hash else None
+    earlier = conn.execute(
+        f"SELECT 1 FROM audit_events WHERE {order} <= ? LIMIT 1",  # noqa: S608
+        (checkpoint.position,),
+    ).fetchone()
+    return None if earlier else checkpoint
+
+
+class VerifyJob:
+    """
+    A verification run on a worker thread, polled with :meth:`status`.
+
+    *run* receives a progress callback and returns the result; it must open
+    its own database connection, as it runs on the worker thread.
+    """
+
+    def __init__(self, run: Callable[[ProgressFn], AuditVerifyResult]) -> None:
+        self._run = run
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._verified = 0
+        self._total = 0
+        self._result: AuditVerifyResult | None = None
+        self._error = ""
+        self._started_at = ""
+        self._finished_at = ""
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> bool:
+        """Start a run; False if one is already in progress."""
+        with self._lock:
+            if self.running:
+                return False
+            self._verified = self._total = 0
+            self._result = None
+            self._error = self._finished_at = ""
+            self._started_at = datetime.now(UTC).isoformat()
+            self._thread = threading.Thread(target=self._work, name="audit-verify", daemon=True)
+            self._thread.start()
+            return True
+
+    def join(self, timeout: float | None = None) -> None:
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def _progress(self, verified: int, total: int) -> None:
+        self._verified, self._total = verified, total
+
+    def _work(self) -> None:
+        try:
+            self._result = self._run(self._progress)
+        except (sqlite3.Error, OSError) as exc:
+            self._error = str(exc)
+        finally:
+            self._finished_at = datetime.now(UTC).isoformat()
+
+    def status(self) -> dict[str, Any]:
+        """JSON-ready state: idle, running, done or failed, with progress."""
+        if self.running:
+            state = "running"
+        elif self._error:
+            state = "failed"
+        elif self._result is not None:
+            state = "done"
+        else:
+            state = "idle"
+        status: dict[str, Any] = {
+            "state": state,
+            "verified": self._verified,
+            "total": self._total,
+            "started_at": self._started_at,
+            "finished_at": self._finished_at,
+        }
+        if self._error:
+            status["error"] = self._error
+        if self._result is not None:
+            status["valid"] = self._result.valid
+            status["errors"] = self._result.errors[:50]
+            status["first_break_event_id"] = self._result.first_break_event_id
+        return status
+
+
 def format_verify_result(result: AuditVerifyResult, session_id: str | None = None) -> str:
     """Format an AuditVerifyResult as human-readable text."""
     lines: list[str] = []
@@ -107,6 +289,8 @@ def format_verify_result(result: AuditVerifyResult, session_id: str | None = Non
     lines.append(f"Audit Chain Verification ({scope})")
     lines.append(f"Total events:    {result.total_events}")
     lines.append(f"Verified:        {result.verified_events}")
+    if result.resumed_events:
+        lines.append(f"From checkpoint: {result.resumed_events} (not re-hashed)")
 
     if result.valid:
         lines.append("Integrity:       VALID")
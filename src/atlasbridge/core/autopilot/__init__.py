@@ -4,8 +4,26 @@ AtlasBridge Autopilot Engine — policy-driven autonomous prompt handling.
 Public API::
 
     from atlasbridge.core.autopilot import AutopilotEngine, AutopilotState
+
+AutopilotEngine is imported on first access: it pulls in the policy models,
+which callers that only read or flip the kill switch do not need.
 """
 
-from atlasbridge.core.autopilot.engine import AutopilotEngine, AutopilotState
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from atlasbridge.core.autopilot.state import AutopilotState
+
+if TYPE_CHECKING:
+    from atlasbridge.core.autopilot.engine import AutopilotEngine
 
 __all__ = ["AutopilotEngine", "AutopilotState"]
+
+
+def __getattr__(name: str) -> type:  # noqa: N807
+    if name == "AutopilotEngine":
+        from atlasbridge.core.autopilot.engine import AutopilotEngine
+
+        return AutopilotEngine
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
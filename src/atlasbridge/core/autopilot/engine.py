@@ -33,7 +33,6 @@ from __future__ import annotations
 import asyncio
 import json
 from datetime import UTC, datetime
-from enum import Enum
 from pathlib import Path
 
 import structlog
@@ -45,7 +44,9 @@ from atlasbridge.core.autopilot.actions import (
     RouteFn,
     execute_action,
 )
+from atlasbridge.core.autopilot.state import HISTORY_FILENAME, AutopilotState
 from atlasbridge.core.autopilot.trace import DecisionTrace
+from atlasbridge.core.policy.compiled import CompiledPolicy, compile_policy
 from atlasbridge.core.policy.evaluator import evaluate
 from atlasbridge.core.policy.model import AutonomyMode, Policy, PolicyDecision, PolicyRule
 from atlasbridge.core.policy.model_v1 import PolicyV1
@@ -54,18 +55,6 @@ AnyPolicy = Policy | PolicyV1
 
 logger = structlog.get_logger()
 
-STATE_FILENAME = "autopilot_state.json"
-HISTORY_FILENAME = "autopilot_history.jsonl"
-
-
-class AutopilotState(str, Enum):
-    """Runtime state of the autopilot kill switch."""
-
-    RUNNING = "running"
-    PAUSED = "paused"
-    STOPPED = "stopped"
-
-
 _VALID_TRANSITIONS: dict[AutopilotState, set[AutopilotState]] = {
     AutopilotState.RUNNING: {AutopilotState.PAUSED, AutopilotState.STOPPED},
     AutopilotState.PAUSED: {AutopilotState.RUNNING, AutopilotState.STOPPED},
@@ -98,6 +87,7 @@ class AutopilotEngine:
         history_path: Path | None = None,
     ) -> None:
         self.policy = policy
+        self._compiled = compile_policy(policy)
         self.trace = DecisionTrace(trace_path)
         self._state_path = state_path
         self._history_path = history_path or state_path.parent / HISTORY_FILENAME
@@ -203,9 +193,13 @@ class AutopilotEngine:
 
     def _get_rule(self, rule_id: str | None) -> PolicyRule | None:
         """Return the rule with the given id, or None (works for v0 and v1 rules)."""
-        if rule_id is None:
-            return None
-        return next((r for r in self.policy.rules if r.id == rule_id), None)  # type: ignore[return-value]
+        return self._compiled_policy().get_rule(rule_id)  # type: ignore[return-value]
+
+    def _compiled_policy(self) -> CompiledPolicy:
+        """Return the compiled form of ``self.policy``, recompiling if it was reassigned."""
+        if self._compiled.policy is not self.policy:
+            self._compiled = compile_policy(self.policy)
+        return self._compiled
 
     def reset_session(self, session_id: str) -> None:
         """Clear per-rule reply counters for a finished session."""
@@ -217,9 +211,10 @@ class AutopilotEngine:
 
     def reload_policy(self, policy: AnyPolicy) -> None:
         """Replace the active policy at runtime (no restart required)."""
-        old_hash = self.policy.content_hash()
+        old_hash = self._compiled_policy().policy_hash
         self.policy = policy
-        new_hash = policy.content_hash()
+        self._compiled = compile_policy(policy)
+        new_hash = self._compiled.policy_hash
         logger.info("autopilot_policy_reloaded", old_hash=old_hash, new_hash=new_hash)
 
     # ------------------------------------------------------------------
@@ -278,7 +273,7 @@ class AutopilotEngine:
 
             # --- Evaluate policy ---
             decision: PolicyDecision = evaluate(
-                policy=self.policy,
+                policy=self._compiled_policy(),
                 prompt_text=prompt_text,
                 prompt_type=prompt_type,
                 confidence=confidence,
@@ -0,0 +1,21 @@
+"""
+Autopilot kill-switch state and the files it is persisted in.
+
+Kept apart from the engine so the CLI and the daemon control socket can read
+and flip the kill switch without importing the policy models.
+"""
+
+from __future__ import annotations
+
+from enum import Enum
+
+STATE_FILENAME = "autopilot_state.json"
+HISTORY_FILENAME = "autopilot_history.jsonl"
+
+
+class AutopilotState(str, Enum):
+    """Runtime state of the autopilot kill switch."""
+
+    RUNNING = "running"
+    PAUSED = "paused"
+    STOPPED = "stopped"
@@ -9,6 +9,14 @@ Each entry is hash-chained: every record includes ``prev_hash`` (the hash of
 the preceding entry) and its own ``hash``.  This forms an append-only chain
 whose integrity can be verified offline via ``verify_integrity()``.
 
+Every line also gets a record in a sidecar index (``<name>.jsonl.idx``, see
+``trace_index``), so ``tail()`` and the dashboard seek straight to the
+entries they show instead of parsing the whole file and its archives.
+A chain-head checkpoint (``<name>.jsonl.head``: last hash, end offset,
+entry count) lets a new writer resume the chain without reading the trace;
+when it does not match the file size the last line is read backwards from
+the end instead.
+
 Usage::
 
     trace = DecisionTrace(path)
@@ -24,16 +32,27 @@ from __future__ import annotations
 
 import hashlib
 import json
+import os
 from collections.abc import Iterator
+from datetime import UTC, datetime
 from pathlib import Path
 
 import structlog
 
+from atlasbridge.core.audit.checkpoint import VerifyCheckpoint, load_checkpoint, save_checkpoint
+from atlasbridge.core.autopilot.trace_index import (
+    TraceReader,
+    archive_path,
+    index_path,
+    pack_record,
+    sync_index,
+)
 from atlasbridge.core.policy.model import PolicyDecision
 
 logger = structlog.get_logger()
 
 TRACE_FILENAME = "autopilot_decisions.jsonl"
+HEAD_SUFFIX = ".head"
 
 
 def _compute_hash(prev_hash: str, entry_dict: dict[str, object]) -> str:
@@ -50,6 +69,29 @@ def _compute_hash(prev_hash: str, entry_dict: dict[str, object]) -> str:
     return hashlib.sha256(chain_input.encode()).hexdigest()
 
 
+def head_path(trace_file: Path) -> Path:
+    """Chain-head checkpoint of *trace_file* (``<name>.head``)."""
+    return trace_file.with_name(trace_file.name + HEAD_SUFFIX)
+
+
+def _read_last_line(path: Path, end: int | None = None, chunk_size: int = 4096) -> bytes:
+    """Return the last non-blank line of *path* before offset *end* (default:
+    the end of the file), reading backwards."""
+    with path.open("rb") as fh:
+        pos = fh.seek(0, os.SEEK_END) if end is None else end
+        buf = b""
+        while pos > 0:
+            step = min(chunk_size, pos)
+            pos -= step
+            fh.seek(pos)
+            buf = fh.read(step) + buf
+            stripped = buf.rstrip()
+            newline = stripped.rfind(b"\n")
+            if newline >= 0:
+                return stripped[newline + 1 :].strip()
+        return buf.strip()
+
+
 class DecisionTrace:
     """
     Append-only JSONL writer for autopilot decisions with size-based rotation.
@@ -71,30 +113,95 @@ class DecisionTrace:
         self._path = path
         self._max_bytes = max_bytes
         self._path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
-        self._last_hash: str = self._load_last_hash()
+        for n in range(1, self.MAX_ARCHIVES + 1):
+            self._sync_index(archive_path(path, n))
+        # Offset the next line must start at to extend the index in place;
+        # None once the index can't be written (readers fall back to the file).
+        self._index_end: int | None = None
+        self._entries = 0
+        synced = self._sync_index(path)
+        if synced is not None:
+            self._index_end, self._entries = synced
+        head = self._load_head()
+        if head is not None:
+            self._last_hash, self._entries = head
+        else:
+            self._last_hash = self._load_last_hash()
+
+    def _load_head(self) -> tuple[str, int] | None:
+        """Chain head ``(hash, entries)`` from the checkpoint, if it matches the file."""
+        try:
+            head = json.loads(head_path(self._path).read_bytes())
+            size = self._path.stat().st_size if self._path.exists() else 0
+        except (OSError, ValueError):
+            return None
+        if not isinstance(head, dict) or head.get("offset") != size:
+            return None
+        last_hash, entries = head.get("hash"), head.get("entries")
+        if not isinstance(last_hash, str) or not isinstance(entries, int):
+            return None
+        return last_hash, entries
+
+    def _save_head(self, offset: int) -> None:
+        """Checkpoint the chain head; the trace stays authoritative if this fails."""
+        head = head_path(self._path)
+        tmp = head.with_name(head.name + ".tmp")
+        data = {"hash": self._last_hash, "offset": offset, "entries": self._entries}
+        try:
+            tmp.write_text(json.dumps(data), encoding="utf-8")
+            tmp.replace(head)
+        except OSError as exc:
+            logger.warning("trace_head_write_failed", path=str(head), error=str(exc))
+            tmp.unlink(missing_ok=True)
 
     def _load_last_hash(self) -> str:
-        """Read the hash of the last entry in the trace file (for chain continuity)."""
-        if not self._path.exists():
-            return ""
+        """Read the hash of the last entry in the trace file (for chain continuity).
+
+        Reads backwards from the end of the file, so only the last line is read.
+        """
         try:
-            with self._path.open("r", encoding="utf-8") as fh:
-                last_line = ""
-                for line in fh:
-                    stripped = line.strip()
-                    if stripped:
-                        last_line = stripped
+            last_line = _read_last_line(self._path)
             if not last_line:
                 return ""
             entry = json.loads(last_line)
             return entry.get("hash", "")
-        except (OSError, json.JSONDecodeError):
+        except (OSError, ValueError):
             return ""
 
+    @property
+    def entry_count(self) -> int:
+        """Entries in the active trace file (archives not included)."""
+        return self._entries
+
     @property
     def path(self) -> Path:
         return self._path
 
+    @staticmethod
+    def _sync_index(path: Path) -> tuple[int, int] | None:
+        try:
+            return sync_index(path)
+        except OSError as exc:
+            logger.warning("trace_index_failed", path=str(path), error=str(exc))
+            return None
+
+    def _index(self, offset: int, line: bytes, entry: dict[str, object]) -> None:
+        """Add the line just written at *offset* to the sidecar index."""
+        if self._index_end is None:
+            return
+        if offset != self._index_end:
+            # Something else wrote to the file: index from the file instead.
+            synced = self._sync_index(self._path)
+            self._index_end, self._entries = synced or (None, self._entries)
+            return
+        try:
+            with index_path(self._path).open("ab") as idx:
+                idx.write(pack_record(offset, line, entry))
+            self._index_end = offset + len(line)
+        except OSError as exc:
+            logger.warning("trace_index_failed", path=str(self._path), error=str(exc))
+            self._index_end = None
+
     # ------------------------------------------------------------------
     # Rotation
     # ------------------------------------------------------------------
@@ -112,25 +219,38 @@ class DecisionTrace:
 
         # Shift existing archives: .jsonl.2 → .jsonl.3, .jsonl.1 → .jsonl.2
         for i in range(self.MAX_ARCHIVES - 1, 0, -1):
-            old = self._path.with_suffix(f".jsonl.{i}")
-            new = self._path.with_suffix(f".jsonl.{i + 1}")
+            old = archive_path(self._path, i)
+            new = archive_path(self._path, i + 1)
             if old.exists():
                 try:
                     old.rename(new)
+                    self._rename_index(old, new)
                 except OSError as exc:
                     logger.warning(
                         "trace_rotate_failed", old=str(old), new=str(new), error=str(exc)
                     )
 
         # Move active file to .jsonl.1
-        archive = self._path.with_suffix(".jsonl.1")
+        archive = archive_path(self._path, 1)
         try:
             self._path.rename(archive)
+            self._rename_index(self._path, archive)
         except OSError as exc:
             logger.warning("trace_archive_failed", path=str(self._path), error=str(exc))
 
-        # New chain starts after rotation
+        # New chain (and index) starts after rotation
         self._last_hash = ""
+        synced = self._sync_index(self._path)
+        self._index_end, self._entries = synced or (None, 0)
+        head_path(self._path).unlink(missing_ok=True)
+
+    @staticmethod
+    def _rename_index(old: Path, new: Path) -> None:
+        """Move *old*'s index to *new*, never leaving *new* a stale one."""
+        try:
+            index_path(old).rename(index_path(new))
+        except FileNotFoundError:
+            index_path(new).unlink(missing_ok=True)
 
     # ------------------------------------------------------------------
     # Public API
@@ -144,36 +264,25 @@ class DecisionTrace:
             entry["prev_hash"] = self._last_hash
             entry_hash = _compute_hash(self._last_hash, entry)
             entry["hash"] = entry_hash
-            line = json.dumps(entry, ensure_ascii=False)
-            with self._path.open("a", encoding="utf-8") as fh:
-                fh.write(line + "\n")
+            line = (json.dumps(entry, ensure_ascii=False) + "\n").encode("utf-8")
+            with self._path.open("ab") as fh:
+                offset = fh.seek(0, os.SEEK_END)
+                fh.write(line)
             self._last_hash = entry_hash
+            self._entries += 1
         except OSError as exc:
             # Trace write failure must never crash the autopilot engine
             logger.error("trace_write_failed", path=str(self._path), error=str(exc))
+            return
+        self._index(offset, line, entry)
+        self._save_head(offset + len(line))
 
     def tail(self, n: int = 50) -> list[dict[str, object]]:
-        """Return the last ``n`` trace entries as dicts (oldest first)."""
-        if not self._path.exists():
-            return []
-        lines: list[str] = []
-        try:
-            with self._path.open("r", encoding="utf-8") as fh:
-                lines = fh.readlines()
-        except OSError as exc:
-            logger.error("trace_read_failed", path=str(self._path), error=str(exc))
-            return []
-
-        entries: list[dict[str, object]] = []
-        for line in lines[-n:]:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                entries.append(json.loads(line))
-            except json.JSONDecodeError:
-                continue
-        return entries
+        """Return the last ``n`` trace entries as dicts (oldest first).
+
+        Reads back through the archives when the active file holds fewer.
+        """
+        return TraceReader(self._path, self.MAX_ARCHIVES).tail(n)
 
     def __iter__(self) -> Iterator[dict[str, object]]:
         """Iterate over all entries in the active file (oldest first)."""
@@ -197,7 +306,12 @@ class DecisionTrace:
     # ------------------------------------------------------------------
 
     @staticmethod
-    def verify_integrity(path: Path) -> tuple[bool, list[str]]:
+    def verify_integrity(
+        path: Path,
+        *,
+        checkpoint_file: Path | None = None,
+        full: bool = False,
+    ) -> tuple[bool, list[str]]:
         """Verify hash chain integrity of a trace file.
 
         Returns ``(valid, errors)`` where ``valid`` is True if the chain
@@ -206,6 +320,10 @@ class DecisionTrace:
 
         Entries written by older versions (without ``hash``/``prev_hash``
         fields) are treated as chain-start entries.
+
+        With *checkpoint_file*, lines up to the last verified one are not
+        re-hashed (unless *full*), and an intact chain moves the checkpoint
+        to the end of the file.
         """
         if not path.exists():
             return True, []
@@ -213,48 +331,90 @@ class DecisionTrace:
         errors: list[str] = []
         prev_hash = ""
         line_no = 0
+        offset = 0
+
+        checkpoint = None
+        if checkpoint_file is not None and not full:
+            checkpoint = _anchored_checkpoint(path, load_checkpoint(checkpoint_file))
+        if checkpoint is not None:
+            offset, prev_hash, line_no = checkpoint.position, checkpoint.hash, checkpoint.count
+        # Chain state after the last newline-terminated line (checkpointable)
+        verified = (offset, prev_hash, line_no)
 
         try:
-            with path.open("r", encoding="utf-8") as fh:
-                for raw_line in fh:
-                    raw_line = raw_line.strip()
-                    if not raw_line:
-                        continue
-                    line_no += 1
+            with path.open("rb") as fh:
+                fh.seek(offset)
+                for raw in fh:
+                    offset += len(raw)
+                    raw_line = raw.strip()
+                    if raw_line:
+                        line_no += 1
+                        prev_hash = _verify_line(raw_line, line_no, prev_hash, errors)
+                    if raw.endswith(b"\n"):
+                        verified = (offset, prev_hash, line_no)
 
-                    try:
-                        entry = json.loads(raw_line)
-                    except json.JSONDecodeError as exc:
-                        errors.append(f"Line {line_no}: invalid JSON — {exc}")
-                        prev_hash = ""
-                        continue
+        except OSError as exc:
+            errors.append(f"Failed to read trace file: {exc}")
 
-                    # Legacy entries without hash fields: treat as chain start
-                    if "hash" not in entry or "prev_hash" not in entry:
-                        prev_hash = ""
-                        continue
+        start_count = checkpoint.count if checkpoint is not None else 0
+        if not errors and checkpoint_file is not None and verified[2] > start_count:
+            save_checkpoint(
+                checkpoint_file,
+                VerifyCheckpoint(
+                    position=verified[0],
+                    hash=verified[1],
+                    count=verified[2],
+                    verified_at=datetime.now(UTC).isoformat(),
+                ),
+            )
+        return len(errors) == 0, errors
 
-                    # Verify prev_hash linkage
-                    if entry["prev_hash"] != prev_hash:
-                        errors.append(
-                            f"Line {line_no}: prev_hash mismatch — "
-                            f"expected {prev_hash!r}, got {entry['prev_hash']!r}"
-                        )
 
-                    # Verify self-hash
-                    stored_hash = entry.pop("hash")
-                    recomputed = _compute_hash(entry["prev_hash"], entry)
-                    entry["hash"] = stored_hash  # restore
+def _verify_line(raw_line: bytes, line_no: int, prev_hash: str, errors: list[str]) -> str:
+    """Check one trace line against the chain; return the hash the next must link to."""
+    try:
+        entry = json.loads(raw_line)
+    except ValueError as exc:
+        errors.append(f"Line {line_no}: invalid JSON — {exc}")
+        return ""
 
-                    if stored_hash != recomputed:
-                        errors.append(
-                            f"Line {line_no}: hash mismatch — "
-                            f"stored {stored_hash!r}, computed {recomputed!r}"
-                        )
+    # Legacy entries without hash fields: treat as chain start
+    if "hash" not in entry or "prev_hash" not in entry:
+        return ""
 
-                    prev_hash = stored_hash
+    # Verify prev_hash linkage
+    if entry["prev_hash"] != prev_hash:
+        errors.append(
+            f"Line {line_no}: prev_hash mismatch — "
+            f"expected {prev_hash!r}, got {entry['prev_hash']!r}"
+        )
 
-        except OSError as exc:
-            errors.append(f"Failed to read trace file: {exc}")
+    # Verify self-hash
+    stored_hash = entry.pop("hash")
+    recomputed = _compute_hash(entry["prev_hash"], entry)
 
-        return len(errors) == 0, errors
+    if stored_hash != recomputed:
+        errors.append(
+            f"Line {line_no}: hash mismatch — stored {stored_hash!r}, computed {recomputed!r}"
+        )
+    return str(stored_hash)
+
+
+def _anchored_checkpoint(
+    path: Path, checkpoint: VerifyCheckpoint | None
+) -> VerifyCheckpoint | None:
+    """Return *checkpoint* if the line ending at its position still has its hash.
+
+    A rotated or replaced trace fails this check and is verified in full.
+    """
+    if checkpoint is None or checkpoint.position == 0:
+        return None
+    try:
+        if checkpoint.position > path.stat().st_size:
+            return None
+        entry = json.loads(_read_last_line(path, end=checkpoint.position))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(entry, dict) or entry.get("hash", "") != checkpoint.hash:
+        return None
+    return checkpoint
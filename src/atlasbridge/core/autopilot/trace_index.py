@@ -0,0 +1,286 @@
+"""
+Sidecar byte-offset index for the decision trace.
+
+For every line DecisionTrace appends to ``<trace>``, it appends one
+fixed-width record to ``<trace>.idx``: the line's byte offset and length,
+plus short keys for its ``session_id``, ``action_type`` and ``confidence``.
+Entry *k* is then one seek into the index and one into the trace, so tail
+and pagination read only the entries they return, and filtered queries scan
+36-byte records instead of JSON-parsing every line.
+
+Each rotated archive (``.jsonl.1`` … ``.jsonl.N``) keeps its own index,
+renamed with it. TraceReader presents the archives and the active file as
+one sequence, oldest first.
+
+An index is trusted only as far as it matches its trace file. If its last
+record runs past the end of the file or does not end on a line boundary,
+the file was replaced and the index is ignored. Lines after the last record
+(written by an older version, or lost in a crash) are read from the trace
+itself. The writer adds them to the index the next time it opens the file.
+Readers never write.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import struct
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+INDEX_SUFFIX = ".idx"
+
+# offset, length, then keys for session_id, action_type, confidence
+_RECORD = struct.Struct("<QI8s8s8s")
+_SESSION, _ACTION, _CONFIDENCE = 2, 3, 4
+
+Record = tuple[int, int, bytes, bytes, bytes]
+
+
+def index_path(trace_file: Path) -> Path:
+    """Sidecar index of *trace_file* (``<name>.idx``)."""
+    return trace_file.with_name(trace_file.name + INDEX_SUFFIX)
+
+
+def archive_path(trace_file: Path, n: int) -> Path:
+    """The *n*-th rotated archive of *trace_file* (``.jsonl.<n>``)."""
+    return trace_file.with_suffix(f".jsonl.{n}")
+
+
+def field_key(value: object) -> bytes:
+    """8-byte key for an indexed field; missing values share the key of ``""``."""
+    return hashlib.blake2b(str(value or "").encode(), digest_size=8).digest()
+
+
+def pack_record(offset: int, line: bytes, entry: dict[str, Any]) -> bytes:
+    """Index record for *line* (including its newline) written at *offset*."""
+    return _RECORD.pack(
+        offset,
+        len(line),
+        field_key(entry.get("session_id")),
+        field_key(entry.get("action_type")),
+        field_key(entry.get("confidence")),
+    )
+
+
+class _Segment:
+    """One trace file and the part of its sidecar that matches it."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.index = index_path(path)
+        self.size = 0  # trace file size
+        self.indexed = 0  # leading sidecar records that can be trusted
+        self.end = 0  # byte offset just past the last indexed line
+        self.tail: list[Record] = []  # lines past the index, read from the trace
+
+    def check(self) -> bool:
+        """Stat the trace and validate its sidecar; False if there is no trace."""
+        self.indexed = self.end = 0
+        try:
+            self.size = self.path.stat().st_size
+        except OSError:
+            self.size = 0
+            return False
+        try:
+            with self.index.open("rb") as idx:
+                count = idx.seek(0, os.SEEK_END) // _RECORD.size
+                if not count:
+                    return True
+                idx.seek((count - 1) * _RECORD.size)
+                offset, length = _RECORD.unpack(idx.read(_RECORD.size))[:2]
+            end = offset + length
+            if end > self.size:
+                return True
+            with self.path.open("rb") as fh:
+                fh.seek(end - 1)
+                if fh.read(1) != b"\n":
+                    return True
+        except (OSError, struct.error):
+            return True
+        self.indexed, self.end = count, end
+        return True
+
+    def scan(self) -> tuple[list[tuple[int, bytes, dict[str, Any]]], int]:
+        """Parse complete lines past the index.
+
+        Returns ``(lines, end)``: ``(offset, line, entry)`` for each JSON
+        object line, and the offset just past the last complete line.
+        Blank and malformed lines are skipped, as every trace reader does.
+        """
+        lines: list[tuple[int, bytes, dict[str, Any]]] = []
+        offset = self.end
+        if offset >= self.size:
+            return lines, offset
+        with self.path.open("rb") as fh:
+            fh.seek(offset)
+            for line in fh:
+                if not line.endswith(b"\n"):
+                    break  # still being written
+                start, offset = offset, offset + len(line)
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+                if isinstance(entry, dict):
+                    lines.append((start, line, entry))
+        return lines, offset
+
+    def load(self) -> bool:
+        """Validate the sidecar and index the unindexed tail in memory."""
+        if not self.check():
+            return False
+        try:
+            lines, _ = self.scan()
+        except OSError:
+            lines = []
+        self.tail = [_RECORD.unpack(pack_record(*line)) for line in lines]
+        return True
+
+    def __len__(self) -> int:
+        return self.indexed + len(self.tail)
+
+    def records(self, start: int, stop: int) -> list[Record]:
+        """Records ``start`` … ``stop - 1`` of this file."""
+        out: list[Record] = []
+        upto = min(stop, self.indexed)
+        if start < upto:
+            try:
+                with self.index.open("rb") as idx:
+                    idx.seek(start * _RECORD.size)
+                    data = idx.read((upto - start) * _RECORD.size)
+            except OSError:
+                data = b""
+            data = data[: len(data) - len(data) % _RECORD.size]
+            out.extend(_RECORD.iter_unpack(data))
+        out.extend(self.tail[max(start - self.indexed, 0) : max(stop - self.indexed, 0)])
+        return out
+
+
+def sync_index(trace_file: Path) -> tuple[int, int]:
+    """Bring the sidecar of *trace_file* up to date with the file.
+
+    Drops records that do not match the file and indexes any lines past the
+    last good record. Returns ``(end, entries)``: the offset just past the
+    last complete line (where the next appended line must start for the
+    index to be extended record by record) and the number of entries
+    indexed. Raises OSError if the index can't be written.
+    """
+    seg = _Segment(trace_file)
+    if not seg.check():
+        seg.index.unlink(missing_ok=True)
+        return 0, 0
+    lines, end = seg.scan()
+    with seg.index.open("a+b") as idx:
+        idx.truncate(seg.indexed * _RECORD.size)
+        if lines:
+            idx.write(b"".join(pack_record(*line) for line in lines))
+    return end, seg.indexed + len(lines)
+
+
+class TraceReader:
+    """
+    Indexed, read-only view of a decision trace and its rotated archives.
+
+    Positions run oldest → newest across ``.jsonl.<archives>`` …
+    ``.jsonl.1`` and the active file. Missing or unreadable files read as
+    empty.
+    """
+
+    def __init__(self, path: Path, archives: int = 3) -> None:
+        self._path = path
+        self._archives = archives
+
+    def _segments(self) -> list[_Segment]:
+        paths = [archive_path(self._path, n) for n in range(self._archives, 0, -1)]
+        segments = [_Segment(p) for p in (*paths, self._path)]
+        return [seg for seg in segments if seg.load()]
+
+    def tail(self, n: int = 50) -> list[dict[str, Any]]:
+        """The last *n* entries, oldest first."""
+        entries, _ = self.page(0, n)
+        entries.reverse()
+        return entries
+
+    def page(
+        self,
+        offset: int = 0,
+        limit: int = 50,
+        *,
+        newest_first: bool = True,
+        session_id: str | None = None,
+        action_type: str | None = None,
+        confidence: str | None = None,
+    ) -> tuple[list[dict[str, Any]], int]:
+        """Up to *limit* entries after skipping *offset*, and the total count.
+
+        Filters match exactly. Without filters only the returned entries'
+        records are read; with filters the index records are scanned.
+        """
+        offset, limit = max(offset, 0), max(limit, 0)
+        segments = self._segments()
+        wanted = [
+            (field, field_key(value))
+            for field, value in (
+                (_SESSION, session_id),
+                (_ACTION, action_type),
+                (_CONFIDENCE, confidence),
+            )
+            if value
+        ]
+
+        chosen: list[tuple[_Segment, Record]]
+        if not wanted:
+            total = sum(len(seg) for seg in segments)
+            if newest_first:
+                lo, hi = max(total - offset - limit, 0), max(total - offset, 0)
+            else:
+                lo, hi = offset, offset + limit
+            chosen = []
+            base = 0
+            for seg in segments:
+                start, stop = max(lo - base, 0), min(hi - base, len(seg))
+                if start < stop:
+                    chosen.extend((seg, rec) for rec in seg.records(start, stop))
+                base += len(seg)
+            if newest_first:
+                chosen.reverse()
+        else:
+            chosen = [
+                (seg, rec)
+                for seg in segments
+                for rec in seg.records(0, len(seg))
+                if all(rec[field] == key for field, key in wanted)
+            ]
+            total = len(chosen)
+            if newest_first:
+                chosen.reverse()
+            chosen = chosen[offset : offset + limit]
+        return self._read(chosen), total
+
+    @staticmethod
+    def _read(chosen: Iterable[tuple[_Segment, Record]]) -> list[dict[str, Any]]:
+        """Seek to and parse each chosen line, opening each file once."""
+        entries: list[dict[str, Any]] = []
+        handles: dict[Path, Any] = {}
+        try:
+            for seg, (offset, length, *_) in chosen:
+                fh = handles.get(seg.path)
+                if fh is None:
+                    try:
+                        fh = handles[seg.path] = seg.path.open("rb")
+                    except OSError:
+                        continue
+                try:
+                    fh.seek(offset)
+                    entry = json.loads(fh.read(length))
+                except (OSError, ValueError):
+                    continue
+                if isinstance(entry, dict):
+                    entries.append(entry)
+        finally:
+            for fh in handles.values():
+                fh.close()
+        return entries
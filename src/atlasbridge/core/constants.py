@@ -54,6 +54,8 @@ DB_FILENAME = "atlasbridge.db"
 AUDIT_FILENAME = "audit.log"
 PID_FILENAME = "atlasbridge.pid"
 LOG_FILENAME = "atlasbridge.log"
+WAKE_FILENAME = "atlasbridge.wake"
+CONTROL_FILENAME = "atlasbridge.ctl"
 PROFILES_DIR_NAME = "profiles"
 
 # ---------------------------------------------------------------------------
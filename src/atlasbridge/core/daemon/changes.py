@@ -0,0 +1,83 @@
+"""
+Change notices for committed audit and transcript rows.
+
+The daemon's Database reports which streams ("audit", "transcript") each
+COMMIT touched. ChangeFeed fans those notices out to subscribers on the
+control socket (``events.subscribe``), so the dashboard reads new rows when
+they exist instead of rescanning tables on a timer.
+
+A notice carries only the stream names; the rows stay in SQLite and
+readers fetch them by sequence. Each subscriber keeps one pending set that
+later notices are merged into, so a slow subscriber costs O(1) memory and
+never holds up the daemon.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncGenerator, Iterable
+from typing import Any
+
+
+class _Subscriber:
+    __slots__ = ("pending", "ready")
+
+    def __init__(self) -> None:
+        self.pending: set[str] = set()
+        self.ready = asyncio.Event()
+
+
+class ChangeFeed:
+    """Coalescing fan-out of change notices to any number of subscribers."""
+
+    def __init__(self) -> None:
+        self._subscribers: set[_Subscriber] = set()
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    def publish(self, streams: Iterable[str]) -> None:
+        """Notify subscribers that rows were committed to *streams*.
+
+        Safe to call from a worker thread (e.g. a commit run in an
+        executor); the notice is handed to the feed's event loop.
+        """
+        if not self._subscribers:
+            return
+        changed = frozenset(streams)
+        loop = self._loop
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if loop is not None and running is not loop:
+            loop.call_soon_threadsafe(self._deliver, changed)
+        else:
+            self._deliver(changed)
+
+    def _deliver(self, changed: frozenset[str]) -> None:
+        for sub in self._subscribers:
+            sub.pending |= changed
+            sub.ready.set()
+
+    async def subscribe(self, params: dict[str, Any] | None = None) -> AsyncGenerator[Any, None]:
+        """Yield ``{"streams": [...]}`` for each batch of notices.
+
+        Control-socket stream handler for ``events.subscribe``. The first
+        item is an empty batch, sent as soon as the subscription is live,
+        so the client knows it will not miss later notices.
+        """
+        self._loop = asyncio.get_running_loop()
+        sub = _Subscriber()
+        self._subscribers.add(sub)
+        try:
+            yield {"streams": []}
+            while True:
+                await sub.ready.wait()
+                sub.ready.clear()
+                changed, sub.pending = sub.pending, set()
+                yield {"streams": sorted(changed)}
+        finally:
+            self._subscribers.discard(sub)
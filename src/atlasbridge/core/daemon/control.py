@@ -0,0 +1,309 @@
+"""
+Daemon control socket.
+
+A long-lived daemon accepts requests from CLI clients on a Unix stream socket
+in the data directory. Each request and response is one line of JSON::
+
+    → {"method": "sessions.start", "params": {"tool": "claude", ...}}
+    ← {"ok": true, "result": {"session_id": "..."}}
+    ← {"ok": false, "error": "Unknown adapter: 'foo'"}
+
+Handlers are registered per method by the DaemonManager. A handler returns a
+JSON-serialisable result or raises AtlasBridgeError; the error message is
+sent back to the client. A connection may carry any number of requests.
+
+A stream method instead turns the connection into a feed: the server answers
+with one line per item its handler yields, until either side closes::
+
+    → {"method": "events.subscribe"}
+    ← {"ok": true, "event": {"streams": ["audit"]}}
+    ← {"ok": true, "event": {"streams": ["audit", "transcript"]}}
+
+Socket: <data_dir>/atlasbridge.ctl
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import os
+import socket
+from collections.abc import AsyncGenerator, AsyncIterator, Awaitable, Callable
+from pathlib import Path
+from typing import Any
+
+import structlog
+
+from atlasbridge.core.constants import CONTROL_FILENAME
+from atlasbridge.core.exceptions import AtlasBridgeError, ControlError, DaemonUnavailableError
+
+logger = structlog.get_logger()
+
+ControlHandler = Callable[[dict[str, Any]], Awaitable[Any]]
+StreamHandler = Callable[[dict[str, Any]], AsyncGenerator[Any, None]]
+
+_MAX_REQUEST_BYTES = 1024 * 1024
+
+
+def control_socket_path(data_dir: Path) -> Path:
+    return data_dir / CONTROL_FILENAME
+
+
+class ControlServer:
+    """
+    Serves registered methods on the control socket.
+
+    Usage::
+
+        server = ControlServer(data_dir)
+        server.register("sessions.start", handle_start)
+        server.register_stream("events.subscribe", stream_changes)
+        if await server.start():
+            ...
+        await server.close()
+    """
+
+    def __init__(self, data_dir: Path) -> None:
+        self._path = control_socket_path(data_dir)
+        self._handlers: dict[str, ControlHandler] = {}
+        self._streams: dict[str, StreamHandler] = {}
+        # Connections held open by stream methods, closed with the server
+        self._stream_writers: set[asyncio.StreamWriter] = set()
+        self._server: asyncio.AbstractServer | None = None
+
+    @property
+    def active(self) -> bool:
+        return self._server is not None
+
+    def register(self, method: str, handler: ControlHandler) -> None:
+        self._handlers[method] = handler
+
+    def register_stream(self, method: str, handler: StreamHandler) -> None:
+        self._streams[method] = handler
+
+    async def start(self) -> bool:
+        """Bind the socket and start serving.
+
+        Returns False when Unix sockets are unavailable, the path cannot be
+        bound, or another daemon is already answering on it.
+        """
+        if not hasattr(socket, "AF_UNIX"):
+            return False
+        if _socket_answers(self._path):
+            logger.warning("control_socket_in_use", path=str(self._path))
+            return False
+        try:
+            # Not answering, so any file left here belongs to a dead daemon.
+            self._path.unlink(missing_ok=True)
+            self._server = await asyncio.start_unix_server(
+                self._handle_client, path=str(self._path), limit=_MAX_REQUEST_BYTES
+            )
+            os.chmod(self._path, 0o600)
+        except (OSError, NotImplementedError) as exc:
+            logger.warning("control_server_unavailable", path=str(self._path), error=str(exc))
+            await self.close()
+            return False
+        logger.debug("control_server_started", path=str(self._path))
+        return True
+
+    async def close(self) -> None:
+        if self._server is None:
+            return
+        self._server.close()
+        for writer in list(self._stream_writers):
+            writer.close()
+        await self._server.wait_closed()
+        self._server = None
+        self._path.unlink(missing_ok=True)
+
+    async def dispatch(self, request: Any) -> dict[str, Any]:
+        """Run one decoded request and return the response object."""
+        if not isinstance(request, dict) or not isinstance(request.get("method"), str):
+            return {"ok": False, "error": "Malformed request"}
+        method = request["method"]
+        params = request.get("params") or {}
+        handler = self._handlers.get(method)
+        if handler is None:
+            return {"ok": False, "error": f"Unknown method: {method}"}
+        if not isinstance(params, dict):
+            return {"ok": False, "error": "params must be an object"}
+        try:
+            return {"ok": True, "result": await handler(params)}
+        except AtlasBridgeError as exc:
+            return {"ok": False, "error": str(exc)}
+        except Exception as exc:  # noqa: BLE001
+            logger.error("control_handler_error", method=method, error=str(exc))
+            return {"ok": False, "error": f"Internal error: {exc}"}
+
+    async def _handle_client(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            while line := await reader.readline():
+                try:
+                    request = json.loads(line)
+                except ValueError:
+                    response: dict[str, Any] = {"ok": False, "error": "Malformed request"}
+                else:
+                    stream = self._stream_for(request)
+                    if stream is not None:
+                        await self._serve_stream(stream, request, reader, writer)
+                        return
+                    response = await self.dispatch(request)
+                writer.write(json.dumps(response).encode() + b"\n")
+                await writer.drain()
+        except (ConnectionError, asyncio.LimitOverrunError, ValueError):
+            pass
+        finally:
+            writer.close()
+            with contextlib.suppress(ConnectionError):
+                await writer.wait_closed()
+
+    def _stream_for(self, request: Any) -> StreamHandler | None:
+        method = request.get("method") if isinstance(request, dict) else None
+        return self._streams.get(method) if isinstance(method, str) else None
+
+    async def _serve_stream(
+        self,
+        handler: StreamHandler,
+        request: dict[str, Any],
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ) -> None:
+        """Feed the handler's items to the client until either side ends.
+
+        The client's EOF is watched alongside the feed, so an idle stream is
+        torn down as soon as its subscriber goes away.
+        """
+        params = request.get("params") or {}
+        if not isinstance(params, dict):
+            writer.write(b'{"ok": false, "error": "params must be an object"}\n')
+            return
+        pump = asyncio.ensure_future(self._pump(handler(params), request["method"], writer))
+        eof = asyncio.ensure_future(reader.read())
+        self._stream_writers.add(writer)
+        try:
+            await asyncio.wait({pump, eof}, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            self._stream_writers.discard(writer)
+            pump.cancel()
+            eof.cancel()
+            await asyncio.gather(pump, eof, return_exceptions=True)
+
+    @staticmethod
+    async def _pump(
+        items: AsyncGenerator[Any, None], method: str, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            async for item in items:
+                writer.write(json.dumps({"ok": True, "event": item}).encode() + b"\n")
+                # A client that stops reading holds up only its own stream.
+                await writer.drain()
+        except AtlasBridgeError as exc:
+            writer.write(json.dumps({"ok": False, "error": str(exc)}).encode() + b"\n")
+        except ConnectionError:
+            pass
+        except Exception as exc:  # noqa: BLE001
+            logger.error("control_stream_error", method=method, error=str(exc))
+            error = {"ok": False, "error": f"Internal error: {exc}"}
+            writer.write(json.dumps(error).encode() + b"\n")
+        finally:
+            await items.aclose()
+
+
+def _socket_answers(path: Path) -> bool:
+    with contextlib.suppress(OSError):
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(str(path))
+            return True
+    return False
+
+
+def call_daemon(
+    data_dir: Path,
+    method: str,
+    params: dict[str, Any] | None = None,
+    timeout: float = 10.0,
+) -> Any:
+    """Send one request to the daemon owning *data_dir* and return its result.
+
+    Raises DaemonUnavailableError when no daemon is listening and
+    ControlError when the daemon rejects the request.
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        raise DaemonUnavailableError("Unix sockets are not supported on this platform")
+    path = control_socket_path(data_dir)
+    request = json.dumps({"method": method, "params": params or {}}).encode() + b"\n"
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        try:
+            sock.connect(str(path))
+        except OSError as exc:
+            raise DaemonUnavailableError(f"No daemon listening on {path}") from exc
+        try:
+            sock.sendall(request)
+            with sock.makefile("rb") as stream:
+                line = stream.readline(_MAX_REQUEST_BYTES)
+        except OSError as exc:
+            raise ControlError(f"Control request {method!r} failed: {exc}") from exc
+    try:
+        response = json.loads(line)
+    except ValueError as exc:
+        raise ControlError(f"Malformed response to {method!r}") from exc
+    if not response.get("ok"):
+        raise ControlError(response.get("error") or f"Control request {method!r} failed")
+    return response.get("result")
+
+
+def call_running_daemon(
+    data_dir: Path,
+    method: str,
+    params: dict[str, Any] | None = None,
+    timeout: float = 10.0,
+) -> Any | None:
+    """Like call_daemon(), but return None when no daemon is listening.
+
+    Lets a CLI command act as a thin client of a running daemon and fall
+    back to doing the work in-process otherwise.
+    """
+    try:
+        return call_daemon(data_dir, method, params, timeout)
+    except DaemonUnavailableError:
+        return None
+
+
+async def stream_daemon(
+    data_dir: Path,
+    method: str,
+    params: dict[str, Any] | None = None,
+) -> AsyncIterator[Any]:
+    """Subscribe to a stream method and yield each item the daemon sends.
+
+    Raises DaemonUnavailableError when no daemon is listening and
+    ControlError when the daemon rejects the request. Ends when the
+    daemon closes the stream.
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        raise DaemonUnavailableError("Unix sockets are not supported on this platform")
+    path = control_socket_path(data_dir)
+    try:
+        reader, writer = await asyncio.open_unix_connection(str(path), limit=_MAX_REQUEST_BYTES)
+    except OSError as exc:
+        raise DaemonUnavailableError(f"No daemon listening on {path}") from exc
+    try:
+        request = {"method": method, "params": params or {}}
+        writer.write(json.dumps(request).encode() + b"\n")
+        await writer.drain()
+        while line := await reader.readline():
+            try:
+                response = json.loads(line)
+            except ValueError as exc:
+                raise ControlError(f"Malformed response to {method!r}") from exc
+            if not response.get("ok"):
+                raise ControlError(response.get("error") or f"Control stream {method!r} failed")
+            yield response.get("event")
+    finally:
+        writer.close()
+        with contextlib.suppress(ConnectionError):
+            await writer.wait_closed()
@@ -8,8 +8,16 @@ daemon process lifetime:
   - Starts the notification channel
   - Manages sessions and the prompt router
   - Runs the reply consumer loop
+  - Serves the control socket: session submission, operator actions and
+    change notices for committed audit/transcript rows
   - Handles graceful shutdown on SIGTERM/SIGINT
 
+In single-session mode (``atlasbridge run``) the daemon supervises one tool
+and exits with it. In multi-session mode (``atlasbridge start
+--multi-session``) it supervises any number of tool sessions submitted over
+the control socket. Each session runs as its own asyncio task group, sharing
+the database, channel, routers and policy.
+
 The daemon is a long-running asyncio process started by `atlasbridge start`
 and managed by launchd (macOS) or systemd (Linux).
 
@@ -21,12 +29,20 @@ from __future__ import annotations
 import asyncio
 import os
 import signal
+import time
 import uuid
+from datetime import UTC, datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 import structlog
 
+from atlasbridge.core.daemon.changes import ChangeFeed
+from atlasbridge.core.daemon.control import ControlServer
+from atlasbridge.core.daemon.wakeup import WAKE_DIRECTIVE, WAKE_REPLY, WakeupListener
+from atlasbridge.core.exceptions import AdapterError, SessionError
+from atlasbridge.core.metrics import Histogram
+
 if TYPE_CHECKING:
     from atlasbridge.adapters.base import BaseAdapter
     from atlasbridge.channels.base import BaseChannel
@@ -41,6 +57,24 @@ logger = structlog.get_logger()
 
 _DEFAULT_DATA_DIR = Path.home() / ".atlasbridge"
 
+# Group commit: defer SQLite commits by up to this long, or until this many
+# writes are queued (see atlasbridge.core.store.database).
+_DB_COMMIT_DELAY_S = 0.005
+_DB_COMMIT_BATCH_SIZE = 64
+
+# Dashboard replies and operator directives are pushed over the wake-up socket
+# (atlasbridge.core.daemon.wakeup); the DB is still polled as a fallback, at
+# the slow interval while the socket is up and the fast one if it is not.
+_DB_POLL_FALLBACK_S = 5.0
+_DB_POLL_NO_WAKEUP_S = 0.5
+
+# Prompts expire at their own deadline (atlasbridge.core.prompt.registry);
+# the TTL sweeper never sleeps longer than this between checks.
+_TTL_SWEEP_MAX_S = 60.0
+
+# Reply-to-inject latency: prompt resolved_at → PTY injection.
+_REPLY_LATENCY_BUCKETS_MS = (5.0, 10.0, 25.0, 50.0, 100.0, 250.0, 500.0, 1000.0, 5000.0)
+
 
 class DaemonManager:
     """
@@ -69,6 +103,12 @@ class DaemonManager:
         self._conversation_registry: Any = None  # ConversationRegistry
         self._autopilot_trace: Any = None  # DecisionTrace | None
         self._transcript_writers: dict[str, Any] = {}  # session_id → TranscriptWriter
+        self._wakeup = WakeupListener(self._data_dir)
+        self._reply_latency_ms = Histogram(_REPLY_LATENCY_BUCKETS_MS)
+        self._control = ControlServer(self._data_dir)
+        self._changes = ChangeFeed()
+        self._multi_session: bool = config.get("multi_session", False)
+        self._session_tasks: dict[str, asyncio.Task[None]] = {}  # multi-session mode
 
     async def start(self) -> None:
         """Start all subsystems and run until shutdown."""
@@ -114,8 +154,14 @@ class DaemonManager:
         from atlasbridge.core.store.database import Database
 
         db_path = self._data_dir / "atlasbridge.db"
-        self._db = Database(db_path)
+        self._db = Database(
+            db_path,
+            commit_delay=_DB_COMMIT_DELAY_S,
+            commit_batch_size=_DB_COMMIT_BATCH_SIZE,
+        )
         self._db.connect()
+        # Committed audit/transcript rows are announced on events.subscribe
+        self._db.add_commit_listener(self._changes.publish)
         logger.info("database_connected", path=str(db_path))
 
     async def _reload_pending_prompts(self) -> None:
@@ -301,21 +347,8 @@ class DaemonManager:
 
     async def _run_adapter_session(self) -> None:
         """
-        Launch the adapter/PTY for the configured tool, run until the child
-        process exits, then trigger daemon shutdown.
-
-        This is the critical wiring between the PTY supervisor and the
-        PromptRouter:
-
-            PTY output bytes
-              → PromptDetector.analyse()
-                → PromptEvent
-                  → PromptRouter.route_event()
-                    → Channel (Telegram / Slack)
-                      → Reply
-                        → PromptRouter.handle_reply()
-                          → adapter.inject_reply()
-                            → PTY stdin
+        Single-session mode: run the configured tool until the child process
+        exits, then trigger daemon shutdown.
         """
         tool = self._config.get("tool", "")
         command = self._config.get("command", [])
@@ -323,23 +356,50 @@ class DaemonManager:
             logger.info("channel_only_mode")
             return
 
+        try:
+            adapter, session_id = await self._start_adapter_session(
+                tool,
+                list(command),
+                cwd=self._config.get("cwd", "") or "",
+                label=self._config.get("session_label") or self._config.get("label", "") or "",
+            )
+        except (AdapterError, SessionError) as exc:
+            logger.error("session_start_failed", tool=tool, error=str(exc))
+            return
+
+        try:
+            await self._supervise_adapter_session(adapter, session_id, tool)
+        finally:
+            await self.stop()
+
+    async def _start_adapter_session(
+        self,
+        tool: str,
+        command: list[str],
+        cwd: str = "",
+        label: str = "",
+    ) -> tuple[BaseAdapter, str]:
+        """Register a session and launch its PTY; return (adapter, session_id).
+
+        Raises AdapterError for an unknown adapter or a failed launch.
+        """
+        import atlasbridge.adapters  # noqa: F401 — registers all built-in adapters
         from atlasbridge.adapters.base import AdapterRegistry
         from atlasbridge.core.session.models import Session
 
+        if self._session_manager is None:
+            raise SessionError("Session manager not initialised")
         try:
             adapter_cls = AdapterRegistry.get(tool)
         except KeyError as exc:
             logger.error("adapter_not_found", tool=tool, error=str(exc))
-            return
+            raise AdapterError(f"Unknown adapter: {tool!r}") from exc
 
         adapter = adapter_cls()
         adapter.experimental = self._config.get("experimental", False)  # type: ignore[attr-defined]
         session_id = str(uuid.uuid4())
 
-        session = Session(session_id=session_id, tool=tool, command=list(command))
-        if self._session_manager is None:
-            logger.error("session_manager_not_initialized")
-            return
+        session = Session(session_id=session_id, tool=tool, command=list(command), cwd=cwd)
         self._session_manager.register(session)
         self._adapters[session_id] = adapter
 
@@ -347,11 +407,16 @@ class DaemonManager:
 
         # Persist session to DB so the dashboard can see it
         if self._db is not None:
-            cwd = self._config.get("cwd", "") or ""
-            label = self._config.get("session_label", "") or ""
             self._db.save_session(session_id, tool, list(command), cwd=cwd, label=label)
 
-        await adapter.start_session(session_id=session_id, command=list(command))
+        try:
+            await adapter.start_session(session_id=session_id, command=list(command), cwd=cwd)
+        except Exception as exc:
+            self._adapters.pop(session_id, None)
+            self._session_manager.mark_ended(session_id, crashed=True)
+            if self._db is not None:
+                self._db.update_session(session_id, status="crashed")
+            raise AdapterError(f"Failed to launch {command[0]!r}: {exc}") from exc
 
         # Mark the session as running once the child PID is known
         ctx = adapter.snapshot_context(session_id)
@@ -359,9 +424,38 @@ class DaemonManager:
         if pid and pid > 0:
             self._session_manager.mark_running(session_id, pid)
             if self._db is not None:
-                import os as _os
+                self._db.update_session(session_id, status="running", pid=pid)
 
-                self._db.update_session(session_id, status="running", pid=pid or _os.getpid())
+        return adapter, session_id
+
+    async def _supervise_adapter_session(
+        self,
+        adapter: BaseAdapter,
+        session_id: str,
+        tool: str,
+        autonomy_mode: str = "",
+    ) -> None:
+        """
+        Pump one session's PTY output until the child process exits.
+
+        This is the critical wiring between the PTY supervisor and the
+        PromptRouter:
+
+            PTY output bytes
+              → OutputPipeline.feed() (decoded and redacted once; feeds forwarder/transcript)
+              → PromptDetector.analyse_chunk()
+                → PromptEvent
+                  → PromptRouter.route_event()
+                    → Channel (Telegram / Slack)
+                      → Reply
+                        → PromptRouter.handle_reply()
+                          → adapter.inject_reply()
+                            → PTY stdin
+
+        Everything here is per-session state; the channel, routers, policy
+        and database are shared by all sessions in the daemon.
+        """
+        assert self._session_manager is not None
 
         # Re-use the detector the adapter already created for this session.
         # This ensures inject_reply() → mark_injected() shares the same state
@@ -375,8 +469,9 @@ class DaemonManager:
         event_q: asyncio.Queue[Any] = asyncio.Queue()
         eof_reached = asyncio.Event()
 
-        # Use intent router when available, fall back to prompt router
-        router = self._intent_router or self._router
+        # Use intent router when available, fall back to prompt router.
+        # A session started with autonomy mode "off" always goes to the human.
+        router = self._router if autonomy_mode == "off" else self._intent_router or self._router
 
         # Wire InteractionEngine and OutputForwarder for Conversation UX v2
         output_forwarder = None
@@ -450,23 +545,31 @@ class DaemonManager:
             transcript_writer = TranscriptWriter(self._db, session_id)
             self._transcript_writers[session_id] = transcript_writer
 
+        # Each chunk is decoded, ANSI-stripped and secret-redacted once, then shared
+        from atlasbridge.core.prompt.sanitize import OutputPipeline
+        from atlasbridge.core.security.redactor import StreamingRedactor
+
+        pipeline = OutputPipeline(redactor=StreamingRedactor())
+        # Output for Chat Mode
+        if output_forwarder is not None:
+            pipeline.subscribe(output_forwarder.feed_chunk)
+        # Output for the dashboard live transcript
+        if transcript_writer is not None:
+            pipeline.subscribe(transcript_writer.feed_chunk)
+
         async def _read_loop() -> None:
             try:
                 while True:
-                    chunk = await adapter.read_stream(session_id)
-                    if not chunk:
+                    raw = await adapter.read_stream(session_id)
+                    if not raw:
                         break
+                    chunk = pipeline.feed(raw)
                     tty_blocked = await adapter.await_input_state(session_id)
-                    ev = detector.analyse(chunk, tty_blocked=tty_blocked)
+                    ev = detector.analyse_chunk(chunk, tty_blocked=tty_blocked)
                     if ev is not None and router is not None:
                         await event_q.put(ev)
-                    # Feed output to forwarder for Chat Mode
-                    if output_forwarder is not None:
-                        output_forwarder.feed(chunk)
-                    # Feed output to transcript writer for dashboard
-                    if transcript_writer is not None:
-                        transcript_writer.feed(chunk)
             finally:
+                pipeline.flush()
                 eof_reached.set()
 
         async def _route_events() -> None:
@@ -479,14 +582,19 @@ class DaemonManager:
                     continue
 
         async def _silence_watchdog() -> None:
-            interval = 1.0
+            # Check often enough that Signal 3 fires close to its threshold,
+            # which the adapter shortens once the TTY confirms blocked-on-read.
             while not eof_reached.is_set():
+                interval = min(1.0, detector.silence_threshold_s / 3)
                 await asyncio.sleep(interval)
+                # Release the redactor's held-back tail once output pauses
+                if time.monotonic() - pipeline.last_feed_at >= interval:
+                    pipeline.flush()
                 try:
-                    running = await adapter.await_input_state(session_id)
+                    waiting = await adapter.await_input_state(session_id)
                 except Exception:  # noqa: BLE001
-                    running = False
-                ev = detector.check_silence(process_running=running)
+                    waiting = False
+                ev = detector.check_silence(process_running=waiting)
                 if ev is not None and router is not None:
                     await router.route_event(ev)
 
@@ -507,8 +615,11 @@ class DaemonManager:
             if self._db is not None:
                 self._db.update_session(session_id, status="completed")
 
-            # Clean up transcript writer
+            # Clean up per-session state
             self._transcript_writers.pop(session_id, None)
+            if self._multi_session:
+                # A single-session daemon leaves it for _cleanup() to terminate
+                self._adapters.pop(session_id, None)
 
             # Unbind conversation threads for this session
             if self._conversation_registry is not None:
@@ -525,7 +636,6 @@ class DaemonManager:
                     pass  # Best-effort; channel may already be closed
 
             await adapter.terminate_session(session_id)
-            await self.stop()
 
     # ------------------------------------------------------------------
     # Chat session (direct LLM API mode)
@@ -804,6 +914,7 @@ class DaemonManager:
         is_chat_mode = mode == "chat"
         is_agent_mode = mode == "agent"
 
+        await self._start_control_server()
         if is_agent_mode:
             tasks.append(asyncio.create_task(self._run_agent_session(), name="agent_session"))
         elif is_chat_mode:
@@ -811,6 +922,7 @@ class DaemonManager:
             tasks.append(asyncio.create_task(self._run_chat_session(), name="chat_session"))
         else:
             # Adapter (PTY) mode: reply consumer + adapter session
+            self._wakeup.start()
             if self._channel and router:
                 tasks.append(asyncio.create_task(self._reply_consumer(), name="reply_consumer"))
             elif not self._channel and router:
@@ -819,7 +931,9 @@ class DaemonManager:
             # Operator directives — always active (dashboard free-text input)
             directive_task = self._db_directive_poller()
             tasks.append(asyncio.create_task(directive_task, name="db_directive_poller"))
-            if self._config.get("tool") and self._config.get("command"):
+            if self._multi_session:
+                logger.info("multi_session_mode", control=self._control.active)
+            elif self._config.get("tool") and self._config.get("command"):
                 tasks.append(
                     asyncio.create_task(self._run_adapter_session(), name="adapter_session")
                 )
@@ -828,10 +942,87 @@ class DaemonManager:
 
         await self._shutdown_event.wait()
 
+        tasks.extend(self._session_tasks.values())
         for t in tasks:
             t.cancel()
         await asyncio.gather(*tasks, return_exceptions=True)
 
+    # ------------------------------------------------------------------
+    # Control socket / multi-session mode
+    # ------------------------------------------------------------------
+
+    async def _start_control_server(self) -> None:
+        from atlasbridge.core.daemon.operations import control_handlers
+
+        self._control.register("daemon.status", self._control_status)
+        self._control.register("sessions.start", self._control_start_session)
+        self._control.register_stream("events.subscribe", self._changes.subscribe)
+        # Operator actions (autopilot, policy, session control) run here
+        # instead of in a CLI subprocess per request.
+        handlers = control_handlers(self._data_dir, lambda: self._db, self._wakeup.notify)
+        for method, handler in handlers.items():
+            self._control.register(method, handler)
+        await self._control.start()
+
+    async def _control_status(self, params: dict[str, Any]) -> dict[str, Any]:
+        return {
+            "pid": os.getpid(),
+            "multi_session": self._multi_session,
+            "sessions": sorted(self._adapters),
+        }
+
+    async def _control_start_session(self, params: dict[str, Any]) -> dict[str, Any]:
+        """Start a tool session in this daemon (multi-session mode only)."""
+        if not self._multi_session:
+            raise SessionError("Daemon is not in multi-session mode")
+        if not self._running:
+            raise SessionError("Daemon is shutting down")
+        tool = params.get("tool")
+        command = params.get("command") or [tool]
+        if not isinstance(tool, str) or not tool:
+            raise SessionError("'tool' is required")
+        if not isinstance(command, list) or not all(isinstance(a, str) for a in command):
+            raise SessionError("'command' must be a list of strings")
+
+        session_id = await self._spawn_session(
+            tool,
+            command,
+            cwd=str(params.get("cwd") or ""),
+            label=str(params.get("label") or ""),
+            autonomy_mode=str(params.get("mode") or ""),
+        )
+        pid = self._adapters[session_id].snapshot_context(session_id).get("pid", -1)
+        return {"session_id": session_id, "pid": pid, "daemon_pid": os.getpid()}
+
+    async def _spawn_session(
+        self,
+        tool: str,
+        command: list[str],
+        cwd: str = "",
+        label: str = "",
+        autonomy_mode: str = "",
+    ) -> str:
+        """Launch a session and supervise it in a background task; return its ID."""
+        adapter, session_id = await self._start_adapter_session(tool, command, cwd=cwd, label=label)
+        task = asyncio.create_task(
+            self._supervise_adapter_session(adapter, session_id, tool, autonomy_mode),
+            name=f"session-{session_id[:8]}",
+        )
+        self._session_tasks[session_id] = task
+        task.add_done_callback(lambda t: self._on_session_done(session_id, t))
+        return session_id
+
+    def _on_session_done(self, session_id: str, task: asyncio.Task[None]) -> None:
+        self._session_tasks.pop(session_id, None)
+        if self._session_manager is not None:
+            self._session_manager.prune_terminal()
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(
+                "session_task_failed",
+                session_id=session_id[:8],
+                error=repr(task.exception()),
+            )
+
     async def _reply_consumer(self) -> None:
         """Consume replies from the channel and hand them to the router."""
         assert self._channel is not None
@@ -843,18 +1034,36 @@ class DaemonManager:
             except Exception as exc:  # noqa: BLE001
                 logger.error("reply_handling_error", error=str(exc))
 
+    async def _wait_for_wakeup(self, kind: str) -> None:
+        """Block until a wake-up datagram of *kind* arrives or the fallback poll is due."""
+        if self._wakeup.active:
+            await self._wakeup.wait(kind, _DB_POLL_FALLBACK_S)
+        else:
+            await asyncio.sleep(_DB_POLL_NO_WAKEUP_S)
+
+    def _observe_reply_latency(self, row: Any) -> float | None:
+        """Record resolved_at → injection latency for a dashboard reply, in ms."""
+        try:
+            resolved_at = datetime.fromisoformat(row["resolved_at"])
+        except (TypeError, ValueError):
+            return None
+        latency_ms = (datetime.now(UTC) - resolved_at).total_seconds() * 1000
+        self._reply_latency_ms.observe(latency_ms)
+        return latency_ms
+
     async def _db_reply_poller(self) -> None:
-        """Poll DB for dashboard-originated replies (channelless mode).
+        """Deliver dashboard-originated replies (channelless mode).
 
         When no channel is configured, the dashboard Chat page is the relay.
         Users reply via ``POST /api/chat/reply`` → ``atlasbridge sessions reply``
-        which atomically sets ``status = 'reply_received'`` in the DB.
-        This loop detects those rows and injects them into the PTY.
+        which atomically sets ``status = 'reply_received'`` in the DB and then
+        sends a wake-up datagram. This loop detects those rows and injects
+        them into the PTY.
         """
         router = self._intent_router or self._router
         assert router is not None
         while self._running:
-            await asyncio.sleep(0.5)
+            await self._wait_for_wakeup(WAKE_REPLY)
             if self._db is None:
                 continue
             try:
@@ -867,23 +1076,31 @@ class DaemonManager:
                         value=row["response_normalized"],
                     )
                     if ok:
+                        latency_ms = self._observe_reply_latency(row)
                         tw = self._transcript_writers.get(sid)
                         if tw is not None:
                             tw.record_input(row["response_normalized"], row["id"])
                         self._db.update_prompt_status(row["id"], "resolved")
+                        logger.info(
+                            "dashboard_reply_injected",
+                            prompt_id=row["id"][:8],
+                            session_id=sid[:8],
+                            latency_ms=None if latency_ms is None else round(latency_ms, 1),
+                        )
             except Exception as exc:  # noqa: BLE001
                 logger.error("db_reply_poller_error", error=str(exc))
 
     async def _db_directive_poller(self) -> None:
-        """Poll DB for operator directives (free-text input from dashboard).
+        """Deliver operator directives (free-text input from dashboard).
 
         The dashboard Chat page sends messages via
         ``POST /api/sessions/:id/message`` → ``atlasbridge sessions message``
-        which inserts a row into operator_directives with status='pending'.
-        This loop detects those rows and injects them into the PTY.
+        which inserts a row into operator_directives with status='pending'
+        and then sends a wake-up datagram. This loop detects those rows and
+        injects them into the PTY.
         """
         while self._running:
-            await asyncio.sleep(0.5)
+            await self._wait_for_wakeup(WAKE_DIRECTIVE)
             if self._db is None:
                 continue
             try:
@@ -930,12 +1147,15 @@ class DaemonManager:
                 logger.error("db_directive_poller_error", error=str(exc))
 
     async def _ttl_sweeper(self) -> None:
-        """Periodically expire overdue prompts."""
+        """Expire each prompt when its TTL elapses."""
         while self._running:
-            await asyncio.sleep(10.0)
             router = self._intent_router or self._router
-            if router:
-                await router.expire_overdue()
+            if router is None:
+                await asyncio.sleep(_TTL_SWEEP_MAX_S)
+                continue
+            await router.wait_for_expiry(_TTL_SWEEP_MAX_S)
+            await router.expire_overdue()
+            await asyncio.sleep(0)  # yield even if the next deadline is already due
 
     # ------------------------------------------------------------------
     # Signal handling
@@ -965,7 +1185,12 @@ class DaemonManager:
 
     async def _cleanup(self) -> None:
         self._running = False
+        await self._control.close()
+        self._wakeup.close()
+        if self._reply_latency_ms.count:
+            logger.info("dashboard_reply_latency_ms", **self._reply_latency_ms.snapshot())
         if self._channel:
             await self._channel.close()
         if self._db:
             self._db.close()
+            logger.info("db_group_commit_stats", **self._db.commit_stats.snapshot())
@@ -0,0 +1,440 @@
+"""
+Operator actions shared by the CLI and the daemon control socket.
+
+Each action is a plain function. A running DaemonManager serves them on its
+control socket (see ``control_handlers``), so the dashboard, the expert agent
+and the CLI can run them without starting a Python process per request. The
+CLI commands call the same functions in-process when no daemon is listening.
+
+Session actions return the JSON payload the CLI prints. An outcome the CLI
+treats as fatal raises OperationError; softer outcomes (session already
+stopped, wrong state) come back as ``{"ok": False, "error": ...}``.
+
+Control-socket methods::
+
+    autopilot.enable    autopilot.disable    autopilot.mode
+    policy.validate     policy.test
+    sessions.reply      sessions.message
+    sessions.stop       sessions.pause       sessions.resume
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import signal
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from atlasbridge.core.autopilot.state import STATE_FILENAME, AutopilotState
+from atlasbridge.core.daemon.control import ControlHandler
+from atlasbridge.core.daemon.wakeup import WAKE_DIRECTIVE, WAKE_REPLY, notify_daemon
+from atlasbridge.core.exceptions import OperationError
+
+AUTONOMY_MODES = ("off", "assist", "full")
+
+_TERMINAL_STATUSES = ("completed", "crashed", "canceled")
+_MESSAGEABLE_STATUSES = ("running", "starting", "awaiting_reply")
+_PAUSABLE_STATUSES = ("running", "awaiting_reply")
+
+Wake = Callable[[str], object]
+
+
+# ---------------------------------------------------------------------------
+# Autopilot
+# ---------------------------------------------------------------------------
+
+
+def read_autopilot_state(data_dir: Path) -> AutopilotState:
+    p = data_dir / STATE_FILENAME
+    if not p.exists():
+        return AutopilotState.RUNNING
+    try:
+        data = json.loads(p.read_text(encoding="utf-8"))
+        return AutopilotState(data.get("state", "running"))
+    except (OSError, json.JSONDecodeError, ValueError):
+        return AutopilotState.RUNNING
+
+
+def write_autopilot_state(data_dir: Path, state: AutopilotState) -> None:
+    p = data_dir / STATE_FILENAME
+    p.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+    p.write_text(json.dumps({"state": state.value}), encoding="utf-8")
+
+
+def set_autopilot_enabled(data_dir: Path, enabled: bool) -> dict[str, Any]:
+    """Resume (*enabled*) or pause the autopilot kill switch."""
+    target = AutopilotState.RUNNING if enabled else AutopilotState.PAUSED
+    current = read_autopilot_state(data_dir)
+    if current == target:
+        message = "Autopilot is already running." if enabled else "Autopilot is already paused."
+        return {"state": target.value, "changed": False, "message": message}
+    if current == AutopilotState.STOPPED:
+        hint = " Start the daemon first." if enabled else ""
+        raise OperationError(f"Autopilot is stopped (daemon not running).{hint}")
+    write_autopilot_state(data_dir, target)
+    if enabled:
+        message = "Autopilot enabled (state: running)."
+    else:
+        message = "Autopilot paused — all prompts will be forwarded to you."
+    return {"state": target.value, "changed": True, "message": message}
+
+
+def set_autonomy_mode(data_dir: Path, mode: str) -> dict[str, Any]:
+    """Set ``autonomy_mode`` in the data directory's policy.yaml."""
+    from atlasbridge.core.policy.parser import PolicyParseError, load_policy
+
+    mode = mode.lower()
+    if mode not in AUTONOMY_MODES:
+        raise OperationError(f"Invalid mode: {mode!r}. Must be off, assist or full")
+    policy_path = data_dir / "policy.yaml"
+    if not policy_path.exists():
+        raise OperationError(
+            f"No policy.yaml found at {policy_path}.\n"
+            "Create one first or copy from: atlasbridge policy validate --help"
+        )
+
+    # Simple in-place YAML field update (avoid full re-serialise to preserve comments)
+    try:
+        text = policy_path.read_text(encoding="utf-8")
+    except OSError as exc:
+        raise OperationError(f"Cannot read policy file: {exc}") from exc
+
+    # Quoted: a bare ``off`` is read by YAML as boolean false.
+    updated = re.sub(
+        r"^(autonomy_mode\s*:\s*).*$",
+        rf'\g<1>"{mode}"',
+        text,
+        flags=re.MULTILINE,
+    )
+    if updated == text:
+        # Field not found — append
+        updated = text.rstrip() + f'\nautonomy_mode: "{mode}"\n'
+
+    try:
+        policy_path.write_text(updated, encoding="utf-8")
+    except OSError as exc:
+        raise OperationError(f"Cannot write policy file: {exc}") from exc
+
+    # Validate after write
+    try:
+        load_policy(policy_path)
+    except PolicyParseError as exc:
+        raise OperationError(f"Policy is now invalid: {exc}") from exc
+
+    return {
+        "mode": mode,
+        "path": str(policy_path),
+        "message": f"Autonomy mode set to {mode!r} in {policy_path}",
+    }
+
+
+# ---------------------------------------------------------------------------
+# Policy
+# ---------------------------------------------------------------------------
+
+
+def validate_policy(path: str, check_overlaps: bool = False) -> dict[str, Any]:
+    """Parse a policy file; an invalid policy is a result, not an error."""
+    from atlasbridge.core.policy.parser import PolicyParseError, load_policy
+
+    try:
+        policy = load_policy(path)
+    except PolicyParseError as exc:
+        return {"valid": False, "error": str(exc)}
+
+    overlaps: list[str] | None = None
+    if check_overlaps:
+        from atlasbridge.core.policy.overlap import detect_overlaps
+
+        overlaps = [str(w) for w in detect_overlaps(policy)]
+    return {
+        "valid": True,
+        "name": policy.name,
+        "version": getattr(policy, "policy_version", "?"),
+        "rules": len(policy.rules),
+        "mode": policy.autonomy_mode.value,
+        "hash": policy.content_hash(),
+        "overlaps": overlaps,
+    }
+
+
+def run_policy_test(
+    path: str,
+    prompt_text: str,
+    prompt_type: str = "yes_no",
+    confidence: str = "high",
+    tool_id: str = "*",
+    repo: str = "",
+    session_tag: str = "",
+    explain: bool = False,
+    debug: bool = False,
+) -> dict[str, Any]:
+    """Evaluate a policy against a synthetic prompt; ``output`` is the CLI text."""
+    from atlasbridge.core.policy.evaluator import evaluate
+    from atlasbridge.core.policy.explain import debug_policy, explain_decision, explain_policy
+    from atlasbridge.core.policy.parser import PolicyParseError, load_policy
+
+    try:
+        policy = load_policy(path)
+    except PolicyParseError as exc:
+        raise OperationError(str(exc)) from exc
+
+    context: dict[str, Any] = {
+        "prompt_text": prompt_text,
+        "prompt_type": prompt_type,
+        "confidence": confidence,
+        "tool_id": tool_id,
+        "repo": repo,
+        "session_tag": session_tag,
+    }
+    if debug:
+        return {"output": debug_policy(policy=policy, **context)}
+
+    decision = evaluate(
+        policy=policy, prompt_id="test-prompt", session_id="test-session", **context
+    )
+    output = explain_decision(decision)
+    if explain:
+        output = f"{explain_policy(policy=policy, **context)}\n\n{output}"
+    return {
+        "output": output,
+        "action_type": decision.action_type,
+        "matched_rule_id": decision.matched_rule_id,
+    }
+
+
+# ---------------------------------------------------------------------------
+# Sessions
+# ---------------------------------------------------------------------------
+
+
+def resolve_session_id(db: Any, session_id: str) -> str | None:
+    """Resolve a short or full session ID to a full session ID."""
+    row = db.get_session(session_id)
+    if row is not None:
+        return row["id"]
+    # Try prefix match
+    matches = db.find_session_ids(session_id)
+    if len(matches) == 1:
+        return matches[0]
+    return None
+
+
+def _session_row(db: Any, session_id: str) -> tuple[str, Any]:
+    full_id = resolve_session_id(db, session_id)
+    row = None if full_id is None else db.get_session(full_id)
+    if full_id is None or row is None:
+        raise OperationError(f"Session not found: {session_id}")
+    return full_id, row
+
+
+def _wake(db: Any, wake: Wake | None) -> Wake:
+    return wake or (lambda kind: notify_daemon(db.path.parent, kind))
+
+
+def reply_to_prompt(
+    db: Any, session_id: str, prompt_id: str, value: str, wake: Wake | None = None
+) -> dict[str, Any]:
+    """Claim a pending prompt with *value* and wake the daemon to inject it."""
+    full_session_id = resolve_session_id(db, session_id)
+    if full_session_id is None:
+        raise OperationError(f"Session not found: {session_id}")
+
+    # Resolve short prompt ID (prefix match against pending prompts)
+    prompt = db.get_prompt(prompt_id)
+    if prompt is None:
+        pending = db.list_pending_prompts(full_session_id)
+        matches = [p for p in pending if p["id"].startswith(prompt_id)]
+        if len(matches) > 1:
+            raise OperationError(f"Ambiguous prompt ID: {prompt_id}")
+        if matches:
+            prompt = db.get_prompt(matches[0]["id"])
+    if prompt is None:
+        raise OperationError(f"Prompt not found: {prompt_id}")
+    if prompt["status"] != "awaiting_reply":
+        raise OperationError(f"Prompt is not awaiting reply (status: {prompt['status']})")
+    if prompt["session_id"] != full_session_id:
+        raise OperationError("Prompt does not belong to this session")
+
+    rows_updated = db.decide_prompt(
+        prompt_id=prompt["id"],
+        new_status="reply_received",
+        channel_identity="dashboard",
+        response_normalized=value,
+        nonce=prompt["nonce"],
+    )
+    if rows_updated == 0:
+        raise OperationError("Prompt could not be claimed (expired or already resolved)")
+
+    _wake(db, wake)(WAKE_REPLY)
+    return {"ok": True, "prompt_id": prompt["id"], "session_id": full_session_id}
+
+
+def message_session(
+    db: Any, session_id: str, text: str, wake: Wake | None = None
+) -> dict[str, Any]:
+    """Queue a free-text operator directive for a running session."""
+    full_session_id, row = _session_row(db, session_id)
+    if row["status"] not in _MESSAGEABLE_STATUSES:
+        raise OperationError("Session is not running")
+
+    directive_id = db.insert_operator_directive(full_session_id, text)
+    _wake(db, wake)(WAKE_DIRECTIVE)
+    return {"ok": True, "directive_id": directive_id, "session_id": full_session_id}
+
+
+def stop_session(db: Any, session_id: str) -> dict[str, Any]:
+    """Send SIGTERM to a session's process and mark it canceled."""
+    full_id, row = _session_row(db, session_id)
+    pid = row["pid"]
+    status = row["status"]
+
+    if status in _TERMINAL_STATUSES:
+        return {"ok": False, "error": f"Session already {status}"}
+
+    if not pid:
+        # No PID means the session never fully started — mark it canceled.
+        db.update_session(full_id, status="canceled")
+        return {"ok": True, "session_id": full_id, "action": "canceled"}
+
+    try:
+        os.kill(pid, signal.SIGTERM)
+    except ProcessLookupError:
+        db.update_session(full_id, status="canceled")
+        return {
+            "ok": True,
+            "session_id": full_id,
+            "action": "canceled",
+            "note": f"Process {pid} not found (already stopped)",
+        }
+    except PermissionError as exc:
+        raise OperationError(f"Permission denied to stop PID {pid}") from exc
+    # Also update DB directly — the daemon's finally block may not run
+    # if the parent process is killed or crashes.
+    db.update_session(full_id, status="canceled")
+    return {"ok": True, "session_id": full_id, "pid": pid, "signal": "SIGTERM"}
+
+
+def pause_session(db: Any, session_id: str) -> dict[str, Any]:
+    """Send SIGSTOP to a running session's process."""
+    full_id, row = _session_row(db, session_id)
+    if row["status"] not in _PAUSABLE_STATUSES:
+        return {"ok": False, "error": f"Cannot pause session in '{row['status']}' state"}
+    return _signal_session(db, full_id, row["pid"], signal.SIGSTOP, "pause", "paused")
+
+
+def resume_session(db: Any, session_id: str) -> dict[str, Any]:
+    """Send SIGCONT to a paused session's process."""
+    full_id, row = _session_row(db, session_id)
+    if row["status"] != "paused":
+        return {"ok": False, "error": f"Session is not paused (status: {row['status']})"}
+    return _signal_session(db, full_id, row["pid"], signal.SIGCONT, "resume", "running")
+
+
+def _signal_session(
+    db: Any, full_id: str, pid: int | None, sig: signal.Signals, verb: str, new_status: str
+) -> dict[str, Any]:
+    if not pid:
+        raise OperationError("No PID recorded for session")
+    try:
+        os.kill(pid, sig)
+    except ProcessLookupError:
+        return {"ok": False, "error": f"Process {pid} not found"}
+    except PermissionError as exc:
+        raise OperationError(f"Permission denied to {verb} PID {pid}") from exc
+    db.update_session(full_id, status=new_status)
+    return {"ok": True, "session_id": full_id, "pid": pid, "signal": sig.name}
+
+
+# ---------------------------------------------------------------------------
+# Control-socket methods
+# ---------------------------------------------------------------------------
+
+
+def _str_param(params: dict[str, Any], name: str, default: str | None = None) -> str:
+    value = params.get(name, default)
+    if not isinstance(value, str) or (default is None and not value):
+        raise OperationError(f"{name!r} is required")
+    return value
+
+
+def control_handlers(
+    data_dir: Path, get_db: Callable[[], Any], wake: Wake | None = None
+) -> dict[str, ControlHandler]:
+    """Control-socket methods for a daemon serving *data_dir*.
+
+    *get_db* returns the daemon's open Database (or None); *wake* signals
+    the daemon's reply/directive pollers in-process.
+    """
+
+    def db() -> Any:
+        database = get_db()
+        if database is None:
+            raise OperationError("Database not found")
+        return database
+
+    async def autopilot_enable(params: dict[str, Any]) -> dict[str, Any]:
+        return set_autopilot_enabled(data_dir, True)
+
+    async def autopilot_disable(params: dict[str, Any]) -> dict[str, Any]:
+        return set_autopilot_enabled(data_dir, False)
+
+    async def autopilot_mode(params: dict[str, Any]) -> dict[str, Any]:
+        return set_autonomy_mode(data_dir, _str_param(params, "mode"))
+
+    async def policy_validate(params: dict[str, Any]) -> dict[str, Any]:
+        return validate_policy(
+            _str_param(params, "path"), check_overlaps=bool(params.get("check_overlaps"))
+        )
+
+    async def policy_test(params: dict[str, Any]) -> dict[str, Any]:
+        return run_policy_test(
+            _str_param(params, "path"),
+            _str_param(params, "prompt"),
+            prompt_type=_str_param(params, "prompt_type", "yes_no"),
+            confidence=_str_param(params, "confidence", "high"),
+            tool_id=_str_param(params, "tool", "*"),
+            repo=_str_param(params, "repo", ""),
+            session_tag=_str_param(params, "session_tag", ""),
+            explain=bool(params.get("explain")),
+            debug=bool(params.get("debug")),
+        )
+
+    async def sessions_reply(params: dict[str, Any]) -> dict[str, Any]:
+        return reply_to_prompt(
+            db(),
+            _str_param(params, "session_id"),
+            _str_param(params, "prompt_id"),
+            _str_param(params, "value"),
+            wake=wake,
+        )
+
+    async def sessions_message(params: dict[str, Any]) -> dict[str, Any]:
+        return message_session(
+            db(), _str_param(params, "session_id"), _str_param(params, "text"), wake=wake
+        )
+
+    async def sessions_stop(params: dict[str, Any]) -> dict[str, Any]:
+        return stop_session(db(), _str_param(params, "session_id"))
+
+    async def sessions_pause(params: dict[str, Any]) -> dict[str, Any]:
+        return pause_session(db(), _str_param(params, "session_id"))
+
+    async def sessions_resume(params: dict[str, Any]) -> dict[str, Any]:
+        return resume_session(db(), _str_param(params, "session_id"))
+
+    return {
+        "autopilot.enable": autopilot_enable,
+        "autopilot.disable": autopilot_disable,
+        "autopilot.mode": autopilot_mode,
+        "policy.validate": policy_validate,
+        "policy.test": policy_test,
+        "sessions.reply": sessions_reply,
+        "sessions.message": sessions_message,
+        "sessions.stop": sessions_stop,
+        "sessions.pause": sessions_pause,
+        "sessions.resume": sessions_resume,
+    }
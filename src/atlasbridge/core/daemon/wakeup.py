@@ -0,0 +1,150 @@
+"""
+Daemon wake-up channel.
+
+Dashboard and CLI writers (``atlasbridge sessions reply`` / ``sessions
+message``) commit their row to SQLite and then send a one-word datagram to a
+Unix socket in the data directory. The daemon watches that socket with
+``loop.add_reader`` and wakes the matching consumer immediately, so replies
+and directives are injected without waiting for the next poll.
+
+The datagram only says *which* table to look at. SQLite stays the source of
+truth: a lost or unsent wake-up just means the consumer's slow fallback poll
+picks the row up instead.
+
+Socket: <data_dir>/atlasbridge.wake
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import os
+import socket
+from pathlib import Path
+
+import structlog
+
+from atlasbridge.core.constants import WAKE_FILENAME
+
+logger = structlog.get_logger()
+
+WAKE_REPLY = "reply"
+WAKE_DIRECTIVE = "directive"
+WAKE_KINDS = (WAKE_REPLY, WAKE_DIRECTIVE)
+
+_MAX_DATAGRAM = 64
+
+
+def wake_socket_path(data_dir: Path) -> Path:
+    return data_dir / WAKE_FILENAME
+
+
+class WakeupListener:
+    """
+    Receives wake-up datagrams and sets one asyncio.Event per kind.
+
+    Usage::
+
+        listener = WakeupListener(data_dir)
+        if listener.start():
+            woken = await listener.wait(WAKE_REPLY, timeout=5.0)
+        listener.close()
+    """
+
+    def __init__(self, data_dir: Path) -> None:
+        self._path = wake_socket_path(data_dir)
+        self._sock: socket.socket | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._events = {kind: asyncio.Event() for kind in WAKE_KINDS}
+
+    @property
+    def active(self) -> bool:
+        return self._sock is not None
+
+    def start(self) -> bool:
+        """Bind the socket and register it with the running loop.
+
+        Returns False (and leaves the caller on polling) when Unix sockets are
+        unavailable or the path cannot be bound.
+        """
+        if not hasattr(socket, "AF_UNIX"):
+            return False
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        try:
+            # A stale socket from a crashed daemon blocks bind(); the PID file
+            # already guarantees a single daemon per data dir.
+            self._path.unlink(missing_ok=True)
+            sock.bind(str(self._path))
+            os.chmod(self._path, 0o600)
+            sock.setblocking(False)
+            self._loop = asyncio.get_running_loop()
+            self._loop.add_reader(sock.fileno(), self._on_readable)
+        except (OSError, NotImplementedError) as exc:
+            sock.close()
+            logger.warning("wakeup_listener_unavailable", path=str(self._path), error=str(exc))
+            return False
+        self._sock = sock
+        logger.debug("wakeup_listener_started", path=str(self._path))
+        return True
+
+    def close(self) -> None:
+        if self._sock is None:
+            return
+        if self._loop is not None:
+            self._loop.remove_reader(self._sock.fileno())
+        self._sock.close()
+        self._sock = None
+        self._path.unlink(missing_ok=True)
+
+    def notify(self, kind: str) -> None:
+        """Wake waiters on *kind* from inside the daemon, without a datagram."""
+        event = self._events.get(kind)
+        if event is not None:
+            event.set()
+
+    async def wait(self, kind: str, timeout: float) -> bool:
+        """Wait until *kind* is signalled or *timeout* elapses.
+
+        Returns True when woken by a datagram. The event is cleared before
+        returning, so a signal that arrives while the caller is processing
+        rows wakes the next wait immediately instead of being lost.
+        """
+        event = self._events[kind]
+        if not event.is_set():
+            try:
+                await asyncio.wait_for(event.wait(), timeout)
+            except TimeoutError:
+                return False
+        event.clear()
+        return True
+
+    def _on_readable(self) -> None:
+        assert self._sock is not None
+        while True:
+            try:
+                data = self._sock.recv(_MAX_DATAGRAM)
+            except (BlockingIOError, InterruptedError):
+                return
+            except OSError as exc:
+                logger.warning("wakeup_recv_failed", error=str(exc))
+                return
+            event = self._events.get(data.decode("ascii", "replace").strip())
+            if event is not None:
+                event.set()
+
+
+def notify_daemon(data_dir: Path, kind: str) -> bool:
+    """Best-effort wake-up of the daemon owning *data_dir*.
+
+    Returns False when no daemon is listening; the row is still picked up by
+    the daemon's fallback poll.
+    """
+    if kind not in WAKE_KINDS or not hasattr(socket, "AF_UNIX"):
+        return False
+    path = wake_socket_path(data_dir)
+    with contextlib.suppress(OSError):
+        with socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM) as sock:
+            sock.setblocking(False)
+            sock.sendto(kind.encode("ascii"), str(path))
+            return True
+    return False
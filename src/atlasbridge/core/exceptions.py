@@ -33,6 +33,18 @@ class SessionError(AtlasBridgeError):
     """Raised when session management fails."""
 
 
+class ControlError(AtlasBridgeError):
+    """Raised when a daemon control-socket request fails."""
+
+
+class DaemonUnavailableError(ControlError):
+    """Raised when no daemon is listening on the control socket."""
+
+
+class OperationError(AtlasBridgeError):
+    """Raised when an operator action (autopilot, policy, session control) is refused."""
+
+
 # Backwards-compat alias — remove in v1.0
 
 
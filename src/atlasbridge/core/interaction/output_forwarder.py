@@ -10,7 +10,7 @@ Rate limiting prevents flooding: max 15 messages per minute.
 Tiny fragments (< 10 meaningful chars) are silently dropped.
 
 Optional features (when ``StreamingConfig`` is provided):
-  - Secret redaction: token patterns stripped before sending
+  - Secret redaction: token patterns stripped as output is buffered
   - Message editing: re-use last message ID for streaming updates
   - State transitions: STREAMING on output, RUNNING after idle cycles
 """
@@ -23,7 +23,7 @@ from typing import TYPE_CHECKING
 
 import structlog
 
-from atlasbridge.core.prompt.sanitize import is_meaningful, strip_ansi
+from atlasbridge.core.prompt.sanitize import SanitizedChunk
 from atlasbridge.core.security.redactor import redact as _redact_secrets
 
 if TYPE_CHECKING:
@@ -114,12 +114,21 @@ class OutputForwarder:
         This is called synchronously from the read loop. The buffer is
         drained asynchronously by ``flush_loop()``.
         """
-        try:
-            text = strip_ansi(raw.decode("utf-8", errors="replace"))
-        except Exception:  # noqa: BLE001
-            return
+        self.feed_chunk(SanitizedChunk.from_bytes(raw))
 
-        if not text or not is_meaningful(text):
+    def feed_chunk(self, chunk: SanitizedChunk) -> None:
+        """Buffer a chunk decoded by the session's OutputPipeline.
+
+        Uses the pipeline's stream-redacted text when present, otherwise
+        redacts the chunk on its own.
+        """
+        if self._redact_secrets and chunk.redacted is not None:
+            text = chunk.redacted
+        elif chunk.meaningful:
+            text = self._redact(chunk.text) if self._redact_secrets else chunk.text
+        else:
+            return
+        if not text:
             return
 
         self._buffer.append(text)
@@ -165,10 +174,6 @@ class OutputForwarder:
         if len(stripped) < self._min_meaningful_chars:
             return
 
-        # Secret redaction
-        if self._redact_secrets:
-            stripped = self._redact(stripped)
-
         # Truncate
         if len(stripped) > self._max_output_chars:
             stripped = stripped[: self._max_output_chars] + "\n...(truncated)"
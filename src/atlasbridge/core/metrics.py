@@ -0,0 +1,32 @@
+"""
+In-process metrics primitives.
+
+Fixed-bucket histograms: cheap to update on hot paths, and their snapshots
+are plain dicts that can be logged or served as JSON.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+
+
+class Histogram:
+    """Counts observations into buckets with fixed upper bounds plus ``+inf``."""
+
+    __slots__ = ("bounds", "counts", "count", "total")
+
+    def __init__(self, bounds: tuple[float, ...]) -> None:
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+
+    def snapshot(self) -> dict[str, int]:
+        """Return ``{"<=bound": count, ..., "+inf": count}``."""
+        labels = [f"<={b:g}" for b in self.bounds] + ["+inf"]
+        return dict(zip(labels, self.counts, strict=True))
@@ -9,6 +9,7 @@ Public API::
     decision = evaluate(policy, event, session_id="abc", tool_id="claude_code", repo="/home/user")
 """
 
+from atlasbridge.core.policy.compiled import CompiledPolicy, compile_policy
 from atlasbridge.core.policy.evaluator import evaluate
 from atlasbridge.core.policy.model import (
     AutonomyMode,
@@ -26,6 +27,7 @@ from atlasbridge.core.policy.parser import load_policy, parse_policy
 __all__ = [
     "AutoReplyAction",
     "AutonomyMode",
+    "CompiledPolicy",
     "DenyAction",
     "NotifyOnlyAction",
     "Policy",
@@ -33,6 +35,7 @@ __all__ = [
     "PolicyDefaults",
     "PolicyRule",
     "RequireHumanAction",
+    "compile_policy",
     "evaluate",
     "load_policy",
     "parse_policy",
@@ -0,0 +1,210 @@
+"""
+Compiled policy — pre-indexed rule lookup for first-match-wins evaluation.
+
+A policy with hundreds of rules is usually scoped by tool, repo, prompt type,
+environment and session tag, so only a handful of rules can ever match a given
+prompt. ``CompiledPolicy`` buckets rules on those criteria once, at load time,
+and narrows each evaluation to the candidate rules before any per-rule check
+runs.
+
+Candidate sets are bitmasks over rule indices, so intersecting dimensions is
+a few integer ANDs and iterating the result in ascending bit order preserves
+first-match-wins semantics.
+
+Usage::
+
+    compiled = compile_policy(policy)
+    decision = evaluate(policy=compiled, prompt_text=..., ...)
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+from typing import TYPE_CHECKING
+
+from atlasbridge.core.policy.model import Policy, PolicyRule, PromptTypeFilter
+
+if TYPE_CHECKING:
+    from atlasbridge.core.policy.model import AutonomyMode, PolicyDefaults
+    from atlasbridge.core.policy.model_v1 import PolicyRuleV1, PolicyV1
+
+
+class _BucketIndex:
+    """Exact-value index: value → bitmask of rules requiring that value."""
+
+    __slots__ = ("_wildcard", "_buckets")
+
+    def __init__(self) -> None:
+        self._wildcard = 0
+        self._buckets: dict[str, int] = {}
+
+    def add(self, bit: int, values: Iterable[str] | None) -> None:
+        """Register a rule. ``values=None`` means the rule does not constrain this field."""
+        if values is None:
+            self._wildcard |= bit
+            return
+        for value in values:
+            self._buckets[value] = self._buckets.get(value, 0) | bit
+
+    def lookup(self, value: str) -> int:
+        return self._wildcard | self._buckets.get(value, 0)
+
+
+class _TrieNode:
+    __slots__ = ("children", "mask")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _TrieNode] = {}
+        self.mask = 0
+
+
+class _PrefixTrie:
+    """Prefix index for ``repo``: lookup returns every rule whose prefix starts the input."""
+
+    __slots__ = ("_wildcard", "_root")
+
+    def __init__(self) -> None:
+        self._wildcard = 0
+        self._root = _TrieNode()
+
+    def add(self, bit: int, prefix: str | None) -> None:
+        if prefix is None:
+            self._wildcard |= bit
+            return
+        node = self._root
+        for ch in prefix:
+            node = node.children.setdefault(ch, _TrieNode())
+        node.mask |= bit
+
+    def lookup(self, text: str) -> int:
+        node = self._root
+        mask = self._wildcard | node.mask
+        for ch in text:
+            child = node.children.get(ch)
+            if child is None:
+                break
+            node = child
+            mask |= node.mask
+        return mask
+
+
+def _prompt_type_keys(criterion: list[PromptTypeFilter] | None) -> list[str] | None:
+    if criterion is None or PromptTypeFilter.ANY in criterion:
+        return None
+    return [f.value for f in criterion]
+
+
+class CompiledPolicy:
+    """
+    Read-only, pre-indexed view of a Policy or PolicyV1.
+
+    Rules are indexed on their top-level ``tool_id``, ``prompt_type``,
+    ``environment``, ``session_tag`` and ``repo`` criteria. Rules whose match
+    is an ``any_of`` block are candidates for every prompt, because the
+    evaluator ignores their top-level fields. The index only prunes rules that cannot match; every
+    candidate is still checked in full by the evaluator.
+
+    The wrapped policy must not be mutated after compilation — compile again
+    (e.g. on hot reload) instead.
+    """
+
+    __slots__ = (
+        "policy",
+        "policy_hash",
+        "is_v1",
+        "rules",
+        "_by_id",
+        "_tool_id",
+        "_prompt_type",
+        "_environment",
+        "_session_tag",
+        "_repo",
+    )
+
+    def __init__(self, policy: Policy | PolicyV1) -> None:
+        self.policy = policy
+        self.policy_hash = policy.content_hash()
+        self.is_v1 = not isinstance(policy, Policy)
+        self.rules: tuple[PolicyRule | PolicyRuleV1, ...] = tuple(policy.rules)
+        self._by_id = {rule.id: rule for rule in self.rules}
+
+        self._tool_id = _BucketIndex()
+        self._prompt_type = _BucketIndex()
+        self._environment = _BucketIndex()
+        self._session_tag = _BucketIndex()
+        self._repo = _PrefixTrie()
+
+        for index, rule in enumerate(self.rules):
+            bit = 1 << index
+            m = rule.match
+            if getattr(m, "any_of", None) is not None:
+                # The any_of block is the whole match condition; top-level
+                # fields are ignored by the evaluator, so never prune on them.
+                for dimension in (
+                    self._tool_id,
+                    self._prompt_type,
+                    self._environment,
+                    self._session_tag,
+                    self._repo,
+                ):
+                    dimension.add(bit, None)
+                continue
+            self._tool_id.add(bit, None if m.tool_id == "*" else [m.tool_id])
+            self._prompt_type.add(bit, _prompt_type_keys(m.prompt_type))
+            self._repo.add(bit, m.repo)
+            environment = getattr(m, "environment", None)
+            self._environment.add(bit, None if environment is None else [environment])
+            session_tag = getattr(m, "session_tag", None)
+            self._session_tag.add(bit, None if session_tag is None else [session_tag])
+
+    @property
+    def name(self) -> str:
+        return self.policy.name
+
+    @property
+    def autonomy_mode(self) -> AutonomyMode:
+        return self.policy.autonomy_mode
+
+    @property
+    def defaults(self) -> PolicyDefaults:
+        return self.policy.defaults
+
+    def content_hash(self) -> str:
+        """Hash of the wrapped policy, computed once at compile time."""
+        return self.policy_hash
+
+    def get_rule(self, rule_id: str | None) -> PolicyRule | PolicyRuleV1 | None:
+        """Return the rule with the given id, or None."""
+        if rule_id is None:
+            return None
+        return self._by_id.get(rule_id)
+
+    def candidates(
+        self,
+        tool_id: str,
+        prompt_type: str,
+        repo: str,
+        session_tag: str = "",
+        environment: str = "",
+    ) -> Iterator[PolicyRule | PolicyRuleV1]:
+        """Yield rules that may match, in policy order (first-match-wins preserved)."""
+        mask = (
+            self._tool_id.lookup(tool_id)
+            & self._prompt_type.lookup(prompt_type)
+            & self._environment.lookup(environment)
+            & self._session_tag.lookup(session_tag)
+        )
+        if mask:
+            mask &= self._repo.lookup(repo)
+        rules = self.rules
+        while mask:
+            low = mask & -mask
+            yield rules[low.bit_length() - 1]
+            mask ^= low
+
+
+def compile_policy(policy: Policy | PolicyV1 | CompiledPolicy) -> CompiledPolicy:
+    """Compile *policy* for repeated evaluation (idempotent for compiled input)."""
+    if isinstance(policy, CompiledPolicy):
+        return policy
+    return CompiledPolicy(policy)
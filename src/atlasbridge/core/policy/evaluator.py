@@ -21,14 +21,16 @@ Usage::
 from __future__ import annotations
 
 import re
-import signal
-from collections.abc import Iterator
-from contextlib import contextmanager
-from typing import TYPE_CHECKING
+from collections.abc import Callable, Iterable
+from functools import partial
+from typing import TYPE_CHECKING, Any
 
 import structlog
 
+from atlasbridge.core.policy.compiled import CompiledPolicy
 from atlasbridge.core.policy.model import (
+    CONTAINS_REGEX_FLAGS,
+    TOOL_NAME_REGEX_FLAGS,
     ConfidenceLevel,
     DenyAction,
     Policy,
@@ -36,6 +38,7 @@ from atlasbridge.core.policy.model import (
     PolicyRule,
     PromptTypeFilter,
     RequireHumanAction,
+    compile_safe_regex,
     confidence_from_str,
 )
 from atlasbridge.core.risk import RiskClassifier, RiskInput
@@ -45,47 +48,30 @@ if TYPE_CHECKING:
 
 logger = structlog.get_logger()
 
-_REGEX_TIMEOUT_S = 0.1  # 100ms max per regex evaluation
-
-
-# ---------------------------------------------------------------------------
-# Timeout context manager (UNIX only; Windows silently skips)
-# ---------------------------------------------------------------------------
-
-
-@contextmanager
-def _regex_timeout(seconds: float) -> Iterator[None]:
-    """Raise TimeoutError if the block runs longer than `seconds`."""
-    try:
-        signal.signal(signal.SIGALRM, lambda *_: (_ for _ in ()).throw(TimeoutError()))
-        signal.setitimer(signal.ITIMER_REAL, seconds)
-        yield
-    except AttributeError:
-        # Windows — no SIGALRM; skip timeout enforcement
-        yield
-    finally:
-        try:
-            signal.setitimer(signal.ITIMER_REAL, 0)
-        except AttributeError:
-            pass
-
-
 # ---------------------------------------------------------------------------
 # Per-criterion matching helpers
+#
+# Each helper is the single implementation of its criterion. With
+# ``explain=False`` (the evaluation hot path) it only decides; the reason
+# string is formatted only when a caller asks for it.
 # ---------------------------------------------------------------------------
 
 
-def _match_tool_id(criterion: str, tool_id: str) -> tuple[bool, str]:
+def _match_tool_id(criterion: str, tool_id: str, explain: bool = True) -> tuple[bool, str]:
     if criterion == "*":
         return True, "tool_id: * (wildcard, always matches)"
     matched = criterion == tool_id
+    if not explain:
+        return matched, ""
     return matched, f"tool_id: {criterion!r} {'==' if matched else '!='} {tool_id!r}"
 
 
-def _match_repo(criterion: str | None, repo: str) -> tuple[bool, str]:
+def _match_repo(criterion: str | None, repo: str, explain: bool = True) -> tuple[bool, str]:
     if criterion is None:
         return True, "repo: not specified (always matches)"
     matched = repo.startswith(criterion)
+    if not explain:
+        return matched, ""
     return (
         matched,
         f"repo: {repo!r} {'starts with' if matched else 'does not start with'} {criterion!r}",
@@ -93,7 +79,7 @@ def _match_repo(criterion: str | None, repo: str) -> tuple[bool, str]:
 
 
 def _match_prompt_type(
-    criterion: list[PromptTypeFilter] | None, prompt_type: str
+    criterion: list[PromptTypeFilter] | None, prompt_type: str, explain: bool = True
 ) -> tuple[bool, str]:
     if criterion is None:
         return True, "prompt_type: not specified (always matches)"
@@ -101,6 +87,8 @@ def _match_prompt_type(
     if PromptTypeFilter.ANY in criterion:
         return True, "prompt_type: * (wildcard, always matches)"
     matched = any(f.value == prompt_type for f in criterion)
+    if not explain:
+        return matched, ""
     types_str = [f.value for f in criterion]
     return (
         matched,
@@ -108,9 +96,13 @@ def _match_prompt_type(
     )
 
 
-def _match_confidence(min_confidence: ConfidenceLevel, confidence_str: str) -> tuple[bool, str]:
+def _match_confidence(
+    min_confidence: ConfidenceLevel, confidence_str: str, explain: bool = True
+) -> tuple[bool, str]:
     event_level = confidence_from_str(confidence_str)
     matched = event_level >= min_confidence
+    if not explain:
+        return matched, ""
     return (
         matched,
         f"min_confidence: {confidence_str} {'≥' if matched else '<'} {min_confidence.value}",
@@ -118,82 +110,111 @@ def _match_confidence(min_confidence: ConfidenceLevel, confidence_str: str) -> t
 
 
 def _match_max_confidence(
-    max_confidence: ConfidenceLevel | None, confidence_str: str
+    max_confidence: ConfidenceLevel | None, confidence_str: str, explain: bool = True
 ) -> tuple[bool, str]:
     if max_confidence is None:
         return True, "max_confidence: not specified (always matches)"
     event_level = confidence_from_str(confidence_str)
     matched = event_level <= max_confidence
+    if not explain:
+        return matched, ""
     return (
         matched,
         f"max_confidence: {confidence_str} {'≤' if matched else '>'} {max_confidence.value}",
     )
 
 
-def _match_session_tag(criterion: str | None, session_tag: str) -> tuple[bool, str]:
+def _match_session_tag(
+    criterion: str | None, session_tag: str, explain: bool = True
+) -> tuple[bool, str]:
     if criterion is None:
         return True, "session_tag: not specified (always matches)"
     matched = criterion == session_tag
+    if not explain:
+        return matched, ""
     return (
         matched,
         f"session_tag: {session_tag!r} {'==' if matched else '!='} {criterion!r}",
     )
 
 
-def _match_session_state(criterion: list[str] | None, session_state: str) -> tuple[bool, str]:
+def _match_session_state(
+    criterion: list[str] | None, session_state: str, explain: bool = True
+) -> tuple[bool, str]:
     if criterion is None:
         return True, "session_state: not specified (always matches)"
+    matched = bool(session_state) and session_state in criterion
+    if not explain:
+        return matched, ""
     if not session_state:
         return False, f"session_state: no state provided, required one of {criterion}"
-    matched = session_state in criterion
     return (
         matched,
         f"session_state: {session_state!r} {'in' if matched else 'not in'} {criterion}",
     )
 
 
-def _match_channel_message(criterion: bool | None, channel_message: bool) -> tuple[bool, str]:
+def _match_channel_message(
+    criterion: bool | None, channel_message: bool, explain: bool = True
+) -> tuple[bool, str]:
     if criterion is None:
         return True, "channel_message: not specified (always matches)"
     matched = criterion == channel_message
+    if not explain:
+        return matched, ""
     return (
         matched,
         f"channel_message: {criterion!r} {'==' if matched else '!='} {channel_message!r}",
     )
 
 
-def _match_environment(criterion: str | None, environment: str) -> tuple[bool, str]:
+def _match_environment(
+    criterion: str | None, environment: str, explain: bool = True
+) -> tuple[bool, str]:
     if criterion is None:
         return True, "environment: not specified (always matches)"
-    if criterion == environment:
-        return True, f"environment: {criterion!r} == {environment!r}"
-    return False, f"environment: {criterion!r} != {environment!r}"
+    matched = criterion == environment
+    if not explain:
+        return matched, ""
+    return matched, f"environment: {criterion!r} {'==' if matched else '!='} {environment!r}"
 
 
-def _match_workspace_trusted(criterion: bool | None, workspace_trusted: bool) -> tuple[bool, str]:
+def _match_workspace_trusted(
+    criterion: bool | None, workspace_trusted: bool, explain: bool = True
+) -> tuple[bool, str]:
     if criterion is None:
         return True, "workspace_trusted: not specified (always matches)"
     matched = criterion == workspace_trusted
+    if not explain:
+        return matched, ""
     return (
         matched,
         f"workspace_trusted: {criterion!r} {'==' if matched else '!='} {workspace_trusted!r}",
     )
 
 
-def _match_workspace_profile(criterion: str | None, workspace_profile: str) -> tuple[bool, str]:
+def _match_workspace_profile(
+    criterion: str | None, workspace_profile: str, explain: bool = True
+) -> tuple[bool, str]:
     if criterion is None:
         return True, "workspace_profile: not specified (always matches)"
     matched = criterion == workspace_profile
+    if not explain:
+        return matched, ""
     return (
         matched,
         f"workspace_profile: {criterion!r} {'==' if matched else '!='} {workspace_profile!r}",
     )
 
 
-def _match_deny_input_types(criterion: list[str] | None, prompt_type: str) -> tuple[bool, str]:
+def _match_deny_input_types(
+    criterion: list[str] | None, prompt_type: str, explain: bool = True
+) -> tuple[bool, str]:
     if criterion is None:
         return True, "deny_input_types: not specified (always matches)"
     matched = prompt_type in criterion
+    if not explain:
+        return matched, ""
     return (
         matched,
         f"deny_input_types: {prompt_type!r} {'in' if matched else 'not in'} {criterion}",
@@ -204,6 +225,8 @@ def _match_tool_name(
     criterion: str | None,
     excerpt: str,
     is_regex: bool = False,
+    compiled: re.Pattern[str] | None = None,
+    explain: bool = True,
 ) -> tuple[bool, str]:
     """Match on a tool_name field. Extracts tool name from 'tool_use: <name>(...)' excerpts."""
     if criterion is None:
@@ -219,18 +242,23 @@ def _match_tool_name(
             tool_name = excerpt[10:]
 
     if is_regex:
-        try:
-            with _regex_timeout(_REGEX_TIMEOUT_S):
-                matched = bool(re.search(criterion, tool_name, re.IGNORECASE))
-            return (
-                matched,
-                f"tool_name: regex {criterion!r} {'matched' if matched else 'did not match'} "
-                f"{tool_name!r}",
-            )
-        except (TimeoutError, re.error):
-            return False, f"tool_name: regex {criterion!r} failed"
+        if compiled is None:
+            try:
+                compiled = compile_safe_regex(criterion, TOOL_NAME_REGEX_FLAGS, "tool_name")
+            except ValueError:
+                return False, f"tool_name: regex {criterion!r} failed" if explain else ""
+        matched = bool(compiled.search(tool_name))
+        if not explain:
+            return matched, ""
+        return (
+            matched,
+            f"tool_name: regex {criterion!r} {'matched' if matched else 'did not match'} "
+            f"{tool_name!r}",
+        )
 
     matched = criterion.lower() == tool_name.lower()
+    if not explain:
+        return matched, ""
     return (
         matched,
         f"tool_name: {criterion!r} {'==' if matched else '!='} {tool_name!r}",
@@ -241,32 +269,176 @@ def _match_contains(
     contains: str | None,
     contains_is_regex: bool,
     excerpt: str,
+    compiled: re.Pattern[str] | None = None,
+    explain: bool = True,
 ) -> tuple[bool, str]:
     if contains is None:
         return True, "contains: not specified (always matches)"
 
     if not contains_is_regex:
         matched = contains.lower() in excerpt.lower()
+        if not explain:
+            return matched, ""
         return (
             matched,
             f"contains: substring {contains!r} {'found' if matched else 'not found'} in excerpt",
         )
 
-    # Regex match with timeout
-    try:
-        with _regex_timeout(_REGEX_TIMEOUT_S):
-            compiled = re.compile(contains, re.IGNORECASE | re.DOTALL)
-            matched = bool(compiled.search(excerpt))
-        return (
-            matched,
-            f"contains: regex {contains!r} {'matched' if matched else 'did not match'} excerpt",
-        )
-    except TimeoutError:
-        logger.warning("regex_timeout", pattern=contains)
-        return False, f"contains: regex {contains!r} timed out — rule skipped"
-    except re.error as exc:
-        logger.warning("regex_error", pattern=contains, error=str(exc))
-        return False, f"contains: regex error {exc} — rule skipped"
+    # Patterns are compiled and vetted for catastrophic backtracking at load
+    # time, so the whole excerpt is searched: a match past any prefix still counts.
+    if compiled is None:
+        try:
+            compiled = compile_safe_regex(contains, CONTAINS_REGEX_FLAGS)
+        except ValueError as exc:
+            logger.warning("regex_error", pattern=contains, error=str(exc))
+            return False, f"contains: regex error {exc} — rule skipped" if explain else ""
+    matched = bool(compiled.search(excerpt))
+    if not explain:
+        return matched, ""
+    return (
+        matched,
+        f"contains: regex {contains!r} {'matched' if matched else 'did not match'} excerpt",
+    )
+
+
+# ---------------------------------------------------------------------------
+# Criteria tables
+# ---------------------------------------------------------------------------
+
+
+class _PromptContext:
+    """The prompt-side inputs every criterion is checked against."""
+
+    __slots__ = (
+        "prompt_type",
+        "confidence",
+        "excerpt",
+        "tool_id",
+        "repo",
+        "session_tag",
+        "session_state",
+        "channel_message",
+        "environment",
+        "workspace_trusted",
+        "workspace_profile",
+    )
+
+    def __init__(
+        self,
+        prompt_type: str,
+        confidence: str,
+        excerpt: str,
+        tool_id: str,
+        repo: str,
+        session_tag: str = "",
+        session_state: str = "",
+        channel_message: bool = False,
+        environment: str = "",
+        workspace_trusted: bool = False,
+        workspace_profile: str = "",
+    ) -> None:
+        self.prompt_type = prompt_type
+        self.confidence = confidence
+        self.excerpt = excerpt
+        self.tool_id = tool_id
+        self.repo = repo
+        self.session_tag = session_tag
+        self.session_state = session_state
+        self.channel_message = channel_message
+        self.environment = environment
+        self.workspace_trusted = workspace_trusted
+        self.workspace_profile = workspace_profile
+
+
+# (criterion name, check(match, ctx, explain)) in evaluation order
+_Criterion = tuple[str, Callable[[Any, _PromptContext, bool], tuple[bool, str]]]
+
+_V0_CRITERIA: tuple[_Criterion, ...] = (
+    ("tool_id", lambda m, c, e: _match_tool_id(m.tool_id, c.tool_id, e)),
+    ("repo", lambda m, c, e: _match_repo(m.repo, c.repo, e)),
+    ("prompt_type", lambda m, c, e: _match_prompt_type(m.prompt_type, c.prompt_type, e)),
+    ("min_confidence", lambda m, c, e: _match_confidence(m.min_confidence, c.confidence, e)),
+    (
+        "tool_name",
+        lambda m, c, e: _match_tool_name(
+            m.tool_name, c.excerpt, m.contains_is_regex, m.tool_name_regex, e
+        ),
+    ),
+    (
+        "contains",
+        lambda m, c, e: _match_contains(
+            m.contains, m.contains_is_regex, c.excerpt, m.contains_regex, e
+        ),
+    ),
+)
+
+_V1_CRITERIA: tuple[_Criterion, ...] = (
+    ("tool_id", lambda m, c, e: _match_tool_id(m.tool_id, c.tool_id, e)),
+    ("repo", lambda m, c, e: _match_repo(m.repo, c.repo, e)),
+    ("prompt_type", lambda m, c, e: _match_prompt_type(m.prompt_type, c.prompt_type, e)),
+    ("min_confidence", lambda m, c, e: _match_confidence(m.min_confidence, c.confidence, e)),
+    (
+        "max_confidence",
+        lambda m, c, e: _match_max_confidence(m.max_confidence, c.confidence, e),
+    ),
+    (
+        "contains",
+        lambda m, c, e: _match_contains(
+            m.contains, m.contains_is_regex, c.excerpt, m.contains_regex, e
+        ),
+    ),
+    ("session_tag", lambda m, c, e: _match_session_tag(m.session_tag, c.session_tag, e)),
+    (
+        "session_state",
+        lambda m, c, e: _match_session_state(m.session_state, c.session_state, e),
+    ),
+    (
+        "channel_message",
+        lambda m, c, e: _match_channel_message(m.channel_message, c.channel_message, e),
+    ),
+    (
+        "deny_input_types",
+        lambda m, c, e: _match_deny_input_types(m.deny_input_types, c.prompt_type, e),
+    ),
+    ("environment", lambda m, c, e: _match_environment(m.environment, c.environment, e)),
+    (
+        "workspace_trusted",
+        lambda m, c, e: _match_workspace_trusted(m.workspace_trusted, c.workspace_trusted, e),
+    ),
+    (
+        "workspace_profile",
+        lambda m, c, e: _match_workspace_profile(m.workspace_profile, c.workspace_profile, e),
+    ),
+)
+
+_V0_CRITERIA_BY_NAME = dict(_V0_CRITERIA)
+_V1_CRITERIA_BY_NAME = dict(_V1_CRITERIA)
+
+
+def _check_criteria(
+    criteria: tuple[_Criterion, ...],
+    m: Any,
+    ctx: _PromptContext,
+    short_circuit: bool,
+    reasons: list[str] | None,
+) -> str | None:
+    """
+    Run flat AND criteria. Returns the first failed criterion name, or None.
+
+    Reason strings are appended only when *reasons* is a list.
+    """
+    explain = reasons is not None
+    failed: str | None = None
+    for name, check in criteria:
+        ok, reason = check(m, ctx, explain)
+        if reasons is not None:
+            reasons.append(("✓ " if ok else "✗ ") + reason)
+        if not ok:
+            if failed is None:
+                failed = name
+            if short_circuit:
+                break
+    return failed
 
 
 # ---------------------------------------------------------------------------
@@ -277,124 +449,114 @@ def _match_contains(
 class RuleMatchResult:
     """Result of evaluating one rule against a prompt."""
 
-    __slots__ = ("rule_id", "matched", "reasons")
+    __slots__ = ("rule_id", "matched", "reasons", "failed")
 
-    def __init__(self, rule_id: str, matched: bool, reasons: list[str]) -> None:
+    def __init__(
+        self, rule_id: str, matched: bool, reasons: list[str], failed: str | None = None
+    ) -> None:
         self.rule_id = rule_id
         self.matched = matched
         self.reasons = reasons
+        # First failed criterion name (e.g. "repo", "none_of[0]"), or None
+        self.failed = failed
 
 
-def _evaluate_rule(
+def _check_rule(
     rule: PolicyRule,
-    prompt_type: str,
-    confidence: str,
-    excerpt: str,
-    tool_id: str,
-    repo: str,
+    ctx: _PromptContext,
     short_circuit: bool = True,
-) -> RuleMatchResult:
-    """Evaluate a single v0 rule. Returns RuleMatchResult with per-criterion reasons."""
-    m = rule.match
-    reasons: list[str] = []
+    reasons: list[str] | None = None,
+) -> str | None:
+    """Check a v0 rule. Returns the first failed criterion name, or None on match."""
+    return _check_criteria(_V0_CRITERIA, rule.match, ctx, short_circuit, reasons)
 
-    checks = [
-        _match_tool_id(m.tool_id, tool_id),
-        _match_repo(m.repo, repo),
-        _match_prompt_type(m.prompt_type, prompt_type),
-        _match_confidence(m.min_confidence, confidence),
-        _match_tool_name(m.tool_name, excerpt, m.contains_is_regex),
-        _match_contains(m.contains, m.contains_is_regex, excerpt),
-    ]
 
-    all_pass = True
-    for ok, reason in checks:
-        reasons.append(("✓ " if ok else "✗ ") + reason)
-        if not ok:
-            all_pass = False
-            if short_circuit:
-                break
+def _check_block_v1(
+    m: MatchCriteriaV1,
+    ctx: _PromptContext,
+    short_circuit: bool = True,
+    reasons: list[str] | None = None,
+) -> str | None:
+    """
+    Check a MatchCriteriaV1 block (flat OR any_of). Returns the first failed
+    criterion name (``"any_of"`` if no sub-block matched), or None on match.
 
-    return RuleMatchResult(rule_id=rule.id, matched=all_pass, reasons=reasons)
+    Does NOT evaluate none_of (callers handle that separately at the rule level).
+    """
+    if m.any_of is None:
+        return _check_criteria(_V1_CRITERIA, m, ctx, short_circuit, reasons)
+
+    # OR semantics: match if ANY sub-block passes
+    any_matched = False
+    for i, sub in enumerate(m.any_of):
+        sub_reasons: list[str] | None = [] if reasons is not None else None
+        sub_matched = _check_block_v1(sub, ctx, short_circuit, sub_reasons) is None
+        if reasons is not None and sub_reasons is not None:
+            reasons.append(f"any_of[{i}]: {'✓ matched' if sub_matched else '✗ no match'}")
+            reasons.extend(f"  {r}" for r in sub_reasons)
+        if sub_matched:
+            if short_circuit:
+                return None
+            any_matched = True
+    return None if any_matched else "any_of"
 
 
-def _eval_criteria_block(
-    m: MatchCriteriaV1,
-    prompt_type: str,
-    confidence: str,
-    excerpt: str,
-    tool_id: str,
-    repo: str,
-    session_tag: str,
-    session_state: str = "",
-    channel_message: bool = False,
-    environment: str = "",
-    workspace_trusted: bool = False,
-    workspace_profile: str = "",
+def _check_rule_v1(
+    rule: PolicyRuleV1,
+    ctx: _PromptContext,
     short_circuit: bool = True,
-) -> tuple[bool, list[str]]:
+    reasons: list[str] | None = None,
+) -> str | None:
     """
-    Evaluate a MatchCriteriaV1 block (flat OR any_of), returning (matched, reasons).
+    Check a v1 rule. Returns the first failed criterion name, or None on match.
 
-    Used internally by _evaluate_rule_v1 and for any_of/none_of sub-blocks.
-    Does NOT evaluate none_of (callers handle that separately at the rule level).
+    Evaluation order:
+    1. Flat AND criteria (or any_of OR block) — primary match condition
+    2. none_of NOT filter — fail if any sub-block matches
     """
-    reasons: list[str] = []
+    m = rule.match
 
-    if m.any_of is not None:
-        # OR semantics: match if ANY sub-block passes
-        any_matched = False
-        for i, sub in enumerate(m.any_of):
-            sub_matched, sub_reasons = _eval_criteria_block(
-                sub,
-                prompt_type,
-                confidence,
-                excerpt,
-                tool_id,
-                repo,
-                session_tag,
-                session_state,
-                channel_message,
-                environment=environment,
-                workspace_trusted=workspace_trusted,
-                workspace_profile=workspace_profile,
-                short_circuit=short_circuit,
-            )
-            reasons.append(f"any_of[{i}]: {'✓ matched' if sub_matched else '✗ no match'}")
-            for r in sub_reasons:
-                reasons.append(f"  {r}")
-            if sub_matched:
+    # Step 1: primary match (flat AND or any_of)
+    failed = _check_block_v1(m, ctx, short_circuit, reasons)
+    if failed is not None:
+        if short_circuit:
+            return failed
+        # In debug mode, continue evaluating none_of for full trace
+        if reasons is not None:
+            reasons.append("  (primary criteria failed — none_of shown for completeness)")
+
+    # Step 2: none_of NOT filter
+    if m.none_of is not None:
+        for i, sub in enumerate(m.none_of):
+            sub_reasons: list[str] | None = [] if reasons is not None else None
+            if _check_block_v1(sub, ctx, short_circuit, sub_reasons) is None:
+                if reasons is not None and sub_reasons is not None:
+                    reasons.append(f"✗ none_of[{i}]: matched (excluded by NOT condition)")
+                    reasons.extend(f"  {r}" for r in sub_reasons)
+                if failed is None:
+                    failed = f"none_of[{i}]"
                 if short_circuit:
-                    return True, reasons
-                any_matched = True
-        return any_matched, reasons
-
-    # Flat AND checks
-    checks = [
-        _match_tool_id(m.tool_id, tool_id),
-        _match_repo(m.repo, repo),
-        _match_prompt_type(m.prompt_type, prompt_type),
-        _match_confidence(m.min_confidence, confidence),
-        _match_max_confidence(m.max_confidence, confidence),
-        _match_contains(m.contains, m.contains_is_regex, excerpt),
-        _match_session_tag(m.session_tag, session_tag),
-        _match_session_state(m.session_state, session_state),
-        _match_channel_message(m.channel_message, channel_message),
-        _match_deny_input_types(m.deny_input_types, prompt_type),
-        _match_environment(m.environment, environment),
-        _match_workspace_trusted(m.workspace_trusted, workspace_trusted),
-        _match_workspace_profile(m.workspace_profile, workspace_profile),
-    ]
+                    return failed
+            elif reasons is not None:
+                reasons.append(f"✓ none_of[{i}]: did not match (NOT condition satisfied)")
 
-    all_pass = True
-    for ok, reason in checks:
-        reasons.append(("✓ " if ok else "✗ ") + reason)
-        if not ok:
-            all_pass = False
-            if short_circuit:
-                break
+    return failed
 
-    return all_pass, reasons
+
+def _evaluate_rule(
+    rule: PolicyRule,
+    prompt_type: str,
+    confidence: str,
+    excerpt: str,
+    tool_id: str,
+    repo: str,
+    short_circuit: bool = True,
+) -> RuleMatchResult:
+    """Evaluate a single v0 rule. Returns RuleMatchResult with per-criterion reasons."""
+    ctx = _PromptContext(prompt_type, confidence, excerpt, tool_id, repo)
+    reasons: list[str] = []
+    failed = _check_rule(rule, ctx, short_circuit, reasons)
+    return RuleMatchResult(rule.id, failed is None, reasons, failed)
 
 
 def _evaluate_rule_v1(
@@ -412,19 +574,8 @@ def _evaluate_rule_v1(
     workspace_profile: str = "",
     short_circuit: bool = True,
 ) -> RuleMatchResult:
-    """
-    Evaluate a single v1 rule.
-
-    Evaluation order:
-    1. Flat AND criteria (or any_of OR block) — primary match condition
-    2. none_of NOT filter — fail if any sub-block matches
-    """
-    m = rule.match
-    reasons: list[str] = []
-
-    # Step 1: primary match (flat AND or any_of)
-    primary_matched, primary_reasons = _eval_criteria_block(
-        m,
+    """Evaluate a single v1 rule. Returns RuleMatchResult with per-criterion reasons."""
+    ctx = _PromptContext(
         prompt_type,
         confidence,
         excerpt,
@@ -433,50 +584,61 @@ def _evaluate_rule_v1(
         session_tag,
         session_state,
         channel_message,
-        environment=environment,
-        workspace_trusted=workspace_trusted,
-        workspace_profile=workspace_profile,
-        short_circuit=short_circuit,
+        environment,
+        workspace_trusted,
+        workspace_profile,
     )
-    reasons.extend(primary_reasons)
+    reasons: list[str] = []
+    failed = _check_rule_v1(rule, ctx, short_circuit, reasons)
+    return RuleMatchResult(rule.id, failed is None, reasons, failed)
 
-    if not primary_matched:
-        if short_circuit:
-            return RuleMatchResult(rule_id=rule.id, matched=False, reasons=reasons)
-        # In debug mode, continue evaluating none_of for full trace
-        reasons.append("  (primary criteria failed — none_of shown for completeness)")
 
-    # Step 2: none_of NOT filter
-    excluded = False
-    if m.none_of is not None:
-        for i, sub in enumerate(m.none_of):
-            sub_matched, sub_reasons = _eval_criteria_block(
-                sub,
-                prompt_type,
-                confidence,
-                excerpt,
-                tool_id,
-                repo,
-                session_tag,
-                session_state,
-                channel_message,
-                environment=environment,
-                workspace_trusted=workspace_trusted,
-                workspace_profile=workspace_profile,
-                short_circuit=short_circuit,
-            )
-            if sub_matched:
-                excluded = True
-                reasons.append(f"✗ none_of[{i}]: matched (excluded by NOT condition)")
-                for r in sub_reasons:
-                    reasons.append(f"  {r}")
-                if short_circuit:
-                    return RuleMatchResult(rule_id=rule.id, matched=False, reasons=reasons)
-            else:
-                reasons.append(f"✓ none_of[{i}]: did not match (NOT condition satisfied)")
+# ---------------------------------------------------------------------------
+# On-demand reason rendering
+# ---------------------------------------------------------------------------
+
+
+def _explain_match(rule: PolicyRule | PolicyRuleV1, ctx: _PromptContext, use_v1: bool) -> str:
+    """Render the explanation for a matched rule (called lazily by PolicyDecision)."""
+    reasons: list[str] = []
+    if use_v1:
+        _check_rule_v1(rule, ctx, reasons=reasons)  # type: ignore[arg-type]
+    else:
+        _check_rule(rule, ctx, reasons=reasons)  # type: ignore[arg-type]
+    return (
+        f"Rule {rule.id!r} matched"
+        + (f" — {rule.description}" if rule.description else "")
+        + ": "
+        + "; ".join(r.lstrip("✓ ").lstrip("✗ ") for r in reasons if r.startswith("✓"))
+    )
 
-    final_matched = primary_matched and not excluded
-    return RuleMatchResult(rule_id=rule.id, matched=final_matched, reasons=reasons)
+
+def _describe_failure(
+    rule: PolicyRule | PolicyRuleV1, failed: str, ctx: _PromptContext, use_v1: bool
+) -> str:
+    """Render the reason for one entry of a compact failed-criteria record."""
+    criteria = _V1_CRITERIA_BY_NAME if use_v1 else _V0_CRITERIA_BY_NAME
+    check = criteria.get(failed)
+    if check is not None:
+        _ok, reason = check(rule.match, ctx, True)
+        return f"✗ {reason}"
+    if failed == "any_of":
+        return "✗ any_of: no sub-block matched"
+    return f"✗ {failed}: matched (excluded by NOT condition)"
+
+
+def _failure_reasons(
+    policy: Policy | PolicyV1,
+    failures: list[tuple[str, str]],
+    ctx: _PromptContext,
+    use_v1: bool,
+) -> list[str]:
+    """Render one ``"<rule_id>: ✗ <reason>"`` line per skipped rule."""
+    rules: dict[str, PolicyRule | PolicyRuleV1] = {r.id: r for r in policy.rules}
+    return [
+        f"{rule_id}: {_describe_failure(rules[rule_id], failed, ctx, use_v1)}"
+        for rule_id, failed in failures
+    ]
 
 
 # ---------------------------------------------------------------------------
@@ -515,7 +677,7 @@ def _compute_risk(
 
 
 def evaluate(
-    policy: Policy | PolicyV1,
+    policy: Policy | PolicyV1 | CompiledPolicy,
     prompt_text: str,
     prompt_type: str,
     confidence: str,
@@ -541,7 +703,8 @@ def evaluate(
     Computes a deterministic risk assessment for every decision.
 
     Args:
-        policy:       Validated Policy (v0) or PolicyV1 (v1) instance.
+        policy:       Validated Policy (v0) or PolicyV1 (v1) instance, or a
+                      :class:`CompiledPolicy` for repeated evaluation.
         prompt_text:  The prompt excerpt (as seen by the user).
         prompt_type:  PromptType string value (e.g. "yes_no").
         confidence:   Confidence string (e.g. "high", "medium", "low").
@@ -565,78 +728,82 @@ def evaluate(
     """
     from atlasbridge.core.policy.model_v1 import PolicyV1
 
-    policy_hash = policy.content_hash()
+    rules: Iterable[PolicyRule | PolicyRuleV1]
+    if isinstance(policy, CompiledPolicy):
+        # Only rules the index cannot rule out are checked, still in policy order
+        compiled = policy
+        policy = compiled.policy
+        policy_hash = compiled.policy_hash
+        rules = compiled.candidates(
+            tool_id=tool_id,
+            prompt_type=prompt_type,
+            repo=repo,
+            session_tag=session_tag,
+            environment=environment,
+        )
+    else:
+        policy_hash = policy.content_hash()
+        rules = policy.rules
     autonomy_mode = policy.autonomy_mode.value
 
     use_v1 = isinstance(policy, PolicyV1)
+    check: Callable[[Any, _PromptContext], str | None] = _check_rule_v1 if use_v1 else _check_rule
+    ctx = _PromptContext(
+        prompt_type,
+        confidence,
+        prompt_text,
+        tool_id,
+        repo,
+        session_tag,
+        session_state,
+        channel_message,
+        environment,
+        workspace_trusted,
+        workspace_profile,
+    )
+    failures: list[tuple[str, str]] = []
 
-    # Evaluate rules in order — first match wins
-    for rule in policy.rules:
-        if use_v1:
-            result = _evaluate_rule_v1(
-                rule=rule,  # type: ignore[arg-type]
-                prompt_type=prompt_type,
-                confidence=confidence,
-                excerpt=prompt_text,
-                tool_id=tool_id,
-                repo=repo,
-                session_tag=session_tag,
-                session_state=session_state,
-                channel_message=channel_message,
-                environment=environment,
-                workspace_trusted=workspace_trusted,
-                workspace_profile=workspace_profile,
-            )
-        else:
-            result = _evaluate_rule(
-                rule=rule,  # type: ignore[arg-type]
-                prompt_type=prompt_type,
-                confidence=confidence,
-                excerpt=prompt_text,
-                tool_id=tool_id,
-                repo=repo,
-            )
-
-        if result.matched:
-            explanation = (
-                f"Rule {rule.id!r} matched"
-                + (f" — {rule.description}" if rule.description else "")
-                + ": "
-                + "; ".join(
-                    r.lstrip("✓ ").lstrip("✗ ") for r in result.reasons if r.startswith("✓")
-                )
-            )
-            risk_score, risk_cat, risk_factors = _compute_risk(
-                prompt_type=prompt_type,
-                action_type=rule.action.type,
-                confidence=confidence,
-                branch=branch,
-                ci_status=ci_status,
-                file_scope=file_scope,
-                command_pattern=command_pattern,
-                environment=environment,
-            )
-            logger.debug(
-                "policy_match",
-                rule_id=rule.id,
-                action=rule.action.type,
-                risk_score=risk_score,
-                risk_category=risk_cat,
-            )
-            return PolicyDecision(
-                prompt_id=prompt_id,
-                session_id=session_id,
-                policy_hash=policy_hash,
-                matched_rule_id=rule.id,
-                action=rule.action,
-                explanation=explanation,
-                confidence=confidence,
-                prompt_type=prompt_type,
-                autonomy_mode=autonomy_mode,
-                risk_score=risk_score,
-                risk_category=risk_cat,
-                risk_factors=risk_factors,
-            )
+    # Evaluate rules in order — first match wins. Only the failed criterion
+    # name is recorded here; reason strings are rendered on demand.
+    for rule in rules:
+        failed = check(rule, ctx)
+        if failed is not None:
+            failures.append((rule.id, failed))
+            continue
+
+        risk_score, risk_cat, risk_factors = _compute_risk(
+            prompt_type=prompt_type,
+            action_type=rule.action.type,
+            confidence=confidence,
+            branch=branch,
+            ci_status=ci_status,
+            file_scope=file_scope,
+            command_pattern=command_pattern,
+            environment=environment,
+        )
+        logger.debug(
+            "policy_match",
+            rule_id=rule.id,
+            action=rule.action.type,
+            risk_score=risk_score,
+            risk_category=risk_cat,
+        )
+        return PolicyDecision(
+            prompt_id=prompt_id,
+            session_id=session_id,
+            policy_hash=policy_hash,
+            matched_rule_id=rule.id,
+            action=rule.action,
+            explanation=partial(_explain_match, rule, ctx, use_v1),
+            confidence=confidence,
+            prompt_type=prompt_type,
+            autonomy_mode=autonomy_mode,
+            risk_score=risk_score,
+            risk_category=risk_cat,
+            risk_factors=risk_factors,
+            failed_criteria=tuple(failures),
+            failure_reasons=partial(_failure_reasons, policy, failures, ctx, use_v1),
+        )
 
     # No rule matched — apply defaults
     conf_level = confidence_from_str(confidence)
@@ -679,4 +846,6 @@ def evaluate(
         risk_score=risk_score,
         risk_category=risk_cat,
         risk_factors=risk_factors,
+        failed_criteria=tuple(failures),
+        failure_reasons=partial(_failure_reasons, policy, failures, ctx, use_v1),
     )
@@ -260,6 +260,13 @@ def explain_decision(decision: PolicyDecision) -> str:
     lines.append("")
     lines.append(f"Explanation:   {decision.explanation}")
 
+    failure_reasons = decision.failure_reasons()
+    if failure_reasons:
+        lines.append("")
+        lines.append("Skipped rules:")
+        for reason in failure_reasons:
+            lines.append(f"  {reason}")
+
     # Risk assessment (GA)
     if decision.risk_score is not None:
         lines.append("")
@@ -13,11 +13,15 @@ from __future__ import annotations
 
 import hashlib
 import json
+import re
+from collections.abc import Callable
 from datetime import UTC, datetime
 from enum import Enum
 from typing import Annotated, Any, Literal
 
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import BaseModel, Field, PrivateAttr, field_validator, model_validator
+
+from atlasbridge.core.policy.regex_safety import backtracking_hazard
 
 # ---------------------------------------------------------------------------
 # Enums
@@ -189,6 +193,71 @@ PolicyAction = Annotated[
 ]
 
 
+# ---------------------------------------------------------------------------
+# Regex safety
+# ---------------------------------------------------------------------------
+
+MAX_REGEX_LENGTH = 200
+"""Maximum length of a ``contains`` regex."""
+
+CONTAINS_REGEX_FLAGS = re.IGNORECASE | re.DOTALL
+TOOL_NAME_REGEX_FLAGS = re.IGNORECASE
+
+
+def compile_safe_regex(pattern: str, flags: int, field_name: str = "contains") -> re.Pattern[str]:
+    """
+    Compile a policy regex, rejecting patterns prone to catastrophic backtracking.
+
+    This replaces a per-evaluation alarm timeout: unsafe shapes (nested or
+    adjacent overlapping quantifiers, ambiguous repeated alternation) are
+    refused when the policy loads, so matching needs no signals and is safe
+    on any thread. See :mod:`atlasbridge.core.policy.regex_safety`.
+
+    Raises:
+        ValueError: if the pattern is invalid or has a backtracking hazard.
+    """
+    try:
+        compiled = re.compile(pattern, flags)
+    except re.error as exc:
+        raise ValueError(f"Invalid regex in {field_name}: {exc}") from exc
+    hazard = backtracking_hazard(pattern, flags)
+    if hazard is not None:
+        raise ValueError(
+            f"Regex {pattern!r} in {field_name} risks catastrophic backtracking: {hazard}"
+        )
+    return compiled
+
+
+def _cached_regex(
+    model: BaseModel, attr: str, pattern: str | None, flags: int, field_name: str
+) -> re.Pattern[str] | None:
+    """Return the compiled regex cached on *model*, recompiling if the source changed."""
+    if pattern is None:
+        return None
+    cached: re.Pattern[str] | None = getattr(model, attr)
+    if cached is not None and cached.pattern == pattern:
+        return cached
+    try:
+        compiled = compile_safe_regex(pattern, flags, field_name)
+    except ValueError:
+        return None
+    setattr(model, attr, compiled)
+    return compiled
+
+
+def validate_contains_regex(model: BaseModel, contains: str) -> None:
+    """Load-time checks for a ``contains`` regex; caches the compiled pattern on *model*."""
+    if len(contains) > MAX_REGEX_LENGTH:
+        raise ValueError(f"contains regex too long ({len(contains)} chars, max {MAX_REGEX_LENGTH})")
+    compiled = compile_safe_regex(contains, CONTAINS_REGEX_FLAGS)
+    # Reject patterns that match empty string (too broad)
+    if compiled.match(""):
+        raise ValueError(
+            f"Regex {contains!r} matches empty string — too broad; use a more specific pattern"
+        )
+    setattr(model, "_contains_re", compiled)  # noqa: B010
+
+
 # ---------------------------------------------------------------------------
 # Match criteria
 # ---------------------------------------------------------------------------
@@ -220,6 +289,10 @@ class MatchCriteria(BaseModel):
     min_confidence: ConfidenceLevel = ConfidenceLevel.LOW
     """Minimum confidence level. event.confidence >= min_confidence required."""
 
+    # Compiled at load time by validate_regex()
+    _contains_re: re.Pattern[str] | None = PrivateAttr(default=None)
+    _tool_name_re: re.Pattern[str] | None = PrivateAttr(default=None)
+
     @field_validator("contains")
     @classmethod
     def validate_contains_not_empty_match(cls, v: str | None) -> str | None:
@@ -230,22 +303,25 @@ class MatchCriteria(BaseModel):
     @model_validator(mode="after")
     def validate_regex(self) -> MatchCriteria:
         if self.contains_is_regex and self.contains:
-            import re
-
-            if len(self.contains) > 200:
-                raise ValueError(f"contains regex too long ({len(self.contains)} chars, max 200)")
-            try:
-                compiled = re.compile(self.contains, re.IGNORECASE)
-            except re.error as exc:
-                raise ValueError(f"Invalid regex in contains: {exc}") from exc
-            # Reject patterns that match empty string (too broad)
-            if compiled.match(""):
-                raise ValueError(
-                    f"Regex {self.contains!r} matches empty string — too broad; "
-                    "use a more specific pattern"
-                )
+            validate_contains_regex(self, self.contains)
+        if self.contains_is_regex and self.tool_name:
+            self._tool_name_re = compile_safe_regex(
+                self.tool_name, TOOL_NAME_REGEX_FLAGS, field_name="tool_name"
+            )
         return self
 
+    @property
+    def contains_regex(self) -> re.Pattern[str] | None:
+        """Compiled ``contains`` regex (None for substring rules or an invalid pattern)."""
+        pattern = self.contains if self.contains_is_regex else None
+        return _cached_regex(self, "_contains_re", pattern, CONTAINS_REGEX_FLAGS, "contains")
+
+    @property
+    def tool_name_regex(self) -> re.Pattern[str] | None:
+        """Compiled ``tool_name`` regex (None unless ``contains_is_regex`` is set)."""
+        pattern = self.tool_name if self.contains_is_regex else None
+        return _cached_regex(self, "_tool_name_re", pattern, TOOL_NAME_REGEX_FLAGS, "tool_name")
+
 
 # ---------------------------------------------------------------------------
 # Rule + policy
@@ -345,6 +421,10 @@ class PolicyDecision:
     - Idempotent: same (policy_hash, prompt_id, session_id) → same decision
     - Auditable: serializes to JSONL for the decision trace
     - Explainable: explanation field describes why this rule matched
+
+    The evaluator records only which criterion failed for each skipped rule
+    (``failed_criteria``); the explanation and per-rule failure reasons are
+    rendered the first time they are read.
     """
 
     __slots__ = (
@@ -356,7 +436,9 @@ class PolicyDecision:
         "action",
         "action_type",
         "action_value",
-        "explanation",
+        "_explanation",
+        "_failure_reasons",
+        "failed_criteria",
         "confidence",
         "prompt_type",
         "autonomy_mode",
@@ -374,13 +456,15 @@ class PolicyDecision:
         policy_hash: str,
         matched_rule_id: str | None,
         action: PolicyAction,
-        explanation: str,
+        explanation: str | Callable[[], str],
         confidence: str,
         prompt_type: str,
         autonomy_mode: str,
         risk_score: int | None = None,
         risk_category: str | None = None,
         risk_factors: list[dict[str, Any]] | None = None,
+        failed_criteria: tuple[tuple[str, str], ...] = (),
+        failure_reasons: Callable[[], list[str]] | None = None,
     ) -> None:
         self.prompt_id = prompt_id
         self.session_id = session_id
@@ -389,7 +473,10 @@ class PolicyDecision:
         self.action = action
         self.action_type = action.type
         self.action_value = getattr(action, "value", "")
-        self.explanation = explanation
+        self._explanation = explanation
+        self._failure_reasons = failure_reasons
+        # (rule_id, criterion) for each rule checked and skipped, in order
+        self.failed_criteria = failed_criteria
         self.confidence = confidence
         self.prompt_type = prompt_type
         self.autonomy_mode = autonomy_mode
@@ -402,6 +489,19 @@ class PolicyDecision:
         raw = f"{policy_hash}:{prompt_id}:{session_id}"
         self.idempotency_key = hashlib.sha256(raw.encode()).hexdigest()[:16]
 
+    @property
+    def explanation(self) -> str:
+        """Why this decision was made (rendered on first access)."""
+        if callable(self._explanation):
+            self._explanation = self._explanation()
+        return self._explanation
+
+    def failure_reasons(self) -> list[str]:
+        """Human-readable reason for each entry of ``failed_criteria``."""
+        if self._failure_reasons is None:
+            return []
+        return self._failure_reasons()
+
     def to_dict(self) -> dict[str, Any]:
         d: dict[str, Any] = {
             "timestamp": self.timestamp,
@@ -20,15 +20,19 @@ Design notes:
 from __future__ import annotations
 
 import hashlib
+import re
 
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import BaseModel, Field, PrivateAttr, field_validator, model_validator
 
 from atlasbridge.core.policy.model import (
+    CONTAINS_REGEX_FLAGS,
     AutonomyMode,
     ConfidenceLevel,
     PolicyAction,
     PolicyDefaults,
     PromptTypeFilter,
+    _cached_regex,
+    validate_contains_regex,
 )
 
 # ---------------------------------------------------------------------------
@@ -118,6 +122,9 @@ class MatchCriteriaV1(BaseModel):
     none_of: list[MatchCriteriaV1] | None = None
     """NOT logic: rule fails if ANY sub-criteria block matches."""
 
+    # Compiled at load time by validate_regex()
+    _contains_re: re.Pattern[str] | None = PrivateAttr(default=None)
+
     @field_validator("contains")
     @classmethod
     def validate_contains_not_empty(cls, v: str | None) -> str | None:
@@ -152,21 +159,15 @@ class MatchCriteriaV1(BaseModel):
     @model_validator(mode="after")
     def validate_regex(self) -> MatchCriteriaV1:
         if self.contains_is_regex and self.contains:
-            import re
-
-            if len(self.contains) > 200:
-                raise ValueError(f"contains regex too long ({len(self.contains)} chars, max 200)")
-            try:
-                compiled = re.compile(self.contains, re.IGNORECASE)
-            except re.error as exc:
-                raise ValueError(f"Invalid regex in contains: {exc}") from exc
-            if compiled.match(""):
-                raise ValueError(
-                    f"Regex {self.contains!r} matches empty string — too broad; "
-                    "use a more specific pattern"
-                )
+            validate_contains_regex(self, self.contains)
         return self
 
+    @property
+    def contains_regex(self) -> re.Pattern[str] | None:
+        """Compiled ``contains`` regex (None for substring rules or an invalid pattern)."""
+        pattern = self.contains if self.contains_is_regex else None
+        return _cached_regex(self, "_contains_re", pattern, CONTAINS_REGEX_FLAGS, "contains")
+
     @model_validator(mode="after")
     def any_of_and_flat_mutually_exclusive(self) -> MatchCriteriaV1:
         """any_of replaces flat AND criteria — they cannot coexist on the same block."""
@@ -0,0 +1,409 @@
+"""
+Load-time backtracking analysis for policy regexes.
+
+Policy regexes run on every prompt, on any thread, with no timeout. Instead
+of arming an alarm per match, patterns whose structure allows super-linear
+backtracking are refused when the policy loads. Three shapes are rejected:
+
+- nested quantifiers: a variable-length item inside an unbounded repeat,
+  e.g. ``(a+)+`` or ``(\\w+\\s?)*``;
+- ambiguous alternation under an unbounded repeat: alternatives that can
+  start with the same character (or match empty), e.g. ``(a|a)+``, ``(a|aa)*``;
+- adjacent overlapping quantifiers: two unbounded repeats separated only by
+  optional items whose character sets overlap, e.g. ``a*a*b`` or ``\\w+\\d+``.
+
+A mandatory separator breaks the ambiguity: a repeated group such as
+``(\\d+\\.)+`` or ``(-[a-z]+)*`` is accepted when each iteration must match a
+character its variable parts cannot, because then there is only one way to
+split the input into iterations.
+
+The analysis is conservative — it may reject a pattern that is in fact safe,
+never the reverse for these shapes.
+
+The stdlib regex parser (``re._parser``) is the only way to inspect pattern
+structure without reimplementing it. It is private and has no typeshed stubs,
+so it is confined to this module.
+"""
+
+from __future__ import annotations
+
+import functools
+import re
+import re._casefix as _casefix  # type: ignore[import-not-found]  # private stdlib, see docstring
+import re._constants as _c  # type: ignore[import-not-found]  # private stdlib, see docstring
+import re._parser as _p  # type: ignore[import-not-found]  # private stdlib, see docstring
+from typing import Any
+
+# Characters are modelled over Latin-1 plus one sentinel per class of other
+# code points. The classes partition the rest of Unicode the way \d, \w and
+# \s do (digits are word characters; nothing is both word and space), so
+# e.g. \s and \S stay disjoint.
+_OTHER_DIGIT = -1
+_OTHER_WORD = -2  # word characters that are not digits
+_OTHER_SPACE = -3
+_OTHER_PUNCT = -4  # neither word nor space
+_OTHERS = frozenset({_OTHER_DIGIT, _OTHER_WORD, _OTHER_SPACE, _OTHER_PUNCT})
+_UNIVERSE = frozenset(range(256)) | _OTHERS
+
+_DIGIT_RE = re.compile(r"\d")
+_WORD_RE = re.compile(r"\w")
+_SPACE_RE = re.compile(r"\s")
+
+
+def _code(code: int) -> int:
+    """Map a code point to itself (Latin-1) or to its class sentinel."""
+    if code < 256:
+        return code
+    ch = chr(code)
+    if _DIGIT_RE.match(ch):
+        return _OTHER_DIGIT
+    if _WORD_RE.match(ch):
+        return _OTHER_WORD
+    if _SPACE_RE.match(ch):
+        return _OTHER_SPACE
+    return _OTHER_PUNCT
+
+
+def _category_table(flags: int) -> dict[Any, frozenset[int]]:
+    others = {
+        _c.CATEGORY_DIGIT: {_OTHER_DIGIT},
+        _c.CATEGORY_NOT_DIGIT: {_OTHER_WORD, _OTHER_SPACE, _OTHER_PUNCT},
+        _c.CATEGORY_SPACE: {_OTHER_SPACE},
+        _c.CATEGORY_NOT_SPACE: {_OTHER_DIGIT, _OTHER_WORD, _OTHER_PUNCT},
+        _c.CATEGORY_WORD: {_OTHER_DIGIT, _OTHER_WORD},
+        _c.CATEGORY_NOT_WORD: {_OTHER_SPACE, _OTHER_PUNCT},
+    }
+    escapes = {
+        _c.CATEGORY_DIGIT: r"\d",
+        _c.CATEGORY_NOT_DIGIT: r"\D",
+        _c.CATEGORY_SPACE: r"\s",
+        _c.CATEGORY_NOT_SPACE: r"\S",
+        _c.CATEGORY_WORD: r"\w",
+        _c.CATEGORY_NOT_WORD: r"\W",
+    }
+    table = {}
+    for category, escape in escapes.items():
+        pattern = re.compile(escape, flags)
+        latin1 = {code for code in range(256) if pattern.match(chr(code))}
+        if flags & re.ASCII:
+            # ASCII classes match no other code point; their negations match all
+            sentinels = set(_OTHERS) if escape.isupper() else set()
+        else:
+            sentinels = others[category]
+        table[category] = frozenset(latin1 | sentinels)
+    return table
+
+
+_UNICODE_CATEGORIES = _category_table(0)
+_ASCII_CATEGORIES = _category_table(re.ASCII)
+# Used when ASCII mode is set anywhere in the pattern: covers both meanings
+_MIXED_CATEGORIES = {k: v | _ASCII_CATEGORIES[k] for k, v in _UNICODE_CATEGORIES.items()}
+
+
+@functools.cache
+def _fold_partners() -> frozenset[int]:
+    """Latin-1 characters that match some other code point case-insensitively."""
+    partners: set[int] = set()
+    for code in range(256, 0x10000):
+        ch = chr(code)
+        partners.update(ord(v) for v in (ch.lower(), ch.upper()) if len(v) == 1 and ord(v) < 256)
+    for code, extra in _casefix._EXTRA_CASES.items():
+        if code < 256 and any(e >= 256 for e in extra):
+            partners.add(code)
+    for code in list(partners):
+        ch = chr(code)
+        partners.update(ord(v) for v in (ch.lower(), ch.upper()) if len(v) == 1 and ord(v) < 256)
+    return frozenset(partners)
+
+
+_VARIABLE_REPEATS = (_c.MAX_REPEAT, _c.MIN_REPEAT)
+
+# Text an unbounded repeat can hand back to a later one when backtracking:
+# (characters it can start with, characters it must contain).
+_Trader = tuple[frozenset[int], frozenset[int]]
+
+
+class _HazardError(Exception):
+    """Raised internally when a backtracking hazard is found."""
+
+
+def _casefold(chars: set[int]) -> set[int]:
+    folded = set(chars)
+    for code in chars:
+        if code >= 0:
+            ch = chr(code)
+            folded.update(_code(ord(v)) for v in (ch.lower(), ch.upper()) if len(v) == 1)
+            if code in _fold_partners():
+                folded.add(_OTHER_WORD)
+    if _OTHER_WORD in chars:
+        folded |= _fold_partners()
+    return folded
+
+
+def _class_chars(
+    items: Any, ignorecase: bool, categories: dict[Any, frozenset[int]]
+) -> frozenset[int]:
+    """Characters matched by the body of an ``IN`` (character class) node."""
+    chars: set[int] = set()
+    whole: set[int] = set()  # sentinels whose entire class is included
+    negate = False
+    for op, av in items:
+        if op is _c.NEGATE:
+            negate = True
+        elif op is _c.LITERAL:
+            chars.add(_code(av))
+        elif op in (_c.RANGE, _c.RANGE_UNI_IGNORE):
+            lo, hi = av
+            chars.update(range(lo, min(hi, 255) + 1))
+            if hi >= 256:
+                chars.update(_OTHERS)
+        elif op is _c.CATEGORY and av in categories:
+            chars |= categories[av]
+            whole |= categories[av] & _OTHERS
+        else:
+            return _UNIVERSE
+    if ignorecase:
+        chars = _casefold(chars)
+    if negate:
+        # A sentinel only partly in the class stays in its complement.
+        return _UNIVERSE - chars | (chars & _OTHERS) - whole
+    return frozenset(chars)
+
+
+def _flatten(items: Any) -> list[tuple[Any, Any]]:
+    """Top-level items of a sequence, with groups expanded in place."""
+    flat: list[tuple[Any, Any]] = []
+    for op, av in items:
+        if op is _c.SUBPATTERN:
+            flat.extend(_flatten(av[-1]))
+        else:
+            flat.append((op, av))
+    return flat
+
+
+def _children(op: Any, av: Any) -> list[Any]:
+    """Sub-sequences nested in one parsed item."""
+    if op in (*_VARIABLE_REPEATS, _c.POSSESSIVE_REPEAT):
+        return [av[2]]
+    if op in (_c.SUBPATTERN, _c.ATOMIC_GROUP):
+        return [av[-1]]
+    if op is _c.BRANCH:
+        return list(av[1])
+    if op in (_c.ASSERT, _c.ASSERT_NOT):
+        return [av[1]]
+    if op is _c.GROUPREF_EXISTS:
+        return [b for b in av[1:] if b is not None]
+    return []
+
+
+def _has_ascii_flag(items: Any) -> bool:
+    """True if a scoped ``(?a:...)`` group appears anywhere in *items*."""
+    for op, av in items:
+        if op is _c.SUBPATTERN and av[1] & re.ASCII:
+            return True
+        if any(_has_ascii_flag(child) for child in _children(op, av)):
+            return True
+    return False
+
+
+class _Analyzer:
+    def __init__(self, parsed: Any, flags: int) -> None:
+        self._state = parsed.state
+        flags |= parsed.state.flags
+        self._ignorecase = bool(flags & re.IGNORECASE)
+        if flags & re.ASCII:
+            self._categories = _ASCII_CATEGORIES
+        elif _has_ascii_flag(parsed):
+            self._categories = _MIXED_CATEGORIES
+        else:
+            self._categories = _UNICODE_CATEGORIES
+
+    # -- helpers ------------------------------------------------------------
+
+    def _width(self, op: Any, av: Any) -> tuple[int, int]:
+        lo, hi = _p.SubPattern(self._state, [(op, av)]).getwidth()
+        return int(lo), int(hi)
+
+    def _min_width(self, op: Any, av: Any) -> int:
+        return self._width(op, av)[0]
+
+    def _is_variable(self, items: Any) -> bool:
+        lo, hi = items.getwidth()
+        return bool(lo != hi)
+
+    def _chars(self, items: Any) -> frozenset[int]:
+        """Every character a sequence may consume."""
+        chars: set[int] = set()
+        for op, av in items:
+            if op is _c.LITERAL:
+                literal = {_code(av)}
+                chars |= _casefold(literal) if self._ignorecase else literal
+            elif op is _c.NOT_LITERAL:
+                excluded = _casefold({_code(av)}) if self._ignorecase else {_code(av)}
+                chars |= _UNIVERSE - (excluded - _OTHERS)
+            elif op is _c.IN:
+                chars |= _class_chars(av, self._ignorecase, self._categories)
+            elif op in (*_VARIABLE_REPEATS, _c.POSSESSIVE_REPEAT):
+                chars |= self._chars(av[2])
+            elif op in (_c.SUBPATTERN, _c.ATOMIC_GROUP):
+                chars |= self._chars(av[-1])
+            elif op is _c.BRANCH:
+                for branch in av[1]:
+                    chars |= self._chars(branch)
+            elif op in (_c.AT, _c.ASSERT, _c.ASSERT_NOT):
+                continue
+            else:
+                return _UNIVERSE
+        return frozenset(chars)
+
+    def _first(self, items: Any) -> frozenset[int]:
+        """Characters a sequence may start with."""
+        first: set[int] = set()
+        for op, av in items:
+            if op in (_c.AT, _c.ASSERT, _c.ASSERT_NOT):
+                continue
+            if op in (*_VARIABLE_REPEATS, _c.POSSESSIVE_REPEAT):
+                first |= self._first(av[2])
+            elif op in (_c.SUBPATTERN, _c.ATOMIC_GROUP):
+                first |= self._first(av[-1])
+            elif op is _c.BRANCH:
+                for branch in av[1]:
+                    first |= self._first(branch)
+            else:
+                first |= self._chars([(op, av)])
+            if self._min_width(op, av) > 0:
+                break
+        return frozenset(first)
+
+    def _separated(self, body: Any) -> bool:
+        """True if every match of *body* has a character its variable parts cannot match."""
+        items = _flatten(body)
+        widths = [self._width(op, av) for op, av in items]
+        variable: set[int] = set()
+        for item, (lo, hi) in zip(items, widths, strict=True):
+            if lo != hi:
+                variable |= self._chars([item])
+        return any(
+            not self._chars([item]) & variable
+            for item, (lo, hi) in zip(items, widths, strict=True)
+            if 0 < lo == hi
+        )
+
+    def _required(self, body: Any) -> frozenset[int]:
+        """A set of characters every match of *body* must contain (the smallest known)."""
+        mandatory = [
+            self._chars([(op, av)]) for op, av in _flatten(body) if self._min_width(op, av) > 0
+        ]
+        return min(mandatory, key=len) if mandatory else self._chars(body)
+
+    # -- checks ---------------------------------------------------------------
+
+    def check_nesting(
+        self, items: Any, in_unbounded: bool = False, separated: bool = False
+    ) -> None:
+        """
+        Reject variable-length items and ambiguous alternation under ``+``/``*``.
+
+        *separated* is set inside an unbounded repeat whose iterations are
+        delimited by a mandatory separator; variable-length items are then
+        allowed, but alternation must still be unambiguous.
+        """
+        for op, av in items:
+            if op in _VARIABLE_REPEATS:
+                lo, hi, body = av
+                if in_unbounded and not separated and (lo != hi or self._is_variable(body)):
+                    raise _HazardError(
+                        "nested quantifier inside an unbounded repeat (e.g. '(a+)+')"
+                    )
+                if hi == _c.MAXREPEAT:
+                    self.check_nesting(body, True, self._separated(body))
+                else:
+                    self.check_nesting(body, in_unbounded, separated)
+            elif op is _c.SUBPATTERN:
+                self.check_nesting(av[-1], in_unbounded, separated)
+            elif op is _c.BRANCH:
+                branches = av[1]
+                if in_unbounded:
+                    self._check_alternation(branches)
+                for branch in branches:
+                    self.check_nesting(branch, in_unbounded, separated)
+            elif op in (_c.ASSERT, _c.ASSERT_NOT):
+                self.check_nesting(av[1], in_unbounded, separated)
+            elif op is _c.GROUPREF_EXISTS:
+                for branch in av[1:]:
+                    if branch is not None:
+                        self.check_nesting(branch, in_unbounded, separated)
+            # Possessive repeats and atomic groups never backtrack into their body.
+
+    def _check_alternation(self, branches: Any) -> None:
+        seen: set[int] = set()
+        for branch in branches:
+            if branch.getwidth()[0] == 0:
+                raise _HazardError(
+                    "ambiguous alternation inside an unbounded repeat (e.g. '(a|aa)+')"
+                )
+            first = self._first(branch)
+            if seen & first:
+                raise _HazardError(
+                    "ambiguous alternation inside an unbounded repeat (e.g. '(a|a)+')"
+                )
+            seen |= first
+
+    def _check_absorb(self, body: Any, pending: frozenset[_Trader]) -> None:
+        """Reject a repeat of *body* that can take over text handed back by *pending*."""
+        first, chars = self._first(body), self._chars(body)
+        for start, required in pending:
+            if start & first and required & chars:
+                raise _HazardError("adjacent quantifiers over overlapping characters (e.g. 'a*a*')")
+
+    def check_adjacency(self, items: Any, pending: frozenset[_Trader]) -> frozenset[_Trader]:
+        """
+        Reject unbounded repeats that can trade characters with an earlier one.
+
+        *pending* describes the unbounded repeats that are still adjacent
+        (only optional items since). Returns the updated set.
+        """
+        for op, av in items:
+            if op in _VARIABLE_REPEATS:
+                lo, hi, body = av
+                if hi == _c.MAXREPEAT:
+                    self._check_absorb(body, pending)
+                    tail = self.check_adjacency(body, frozenset())
+                    # Each iteration starts right after the previous one's tail
+                    self._check_absorb(body, tail)
+                    handed = tail | {(self._first(body), self._required(body))}
+                    pending = pending | handed if lo == 0 else handed
+                else:
+                    self.check_adjacency(body, frozenset())
+                    if self._min_width(op, av) > 0:
+                        pending = frozenset()
+            elif op is _c.SUBPATTERN:
+                pending = self.check_adjacency(av[-1], pending)
+            elif op is _c.BRANCH:
+                ends = [self.check_adjacency(branch, pending) for branch in av[1]]
+                pending = frozenset().union(*ends)
+            elif op in (_c.AT, _c.ASSERT, _c.ASSERT_NOT):
+                if op is not _c.AT:
+                    self.check_adjacency(av[1], frozenset())
+            elif op is _c.GROUPREF_EXISTS:
+                ends = [self.check_adjacency(b, pending) for b in av[1:] if b is not None]
+                pending = frozenset().union(pending, *ends)
+            elif self._min_width(op, av) > 0:
+                pending = frozenset()
+        return pending
+
+
+def backtracking_hazard(pattern: str, flags: int = 0) -> str | None:
+    """
+    Return why *pattern* risks catastrophic backtracking, or None if it is safe.
+
+    The pattern must already be known to compile.
+    """
+    parsed = _p.parse(pattern, flags)
+    analyzer = _Analyzer(parsed, flags)
+    try:
+        analyzer.check_nesting(parsed)
+        analyzer.check_adjacency(parsed, frozenset())
+    except _HazardError as exc:
+        return str(exc)
+    return None
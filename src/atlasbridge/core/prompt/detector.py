@@ -16,6 +16,16 @@ Combination rules:
 Echo suppression:
   After injection, suppress detection for ECHO_SUPPRESS_MS milliseconds
   to prevent the echoed input text from triggering a new prompt event.
+
+Incremental scanning:
+  Each chunk is decoded and ANSI-stripped exactly once by a per-session
+  StreamSanitizer (UTF-8 characters and escapes split across reads are
+  carried over). Prompts only appear at the end of output, so at most the
+  last SCAN_WINDOW_BYTES of a chunk (counted in UTF-8 bytes, whether it
+  arrives raw or already decoded) are processed, and multi-chunk menus are
+  matched against a bounded tail (TAIL_WINDOW_CHARS) that only grows while
+  consecutive chunks carry menu items, joined by newlines. Per-chunk cost
+  is constant however much the CLI prints.
 """
 
 from __future__ import annotations
@@ -24,71 +34,146 @@ import hashlib
 import re
 import time
 from dataclasses import dataclass, field
-from re import Pattern
 
 from atlasbridge.core.prompt.models import Confidence, PromptEvent, PromptType
-from atlasbridge.core.prompt.sanitize import extract_choices, is_meaningful, strip_ansi
+from atlasbridge.core.prompt.sanitize import (
+    SanitizedChunk,
+    StreamSanitizer,
+    extract_choices,
+    is_meaningful_text,
+)
+from atlasbridge.core.prompt.scanner import PatternTier, PromptScanner, ScanRule
 
 # ---------------------------------------------------------------------------
 # Pattern library
 # ---------------------------------------------------------------------------
 
+# Each rule carries the lowercase literals its regex cannot match without
+# (see core/prompt/scanner.py) so chunks lacking them skip the regex.
+
+_DESTRUCTIVE_VERBS = (
+    "delete", "remove", "destroy", "overwrite", "replace", "reset", "drop", "purge",
+    "install", "update", "upgrade", "enable", "disable", "kill", "stop", "terminate",
+)  # fmt: skip
+
 # YES/NO patterns — high confidence
-_YES_NO_PATTERNS: list[Pattern[str]] = [
-    re.compile(
-        r"(?:delete|remove|destroy|overwrite|replace|reset|drop|purge|"
-        r"install|update|upgrade|enable|disable|kill|stop|terminate)\b"
-        r".{0,60}?\[\s*[Yy]\s*/\s*[Nn]\s*\]",
-        re.IGNORECASE,
+_YES_NO_RULES: tuple[ScanRule, ...] = (
+    ScanRule(
+        re.compile(
+            r"(?:delete|remove|destroy|overwrite|replace|reset|drop|purge|"
+            r"install|update|upgrade|enable|disable|kill|stop|terminate)\b"
+            r".{0,60}?\[\s*[Yy]\s*/\s*[Nn]\s*\]",
+            re.IGNORECASE,
+        ),
+        (_DESTRUCTIVE_VERBS, ("/",), ("[",)),
+    ),
+    ScanRule(re.compile(r"\(\s*[Yy]es\s*/\s*[Nn]o\s*\)", re.IGNORECASE), (("yes",), ("/",))),
+    ScanRule(
+        re.compile(r"\[\s*[Yy]\s*/\s*[Nn]\s*\]\s*:?\s*$", re.IGNORECASE | re.MULTILINE),
+        (("/",), ("[",), ("]",)),
     ),
-    re.compile(r"\(\s*[Yy]es\s*/\s*[Nn]o\s*\)", re.IGNORECASE),
-    re.compile(r"\[\s*[Yy]\s*/\s*[Nn]\s*\]\s*:?\s*$", re.IGNORECASE | re.MULTILINE),
-    re.compile(r"(?:^|\n)\s*[Yy]/[Nn]\s*[>:]\s*$", re.MULTILINE),
-    re.compile(r"Do you want to (?:proceed|continue|overwrite)\?", re.IGNORECASE),
-]
+    ScanRule(re.compile(r"(?:^|\n)\s*[Yy]/[Nn]\s*[>:]\s*$", re.MULTILINE), (("y/n",),)),
+    ScanRule(
+        re.compile(r"Do you want to (?:proceed|continue|overwrite)\?", re.IGNORECASE),
+        (("do you want to",),),
+    ),
+)
 
 # CONFIRM ENTER patterns
-_CONFIRM_ENTER_PATTERNS: list[Pattern[str]] = [
-    re.compile(
-        r"press\s+(?:enter|return|<enter>|<return>)\s+to\s+"
-        r"(?:continue|proceed|confirm|accept|start|begin)",
-        re.IGNORECASE,
+_CONFIRM_ENTER_RULES: tuple[ScanRule, ...] = (
+    ScanRule(
+        re.compile(
+            r"press\s+(?:enter|return|<enter>|<return>)\s+to\s+"
+            r"(?:continue|proceed|confirm|accept|start|begin)",
+            re.IGNORECASE,
+        ),
+        (("press",), ("enter", "return")),
+    ),
+    ScanRule(
+        re.compile(r"hit\s+(?:enter|return)\s+to\s+(?:continue|proceed)", re.IGNORECASE),
+        (("hit",), ("enter", "return")),
     ),
-    re.compile(r"hit\s+(?:enter|return)\s+to\s+(?:continue|proceed)", re.IGNORECASE),
-    re.compile(r"\[Press\s+Enter\]", re.IGNORECASE),
-    re.compile(r"--More--", re.IGNORECASE),
-]
+    ScanRule(re.compile(r"\[Press\s+Enter\]", re.IGNORECASE), (("[press",), ("enter]",))),
+    ScanRule(re.compile(r"--More--", re.IGNORECASE), (("--more--",),)),
+)
 
 # MULTIPLE CHOICE patterns
-_MULTIPLE_CHOICE_PATTERNS: list[Pattern[str]] = [
-    re.compile(
-        r"(?:select|choose|pick|enter)\s+(?:an?\s+)?(?:option|choice|number)\s*"
-        r"[\(\[]\s*\d+\s*[-–]\s*\d+\s*[\)\]]",
-        re.IGNORECASE,
+_MULTIPLE_CHOICE_RULES: tuple[ScanRule, ...] = (
+    ScanRule(
+        re.compile(
+            r"(?:select|choose|pick|enter)\s+(?:an?\s+)?(?:option|choice|number)\s*"
+            r"[\(\[]\s*\d+\s*[-–]\s*\d+\s*[\)\]]",
+            re.IGNORECASE,
+        ),
+        (("select", "choose", "pick", "enter"), ("option", "choice", "number")),
     ),
     # Numbered items — allow Unicode bullets/arrows (❯, ▶, >, etc.) before digits
-    re.compile(r"(?:^|\n)\s*\S?\s*1[\)\.]\s+\S.+\n\s*\S?\s*2[\)\.]\s+\S", re.DOTALL),
-    re.compile(r"(?:^|\n)\s*\[A\].+\[B\]", re.DOTALL | re.IGNORECASE),
+    ScanRule(
+        re.compile(r"(?:^|\n)\s*\S?\s*1[\)\.]\s+\S.+\n\s*\S?\s*2[\)\.]\s+\S", re.DOTALL),
+        (("1)", "1."), ("2)", "2.")),
+    ),
+    ScanRule(
+        re.compile(r"(?:^|\n)\s*\[A\].+\[B\]", re.DOTALL | re.IGNORECASE),
+        (("[a]",), ("[b]",)),
+    ),
     # Folder trust prompt — "trust" and "folder" in same text, followed by numbered items.
     # Claude Code's safety message puts ~134 chars between "trust" and "folder",
     # so allow up to 200 chars gap.
-    re.compile(
-        r"trust.{0,200}folder.{0,400}?\n\s*\S?\s*1[\)\.]\s+",
-        re.DOTALL | re.IGNORECASE,
+    ScanRule(
+        re.compile(
+            r"trust.{0,200}folder.{0,400}?\n\s*\S?\s*1[\)\.]\s+",
+            re.DOTALL | re.IGNORECASE,
+        ),
+        (("trust",), ("folder",), ("1)", "1.")),
     ),
-]
+)
 
 # FREE TEXT patterns
-_FREE_TEXT_PATTERNS: list[Pattern[str]] = [
-    re.compile(r"(?:enter|type|provide|input)\b.{1,40}:\s*$", re.IGNORECASE | re.MULTILINE),
-    re.compile(
-        r"(?:name|email|username|branch|message|description)\s*:\s*$", re.IGNORECASE | re.MULTILINE
+_FREE_TEXT_RULES: tuple[ScanRule, ...] = (
+    ScanRule(
+        re.compile(r"(?:enter|type|provide|input)\b.{1,40}:\s*$", re.IGNORECASE | re.MULTILINE),
+        (("enter", "type", "provide", "input"), (":",)),
     ),
-    re.compile(r"(?:password|token|api.?key)\s*:\s*$", re.IGNORECASE | re.MULTILINE),
-]
+    ScanRule(
+        re.compile(
+            r"(?:name|email|username|branch|message|description)\s*:\s*$",
+            re.IGNORECASE | re.MULTILINE,
+        ),
+        (("name", "email", "branch", "message", "description"), (":",)),
+    ),
+    ScanRule(
+        re.compile(r"(?:password|token|api.?key)\s*:\s*$", re.IGNORECASE | re.MULTILINE),
+        (("password", "token", "api"), (":",)),
+    ),
+)
+
+# Generic pattern library, compiled in priority order. Adapter detectors extend it.
+GENERIC_SCANNER = PromptScanner(
+    [
+        PatternTier(PromptType.TYPE_YES_NO, Confidence.HIGH, _YES_NO_RULES, choices=("y", "n")),
+        PatternTier(
+            PromptType.TYPE_CONFIRM_ENTER, Confidence.HIGH, _CONFIRM_ENTER_RULES, choices=("\n",)
+        ),
+        PatternTier(
+            PromptType.TYPE_MULTIPLE_CHOICE,
+            Confidence.HIGH,
+            _MULTIPLE_CHOICE_RULES,
+            extract_choices=True,
+            multi_chunk=True,
+        ),
+        PatternTier(PromptType.TYPE_FREE_TEXT, Confidence.MED, _FREE_TEXT_RULES),
+    ]
+)
 
 ECHO_SUPPRESS_MS = 500  # ms to suppress detection after injection
 CONTENT_DEDUP_WINDOW_S = 30.0  # suppress duplicate events with same content within this window
+SCAN_WINDOW_BYTES = 4096  # only the end of a chunk can hold a pending prompt
+TAIL_WINDOW_CHARS = 2000  # sanitized output kept for multi-chunk menus
+_UTF8_CONTINUATION = bytes(range(0x80, 0xC0))
+
+# A chunk carrying a menu item ("1. Yes", "❯ 2) No", "[A] Accept") continues
+# the tail; any other output starts a new one.
+_MENU_ITEM_RE = re.compile(r"(?:^|\n)\s*\S?\s*(?:\d+[\)\.]|\[[A-Za-z0-9]\])\s+\S")
 
 
 @dataclass
@@ -100,6 +185,10 @@ class DetectorState:
     stable_excerpt: str = ""  # Last stable text before ANSI redraws
     silence_threshold_s: float = 3.0  # Signal 3 threshold
 
+    # Incremental decoding — bytes/escapes split across reads are carried over
+    stream: StreamSanitizer = field(default_factory=StreamSanitizer)
+    tail: str = ""  # Bounded sanitized tail (≤ TAIL_WINDOW_CHARS) across chunks
+
     # Content dedup — suppresses re-detection of same prompt text
     last_emitted_hash: str = ""
     last_emitted_at: float = 0.0
@@ -117,8 +206,13 @@ class PromptDetector:
             await router.route(event)
         # After inject:
         detector.mark_injected()
+
+    Subclasses add tool-specific patterns by overriding ``scanner`` with
+    ``GENERIC_SCANNER.extend(...)``.
     """
 
+    scanner: PromptScanner = GENERIC_SCANNER
+
     def __init__(self, session_id: str, silence_threshold_s: float = 3.0) -> None:
         self.session_id = session_id
         self._state = DetectorState(silence_threshold_s=silence_threshold_s)
@@ -138,15 +232,37 @@ class PromptDetector:
         Returns:
             PromptEvent if a prompt is detected, else None.
         """
+        # Decode even while suppressed so the stream stays aligned
+        text = self._sanitize(raw)
+        return self._analyse_text(text, is_meaningful_text(text), tty_blocked)
+
+    def analyse_chunk(self, chunk: SanitizedChunk, tty_blocked: bool = False) -> PromptEvent | None:
+        """
+        Analyse a chunk already decoded by the session's OutputPipeline.
+
+        Equivalent to ``analyse(chunk.raw)`` without decoding the bytes again.
+        Use one or the other for a session, not both: each keeps its own
+        decoder state.
+        """
+        text, meaningful = chunk.text, chunk.meaningful
+        if len(text) > SCAN_WINDOW_BYTES // 4:
+            # A character is at most four UTF-8 bytes, so shorter text always fits
+            window = text[-SCAN_WINDOW_BYTES:].encode()[-SCAN_WINDOW_BYTES:]
+            clipped = window.lstrip(_UTF8_CONTINUATION).decode()
+            if len(clipped) < len(text):
+                text, meaningful = clipped, is_meaningful_text(clipped)
+        return self._analyse_text(text, meaningful, tty_blocked)
+
+    def _analyse_text(self, text: str, meaningful: bool, tty_blocked: bool) -> PromptEvent | None:
         if self._in_echo_suppress_window():
             return None
 
-        text = strip_ansi(raw.decode("utf-8", errors="replace"))
         self._state.last_output_time = time.monotonic()
 
         # Only update stable_excerpt with meaningful content (not ANSI junk remnants)
-        if text.strip() and is_meaningful(text):
+        if meaningful:
             self._state.stable_excerpt = text
+        self._update_tail(text)
 
         # Signal 1 — pattern match
         event = self._pattern_match(text)
@@ -176,7 +292,7 @@ class PromptDetector:
         if elapsed >= self._state.silence_threshold_s:
             excerpt = self._state.stable_excerpt[-200:]
             # Guard: don't fire Signal 3 if stable_excerpt is empty or not meaningful
-            if not excerpt or not is_meaningful(excerpt):
+            if not excerpt or not is_meaningful_text(excerpt):
                 return None
             event = PromptEvent.create(
                 session_id=self.session_id,
@@ -187,6 +303,15 @@ class PromptDetector:
             return self._dedup_event(event)
         return None
 
+    @property
+    def silence_threshold_s(self) -> float:
+        """Seconds of output silence before Signal 3 fires."""
+        return self._state.silence_threshold_s
+
+    @silence_threshold_s.setter
+    def silence_threshold_s(self, value: float) -> None:
+        self._state.silence_threshold_s = value
+
     @property
     def last_output_time(self) -> float:
         """Monotonic timestamp of the last PTY output received."""
@@ -195,17 +320,49 @@ class PromptDetector:
     def mark_injected(self) -> None:
         """Call immediately after injecting a reply — starts echo suppression window.
 
-        Also clears stable_excerpt and dedup hash so a genuinely new prompt
-        (even with the same text) can be detected after the echo window.
+        Also clears stable_excerpt, the output tail and dedup hash so a genuinely
+        new prompt (even with the same text) can be detected after the echo window.
         """
         self._state.injection_time = time.monotonic()
         self._state.stable_excerpt = ""
+        self._state.tail = ""
         self._state.last_emitted_hash = ""
 
     # ------------------------------------------------------------------
     # Private helpers
     # ------------------------------------------------------------------
 
+    def _sanitize(self, raw: bytes) -> str:
+        """Decode and strip *raw*, keeping only the last SCAN_WINDOW_BYTES of it."""
+        state = self._state
+        if len(raw) > SCAN_WINDOW_BYTES:
+            # Earlier output in this chunk cannot be a pending prompt. Skipping it
+            # breaks stream continuity, so restart decoding at a safe boundary —
+            # a newline or ESC — so no half escape sequence or character leaks in.
+            raw = raw[-SCAN_WINDOW_BYTES:]
+            cut = min((i for i in (raw.find(b"\n"), raw.find(b"\x1b")) if i >= 0), default=-1)
+            raw = raw[cut:] if cut >= 0 else raw.lstrip(_UTF8_CONTINUATION)
+            state.stream.reset()
+        return state.stream.feed(raw)
+
+    def _update_tail(self, text: str) -> None:
+        """
+        Extend the multi-chunk tail with *text*, or restart it.
+
+        Only menu-item chunks extend the tail, so a menu is matched across
+        contiguous reads (question, then items) but never stitched together
+        from items separated by unrelated output. Chunks are joined with a
+        newline, as reads usually end on a line boundary and a menu item
+        must start a line.
+        """
+        if not text:
+            return
+        state = self._state
+        if state.tail and (text.isspace() or _MENU_ITEM_RE.search(text)):
+            state.tail = (state.tail + "\n" + text)[-TAIL_WINDOW_CHARS:]
+        else:
+            state.tail = text[-TAIL_WINDOW_CHARS:]
+
     def _in_echo_suppress_window(self) -> bool:
         elapsed_ms = (time.monotonic() - self._state.injection_time) * 1000
         return elapsed_ms < ECHO_SUPPRESS_MS
@@ -224,47 +381,22 @@ class PromptDetector:
         return event
 
     def _pattern_match(self, text: str) -> PromptEvent | None:
-        for pat in _YES_NO_PATTERNS:
-            if pat.search(text):
-                return PromptEvent.create(
-                    session_id=self.session_id,
-                    prompt_type=PromptType.TYPE_YES_NO,
-                    confidence=Confidence.HIGH,
-                    excerpt=text[-200:],
-                    choices=["y", "n"],
-                )
-        for pat in _CONFIRM_ENTER_PATTERNS:
-            if pat.search(text):
-                return PromptEvent.create(
-                    session_id=self.session_id,
-                    prompt_type=PromptType.TYPE_CONFIRM_ENTER,
-                    confidence=Confidence.HIGH,
-                    excerpt=text[-200:],
-                    choices=["\n"],
-                )
-        # For MULTIPLE_CHOICE, also try combined buffer (handles multi-chunk menus
+        # For MULTIPLE_CHOICE, also try the output tail (handles multi-chunk menus
         # like folder trust prompts where the question and items arrive separately).
-        combined = (self._state.stable_excerpt + "\n" + text)[-2000:]
-        for pat in _MULTIPLE_CHOICE_PATTERNS:
-            matched_text = text
-            if not pat.search(text) and not pat.search(combined):
-                continue
-            if not pat.search(text):
-                matched_text = combined
-            choices = extract_choices(matched_text)
-            return PromptEvent.create(
-                session_id=self.session_id,
-                prompt_type=PromptType.TYPE_MULTIPLE_CHOICE,
-                confidence=Confidence.HIGH,
-                excerpt=matched_text[-200:],
-                choices=choices,
-            )
-        for pat in _FREE_TEXT_PATTERNS:
-            if pat.search(text):
-                return PromptEvent.create(
-                    session_id=self.session_id,
-                    prompt_type=PromptType.TYPE_FREE_TEXT,
-                    confidence=Confidence.MED,
-                    excerpt=text[-200:],
-                )
-        return None
+        # Only tail matches that reach into this chunk count.
+        tail = self._state.tail
+        hit = self.scanner.scan(text, context=tail, min_context_end=len(tail) - len(text))
+        if hit is None:
+            return None
+        tier = hit.tier
+        if tier.extract_choices:
+            choices = extract_choices(hit.matched_text)
+        else:
+            choices = list(tier.choices)
+        return PromptEvent.create(
+            session_id=self.session_id,
+            prompt_type=tier.prompt_type,
+            confidence=tier.confidence,
+            excerpt=hit.matched_text[-200:],
+            choices=choices,
+        )
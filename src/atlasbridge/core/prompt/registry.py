@@ -0,0 +1,194 @@
+"""
+Prompt registry — the router's table of PromptStateMachines.
+
+Live machines are kept until they reach a terminal state. The registry
+watches their transitions and then moves them to a small LRU of retired
+machines, kept only so that a late or duplicate reply is recognised as
+"already resolved" instead of "unknown prompt". The daemon's memory no
+longer grows with every prompt it has ever seen.
+
+Expiry deadlines sit in a min-heap keyed on ``expires_at``, so the TTL
+sweeper pops exactly the prompts that are due and can sleep until the
+next deadline (see :meth:`PromptRegistry.next_deadline`). Entries for
+machines that resolve first are left in the heap and skipped when popped;
+the heap is rebuilt if such stale entries come to outnumber live ones.
+
+A deadline is read when the machine is added. Code that moves
+``expires_at`` afterwards must call :meth:`PromptRegistry.reschedule`.
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+from collections import OrderedDict
+from collections.abc import Callable, Iterator
+from datetime import UTC, datetime
+
+from atlasbridge.core.prompt.models import PromptStatus
+from atlasbridge.core.prompt.state import TERMINAL_STATES, PromptStateMachine
+
+_RETIRED_MAX = 256  # resolved machines kept for duplicate-reply detection
+_HEAP_SLACK = 64  # stale heap entries tolerated before a rebuild
+
+
+class PromptRegistry:
+    """Live prompts by id, a bounded LRU of retired ones, and a deadline heap."""
+
+    def __init__(
+        self,
+        retired_max: int = _RETIRED_MAX,
+        on_earlier_deadline: Callable[[], None] | None = None,
+    ) -> None:
+        self._live: dict[str, PromptStateMachine] = {}
+        self._retired: OrderedDict[str, PromptStateMachine] = OrderedDict()
+        self._retired_max = retired_max
+        # (expires_at, tie-breaker, machine); stale entries are skipped on pop
+        self._deadlines: list[tuple[datetime, int, PromptStateMachine]] = []
+        self._counter = itertools.count()
+        self._on_earlier_deadline = on_earlier_deadline
+
+    # ------------------------------------------------------------------
+    # Mapping interface
+    # ------------------------------------------------------------------
+
+    def get(self, prompt_id: str) -> PromptStateMachine | None:
+        """The live or retired machine for *prompt_id*."""
+        sm = self._live.get(prompt_id)
+        if sm is None:
+            sm = self._retired.get(prompt_id)
+            if sm is not None:
+                self._retired.move_to_end(prompt_id)
+        return sm
+
+    def __getitem__(self, prompt_id: str) -> PromptStateMachine:
+        sm = self.get(prompt_id)
+        if sm is None:
+            raise KeyError(prompt_id)
+        return sm
+
+    def __setitem__(self, prompt_id: str, sm: PromptStateMachine) -> None:
+        if prompt_id != sm.event.prompt_id:
+            raise ValueError(f"Machine for {sm.event.prompt_id} registered as {prompt_id}")
+        self.add(sm)
+
+    def __contains__(self, prompt_id: object) -> bool:
+        return prompt_id in self._live or prompt_id in self._retired
+
+    def __len__(self) -> int:
+        return len(self._live) + len(self._retired)
+
+    @property
+    def live_count(self) -> int:
+        return len(self._live)
+
+    def live(self) -> Iterator[tuple[str, PromptStateMachine]]:
+        """Non-terminal machines in registration order."""
+        return iter(list(self._live.items()))
+
+    def values(self) -> list[PromptStateMachine]:
+        """Retired machines (least recently used first), then live ones."""
+        return [*self._retired.values(), *self._live.values()]
+
+    # ------------------------------------------------------------------
+    # Registration
+    # ------------------------------------------------------------------
+
+    def add(self, sm: PromptStateMachine) -> None:
+        """Register *sm* (replacing any machine with the same id) and schedule its expiry."""
+        prompt_id = sm.event.prompt_id
+        self._retired.pop(prompt_id, None)
+        self._watch(prompt_id, sm)
+        if sm.is_terminal:
+            self._live.pop(prompt_id, None)
+            self._retire(prompt_id, sm)
+            return
+        self._live[prompt_id] = sm
+        self._schedule(sm)
+
+    def reschedule(self, sm: PromptStateMachine) -> None:
+        """Re-read ``sm.expires_at`` after it was changed."""
+        if not sm.is_terminal and self._live.get(sm.event.prompt_id) is sm:
+            self._schedule(sm)
+
+    def _watch(self, prompt_id: str, sm: PromptStateMachine) -> None:
+        """Retire *sm* as soon as it transitions to a terminal state."""
+        previous = sm.on_transition
+
+        def on_transition(old: PromptStatus, new: PromptStatus) -> None:
+            if previous is not None:
+                previous(old, new)
+            if new in TERMINAL_STATES and self._live.get(prompt_id) is sm:
+                del self._live[prompt_id]
+                self._retire(prompt_id, sm)
+
+        sm.on_transition = on_transition
+
+    def _retire(self, prompt_id: str, sm: PromptStateMachine) -> None:
+        self._retired[prompt_id] = sm
+        self._retired.move_to_end(prompt_id)
+        while len(self._retired) > self._retired_max:
+            self._retired.popitem(last=False)
+
+    def _schedule(self, sm: PromptStateMachine) -> None:
+        earliest = not self._deadlines or sm.expires_at < self._deadlines[0][0]
+        if len(self._deadlines) > 2 * len(self._live) + _HEAP_SLACK:
+            self._deadlines = [entry for entry in self._deadlines if self._is_current(entry)]
+            heapq.heapify(self._deadlines)
+        heapq.heappush(self._deadlines, (sm.expires_at, next(self._counter), sm))
+        if earliest and self._on_earlier_deadline is not None:
+            self._on_earlier_deadline()
+
+    # ------------------------------------------------------------------
+    # Expiry
+    # ------------------------------------------------------------------
+
+    def _is_current(self, entry: tuple[datetime, int, PromptStateMachine]) -> bool:
+        """True if a heap entry still holds a live machine's current deadline."""
+        expires_at, _, sm = entry
+        return (
+            self._live.get(sm.event.prompt_id) is sm
+            and not sm.is_terminal
+            and sm.expires_at == expires_at
+        )
+
+    def next_deadline(self) -> datetime | None:
+        """Earliest deadline of a live machine, or None if nothing is pending."""
+        while self._deadlines:
+            entry = self._deadlines[0]
+            if self._is_current(entry):
+                return entry[0]
+            heapq.heappop(self._deadlines)
+            sm = entry[2]
+            if self._live.get(sm.event.prompt_id) is sm:
+                if sm.is_terminal:
+                    self._drop(sm)  # forced to EXPIRED without a transition
+                else:
+                    self._schedule(sm)  # expires_at was moved
+        return None
+
+    def expire_due(self) -> list[PromptStateMachine]:
+        """Expire every live machine whose deadline has passed; return them."""
+        now = datetime.now(UTC)
+        expired: list[PromptStateMachine] = []
+        pending: list[PromptStateMachine] = []
+        while True:
+            deadline = self.next_deadline()
+            if deadline is None or deadline >= now:
+                break
+            _, _, sm = heapq.heappop(self._deadlines)
+            if sm.expire_if_due():
+                expired.append(sm)
+            if sm.is_terminal:
+                self._drop(sm)
+            else:
+                pending.append(sm)  # the clock stepped back; try again later
+        for sm in pending:
+            self._schedule(sm)
+        return expired
+
+    def _drop(self, sm: PromptStateMachine) -> None:
+        prompt_id = sm.event.prompt_id
+        if self._live.get(prompt_id) is sm:
+            del self._live[prompt_id]
+            self._retire(prompt_id, sm)
@@ -5,13 +5,23 @@ Provides shared utilities for cleaning ANSI escape sequences and
 extracting structured choices from terminal prompt text.
 
 Used by:
+  - OutputPipeline (decode each PTY chunk once per session, shared by the
+    detector, OutputForwarder and TranscriptWriter)
   - PromptDetector (strip ANSI, gate meaningful output, extract choices)
   - Tests and Prompt Lab scenarios
 """
 
 from __future__ import annotations
 
+import codecs
 import re
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from atlasbridge.core.security.redactor import StreamingRedactor
 
 # ---------------------------------------------------------------------------
 # Comprehensive ANSI escape sequence regex
@@ -30,6 +40,16 @@ _ANSI_RE = re.compile(
     r"|\r"  # Carriage returns
 )
 
+# An escape sequence cut off by a read boundary: a lone ESC, an unterminated
+# CSI, an OSC still waiting for BEL/ST, or a charset designator missing its
+# final byte. Only searched for near the end of the decoded text.
+_PARTIAL_ESCAPE_RE = re.compile(r"\x1b(?:\[[0-9;?]*[ -/]*|\][^\x07\x1b]*\x1b?|[()]|[ -/]*)\Z")
+_MAX_ESCAPE_CARRY = 256
+
+# Meaningful text: three non-whitespace characters, one of them alphanumeric.
+_THREE_NON_WS_RE = re.compile(r"\S\s*\S\s*\S")
+_ALNUM_RE = re.compile(r"[A-Za-z0-9]")
+
 # ---------------------------------------------------------------------------
 # Choice extraction patterns
 # ---------------------------------------------------------------------------
@@ -58,16 +78,133 @@ def strip_ansi(text: str) -> str:
     return _ANSI_RE.sub("", text)
 
 
+class StreamSanitizer:
+    """
+    Incremental decode + ANSI strip for a PTY byte stream.
+
+    PTY reads split the stream at arbitrary byte offsets. Multi-byte UTF-8
+    characters and escape sequences that straddle a read are held back
+    until the next ``feed()`` so they are neither replaced with U+FFFD nor
+    leaked into the output as fragments like ``[31m``.
+    """
+
+    def __init__(self) -> None:
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self._carry = ""
+
+    def feed(self, raw: bytes) -> str:
+        """Decode *raw* and return the newly completed, ANSI-free text."""
+        text = self._carry + self._decoder.decode(raw)
+        self._carry = ""
+        partial = _PARTIAL_ESCAPE_RE.search(text, max(0, len(text) - _MAX_ESCAPE_CARRY))
+        if partial:
+            self._carry = partial.group()
+            text = text[: partial.start()]
+        return strip_ansi(text)
+
+    def reset(self) -> None:
+        """Drop any held-back bytes (e.g. after skipping part of the stream)."""
+        self._decoder.reset()
+        self._carry = ""
+
+
 def is_meaningful(text: str) -> bool:
     """Return True if text contains meaningful content (not just ANSI junk remnants).
 
     Requires at least 3 non-whitespace characters and at least 1 alphanumeric.
     """
-    stripped = strip_ansi(text).strip()
-    non_ws = re.sub(r"\s", "", stripped)
-    if len(non_ws) < 3:
-        return False
-    return bool(re.search(r"[A-Za-z0-9]", non_ws))
+    return is_meaningful_text(strip_ansi(text))
+
+
+def is_meaningful_text(text: str) -> bool:
+    """``is_meaningful()`` for text that is already ANSI-stripped."""
+    return _THREE_NON_WS_RE.search(text) is not None and _ALNUM_RE.search(text) is not None
+
+
+@dataclass(frozen=True, slots=True)
+class SanitizedChunk:
+    """One PTY read, decoded and ANSI-stripped, shared by every output consumer."""
+
+    raw: bytes
+    text: str
+    meaningful: bool
+    # Secret-redacted text released by the pipeline's StreamingRedactor, or
+    # "" if what was released is not meaningful. None when the pipeline does
+    # not redact; consumers then redact ``text`` themselves.
+    redacted: str | None = None
+
+    @classmethod
+    def from_text(cls, raw: bytes, text: str, redacted: str | None = None) -> SanitizedChunk:
+        return cls(
+            raw=raw,
+            text=text,
+            meaningful=bool(text) and is_meaningful_text(text),
+            redacted=redacted,
+        )
+
+    @classmethod
+    def from_bytes(cls, raw: bytes) -> SanitizedChunk:
+        """Decode a standalone chunk (no carry-over from earlier reads)."""
+        return cls.from_text(raw, strip_ansi(raw.decode("utf-8", errors="replace")))
+
+
+class OutputPipeline:
+    """
+    Per-session output stage: decodes each PTY chunk once and fans it out.
+
+    With a ``redactor``, the decoded text is also passed through it as one
+    continuous stream. Secrets split across PTY reads are then still caught.
+    The redactor holds back a short tail, so ``chunk.redacted`` lags
+    ``chunk.text``. Call ``flush()`` when output goes idle or ends to
+    release the tail.
+
+    Usage::
+
+        pipeline = OutputPipeline(redactor=StreamingRedactor())
+        pipeline.subscribe(forwarder.feed_chunk)
+        pipeline.subscribe(transcript.feed_chunk)
+        chunk = pipeline.feed(raw)          # subscribers called in order
+        event = detector.analyse_chunk(chunk)
+        ...
+        pipeline.flush()                    # on idle / EOF
+    """
+
+    def __init__(self, redactor: StreamingRedactor | None = None) -> None:
+        self._stream = StreamSanitizer()
+        self._redactor = redactor
+        self._subscribers: list[Callable[[SanitizedChunk], None]] = []
+        self.last_feed_at = time.monotonic()
+
+    def subscribe(self, callback: Callable[[SanitizedChunk], None]) -> None:
+        self._subscribers.append(callback)
+
+    def feed(self, raw: bytes) -> SanitizedChunk:
+        self.last_feed_at = time.monotonic()
+        text = self._stream.feed(raw)
+        redacted = None
+        if self._redactor is not None:
+            redacted = _releasable(self._redactor.feed(text))
+        chunk = SanitizedChunk.from_text(raw, text, redacted)
+        self._publish(chunk)
+        return chunk
+
+    def flush(self) -> SanitizedChunk | None:
+        """Release text held back by the redactor, if any."""
+        if self._redactor is None or not self._redactor.pending:
+            return None
+        chunk = SanitizedChunk(
+            raw=b"", text="", meaningful=False, redacted=_releasable(self._redactor.flush())
+        )
+        self._publish(chunk)
+        return chunk
+
+    def _publish(self, chunk: SanitizedChunk) -> None:
+        for callback in self._subscribers:
+            callback(chunk)
+
+
+def _releasable(text: str) -> str:
+    return text if text and is_meaningful_text(text) else ""
 
 
 def sanitize_terminal_output(text: str) -> str:
@@ -37,6 +37,7 @@ import json
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, Union
 
+from atlasbridge.core.policy.compiled import compile_policy
 from atlasbridge.core.policy.evaluator import evaluate
 from atlasbridge.core.policy.model import Policy
 
@@ -344,9 +345,10 @@ class ReplayEngine:
             prompt_count=snapshot.prompt_count,
         )
 
+        compiled = compile_policy(policy)
         for prompt in snapshot.prompts:
             decision = evaluate(
-                policy=policy,
+                policy=compiled,
                 prompt_text=prompt.excerpt,
                 prompt_type=prompt.prompt_type,
                 confidence=prompt.confidence,
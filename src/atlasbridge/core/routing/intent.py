@@ -111,7 +111,9 @@ class PolicyRouteClassifier:
     """Classifies PromptEvents using the policy evaluator."""
 
     def __init__(self, policy: Any) -> None:
-        self._policy = policy
+        from atlasbridge.core.policy.compiled import compile_policy
+
+        self._policy = compile_policy(policy)
 
     def classify(self, event: PromptEvent) -> ClassificationResult:
         """Evaluate the policy and map the decision to a RouteIntent."""
@@ -148,7 +150,9 @@ class PolicyRouteClassifier:
 
     def reload_policy(self, policy: Any) -> None:
         """Hot-swap the policy used for classification."""
-        self._policy = policy
+        from atlasbridge.core.policy.compiled import compile_policy
+
+        self._policy = compile_policy(policy)
 
 
 # ---------------------------------------------------------------------------
@@ -220,6 +224,10 @@ class IntentRouter:
         """Delegate to the wrapped PromptRouter."""
         return await self._prompt_router.inject_dashboard_reply(prompt_id, session_id, value)
 
+    async def wait_for_expiry(self, timeout: float) -> None:
+        """Delegate to the wrapped PromptRouter."""
+        await self._prompt_router.wait_for_expiry(timeout)
+
     async def expire_overdue(self) -> None:
         """Delegate to the wrapped PromptRouter."""
         await self._prompt_router.expire_overdue()
@@ -37,6 +37,7 @@ from atlasbridge.core.conversation.session_binding import ConversationState
 from atlasbridge.core.gate.engine import GateContext, GateDecision, GateRejectReason, evaluate_gate
 from atlasbridge.core.gate.messages import format_gate_decision
 from atlasbridge.core.prompt.models import Confidence, PromptEvent, PromptStatus, Reply
+from atlasbridge.core.prompt.registry import PromptRegistry
 from atlasbridge.core.prompt.state import PromptStateMachine
 from atlasbridge.core.session.manager import SessionManager
 from atlasbridge.core.session.models import SessionStatus
@@ -78,8 +79,10 @@ class PromptRouter:
         self._audit_writer = audit_writer
         self._dry_run = dry_run
 
-        # Active state machines: prompt_id → PromptStateMachine
-        self._machines: dict[str, PromptStateMachine] = {}
+        # State machines by prompt_id: live ones plus a bounded LRU of resolved
+        # ones; set when a prompt's deadline is earlier than any pending one.
+        self._expiry_changed = asyncio.Event()
+        self._machines = PromptRegistry(on_earlier_deadline=self._expiry_changed.set)
 
         # Spam prevention: session_id → (window_start, dispatch_count)
         self._session_dispatch_counts: dict[str, list[float]] = {}
@@ -387,6 +390,7 @@ class PromptRouter:
 
             if self._interaction_engine is not None:
                 # Use the interaction engine (classify → plan → execute → feedback)
+                self._flush_store()
                 result = await self._interaction_engine.handle_prompt_reply(
                     sm.event, effective_reply
                 )
@@ -423,6 +427,7 @@ class PromptRouter:
                 if adapter is None:
                     raise RuntimeError(f"No adapter for session {sm.event.session_id}")
 
+                self._flush_store()
                 await adapter.inject_reply(
                     session_id=sm.event.session_id,
                     value=effective_reply.value,
@@ -520,6 +525,7 @@ class PromptRouter:
             return
 
         try:
+            self._flush_store()
             await adapter.inject_reply(
                 session_id=event.session_id,
                 value=value,
@@ -575,6 +581,7 @@ class PromptRouter:
             return False
 
         try:
+            self._flush_store()
             await adapter.inject_reply(
                 session_id=session_id,
                 value=value,
@@ -591,6 +598,16 @@ class PromptRouter:
             sm.transition(PromptStatus.FAILED, str(exc))
             return False
 
+    def _flush_store(self) -> None:
+        """Durability barrier: commit queued store writes before writing to the PTY."""
+        flush = getattr(self._store, "flush", None)
+        if flush is None:
+            return
+        try:
+            flush()
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("store_flush_failed", error=str(exc))
+
     # ------------------------------------------------------------------
     # Workspace trust helpers
     # ------------------------------------------------------------------
@@ -652,6 +669,7 @@ class PromptRouter:
         try:
             # Brief delay to ensure PTY prompt is stable before injection
             await asyncio.sleep(0.15)
+            self._flush_store()
             await adapter.inject_reply(
                 session_id=event.session_id,
                 value="1",
@@ -851,7 +869,7 @@ class PromptRouter:
             channel_name = reply.channel_identity.split(":")[0]
             target_session = self._conversation_registry.resolve(channel_name, reply.thread_id)
 
-        for prompt_id, sm in self._machines.items():
+        for prompt_id, sm in self._machines.live():
             if sm.is_terminal:
                 continue
             sid = sm.event.session_id
@@ -927,21 +945,38 @@ class PromptRouter:
     # TTL expiry sweep (called by scheduler)
     # ------------------------------------------------------------------
 
+    async def wait_for_expiry(self, timeout: float) -> None:
+        """Sleep until the next prompt deadline, at most *timeout* seconds.
+
+        Returns early when a prompt with an earlier deadline is registered,
+        so the caller can re-arm on the new deadline.
+        """
+        self._expiry_changed.clear()
+        delay = timeout
+        deadline = self._machines.next_deadline()
+        if deadline is not None:
+            delay = min(delay, (deadline - datetime.now(UTC)).total_seconds())
+        if delay <= 0:
+            return
+        try:
+            await asyncio.wait_for(self._expiry_changed.wait(), delay)
+        except TimeoutError:
+            pass
+
     async def expire_overdue(self) -> None:
-        """Expire all overdue prompts. Called periodically by the scheduler."""
-        for sm in list(self._machines.values()):
-            if sm.expire_if_due():
-                logger.info(
-                    "prompt_expired",
-                    prompt_id=sm.event.prompt_id,
-                    session_id=sm.event.session_id[:8],
-                )
-                session = self._sessions.get_or_none(sm.event.session_id)
-                if session:
-                    msg_id = session.channel_message_ids.get(sm.event.prompt_id, "")
-                    if msg_id:
-                        await self._channel.edit_prompt_message(
-                            msg_id,
-                            "\u23f0 Prompt expired. Safe default applied.",
-                            session_id=sm.event.session_id,
-                        )
+        """Expire prompts whose TTL has elapsed. Called by the TTL sweeper."""
+        for sm in self._machines.expire_due():
+            logger.info(
+                "prompt_expired",
+                prompt_id=sm.event.prompt_id,
+                session_id=sm.event.session_id[:8],
+            )
+            session = self._sessions.get_or_none(sm.event.session_id)
+            if session:
+                msg_id = session.channel_message_ids.get(sm.event.prompt_id, "")
+                if msg_id:
+                    await self._channel.edit_prompt_message(
+                        msg_id,
+                        "\u23f0 Prompt expired. Safe default applied.",
+                        session_id=sm.event.session_id,
+                    )
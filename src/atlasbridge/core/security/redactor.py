@@ -12,46 +12,70 @@ are preferred over false negatives (leaked secrets).
 from __future__ import annotations
 
 import re
-from typing import TYPE_CHECKING
-
-if TYPE_CHECKING:
-    pass
+from collections.abc import Callable
+from dataclasses import dataclass
 
 # ---------------------------------------------------------------------------
 # Built-in patterns — superset of all previously scattered pattern lists
 # ---------------------------------------------------------------------------
 
-# Each entry: (compiled regex, human-readable label)
-_BUILTIN_PATTERNS: list[tuple[re.Pattern[str], str]] = [
+
+@dataclass(frozen=True, slots=True)
+class _SecretPattern:
+    """A secret regex plus the literals it cannot match without.
+
+    ``anchors`` is a prefilter: if none of them occurs in the text, the regex
+    is skipped. Every match must contain at least one anchor, so skipping
+    never changes the result. For case-insensitive patterns the anchors are
+    compared against ``text.casefold()`` and must avoid the letter ``i``,
+    whose re.IGNORECASE equivalents (``İ``, ``ı``) casefold differently.
+    An empty ``anchors`` means the regex always runs.
+    """
+
+    regex: re.Pattern[str]
+    label: str
+    anchors: tuple[str, ...] = ()
+    casefold: bool = False
+
+
+_BUILTIN_PATTERNS: list[_SecretPattern] = [
     # Telegram bot tokens: 123456789:ABC-DEF...
-    (re.compile(r"\b\d{8,12}:[A-Za-z0-9_\-]{35,}\b"), "telegram-token"),
+    _SecretPattern(re.compile(r"\b\d{8,12}:[A-Za-z0-9_\-]{35,}\b"), "telegram-token", (":",)),
     # Slack tokens: xoxb-, xoxp-, xoxs-, xoxa-, xoxr-, xapp-
-    (re.compile(r"\bxox[bpsar]-[A-Za-z0-9\-]{10,}\b"), "slack-token"),
-    (re.compile(r"\bxapp-[A-Za-z0-9\-]{20,}\b"), "slack-app-token"),
+    _SecretPattern(re.compile(r"\bxox[bpsar]-[A-Za-z0-9\-]{10,}\b"), "slack-token", ("xox",)),
+    _SecretPattern(re.compile(r"\bxapp-[A-Za-z0-9\-]{20,}\b"), "slack-app-token", ("xapp-",)),
     # OpenAI / generic API keys: sk-...
-    (re.compile(r"\bsk-[A-Za-z0-9]{20,}\b"), "api-key"),
+    _SecretPattern(re.compile(r"\bsk-[A-Za-z0-9]{20,}\b"), "api-key", ("sk-",)),
     # GitHub PATs: ghp_, gho_, ghu_, ghs_, ghr_
-    (re.compile(r"\bgh[pousr]_[A-Za-z0-9]{36,}\b"), "github-pat"),
+    _SecretPattern(re.compile(r"\bgh[pousr]_[A-Za-z0-9]{36,}\b"), "github-pat", ("gh",)),
     # AWS access keys: AKIA...
-    (re.compile(r"\bAKIA[A-Z0-9]{16}\b"), "aws-key"),
+    _SecretPattern(re.compile(r"\bAKIA[A-Z0-9]{16}\b"), "aws-key", ("AKIA",)),
     # AWS secret keys (40 base64 chars after known prefixes)
-    (re.compile(r"(?<=AWS_SECRET_ACCESS_KEY[=: ])[A-Za-z0-9/+=]{40}"), "aws-secret"),
+    _SecretPattern(
+        re.compile(r"(?<=AWS_SECRET_ACCESS_KEY[=: ])[A-Za-z0-9/+=]{40}"),
+        "aws-secret",
+        ("AWS_SECRET_ACCESS_KEY",),
+    ),
     # Google API keys
-    (re.compile(r"\bAIza[A-Za-z0-9_\-]{35}\b"), "google-api-key"),
+    _SecretPattern(re.compile(r"\bAIza[A-Za-z0-9_\-]{35}\b"), "google-api-key", ("AIza",)),
     # Anthropic API keys: sk-ant-...
-    (re.compile(r"\bsk-ant-[A-Za-z0-9\-]{20,}\b"), "anthropic-key"),
+    _SecretPattern(re.compile(r"\bsk-ant-[A-Za-z0-9\-]{20,}\b"), "anthropic-key", ("sk-ant-",)),
     # Generic long hex secrets (64+ hex chars)
-    (re.compile(r"\b[0-9a-f]{64,}\b"), "hex-secret"),
+    _SecretPattern(re.compile(r"\b[0-9a-f]{64,}\b"), "hex-secret"),
     # Bearer tokens in headers
-    (re.compile(r"(?i)Bearer\s+[A-Za-z0-9\-._~+/]+=*"), "bearer-token"),
+    _SecretPattern(
+        re.compile(r"(?i)Bearer\s+[A-Za-z0-9\-._~+/]+=*"), "bearer-token", ("bearer",), True
+    ),
     # Generic key=value for common env var names
-    (
+    _SecretPattern(
         re.compile(
             r"(?i)(?:api_key|api_secret|secret_key|access_token|auth_token"
             r"|password|passwd|token)"
             r"[=:]\s*['\"]?([A-Za-z0-9\-._~+/]{8,})['\"]?"
         ),
         "env-secret",
+        ("_key", "_secret", "token", "passw"),
+        True,
     ),
 ]
 
@@ -71,33 +95,40 @@ class SecretRedactor:
 
         redactor = SecretRedactor(custom_patterns=["my-corp-[a-z]{20}"])
         redactor.add_pattern(r"internal-\\d{10}")
+
+    Patterns are applied one after another, in order, each to the output of
+    the previous one. Built-in patterns are skipped when none of their anchor
+    literals occurs in the text, so text without secret-like substrings costs
+    a casefold and a few substring probes plus the anchorless patterns.
     """
 
     def __init__(self, custom_patterns: list[str] | None = None) -> None:
-        self._patterns: list[tuple[re.Pattern[str], str]] = list(_BUILTIN_PATTERNS)
+        self._patterns: list[_SecretPattern] = list(_BUILTIN_PATTERNS)
         for p in custom_patterns or []:
             self.add_pattern(p)
 
     def add_pattern(self, pattern: str, label: str = "custom") -> None:
         """Add a custom regex pattern for secret detection."""
-        self._patterns.append((re.compile(pattern), label))
+        self._patterns.append(_SecretPattern(re.compile(pattern), label))
 
     def redact(self, text: str, placeholder: str = REDACTION_PLACEHOLDER) -> str:
         """Replace all detected secrets with a redaction placeholder."""
-        for regex, _label in self._patterns:
-            text = regex.sub(placeholder, text)
-        return text
+        return self._substitute(text, lambda _label: placeholder)
 
     def redact_labeled(self, text: str) -> str:
         """Replace secrets with labeled placeholders like ``[REDACTED:api-key]``."""
-        for regex, label in self._patterns:
-            text = regex.sub(f"[REDACTED:{label}]", text)
-        return text
+        return self._substitute(text, lambda label: f"[REDACTED:{label}]")
 
     def contains_secret(self, text: str) -> bool:
         """Return True if text contains any known secret pattern."""
-        for regex, _ in self._patterns:
-            if regex.search(text):
+        folded: str | None = None
+        for pattern in self._patterns:
+            if pattern.anchors:
+                if pattern.casefold and folded is None:
+                    folded = text.casefold()
+                if not _has_anchor(pattern, text, folded):
+                    continue
+            if pattern.regex.search(text):
                 return True
         return False
 
@@ -106,6 +137,45 @@ class SecretRedactor:
         """Number of active patterns (built-in + custom)."""
         return len(self._patterns)
 
+    def overlap_start(self, text: str, cut: int, lo: int = 0) -> int | None:
+        """Return the start of the earliest match from *lo* on that contains *cut*.
+
+        A match starting exactly at *cut* counts, since splitting there would
+        separate it from a prefix matched by lookbehind. None if no match does.
+        """
+        folded: str | None = None
+        start: int | None = None
+        for pattern in self._patterns:
+            if pattern.anchors:
+                if pattern.casefold and folded is None:
+                    folded = text.casefold()
+                if not _has_anchor(pattern, text, folded):
+                    continue
+            for m in pattern.regex.finditer(text, lo, len(text)):
+                if m.start() > cut:
+                    break
+                if m.end() > cut and (start is None or m.start() < start):
+                    start = m.start()
+        return start
+
+    def _substitute(self, text: str, replacement: Callable[[str], str]) -> str:
+        folded: str | None = None
+        for pattern in self._patterns:
+            if pattern.anchors:
+                if pattern.casefold and folded is None:
+                    folded = text.casefold()
+                if not _has_anchor(pattern, text, folded):
+                    continue
+            text, count = pattern.regex.subn(replacement(pattern.label), text)
+            if count:
+                folded = None
+        return text
+
+
+def _has_anchor(pattern: _SecretPattern, text: str, folded: str | None) -> bool:
+    haystack = folded if pattern.casefold and folded is not None else text
+    return any(anchor in haystack for anchor in pattern.anchors)
+
 
 # ---------------------------------------------------------------------------
 # Module-level singleton for simple import
@@ -137,3 +207,102 @@ def redact(text: str) -> str:
 def contains_secret(text: str) -> bool:
     """Convenience: check using the default singleton."""
     return get_redactor().contains_secret(text)
+
+
+# ---------------------------------------------------------------------------
+# Streaming redaction
+# ---------------------------------------------------------------------------
+
+STREAM_CARRY_CHARS = 256
+
+
+class StreamingRedactor:
+    """Redacts a text stream chunk by chunk, catching secrets split across chunks.
+
+    ``feed()`` returns the redacted text that is safe to release and holds
+    back a tail of about ``carry_chars`` characters to be scanned together
+    with the next chunk. The cut between the two never falls inside a
+    secret, or between a secret and the word before it (``Bearer``,
+    ``AWS_SECRET_ACCESS_KEY``). Released text is redacted exactly once;
+    only the held-back tail is scanned again.
+
+    A tail that grows past ``16 * carry_chars`` (one unbroken token) is
+    released anyway, so memory stays bounded.
+
+    ``flush()`` releases the held-back tail. Call it when the stream goes
+    idle or ends, not after every chunk.
+
+    Usage::
+
+        stream = StreamingRedactor()
+        safe = stream.feed(text)   # may be "" while the tail is held back
+        safe += stream.flush()
+    """
+
+    def __init__(
+        self,
+        redactor: SecretRedactor | None = None,
+        carry_chars: int = STREAM_CARRY_CHARS,
+    ) -> None:
+        self._redactor = redactor or get_redactor()
+        self._carry_chars = carry_chars
+        self._max_carry = 16 * carry_chars
+        self._carry = ""
+
+    @property
+    def pending(self) -> bool:
+        """True if text is held back waiting for more input or a flush."""
+        return bool(self._carry)
+
+    def feed(self, text: str) -> str:
+        buf = self._carry + text
+        cut = len(buf) - self._carry_chars
+        if cut <= 0:
+            self._carry = buf
+            return ""
+        # Cut at a line start (or, failing that, a word start) where no secret
+        # spans the cut. Each scan starts a window further back, so a secret
+        # reaching the cut and the words before it are seen.
+        window = self._carry_chars
+        cut = _cut_point(buf, cut, max(0, cut - window))
+        while True:
+            lo = _cut_point(buf, max(0, cut - window), max(0, cut - 2 * window))
+            start = self._redactor.overlap_start(buf, cut, lo)
+            if start is None:
+                break
+            moved = _cut_point(buf, start, lo)
+            if moved >= cut:
+                break
+            cut = moved
+        if len(buf) - cut > self._max_carry:
+            cut = len(buf) - self._carry_chars
+        self._carry = buf[cut:]
+        return self._redactor.redact(buf[:cut]) if cut else ""
+
+    def flush(self) -> str:
+        buf, self._carry = self._carry, ""
+        return self._redactor.redact(buf) if buf else ""
+
+
+def _word_start(text: str, pos: int) -> int:
+    while pos > 0 and not text[pos - 1].isspace():
+        pos -= 1
+    return pos
+
+
+def _cut_point(text: str, pos: int, line_floor: int) -> int:
+    """Start of the line containing *pos* if it begins after *line_floor*,
+    else the start of the word before the one containing *pos*.
+
+    Keeping the preceding word (or line) with a secret preserves prefixes
+    such as ``AWS_SECRET_ACCESS_KEY=`` that patterns match via lookbehind.
+    """
+    newline = text.rfind("\n", line_floor, pos)
+    if newline >= 0:
+        return newline + 1
+    pos = _word_start(text, pos)
+    while pos > 0 and text[pos - 1].isspace():
+        if text[pos - 1] == "\n":
+            return pos
+        pos -= 1
+    return _word_start(text, pos)
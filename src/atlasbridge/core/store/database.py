@@ -5,7 +5,7 @@ Schema (4 tables):
   sessions       — session lifecycle records
   prompts        — prompt records with atomic decide_prompt guard
   replies        — reply records (one per decide_prompt success)
-  audit_events   — append-only audit log with hash chain
+  audit_events   — append-only audit log with hash chain (ordered by seq)
 
 The decide_prompt() method is the idempotency guard:
   UPDATE prompts
@@ -22,6 +22,42 @@ Thread safety:
   because asyncio runs all coroutines on the same thread, but executor calls
   may cross thread boundaries. All writes use parameterised queries.
 
+Audit chain:
+  The chain tail (last seq and hash) is cached in memory after the first
+  append, so appends do not read before writing. seq carries a UNIQUE index:
+  if another connection appended meanwhile, the insert fails, the tail is
+  re-read and the append is retried, so the chain never forks. A tail
+  written inside a still-open group commit is dropped if that commit fails
+  or the transaction is rolled back, so it never names an event that is not
+  in the table.
+
+Group commit:
+  With ``commit_delay > 0`` writes still execute immediately (so reads on this
+  connection see them) but their COMMIT is deferred: it runs once the delay
+  elapses on the running event loop, or as soon as ``commit_batch_size``
+  writes are pending. ``flush()`` is the durability barrier for paths that
+  must persist before acting (e.g. before injecting into a PTY). Without a
+  running loop, or with ``commit_delay == 0``, every write commits at once.
+  Batch sizes and flush latencies are recorded in ``commit_stats``.
+
+Change notices:
+  Listeners added with ``add_commit_listener()`` are called after each COMMIT
+  with the change streams it made visible (``AUDIT_STREAM``,
+  ``TRANSCRIPT_STREAM``). The daemon forwards them to the dashboard, which
+  then reads only the rows past its cursor.
+
+Full-text search:
+  save_prompt(), save_transcript_chunk() and append_audit_event() add the
+  row's redacted text to the FTS5 ``search_index`` in the same transaction
+  (see core.store.search). Archiving removes a batch's audit rows from the
+  index in the transaction that deletes the batch. Builds without FTS5
+  skip it.
+
+Stats counters:
+  Triggers keep per-status session, per-type prompt and total audit counts
+  in the ``stats`` table (see core.store.stats), so dashboards read totals
+  without scanning. ``rebuild_stats()`` recounts them.
+
 Schema versioning:
   Uses PRAGMA user_version and the migrations module. On connect(), WAL mode
   and foreign keys are set first, then run_migrations() applies any pending
@@ -31,24 +67,161 @@ Schema versioning:
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import json
 import sqlite3
+import time
+from collections.abc import Callable
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
 import structlog
 
+from atlasbridge.core.metrics import Histogram
+from atlasbridge.core.security.redactor import redact
+from atlasbridge.core.store import search as fts
+from atlasbridge.core.store import stats as counters
+
 logger = structlog.get_logger()
 
+_ARCHIVE_BATCH = 5000  # audit events moved per archive transaction
+_ARCHIVE_COLUMNS = "id, event_type, session_id, prompt_id, payload, timestamp, prev_hash, hash, seq"
+
+# Change streams reported to commit listeners
+AUDIT_STREAM = "audit"
+TRANSCRIPT_STREAM = "transcript"
+
+CommitListener = Callable[[frozenset[str]], None]
+
+
+def _prefix_upper_bound(prefix: str) -> str:
+    """Smallest string greater than every string that starts with *prefix*.
+
+    SQLite compares TEXT bytewise and UTF-8 preserves code point order, so
+    ``prefix <= s < _prefix_upper_bound(prefix)`` is a prefix match that
+    can use an index (LIKE cannot, being case-insensitive).
+    """
+    return prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+
+def _audit_filter(
+    session_id: str | None, since: str | None, until: str | None
+) -> tuple[str, list[str]]:
+    """``" AND …"`` clauses (possibly empty) and params for audit event filters."""
+    clauses: list[str] = []
+    params: list[str] = []
+    if session_id:
+        clauses.append("session_id = ?")
+        params.append(session_id)
+    if since:
+        clauses.append("timestamp >= ?")
+        params.append(since)
+    if until:
+        clauses.append("timestamp <= ?")
+        params.append(until)
+    return "".join(f" AND {c}" for c in clauses), params
+
+
+def _prepare_archive(conn: sqlite3.Connection) -> None:
+    """Create the audit archive schema in the attached ``archive`` database.
+
+    Archives written before seq existed get the column added; their older
+    rows keep seq NULL.
+    """
+    conn.execute("PRAGMA archive.journal_mode=WAL")
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS archive.audit_events (
+            id          TEXT PRIMARY KEY,
+            event_type  TEXT NOT NULL,
+            session_id  TEXT NOT NULL DEFAULT '',
+            prompt_id   TEXT NOT NULL DEFAULT '',
+            payload     TEXT NOT NULL DEFAULT '{}',
+            timestamp   TEXT NOT NULL,
+            prev_hash   TEXT NOT NULL DEFAULT '',
+            hash        TEXT NOT NULL DEFAULT '',
+            seq         INTEGER
+        )
+        """
+    )
+    columns = {row[1] for row in conn.execute("PRAGMA archive.table_info(audit_events)")}
+    if "seq" not in columns:
+        conn.execute("ALTER TABLE archive.audit_events ADD COLUMN seq INTEGER")
+    conn.execute("CREATE INDEX IF NOT EXISTS archive.idx_archive_ts ON audit_events(timestamp)")
+    conn.execute("CREATE INDEX IF NOT EXISTS archive.idx_archive_seq ON audit_events(seq)")
+    # One row per committed batch: the last event moved, where the chain
+    # continues in the next batch (or the main database)
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS archive.archive_checkpoints (
+            last_seq     INTEGER PRIMARY KEY,
+            last_hash    TEXT NOT NULL,
+            count        INTEGER NOT NULL,
+            archived_at  TEXT NOT NULL
+        )
+        """
+    )
+
+
+class CommitStats:
+    """Batch-size and flush-latency histograms for group commit."""
+
+    BATCH_BUCKETS: tuple[float, ...] = (1, 2, 4, 8, 16, 32, 64, 128)
+    LATENCY_BUCKETS_MS: tuple[float, ...] = (0.5, 1.0, 2.0, 5.0, 10.0, 25.0, 50.0, 100.0)
+
+    def __init__(self) -> None:
+        self.batch_size = Histogram(self.BATCH_BUCKETS)
+        self.flush_latency_ms = Histogram(self.LATENCY_BUCKETS_MS)
+
+    @property
+    def flushes(self) -> int:
+        return self.batch_size.count
+
+    @property
+    def writes(self) -> int:
+        return int(self.batch_size.total)
+
+    def observe(self, batch_size: int, latency_ms: float) -> None:
+        self.batch_size.observe(batch_size)
+        self.flush_latency_ms.observe(latency_ms)
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "flushes": self.flushes,
+            "writes": self.writes,
+            "batch_size": self.batch_size.snapshot(),
+            "flush_latency_ms": self.flush_latency_ms.snapshot(),
+        }
+
 
 class Database:
     """SQLite persistence layer for AtlasBridge."""
 
-    def __init__(self, db_path: Path) -> None:
+    def __init__(
+        self,
+        db_path: Path,
+        commit_delay: float = 0.0,
+        commit_batch_size: int = 64,
+    ) -> None:
         self._path = db_path
         self._conn: sqlite3.Connection | None = None
+        # (seq, hash) of the last audit event; None until first needed.
+        # Pending while it names a row of the still-open transaction.
+        self._audit_tail: tuple[int, str] | None = None
+        self._audit_tail_pending = False
+        # Group commit (see module docstring)
+        self._commit_delay = commit_delay
+        self._commit_batch_size = commit_batch_size
+        self._pending_writes = 0
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self.commit_stats = CommitStats()
+        # Change streams written since the last COMMIT
+        self._changed: set[str] = set()
+        self._commit_listeners: list[CommitListener] = []
+        # Set on connect(): False if SQLite has no FTS5
+        self._search_enabled = False
 
     @property
     def path(self) -> Path:
@@ -71,11 +244,74 @@ class Database:
 
         # Run idempotent schema migrations (fresh install or upgrade)
         run_migrations(self._conn, self._path)
+        self._search_enabled = fts.has_search_index(self._conn)
 
     def close(self) -> None:
         if self._conn:
+            self.flush()
             self._conn.close()
             self._conn = None
+        self._audit_tail = None
+
+    # ------------------------------------------------------------------
+    # Group commit
+    # ------------------------------------------------------------------
+
+    def flush(self) -> None:
+        """Commit all pending writes now (durability barrier)."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if not self._pending_writes:
+            return
+        start = time.perf_counter()
+        try:
+            self._db.commit()
+        except sqlite3.Error:
+            # The cached chain tail may name events that never committed
+            self._audit_tail = None
+            self._audit_tail_pending = False
+            raise
+        self._audit_tail_pending = False
+        self.commit_stats.observe(self._pending_writes, (time.perf_counter() - start) * 1000)
+        self._pending_writes = 0
+        if self._changed:
+            changed = frozenset(self._changed)
+            self._changed.clear()
+            self._notify_commit(changed)
+
+    def add_commit_listener(self, listener: CommitListener) -> None:
+        """Call *listener* with the change streams of every later COMMIT."""
+        self._commit_listeners.append(listener)
+
+    def _notify_commit(self, changed: frozenset[str]) -> None:
+        for listener in self._commit_listeners:
+            try:
+                listener(changed)
+            except Exception as exc:  # noqa: BLE001
+                logger.error("commit_listener_failed", error=str(exc))
+
+    def _commit(self, barrier: bool = False) -> None:
+        """Commit the write just executed, or defer it into the current batch."""
+        self._pending_writes += 1
+        if barrier or self._commit_delay <= 0 or self._pending_writes >= self._commit_batch_size:
+            self.flush()
+            return
+        if self._flush_handle is not None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.flush()  # No loop to run the deadline on — commit synchronously
+            return
+        self._flush_handle = loop.call_later(self._commit_delay, self._deadline_flush)
+
+    def _deadline_flush(self) -> None:
+        self._flush_handle = None
+        try:
+            self.flush()
+        except sqlite3.Error as exc:
+            logger.error("group_commit_flush_failed", error=str(exc), pending=self._pending_writes)
 
     @property
     def _db(self) -> sqlite3.Connection:
@@ -97,7 +333,7 @@ class Database:
             """,
             (session_id, tool, json.dumps(command), cwd, label),
         )
-        self._db.commit()
+        self._commit()
 
     # Columns that callers may update on the sessions table.  Any key not in
     # this set is rejected to prevent accidental SQL column injection even
@@ -129,11 +365,21 @@ class Database:
             f"UPDATE sessions SET {columns} WHERE id = ?",
             values,  # noqa: S608
         )
-        self._db.commit()
+        self._commit()
 
     def get_session(self, session_id: str) -> sqlite3.Row | None:
         return self._db.execute("SELECT * FROM sessions WHERE id = ?", (session_id,)).fetchone()
 
+    def find_session_ids(self, prefix: str, limit: int = 2) -> list[str]:
+        """Session ids starting with *prefix*, as a range scan of the primary key."""
+        if not prefix:
+            return []
+        rows = self._db.execute(
+            "SELECT id FROM sessions WHERE id >= ? AND id < ? ORDER BY id LIMIT ?",
+            (prefix, _prefix_upper_bound(prefix), limit),
+        ).fetchall()
+        return [row["id"] for row in rows]
+
     def list_active_sessions(self) -> list[sqlite3.Row]:
         return self._db.execute(
             "SELECT * FROM sessions WHERE status NOT IN ('completed', 'crashed', 'canceled')"
@@ -192,7 +438,8 @@ class Database:
                 channel_message_id,
             ),
         )
-        self._db.commit()
+        self._index_search(fts.KIND_PROMPT, session_id, prompt_id, redact(excerpt))
+        self._commit()
 
     def decide_prompt(
         self,
@@ -225,7 +472,7 @@ class Database:
             """,
             (new_status, response_normalized, channel_identity, now, prompt_id, nonce),
         )
-        self._db.commit()
+        self._commit(barrier=True)
         return cur.rowcount
 
     def get_prompt(self, prompt_id: str) -> sqlite3.Row | None:
@@ -249,7 +496,7 @@ class Database:
             "UPDATE prompts SET status = ? WHERE id = ?",
             (new_status, prompt_id),
         )
-        self._db.commit()
+        self._commit()
 
     def list_expired_pending(self) -> list[sqlite3.Row]:
         return self._db.execute(
@@ -272,12 +519,15 @@ class Database:
         seq: int,
         prompt_id: str = "",
     ) -> None:
-        self._db.execute(
+        """Store a chunk; *content* must already be redacted (TranscriptWriter does)."""
+        cur = self._db.execute(
             "INSERT INTO transcript_chunks (session_id, role, content, prompt_id, seq) "
             "VALUES (?, ?, ?, ?, ?)",
             (session_id, role, content, prompt_id or None, seq),
         )
-        self._db.commit()
+        self._index_search(fts.KIND_TRANSCRIPT, session_id, str(cur.lastrowid), content)
+        self._changed.add(TRANSCRIPT_STREAM)
+        self._commit()
 
     def list_transcript_chunks(
         self, session_id: str, after_seq: int = 0, limit: int = 200
@@ -288,6 +538,73 @@ class Database:
             (session_id, after_seq, limit),
         ).fetchall()
 
+    # ------------------------------------------------------------------
+    # Full-text search
+    # ------------------------------------------------------------------
+
+    def _index_search(
+        self,
+        kind: str,
+        session_id: str,
+        ref: str,
+        body: str,
+        created_at: str | None = None,
+        audit_seq: int | None = None,
+    ) -> None:
+        """Add redacted *body* to the search index, in the caller's transaction.
+
+        Audit rows pass their *audit_seq* so archiving can find them by key.
+        """
+        if not self._search_enabled or not body:
+            return
+        cur = self._db.execute(
+            f"INSERT INTO {fts.SEARCH_TABLE} (body, kind, session_id, ref, created_at) "  # noqa: S608
+            "VALUES (?, ?, ?, ?, COALESCE(?, datetime('now')))",
+            (body, kind, session_id, ref, created_at),
+        )
+        if audit_seq is not None:
+            self._db.execute(
+                f"INSERT OR REPLACE INTO {fts.AUDIT_ROWS_TABLE} (seq, fts_rowid) "  # noqa: S608
+                "VALUES (?, ?)",
+                (audit_seq, cur.lastrowid),
+            )
+
+    def search(
+        self,
+        text: str,
+        kind: str | None = None,
+        session_id: str | None = None,
+        limit: int = 20,
+        offset: int = 0,
+    ) -> tuple[list[fts.SearchHit], int]:
+        """Ranked full-text matches and their total (see core.store.search.search)."""
+        return fts.search(
+            self._db, text, kind=kind, session_id=session_id, limit=limit, offset=offset
+        )
+
+    def rebuild_search_index(self) -> int:
+        """Re-index every transcript chunk, prompt and audit event; return the row count."""
+        self.flush()
+        count = fts.rebuild_search_index(self._db)
+        self._db.commit()
+        self._search_enabled = fts.has_search_index(self._db)
+        return count
+
+    # ------------------------------------------------------------------
+    # Stats counters
+    # ------------------------------------------------------------------
+
+    def get_stats(self) -> dict[str, Any]:
+        """Session, prompt and audit totals from the trigger-maintained counters."""
+        return counters.read_stats(self._db)
+
+    def rebuild_stats(self) -> dict[tuple[str, str], int]:
+        """Recount the stats counters; return the drift that was corrected."""
+        self.flush()
+        drift = counters.rebuild_stats(self._db)
+        self._db.commit()
+        return drift
+
     # ------------------------------------------------------------------
     # Operator directives
     # ------------------------------------------------------------------
@@ -304,7 +621,7 @@ class Database:
             "VALUES (?, ?, ?, 'pending', ?)",
             (directive_id, session_id, content, actor),
         )
-        self._db.commit()
+        self._commit()
         return directive_id
 
     def list_pending_directives(self) -> list[sqlite3.Row]:
@@ -320,7 +637,7 @@ class Database:
             "processed_at = datetime('now') WHERE id = ?",
             (directive_id,),
         )
-        self._db.commit()
+        self._commit()
 
     # ------------------------------------------------------------------
     # Delivery tracking
@@ -348,7 +665,7 @@ class Database:
             """,
             (prompt_id, session_id, channel, channel_identity, message_id),
         )
-        self._db.commit()
+        self._commit()
         return cur.rowcount == 1
 
     def was_delivered(
@@ -381,45 +698,107 @@ class Database:
         prompt_id: str = "",
     ) -> None:
         """Append an event to the audit log with hash chaining."""
-        last = self._db.execute(
-            "SELECT hash FROM audit_events ORDER BY timestamp DESC LIMIT 1"
-        ).fetchone()
-        prev_hash = last["hash"] if last else ""
-
         now = datetime.now(UTC).isoformat()
         payload_str = json.dumps(payload, separators=(",", ":"), sort_keys=True)
-        chain_input = f"{prev_hash}{event_id}{event_type}{payload_str}"
-        event_hash = hashlib.sha256(chain_input.encode()).hexdigest()
 
-        self._db.execute(
-            """
-            INSERT INTO audit_events
-              (id, event_type, session_id, prompt_id, payload, timestamp,
-               prev_hash, hash)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                event_id,
-                event_type,
+        for attempt in range(2):
+            tail_seq, prev_hash = self._load_audit_tail(refresh=attempt > 0)
+            seq = tail_seq + 1
+            chain_input = f"{prev_hash}{event_id}{event_type}{payload_str}"
+            event_hash = hashlib.sha256(chain_input.encode()).hexdigest()
+            try:
+                self._db.execute(
+                    """
+                    INSERT INTO audit_events
+                      (id, event_type, session_id, prompt_id, payload, timestamp,
+                       prev_hash, hash, seq)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    (
+                        event_id,
+                        event_type,
+                        session_id,
+                        prompt_id,
+                        payload_str,
+                        now,
+                        prev_hash,
+                        event_hash,
+                        seq,
+                    ),
+                )
+            except sqlite3.IntegrityError:
+                # Another connection advanced the chain (seq taken) or the
+                # event id is a duplicate: re-read the tail once, then give up.
+                # Only the failed statement is undone; queued writes survive.
+                self._audit_tail = None
+                if attempt:
+                    raise
+                continue
+            self._audit_tail = (seq, event_hash)
+            self._audit_tail_pending = True
+            self._index_search(
+                fts.KIND_AUDIT,
                 session_id,
-                prompt_id,
-                payload_str,
-                now,
-                prev_hash,
-                event_hash,
-            ),
-        )
-        self._db.commit()
+                event_id,
+                redact(fts.audit_text(event_type, payload)),
+                created_at=now,
+                audit_seq=seq,
+            )
+            self._changed.add(AUDIT_STREAM)
+            self._commit()
+            return
+
+    def _load_audit_tail(self, refresh: bool = False) -> tuple[int, str]:
+        """Return the cached (seq, hash) chain tail, reading it on first use."""
+        if self._audit_tail_pending and not self._db.in_transaction:
+            # The transaction holding the cached tail ended outside flush()
+            # — possibly rolled back — so only the table can be trusted.
+            self._audit_tail = None
+            self._audit_tail_pending = False
+        if self._audit_tail is None or refresh:
+            last = self._db.execute(
+                "SELECT seq, hash FROM audit_events ORDER BY seq DESC LIMIT 1"
+            ).fetchone()
+            self._audit_tail = (last["seq"] or 0, last["hash"]) if last else (0, "")
+        return self._audit_tail
+
+    def get_recent_audit_events(
+        self, limit: int = 100, session_id: str | None = None
+    ) -> list[sqlite3.Row]:
+        """Return the newest audit events (newest first), optionally for one session."""
+        if session_id:
+            return self._db.execute(
+                "SELECT * FROM audit_events WHERE session_id = ? ORDER BY seq DESC LIMIT ?",
+                (session_id, limit),
+            ).fetchall()
+        return self._db.execute(
+            "SELECT * FROM audit_events ORDER BY seq DESC LIMIT ?", (limit,)
+        ).fetchall()
 
-    def get_recent_audit_events(self, limit: int = 100) -> list[sqlite3.Row]:
+    def get_audit_events_after(
+        self, after_seq: int, session_id: str | None = None, limit: int = 500
+    ) -> list[sqlite3.Row]:
+        """Return up to *limit* audit events with ``seq > after_seq``, oldest first.
+
+        A cursor read: callers pass the last ``seq`` they saw, so each call
+        touches only new rows (via idx_audit_seq, or idx_audit_session_seq
+        when scoped to a session).
+        """
+        if session_id:
+            return self._db.execute(
+                "SELECT * FROM audit_events WHERE session_id = ? AND seq > ? "
+                "ORDER BY seq ASC LIMIT ?",
+                (session_id, after_seq, limit),
+            ).fetchall()
         return self._db.execute(
-            "SELECT * FROM audit_events ORDER BY timestamp DESC LIMIT ?", (limit,)
+            "SELECT * FROM audit_events WHERE seq > ? ORDER BY seq ASC LIMIT ?",
+            (after_seq, limit),
         ).fetchall()
 
     def get_audit_events_for_session(self, session_id: str, limit: int = 500) -> list[sqlite3.Row]:
         """Return audit events for a session, ordered chronologically (oldest first)."""
         return self._db.execute(
-            "SELECT * FROM audit_events WHERE session_id = ? ORDER BY timestamp ASC LIMIT ?",
+            "SELECT * FROM audit_events WHERE session_id = ? ORDER BY seq ASC LIMIT ?",
             (session_id, limit),
         ).fetchall()
 
@@ -428,96 +807,133 @@ class Database:
         session_id: str | None = None,
         since: str | None = None,
         until: str | None = None,
+        after_seq: int = 0,
+        limit: int | None = None,
     ) -> list[sqlite3.Row]:
-        """Return audit events matching optional filters, ordered chronologically."""
-        clauses: list[str] = []
-        params: list[str] = []
-        if session_id:
-            clauses.append("session_id = ?")
-            params.append(session_id)
-        if since:
-            clauses.append("timestamp >= ?")
-            params.append(since)
-        if until:
-            clauses.append("timestamp <= ?")
-            params.append(until)
-        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
-        return self._db.execute(
-            f"SELECT * FROM audit_events{where} ORDER BY timestamp ASC",
-            params,
-        ).fetchall()
+        """Return audit events matching optional filters, ordered chronologically.
 
-    def count_audit_events(self) -> int:
-        """Return the total number of audit events."""
-        row = self._db.execute("SELECT count(*) FROM audit_events").fetchone()
+        ``after_seq`` and ``limit`` read one page at a time (pass the last
+        ``seq`` of the previous page), so large exports never hold the
+        whole log in memory.
+        """
+        where, params = _audit_filter(session_id, since, until)
+        where = f"seq > ?{where}"
+        sql = f"SELECT * FROM audit_events WHERE {where} ORDER BY seq ASC"  # noqa: S608
+        if limit is not None:
+            sql += " LIMIT ?"
+            return self._db.execute(sql, [after_seq, *params, limit]).fetchall()
+        return self._db.execute(sql, [after_seq, *params]).fetchall()
+
+    def count_audit_events(
+        self,
+        session_id: str | None = None,
+        since: str | None = None,
+        until: str | None = None,
+    ) -> int:
+        """Return the number of audit events, optionally matching filters."""
+        where, params = _audit_filter(session_id, since, until)
+        row = self._db.execute(
+            f"SELECT count(*) FROM audit_events WHERE 1{where}",  # noqa: S608
+            params,
+        ).fetchone()
         return row[0] if row else 0
 
     def archive_audit_events(
         self,
         archive_path: Path,
         before_date: str,
+        batch_size: int = _ARCHIVE_BATCH,
+        progress: Callable[[int, int], None] | None = None,
     ) -> int:
         """Move audit events older than *before_date* to *archive_path*.
 
-        The archived events are written to a new SQLite file with the
-        same ``audit_events`` schema, preserving hash chain order.
-        Events are then deleted from the main database.
+        The archived events are written to a SQLite file with the same
+        ``audit_events`` columns, preserving hash chain order, in batches
+        (see ``_archive_audit_where``).
 
         Returns the number of events archived.
         """
-        rows = self._db.execute(
-            "SELECT * FROM audit_events WHERE timestamp < ? ORDER BY timestamp ASC",
-            (before_date,),
-        ).fetchall()
+        return self._archive_audit_where(
+            "timestamp < ?", (before_date,), archive_path, batch_size, progress
+        )
 
-        if not rows:
+    def _archive_audit_where(
+        self,
+        where: str,
+        params: tuple[Any, ...],
+        archive_path: Path,
+        batch_size: int,
+        progress: Callable[[int, int], None] | None,
+    ) -> int:
+        """Move the audit events matching *where* to *archive_path*, oldest first.
+
+        The archive is attached to this connection and each batch of at
+        most *batch_size* events is copied with one INSERT … SELECT, then
+        deleted from the main database. The copy and a chain-boundary row
+        in ``archive_checkpoints`` (last seq and hash moved) commit before
+        the delete, so an interrupted run leaves every event in at least
+        one file and can simply be run again. The write lock is released
+        between batches.
+        """
+        first = self._db.execute(
+            f"SELECT 1 FROM audit_events WHERE {where} LIMIT 1",  # noqa: S608
+            params,
+        ).fetchone()
+        if first is None:
             return 0
-
-        # Create archive database with same schema
-        archive_db = sqlite3.connect(str(archive_path))
-        archive_db.execute("PRAGMA journal_mode=WAL")
-        archive_db.execute(
-            """
-            CREATE TABLE IF NOT EXISTS audit_events (
-                id          TEXT PRIMARY KEY,
-                event_type  TEXT NOT NULL,
-                session_id  TEXT NOT NULL DEFAULT '',
-                prompt_id   TEXT NOT NULL DEFAULT '',
-                payload     TEXT NOT NULL DEFAULT '{}',
-                timestamp   TEXT NOT NULL,
-                prev_hash   TEXT NOT NULL DEFAULT '',
-                hash        TEXT NOT NULL DEFAULT ''
-            )
-            """
+        total = (
+            self._db.execute(
+                f"SELECT count(*) FROM audit_events WHERE {where}",  # noqa: S608
+                params,
+            ).fetchone()[0]
+            if progress is not None
+            else 0
         )
-        archive_db.execute("CREATE INDEX IF NOT EXISTS idx_archive_ts ON audit_events(timestamp)")
-
-        # Copy rows to archive
-        for row in rows:
-            archive_db.execute(
-                """INSERT OR IGNORE INTO audit_events
-                   (id, event_type, session_id, prompt_id, payload,
-                    timestamp, prev_hash, hash)
-                   VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
-                (
-                    row["id"],
-                    row["event_type"],
-                    row["session_id"],
-                    row["prompt_id"],
-                    row["payload"],
-                    row["timestamp"],
-                    row["prev_hash"],
-                    row["hash"],
-                ),
-            )
-        archive_db.commit()
-        archive_db.close()
 
-        # Delete archived events from main database
-        self._db.execute("DELETE FROM audit_events WHERE timestamp < ?", (before_date,))
-        self._db.commit()
-
-        return len(rows)
+        self.flush()  # ATTACH is not allowed inside a transaction
+        self._db.execute("ATTACH DATABASE ? AS archive", (str(archive_path),))
+        try:
+            _prepare_archive(self._db)
+            moved = 0
+            after = 0
+            while True:
+                hi, count = self._db.execute(
+                    f"SELECT max(seq), count(*) FROM (SELECT seq FROM main.audit_events "  # noqa: S608
+                    f"WHERE seq > ? AND {where} ORDER BY seq LIMIT ?)",
+                    (after, *params, batch_size),
+                ).fetchone()
+                if not count:
+                    break
+                batch = f"seq > ? AND seq <= ? AND {where}"
+                batch_params = (after, hi, *params)
+                self._db.execute(
+                    f"INSERT OR IGNORE INTO archive.audit_events ({_ARCHIVE_COLUMNS}) "  # noqa: S608
+                    f"SELECT {_ARCHIVE_COLUMNS} FROM main.audit_events WHERE {batch}",
+                    batch_params,
+                )
+                self._db.execute(
+                    "INSERT OR REPLACE INTO archive.archive_checkpoints "
+                    "(last_seq, last_hash, count, archived_at) "
+                    "SELECT seq, hash, ?, ? FROM main.audit_events WHERE seq = ?",
+                    (count, datetime.now(UTC).isoformat(), hi),
+                )
+                self._commit(barrier=True)
+                if self._search_enabled:
+                    fts.delete_audit_rows(self._db, batch, batch_params)
+                self._db.execute(
+                    f"DELETE FROM main.audit_events WHERE {batch}",  # noqa: S608
+                    batch_params,
+                )
+                self._commit(barrier=True)
+                moved += count
+                after = hi
+                if progress is not None:
+                    progress(moved, total)
+        finally:
+            self.flush()
+            self._db.execute("DETACH DATABASE archive")
+        self._audit_tail = None
+        return moved
 
     # ------------------------------------------------------------------
     # Agent SoR tables
@@ -542,7 +958,7 @@ class Database:
             """,
             (turn_id, session_id, trace_id, turn_number, role, content, state, metadata),
         )
-        self._db.commit()
+        self._commit()
 
     def update_agent_turn(self, turn_id: str, **kwargs: Any) -> None:
         allowed = {"content", "state", "metadata"}
@@ -554,7 +970,7 @@ class Database:
         columns = ", ".join(f"{k} = ?" for k in kwargs)
         values = list(kwargs.values()) + [turn_id]
         self._db.execute(f"UPDATE agent_turns SET {columns} WHERE id = ?", values)  # noqa: S608
-        self._db.commit()
+        self._commit()
 
     def get_agent_turn(self, turn_id: str) -> sqlite3.Row | None:
         return self._db.execute("SELECT * FROM agent_turns WHERE id = ?", (turn_id,)).fetchone()
@@ -583,7 +999,7 @@ class Database:
             """,
             (plan_id, session_id, trace_id, turn_id, description, steps, risk_level),
         )
-        self._db.commit()
+        self._commit()
 
     def update_agent_plan(self, plan_id: str, **kwargs: Any) -> None:
         allowed = {"status", "resolved_at", "resolved_by"}
@@ -595,7 +1011,7 @@ class Database:
         columns = ", ".join(f"{k} = ?" for k in kwargs)
         values = list(kwargs.values()) + [plan_id]
         self._db.execute(f"UPDATE agent_plans SET {columns} WHERE id = ?", values)  # noqa: S608
-        self._db.commit()
+        self._commit()
 
     def get_agent_plan(self, plan_id: str) -> sqlite3.Row | None:
         return self._db.execute("SELECT * FROM agent_plans WHERE id = ?", (plan_id,)).fetchone()
@@ -641,7 +1057,7 @@ class Database:
                 risk_score,
             ),
         )
-        self._db.commit()
+        self._commit()
 
     def list_agent_decisions(self, session_id: str, limit: int = 200) -> list[sqlite3.Row]:
         return self._db.execute(
@@ -682,7 +1098,7 @@ class Database:
                 duration_ms,
             ),
         )
-        self._db.commit()
+        self._commit()
 
     def list_agent_tool_runs(self, session_id: str, limit: int = 200) -> list[sqlite3.Row]:
         return self._db.execute(
@@ -719,7 +1135,7 @@ class Database:
                 total_duration_ms,
             ),
         )
-        self._db.commit()
+        self._commit()
 
     def list_agent_outcomes(self, session_id: str, limit: int = 100) -> list[sqlite3.Row]:
         return self._db.execute(
@@ -731,68 +1147,19 @@ class Database:
         self,
         archive_path: Path,
         keep_count: int,
+        batch_size: int = _ARCHIVE_BATCH,
+        progress: Callable[[int, int], None] | None = None,
     ) -> int:
         """Archive the oldest events, keeping only the newest *keep_count*.
 
         Returns the number of events archived.
         """
-        total = self.count_audit_events()
-        if total <= keep_count:
-            return 0
-
-        # Select oldest events to archive (everything except the newest keep_count)
-        rows = self._db.execute(
-            """SELECT * FROM audit_events
-               ORDER BY timestamp ASC
-               LIMIT ?""",
-            (total - keep_count,),
-        ).fetchall()
-
-        if not rows:
+        row = self._db.execute(
+            "SELECT seq FROM audit_events ORDER BY seq DESC LIMIT 1 OFFSET ?",
+            (max(keep_count, 0),),
+        ).fetchone()
+        if row is None:
             return 0
-
-        archive_db = sqlite3.connect(str(archive_path))
-        archive_db.execute("PRAGMA journal_mode=WAL")
-        archive_db.execute(
-            """
-            CREATE TABLE IF NOT EXISTS audit_events (
-                id          TEXT PRIMARY KEY,
-                event_type  TEXT NOT NULL,
-                session_id  TEXT NOT NULL DEFAULT '',
-                prompt_id   TEXT NOT NULL DEFAULT '',
-                payload     TEXT NOT NULL DEFAULT '{}',
-                timestamp   TEXT NOT NULL,
-                prev_hash   TEXT NOT NULL DEFAULT '',
-                hash        TEXT NOT NULL DEFAULT ''
-            )
-            """
+        return self._archive_audit_where(
+            "seq <= ?", (row["seq"],), archive_path, batch_size, progress
         )
-        archive_db.execute("CREATE INDEX IF NOT EXISTS idx_archive_ts ON audit_events(timestamp)")
-
-        for row in rows:
-            archive_db.execute(
-                """INSERT OR IGNORE INTO audit_events
-                   (id, event_type, session_id, prompt_id, payload,
-                    timestamp, prev_hash, hash)
-                   VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
-                (
-                    row["id"],
-                    row["event_type"],
-                    row["session_id"],
-                    row["prompt_id"],
-                    row["payload"],
-                    row["timestamp"],
-                    row["prev_hash"],
-                    row["hash"],
-                ),
-            )
-        archive_db.commit()
-        archive_db.close()
-
-        # Delete archived events by their IDs
-        ids = [row["id"] for row in rows]
-        placeholders = ",".join("?" for _ in ids)
-        self._db.execute(f"DELETE FROM audit_events WHERE id IN ({placeholders})", ids)
-        self._db.commit()
-
-        return len(rows)
@@ -22,6 +22,11 @@ Version history:
   6 → 7: Transcript chunks table (live session transcript for dashboard)
   7 → 8: Workspace governance (posture bindings, TTL, scan artifacts)
   8 → 9: Operator directives (free-text input from dashboard to running sessions)
+  9 → 10: audit_events.seq — monotonic chain order (backfilled), unique index
+  10 → 11: audit_events (session_id, seq) and (event_type, seq) indexes
+  11 → 12: search_index — FTS5 over transcripts, prompt excerpts, audit payloads
+  12 → 13: stats — trigger-maintained session/prompt/audit counters
+  13 → 14: search_audit_rows — audit seq → search_index rowid, for archiving
 """
 
 from __future__ import annotations
@@ -35,7 +40,7 @@ import structlog
 logger = structlog.get_logger()
 
 # Bump this when adding a new migration.
-LATEST_SCHEMA_VERSION = 9
+LATEST_SCHEMA_VERSION = 14
 
 
 # ---------------------------------------------------------------------------
@@ -408,6 +413,94 @@ def _migrate_8_to_9(conn: sqlite3.Connection) -> None:
     """)
 
 
+def _migrate_9_to_10(conn: sqlite3.Connection) -> None:
+    """
+    Version 9 → 10: add audit_events.seq, the hash chain order.
+
+    Timestamps are not unique, so ordering the chain by them is ambiguous.
+    Existing rows are numbered in (timestamp, rowid) order — the order they
+    were chained in — and new rows take the next number.
+    """
+    _add_column_if_missing(conn, "audit_events", "seq", "INTEGER")
+    conn.execute("DROP TABLE IF EXISTS temp._audit_seq")
+    conn.execute("CREATE TEMP TABLE _audit_seq (id TEXT PRIMARY KEY, seq INTEGER NOT NULL)")
+    conn.execute("""
+        INSERT INTO temp._audit_seq (id, seq)
+        SELECT id, ROW_NUMBER() OVER (ORDER BY timestamp, rowid)
+          FROM audit_events
+         WHERE seq IS NULL
+    """)
+    conn.execute("""
+        UPDATE audit_events
+           SET seq = (SELECT s.seq FROM temp._audit_seq s WHERE s.id = audit_events.id)
+         WHERE seq IS NULL
+    """)
+    conn.execute("DROP TABLE temp._audit_seq")
+    conn.execute("""
+        CREATE UNIQUE INDEX IF NOT EXISTS idx_audit_seq
+            ON audit_events(seq)
+    """)
+
+
+def _migrate_10_to_11(conn: sqlite3.Connection) -> None:
+    """
+    Version 10 → 11: index the audit log by session and by event type.
+
+    Session timelines, ``logs --session``, session-scoped verification and
+    event-type filters read one session's (or one type's) events in chain
+    order; these indexes serve them without scanning the whole log.
+    """
+    conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_audit_session_seq
+            ON audit_events(session_id, seq)
+    """)
+    conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_audit_event_type_seq
+            ON audit_events(event_type, seq)
+    """)
+
+
+def _migrate_11_to_12(conn: sqlite3.Connection) -> None:
+    """
+    Version 11 → 12: full-text search index, backfilled from existing rows.
+
+    Skipped (with a warning) on SQLite builds without FTS5; search is then
+    unavailable but everything else works.
+    """
+    from atlasbridge.core.store.search import has_search_index, rebuild_search_index
+
+    if not has_search_index(conn):
+        count = rebuild_search_index(conn)
+        logger.info("migration_search_index_built", rows=count)
+
+
+def _migrate_12_to_13(conn: sqlite3.Connection) -> None:
+    """
+    Version 12 → 13: stats table and the triggers that maintain it.
+
+    Counters are filled from the existing rows.
+    """
+    from atlasbridge.core.store.stats import rebuild_stats
+
+    rebuild_stats(conn)
+
+
+def _migrate_13_to_14(conn: sqlite3.Connection) -> None:
+    """
+    Version 13 → 14: map audit events to their search index rows.
+
+    Archiving deletes a batch's index rows through this map instead of
+    scanning the whole index. Filled from the rows already indexed; skipped
+    when there is no search index.
+    """
+    from atlasbridge.core.store.search import create_audit_rows, has_search_index, map_audit_rows
+
+    if has_search_index(conn):
+        create_audit_rows(conn)
+        count = map_audit_rows(conn)
+        logger.info("migration_search_audit_rows_mapped", rows=count)
+
+
 _MIGRATIONS: dict[int, Callable[[sqlite3.Connection], None]] = {
     0: _migrate_0_to_1,
     1: _migrate_1_to_2,
@@ -418,6 +511,11 @@ _MIGRATIONS: dict[int, Callable[[sqlite3.Connection], None]] = {
     6: _migrate_6_to_7,
     7: _migrate_7_to_8,
     8: _migrate_8_to_9,
+    9: _migrate_9_to_10,
+    10: _migrate_10_to_11,
+    11: _migrate_11_to_12,
+    12: _migrate_12_to_13,
+    13: _migrate_13_to_14,
 }
 
 
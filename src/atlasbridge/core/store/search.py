@@ -0,0 +1,275 @@
+"""
+Full-text search over transcripts, prompt excerpts and audit payloads.
+
+One SQLite FTS5 table, ``search_index``, holds the searchable text of
+three sources, each row tagged with its ``kind``, ``session_id`` and a
+``ref`` back to the source row:
+
+  transcript — transcript_chunks.content (ref: chunk id)
+  prompt     — prompts.excerpt           (ref: prompt id)
+  audit      — event type + audit payload string values (ref: event id)
+
+Only redacted text is indexed. TranscriptWriter content is redacted
+before it is stored; prompt excerpts and audit payloads are redacted as
+they are indexed. The writers add rows as they write (see
+``Database.index_search_text``); ``rebuild_search_index`` recreates the
+whole index from the source tables.
+
+``search_audit_rows`` maps each audit event's ``seq`` to its index rowid,
+so archiving can drop a batch's index rows by key, in the batch's own
+transaction, instead of scanning the index for orphans.
+
+SQLite builds without FTS5 have no index: writers skip it and
+``search`` raises SearchUnavailableError.
+"""
+
+from __future__ import annotations
+
+import itertools
+import json
+import re
+import sqlite3
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from typing import Any
+
+import structlog
+
+from atlasbridge.core.security.redactor import redact
+
+logger = structlog.get_logger()
+
+SEARCH_TABLE = "search_index"
+AUDIT_ROWS_TABLE = "search_audit_rows"
+
+KIND_TRANSCRIPT = "transcript"
+KIND_PROMPT = "prompt"
+KIND_AUDIT = "audit"
+SEARCH_KINDS = (KIND_TRANSCRIPT, KIND_PROMPT, KIND_AUDIT)
+
+_REBUILD_BATCH = 1000
+_SNIPPET_TOKENS = 12
+_TERM = re.compile(r'"([^"]*)"|(\S+)')
+
+
+class SearchUnavailableError(RuntimeError):
+    """The database has no full-text index (no FTS5 support, or not migrated)."""
+
+
+@dataclass(frozen=True)
+class SearchHit:
+    """One ranked match; ``snippet`` marks matched terms with « »."""
+
+    kind: str
+    session_id: str
+    ref: str
+    created_at: str
+    snippet: str
+    rank: float
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "kind": self.kind,
+            "session_id": self.session_id,
+            "ref": self.ref,
+            "created_at": self.created_at,
+            "snippet": self.snippet,
+            "rank": self.rank,
+        }
+
+
+def create_search_index(conn: sqlite3.Connection) -> bool:
+    """Create the FTS5 table; False if this SQLite build has no FTS5."""
+    try:
+        conn.execute(f"""
+            CREATE VIRTUAL TABLE IF NOT EXISTS {SEARCH_TABLE} USING fts5(
+                body,
+                kind UNINDEXED,
+                session_id UNINDEXED,
+                ref UNINDEXED,
+                created_at UNINDEXED,
+                tokenize = 'unicode61 remove_diacritics 2'
+            )
+        """)
+    except sqlite3.OperationalError as exc:
+        logger.warning("search_index_unavailable", error=str(exc))
+        return False
+    create_audit_rows(conn)
+    return True
+
+
+def create_audit_rows(conn: sqlite3.Connection) -> None:
+    """Create the audit seq → index rowid map (idempotent)."""
+    conn.execute(f"""
+        CREATE TABLE IF NOT EXISTS {AUDIT_ROWS_TABLE} (
+            seq        INTEGER PRIMARY KEY,
+            fts_rowid  INTEGER NOT NULL
+        )
+    """)
+
+
+def map_audit_rows(conn: sqlite3.Connection) -> int:
+    """Fill ``search_audit_rows`` from the audit rows already in the index."""
+    return conn.execute(f"""
+        INSERT OR REPLACE INTO {AUDIT_ROWS_TABLE} (seq, fts_rowid)
+        SELECT a.seq, s.rowid
+          FROM {SEARCH_TABLE} s JOIN audit_events a ON a.id = s.ref
+         WHERE s.kind = '{KIND_AUDIT}' AND a.seq IS NOT NULL
+    """).rowcount  # noqa: S608
+
+
+def delete_audit_rows(conn: sqlite3.Connection, where: str, params: tuple[Any, ...]) -> None:
+    """Drop the index rows of the audit events matching *where*, by key.
+
+    Must run before those events are deleted from ``audit_events``.
+    """
+    events = f"SELECT seq FROM main.audit_events WHERE {where}"
+    conn.execute(
+        f"DELETE FROM {SEARCH_TABLE} WHERE rowid IN "  # noqa: S608
+        f"(SELECT fts_rowid FROM {AUDIT_ROWS_TABLE} WHERE seq IN ({events}))",
+        params,
+    )
+    conn.execute(
+        f"DELETE FROM {AUDIT_ROWS_TABLE} WHERE seq IN ({events})",  # noqa: S608
+        params,
+    )
+
+
+def has_search_index(conn: sqlite3.Connection) -> bool:
+    row = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (SEARCH_TABLE,)
+    ).fetchone()
+    return row is not None
+
+
+def audit_text(event_type: str, payload: Any) -> str:
+    """Searchable text of an audit event: its type and its payload's strings."""
+    return " ".join([event_type, *_strings(payload)])
+
+
+def _strings(value: Any) -> Iterator[str]:
+    if isinstance(value, str):
+        if value:
+            yield value
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from _strings(item)
+    elif isinstance(value, list | tuple):
+        for item in value:
+            yield from _strings(item)
+
+
+def fts_query(text: str) -> str:
+    """Turn user input into an FTS5 query matching all of its terms.
+
+    Words and ``"quoted phrases"`` are quoted for FTS5, so operators and
+    punctuation in the input are matched literally. Raises ValueError if
+    the input has no terms.
+    """
+    terms = [phrase or word for phrase, word in _TERM.findall(text)]
+    terms = [t for t in terms if t.strip()]
+    if not terms:
+        raise ValueError("Empty search query")
+    return " ".join('"' + t.replace('"', '""') + '"' for t in terms)
+
+
+def search(
+    conn: sqlite3.Connection,
+    text: str,
+    *,
+    kind: str | None = None,
+    session_id: str | None = None,
+    limit: int = 20,
+    offset: int = 0,
+) -> tuple[list[SearchHit], int]:
+    """Best matches for *text* first (BM25), and the total number of matches.
+
+    Raises ValueError for an empty query and SearchUnavailableError when
+    the database has no index.
+    """
+    if not has_search_index(conn):
+        raise SearchUnavailableError("Full-text search index is not available")
+    clauses = [f"{SEARCH_TABLE} MATCH ?"]
+    params: list[Any] = [fts_query(text)]
+    if kind:
+        clauses.append("kind = ?")
+        params.append(kind)
+    if session_id:
+        clauses.append("session_id = ?")
+        params.append(session_id)
+    where = " AND ".join(clauses)
+
+    total = conn.execute(
+        f"SELECT count(*) FROM {SEARCH_TABLE} WHERE {where}",  # noqa: S608
+        params,
+    ).fetchone()[0]
+    rows = conn.execute(
+        f"SELECT kind, session_id, ref, created_at, rank, "  # noqa: S608
+        f"snippet({SEARCH_TABLE}, 0, '«', '»', '…', {_SNIPPET_TOKENS}) "
+        f"FROM {SEARCH_TABLE} WHERE {where} ORDER BY rank LIMIT ? OFFSET ?",
+        [*params, max(limit, 0), max(offset, 0)],
+    ).fetchall()
+    hits = [
+        SearchHit(
+            kind=row[0],
+            session_id=row[1],
+            ref=row[2],
+            created_at=row[3],
+            rank=row[4],
+            snippet=row[5],
+        )
+        for row in rows
+    ]
+    return hits, total
+
+
+def insert_search_rows(
+    conn: sqlite3.Connection, rows: Iterable[tuple[str, str, str, str, str]]
+) -> None:
+    """Insert ``(body, kind, session_id, ref, created_at)`` rows; bodies must be redacted."""
+    conn.executemany(
+        f"INSERT INTO {SEARCH_TABLE} (body, kind, session_id, ref, created_at) "  # noqa: S608
+        "VALUES (?, ?, ?, ?, ?)",
+        rows,
+    )
+
+
+def rebuild_search_index(conn: sqlite3.Connection) -> int:
+    """Recreate the index from transcripts, prompts and audit events.
+
+    Runs in the caller's transaction. Returns the number of rows indexed,
+    or 0 without FTS5.
+    """
+    if not create_search_index(conn):
+        return 0
+    conn.execute(f"DELETE FROM {SEARCH_TABLE}")  # noqa: S608
+    conn.execute(f"DELETE FROM {AUDIT_ROWS_TABLE}")  # noqa: S608
+    # Transcript content is redacted before it is stored
+    count = conn.execute(f"""
+        INSERT INTO {SEARCH_TABLE} (body, kind, session_id, ref, created_at)
+        SELECT content, '{KIND_TRANSCRIPT}', session_id, CAST(id AS TEXT), created_at
+          FROM transcript_chunks
+    """).rowcount  # noqa: S608
+
+    def prompts() -> Iterator[tuple[str, str, str, str, str]]:
+        for pid, sid, excerpt, created_at in conn.execute(
+            "SELECT id, session_id, excerpt, created_at FROM prompts"
+        ):
+            yield redact(excerpt or ""), KIND_PROMPT, sid, pid, created_at
+
+    def audit() -> Iterator[tuple[str, str, str, str, str]]:
+        for eid, event_type, sid, payload, timestamp in conn.execute(
+            "SELECT id, event_type, session_id, payload, timestamp FROM audit_events"
+        ):
+            try:
+                data = json.loads(payload or "{}")
+            except ValueError:
+                data = payload
+            yield redact(audit_text(event_type, data)), KIND_AUDIT, sid, eid, timestamp
+
+    for source in (prompts(), audit()):
+        while batch := list(itertools.islice(source, _REBUILD_BATCH)):
+            insert_search_rows(conn, batch)
+            count += len(batch)
+    map_audit_rows(conn)
+    return count
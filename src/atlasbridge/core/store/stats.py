@@ -0,0 +1,169 @@
+"""
+Maintained row counts for dashboard stats.
+
+The ``stats`` table holds one counter per ``(scope, key)``:
+
+  session_status — sessions per status     (key: status)
+  prompt_type    — prompts per prompt type (key: prompt_type)
+  audit          — audit events            (key: "total")
+
+Triggers on ``sessions``, ``prompts`` and ``audit_events`` update the
+counters in the same transaction as the row change, whichever connection
+makes it. Readers therefore get totals from a handful of rows instead of
+COUNT(*) scans that grow with history.
+
+The counters can only drift if rows are changed with the triggers absent
+(e.g. a copy of the tables restored by hand). ``rebuild_stats`` recounts
+them; ``atlasbridge db stats --rebuild`` runs it and reports the drift.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from typing import Any
+
+STATS_TABLE = "stats"
+
+SCOPE_SESSION_STATUS = "session_status"
+SCOPE_PROMPT_TYPE = "prompt_type"
+SCOPE_AUDIT = "audit"
+AUDIT_TOTAL = "total"
+
+# Session statuses that no longer count as active
+TERMINAL_SESSION_STATUSES = ("completed", "crashed", "canceled")
+
+
+def _bump(scope: str, key: str, delta: int) -> str:
+    """Trigger statement adding *delta* to one counter (*key* is SQL)."""
+    return (
+        f"INSERT INTO {STATS_TABLE} (scope, key, value) VALUES ('{scope}', {key}, {delta}) "
+        f"ON CONFLICT (scope, key) DO UPDATE SET value = value + {delta};"
+    )
+
+
+_TRIGGERS = {
+    "trg_stats_session_insert": f"""
+        AFTER INSERT ON sessions BEGIN
+            {_bump(SCOPE_SESSION_STATUS, "NEW.status", 1)}
+        END""",
+    "trg_stats_session_status": f"""
+        AFTER UPDATE OF status ON sessions WHEN OLD.status IS NOT NEW.status BEGIN
+            {_bump(SCOPE_SESSION_STATUS, "OLD.status", -1)}
+            {_bump(SCOPE_SESSION_STATUS, "NEW.status", 1)}
+        END""",
+    "trg_stats_session_delete": f"""
+        AFTER DELETE ON sessions BEGIN
+            {_bump(SCOPE_SESSION_STATUS, "OLD.status", -1)}
+        END""",
+    "trg_stats_prompt_insert": f"""
+        AFTER INSERT ON prompts BEGIN
+            {_bump(SCOPE_PROMPT_TYPE, "NEW.prompt_type", 1)}
+        END""",
+    "trg_stats_prompt_type": f"""
+        AFTER UPDATE OF prompt_type ON prompts
+        WHEN OLD.prompt_type IS NOT NEW.prompt_type BEGIN
+            {_bump(SCOPE_PROMPT_TYPE, "OLD.prompt_type", -1)}
+            {_bump(SCOPE_PROMPT_TYPE, "NEW.prompt_type", 1)}
+        END""",
+    "trg_stats_prompt_delete": f"""
+        AFTER DELETE ON prompts BEGIN
+            {_bump(SCOPE_PROMPT_TYPE, "OLD.prompt_type", -1)}
+        END""",
+    "trg_stats_audit_insert": f"""
+        AFTER INSERT ON audit_events BEGIN
+            {_bump(SCOPE_AUDIT, f"'{AUDIT_TOTAL}'", 1)}
+        END""",
+    "trg_stats_audit_delete": f"""
+        AFTER DELETE ON audit_events BEGIN
+            {_bump(SCOPE_AUDIT, f"'{AUDIT_TOTAL}'", -1)}
+        END""",
+}
+
+
+def create_stats(conn: sqlite3.Connection) -> None:
+    """Create the ``stats`` table and its triggers (idempotent)."""
+    conn.execute(f"""
+        CREATE TABLE IF NOT EXISTS {STATS_TABLE} (
+            scope  TEXT    NOT NULL,
+            key    TEXT    NOT NULL,
+            value  INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (scope, key)
+        ) WITHOUT ROWID
+    """)
+    for name, body in _TRIGGERS.items():
+        conn.execute(f"CREATE TRIGGER IF NOT EXISTS {name} {body}")
+
+
+def has_stats(conn: sqlite3.Connection) -> bool:
+    row = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (STATS_TABLE,)
+    ).fetchone()
+    return row is not None
+
+
+def rebuild_stats(conn: sqlite3.Connection) -> dict[tuple[str, str], int]:
+    """Recount every counter from the source tables, in the caller's transaction.
+
+    Returns the drift that was corrected: ``{(scope, key): new - old}`` for
+    each counter that changed.
+    """
+    create_stats(conn)
+    before = _counters(conn)
+    conn.execute(f"DELETE FROM {STATS_TABLE}")  # noqa: S608
+    conn.execute(f"""
+        INSERT INTO {STATS_TABLE} (scope, key, value)
+        SELECT '{SCOPE_SESSION_STATUS}', status, count(*) FROM sessions GROUP BY status
+        UNION ALL
+        SELECT '{SCOPE_PROMPT_TYPE}', prompt_type, count(*) FROM prompts GROUP BY prompt_type
+        UNION ALL
+        SELECT '{SCOPE_AUDIT}', '{AUDIT_TOTAL}', count(*) FROM audit_events
+    """)  # noqa: S608
+    after = _counters(conn)
+    return {
+        k: after.get(k, 0) - before.get(k, 0)
+        for k in before.keys() | after.keys()
+        if after.get(k, 0) != before.get(k, 0)
+    }
+
+
+def _counters(conn: sqlite3.Connection) -> dict[tuple[str, str], int]:
+    return {
+        (scope, key): value
+        for scope, key, value in conn.execute(
+            f"SELECT scope, key, value FROM {STATS_TABLE}"  # noqa: S608
+        )
+    }
+
+
+def read_stats(conn: sqlite3.Connection) -> dict[str, Any]:
+    """Totals and breakdowns from the counters (zero counters omitted)."""
+    sessions: dict[str, int] = {}
+    prompts: dict[str, int] = {}
+    audit = 0
+    for (scope, key), value in _counters(conn).items():
+        if not value:
+            continue
+        if scope == SCOPE_SESSION_STATUS:
+            sessions[key] = value
+        elif scope == SCOPE_PROMPT_TYPE:
+            prompts[key] = value
+        elif scope == SCOPE_AUDIT and key == AUDIT_TOTAL:
+            audit = value
+    return {
+        "sessions": sum(sessions.values()),
+        "prompts": sum(prompts.values()),
+        "audit_events": audit,
+        "active_sessions": sum(
+            n for status, n in sessions.items() if status not in TERMINAL_SESSION_STATUSES
+        ),
+        "sessions_by_status": sessions,
+        "prompts_by_type": prompts,
+    }
+
+
+def count_sessions_with_status(conn: sqlite3.Connection, status: str) -> int:
+    row = conn.execute(
+        f"SELECT value FROM {STATS_TABLE} WHERE scope = ? AND key = ?",  # noqa: S608
+        (SCOPE_SESSION_STATUS, status),
+    ).fetchone()
+    return row[0] if row else 0
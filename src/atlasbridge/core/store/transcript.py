@@ -11,7 +11,7 @@ import asyncio
 
 import structlog
 
-from atlasbridge.core.prompt.sanitize import is_meaningful, strip_ansi
+from atlasbridge.core.prompt.sanitize import SanitizedChunk
 from atlasbridge.core.security.redactor import redact
 
 from .database import Database
@@ -41,13 +41,22 @@ class TranscriptWriter:
 
     def feed(self, raw: bytes) -> None:
         """Accept raw PTY bytes, sanitize, and buffer for batch write."""
-        try:
-            text = strip_ansi(raw.decode("utf-8", errors="replace"))
-        except Exception:  # noqa: BLE001
+        self.feed_chunk(SanitizedChunk.from_bytes(raw))
+
+    def feed_chunk(self, chunk: SanitizedChunk) -> None:
+        """Buffer a chunk decoded by the session's OutputPipeline.
+
+        Uses the pipeline's stream-redacted text when present, otherwise
+        redacts the chunk on its own.
+        """
+        if chunk.redacted is not None:
+            text = chunk.redacted
+        elif chunk.meaningful:
+            text = redact(chunk.text)
+        else:
             return
-        if not text or not is_meaningful(text):
+        if not text:
             return
-        text = redact(text)
         self._buffer.append(text)
         self._buffer_chars += len(text)
         # Cap internal buffer
@@ -23,6 +23,7 @@ from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from starlette.middleware.base import BaseHTTPMiddleware
 
+from atlasbridge.dashboard.live import LiveFeed
 from atlasbridge.dashboard.repo import DashboardRepo
 from atlasbridge.dashboard.sanitize import is_loopback, redact_query_params
 
@@ -151,6 +152,7 @@ def create_app(
 
     repo = DashboardRepo(db_path, trace_path)
     repo.connect()
+    live = LiveFeed(db_path)
 
     # ------------------------------------------------------------------
     # Mount routers — edition-aware
@@ -168,6 +170,7 @@ def create_app(
             edition_value=edition.value,
             authority_mode_value=authority_mode.value,
             environment=environment,
+            live=live,
         )
     )
 
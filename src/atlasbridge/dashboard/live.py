@@ -0,0 +1,319 @@
+"""
+Live event feed for the dashboard — audit events and transcript chunks
+pushed to viewers as Server-Sent Events.
+
+One LiveFeed per dashboard process tails the database for every viewer:
+
+- It subscribes to the daemon's change notices (``events.subscribe`` on the
+  control socket) and reads only the rows past its cursor when a notice
+  arrives, so N viewers cost one indexed read per commit rather than one
+  table scan per viewer per tick. With no daemon listening it checks for
+  new rows every few seconds and retries the subscription.
+- Each viewer may follow one session and resume from a cursor (the SSE
+  ``id`` of the last event it saw, ``<audit seq>:<transcript id>``). Rows
+  it missed are replayed from the database before live events.
+- Each viewer has a bounded queue. A viewer that falls behind is sent an
+  ``overflow`` event carrying its last delivered cursor and the stream
+  ends; the browser's EventSource reconnects with that cursor and is
+  replayed from the database.
+
+The feed only runs while at least one viewer is connected.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import sqlite3
+from collections.abc import AsyncGenerator, AsyncIterator, Iterable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from atlasbridge.core.daemon.control import stream_daemon
+from atlasbridge.core.exceptions import ControlError, DaemonUnavailableError
+from atlasbridge.core.store.database import AUDIT_STREAM, TRANSCRIPT_STREAM
+from atlasbridge.dashboard.repo import DashboardRepo
+from atlasbridge.dashboard.sanitize import sanitize_for_display
+
+_QUEUE_SIZE = 1000
+_READ_BATCH = 500
+_POLL_INTERVAL_S = 2.0
+_KEEPALIVE_S = 15.0
+_RETRY_MS = 2000
+
+_ALL_STREAMS = frozenset({AUDIT_STREAM, TRANSCRIPT_STREAM})
+
+
+@dataclass(frozen=True)
+class Cursor:
+    """Position in both feeds: last audit ``seq`` and last transcript ``id``."""
+
+    audit: int = 0
+    transcript: int = 0
+
+    @classmethod
+    def parse(cls, value: str) -> Cursor:
+        """Parse ``"<audit>:<transcript>"``; raises ValueError when malformed."""
+        audit, sep, transcript = value.partition(":")
+        if not sep:
+            raise ValueError(f"Invalid cursor: {value!r}")
+        cursor = cls(int(audit), int(transcript))
+        if cursor.audit < 0 or cursor.transcript < 0:
+            raise ValueError(f"Invalid cursor: {value!r}")
+        return cursor
+
+    def __str__(self) -> str:
+        return f"{self.audit}:{self.transcript}"
+
+
+@dataclass(frozen=True)
+class LiveEvent:
+    """One event for viewers; ``cursor`` is the position just after it."""
+
+    kind: str  # "audit" | "transcript" | "overflow"
+    cursor: Cursor
+    session_id: str = ""
+    data: dict[str, Any] = field(default_factory=dict)
+
+    def to_sse(self) -> str:
+        payload = json.dumps(self.data, separators=(",", ":"), default=str)
+        return f"id: {self.cursor}\nevent: {self.kind}\ndata: {payload}\n\n"
+
+
+class _Viewer:
+    __slots__ = ("session_id", "queue", "delivered", "overflowed")
+
+    def __init__(self, session_id: str | None, start: Cursor, queue_size: int) -> None:
+        self.session_id = session_id
+        self.queue: asyncio.Queue[LiveEvent] = asyncio.Queue(queue_size)
+        self.delivered = start
+        self.overflowed = False
+
+    def wants(self, event: LiveEvent) -> bool:
+        return self.session_id is None or event.session_id == self.session_id
+
+    def offer(self, event: LiveEvent) -> None:
+        if self.overflowed:
+            return
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            # Drop what is queued: the viewer resumes from what it has seen.
+            self.overflowed = True
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(LiveEvent("overflow", self.delivered))
+
+
+class LiveFeed:
+    """Shared tail of audit events and transcript chunks for SSE viewers."""
+
+    def __init__(
+        self,
+        db_path: Path,
+        data_dir: Path | None = None,
+        *,
+        queue_size: int = _QUEUE_SIZE,
+        poll_interval: float = _POLL_INTERVAL_S,
+        keepalive: float = _KEEPALIVE_S,
+    ) -> None:
+        self._db_path = db_path
+        # The daemon serves its control socket next to the database.
+        self._data_dir = data_dir or db_path.parent
+        self._queue_size = queue_size
+        self._poll_interval = poll_interval
+        self._keepalive = keepalive
+        self._conn: sqlite3.Connection | None = None
+        self._audit_column = "seq"
+        self._cursor = Cursor()
+        self._viewers: set[_Viewer] = set()
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def viewer_count(self) -> int:
+        return len(self._viewers)
+
+    @property
+    def cursor(self) -> Cursor:
+        return self._cursor
+
+    # ------------------------------------------------------------------
+    # Viewers
+    # ------------------------------------------------------------------
+
+    async def subscribe(
+        self, session_id: str | None = None, after: Cursor | None = None
+    ) -> AsyncGenerator[LiveEvent | None, None]:
+        """Yield events for one viewer; ``None`` means "send a keep-alive".
+
+        Without *after*, only events committed from now on are sent.
+        """
+        self._start()
+        start = self._cursor
+        viewer = _Viewer(session_id, after or start, self._queue_size)
+        self._viewers.add(viewer)
+        try:
+            if after is not None:
+                # Events up to `start` come from the database; later ones
+                # were already queued for this viewer by the pump.
+                for event in self._read(after, start, session_id):
+                    viewer.delivered = event.cursor
+                    yield event
+            while True:
+                try:
+                    event = await asyncio.wait_for(viewer.queue.get(), self._keepalive)
+                except TimeoutError:
+                    yield None
+                    continue
+                if event.kind == "overflow":
+                    yield LiveEvent("overflow", viewer.delivered)
+                    return
+                viewer.delivered = event.cursor
+                yield event
+        finally:
+            self._viewers.discard(viewer)
+            if not self._viewers:
+                self._stop()
+
+    async def sse(
+        self, session_id: str | None = None, after: Cursor | None = None
+    ) -> AsyncIterator[str]:
+        """Server-Sent Events body for :meth:`subscribe`."""
+        yield f"retry: {_RETRY_MS}\n\n"
+        async with contextlib.aclosing(self.subscribe(session_id, after)) as events:
+            async for event in events:
+                yield ": keep-alive\n\n" if event is None else event.to_sse()
+
+    # ------------------------------------------------------------------
+    # Pump — one per process, shared by all viewers
+    # ------------------------------------------------------------------
+
+    def _start(self) -> None:
+        if self._task is not None:
+            return
+        self._connect()
+        self._cursor = self._tail_cursor()
+        self._task = asyncio.get_running_loop().create_task(self._pump(), name="dashboard_live")
+
+    def _stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    async def _pump(self) -> None:
+        while True:
+            try:
+                async for notice in stream_daemon(self._data_dir, "events.subscribe"):
+                    # The first (empty) notice marks the subscription live:
+                    # catch up on anything committed before it.
+                    streams = (notice or {}).get("streams") or _ALL_STREAMS
+                    self._advance(streams)
+            except (DaemonUnavailableError, ControlError, OSError):
+                pass
+            # No daemon (or it went away): pick up rows written by other
+            # processes, then try to subscribe again.
+            self._advance(_ALL_STREAMS)
+            await asyncio.sleep(self._poll_interval)
+
+    def _advance(self, streams: Iterable[str]) -> None:
+        """Read rows past the shared cursor and hand them to viewers."""
+        streams = set(streams)
+        target = Cursor(
+            audit=2**63 - 1 if AUDIT_STREAM in streams else self._cursor.audit,
+            transcript=2**63 - 1 if TRANSCRIPT_STREAM in streams else self._cursor.transcript,
+        )
+        for event in self._read(self._cursor, target):
+            self._cursor = event.cursor
+            for viewer in self._viewers:
+                if viewer.wants(event):
+                    viewer.offer(event)
+
+    # ------------------------------------------------------------------
+    # Database
+    # ------------------------------------------------------------------
+
+    def _connect(self) -> bool:
+        if self._conn is not None:
+            return True
+        if not self._db_path.exists():
+            return False
+        self._conn = sqlite3.connect(
+            f"file:{self._db_path}?mode=ro", uri=True, check_same_thread=False
+        )
+        self._conn.row_factory = sqlite3.Row
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(audit_events)")}
+        # Chain order, or insertion order on a not-yet-migrated database
+        self._audit_column = "seq" if "seq" in columns else "rowid"
+        return True
+
+    def _tail_cursor(self) -> Cursor:
+        if self._conn is None:
+            return Cursor()
+        audit = self._scalar(f"SELECT max({self._audit_column}) FROM audit_events")  # noqa: S608
+        transcript = self._scalar("SELECT max(id) FROM transcript_chunks")
+        return Cursor(audit, transcript)
+
+    def _scalar(self, sql: str) -> int:
+        assert self._conn is not None
+        try:
+            row = self._conn.execute(sql).fetchone()
+        except sqlite3.OperationalError:
+            return 0  # table not created yet
+        return int(row[0] or 0) if row else 0
+
+    def _read(
+        self, after: Cursor, upto: Cursor, session_id: str | None = None
+    ) -> Iterable[LiveEvent]:
+        """Events in (after, upto], audit first, in batches of _READ_BATCH."""
+        if not self._connect():
+            return
+        assert self._conn is not None
+        session_clause = " AND session_id = ?" if session_id else ""
+        extra: tuple[Any, ...] = (session_id,) if session_id else ()
+        col = self._audit_column
+
+        audit = after.audit
+        while audit < upto.audit:
+            rows = self._rows(
+                f"SELECT {col} AS cursor_seq, * FROM audit_events "  # noqa: S608
+                f"WHERE {col} > ? AND {col} <= ?{session_clause} ORDER BY {col} LIMIT ?",
+                (audit, upto.audit, *extra, _READ_BATCH),
+            )
+            for row in rows:
+                audit = row["cursor_seq"]
+                data = DashboardRepo._row_to_dict(row)
+                data.pop("cursor_seq", None)
+                yield LiveEvent(
+                    AUDIT_STREAM, Cursor(audit, after.transcript), data["session_id"], data
+                )
+            if len(rows) < _READ_BATCH:
+                break
+
+        transcript = after.transcript
+        while transcript < upto.transcript:
+            rows = self._rows(
+                "SELECT * FROM transcript_chunks "
+                f"WHERE id > ? AND id <= ?{session_clause} ORDER BY id LIMIT ?",
+                (transcript, upto.transcript, *extra, _READ_BATCH),
+            )
+            for row in rows:
+                transcript = row["id"]
+                data = dict(row)
+                data["content"] = sanitize_for_display(data["content"])
+                yield LiveEvent(
+                    TRANSCRIPT_STREAM, Cursor(audit, transcript), data["session_id"], data
+                )
+            if len(rows) < _READ_BATCH:
+                break
+
+    def _rows(self, sql: str, params: tuple[Any, ...]) -> list[sqlite3.Row]:
+        assert self._conn is not None
+        try:
+            return self._conn.execute(sql, params).fetchall()
+        except sqlite3.OperationalError:
+            return []  # table not created yet
@@ -2,8 +2,11 @@
 Read-only repository for the local dashboard.
 
 Opens the SQLite database in ``mode=ro`` (read-only) to prevent accidental
-writes and avoid WAL lock contention with a running daemon. Accesses the
-decision trace via ``DecisionTrace.tail()`` and ``verify_integrity()``.
+writes and avoid WAL lock contention with a running daemon. The only files
+it writes are integrity-verification checkpoints (``<file>.verified``) next
+to the database and the trace. Accesses the
+decision trace through its index (``TraceReader``) and
+``DecisionTrace.verify_integrity()``.
 
 All methods return plain dicts so templates can consume them directly.
 """
@@ -15,6 +18,16 @@ import sqlite3
 from pathlib import Path
 from typing import Any
 
+from atlasbridge.core.audit.checkpoint import checkpoint_path
+from atlasbridge.core.audit.verify import (
+    AuditVerifyResult,
+    ProgressFn,
+    VerifyJob,
+    verify_audit_rows,
+)
+from atlasbridge.core.autopilot.trace_index import TraceReader
+from atlasbridge.core.store import search as fts
+from atlasbridge.core.store import stats as counters
 from atlasbridge.dashboard.sanitize import sanitize_for_display
 
 
@@ -25,6 +38,8 @@ class DashboardRepo:
         self._db_path = db_path
         self._trace_path = trace_path
         self._conn: sqlite3.Connection | None = None
+        self._verify_job: VerifyJob | None = None
+        self._has_counters = False
 
     # ------------------------------------------------------------------
     # Connection lifecycle
@@ -59,11 +74,18 @@ class DashboardRepo:
     # ------------------------------------------------------------------
 
     def get_stats(self) -> dict[str, Any]:
-        """Return summary stats for the home page cards."""
+        """Return summary stats for the home page cards.
+
+        Read from the trigger-maintained ``stats`` counters; databases
+        that predate them are counted directly.
+        """
         if not self.db_available:
             return {"sessions": 0, "prompts": 0, "audit_events": 0, "active_sessions": 0}
 
         assert self._conn is not None
+        if self._counters_available():
+            return counters.read_stats(self._conn)
+
         stats: dict[str, Any] = {}
         for table in ("sessions", "prompts", "audit_events"):
             row = self._conn.execute(f"SELECT count(*) FROM {table}").fetchone()  # noqa: S608
@@ -75,6 +97,12 @@ class DashboardRepo:
         stats["active_sessions"] = row[0] if row else 0
         return stats
 
+    def _counters_available(self) -> bool:
+        """True once the database has the ``stats`` table (schema v13+)."""
+        if not self._has_counters and self._conn is not None:
+            self._has_counters = counters.has_stats(self._conn)
+        return self._has_counters
+
     # ------------------------------------------------------------------
     # Sessions
     # ------------------------------------------------------------------
@@ -116,10 +144,18 @@ class DashboardRepo:
         tool: str | None = None,
         q: str | None = None,
     ) -> int:
-        """Return the total count of sessions matching the given filters."""
+        """Return the total count of sessions matching the given filters.
+
+        Status-only (or no) filters are answered from the maintained
+        counters; ``tool`` and ``q`` need a scan.
+        """
         if not self.db_available:
             return 0
         assert self._conn is not None
+        if not tool and not q and self._counters_available():
+            if status:
+                return counters.count_sessions_with_status(self._conn, status)
+            return int(counters.read_stats(self._conn)["sessions"])
         where_clauses: list[str] = []
         params: list[Any] = []
         if status:
@@ -145,6 +181,43 @@ class DashboardRepo:
         row = self._conn.execute("SELECT * FROM sessions WHERE id = ?", (session_id,)).fetchone()
         return self._row_to_dict(row) if row else None
 
+    # ------------------------------------------------------------------
+    # Search
+    # ------------------------------------------------------------------
+
+    def search(
+        self,
+        q: str,
+        kind: str | None = None,
+        session_id: str | None = None,
+        limit: int = 20,
+        offset: int = 0,
+    ) -> dict[str, Any]:
+        """Ranked full-text matches over transcripts, prompts and audit events.
+
+        Returns ``{"results": [...], "total": n, "available": bool}``;
+        ``available`` is False when the database has no search index.
+        Raises ValueError for an empty query or an unknown *kind*.
+        """
+        if kind and kind not in fts.SEARCH_KINDS:
+            raise ValueError(f"Unknown kind: {kind!r}")
+        fts.fts_query(q)  # reject empty queries even without a database
+        if not self.db_available:
+            return {"results": [], "total": 0, "available": False}
+        assert self._conn is not None
+        try:
+            hits, total = fts.search(
+                self._conn, q, kind=kind, session_id=session_id, limit=limit, offset=offset
+            )
+        except fts.SearchUnavailableError:
+            return {"results": [], "total": 0, "available": False}
+        results = []
+        for hit in hits:
+            d = hit.to_dict()
+            d["snippet"] = sanitize_for_display(d["snippet"])
+            results.append(d)
+        return {"results": results, "total": total, "available": True}
+
     # ------------------------------------------------------------------
     # Prompts
     # ------------------------------------------------------------------
@@ -199,7 +272,7 @@ class DashboardRepo:
         sql = "SELECT * FROM audit_events"
         if where:
             sql += f" WHERE {where}"
-        sql += " ORDER BY timestamp DESC LIMIT ? OFFSET ?"
+        sql += f" ORDER BY {self._audit_order_column()} DESC LIMIT ? OFFSET ?"
         params.extend([limit, offset])
         rows = self._conn.execute(sql, params).fetchall()
         return [self._row_to_dict(r) for r in rows]
@@ -208,20 +281,21 @@ class DashboardRepo:
     # Decision trace (JSONL)
     # ------------------------------------------------------------------
 
+    def _trace_reader(self) -> TraceReader:
+        return TraceReader(self._trace_path)
+
     def trace_tail(self, n: int = 50) -> list[dict[str, Any]]:
-        """Return the last n trace entries."""
+        """Return the last n trace entries (oldest first)."""
         if not self.trace_available:
             return []
-        from atlasbridge.core.autopilot.trace import DecisionTrace
-
-        return DecisionTrace(self._trace_path).tail(n)
+        return self._trace_reader().tail(n)
 
     def trace_entry(self, index: int) -> dict[str, Any] | None:
-        """Return a single trace entry by 0-based index (from the tail)."""
-        entries = self.trace_tail(index + 1)
-        if index < len(entries):
-            return entries[index]
-        return None
+        """Return a single trace entry by 0-based index from the newest."""
+        if not self.trace_available or index < 0:
+            return None
+        entries, _ = self._trace_reader().page(index, 1)
+        return entries[0] if entries else None
 
     def trace_page(
         self,
@@ -232,85 +306,81 @@ class DashboardRepo:
     ) -> tuple[list[dict[str, Any]], int]:
         """Return a page of trace entries (newest-first) with total count.
 
-        Reads the JSONL file, applies optional filters, reverses to
-        newest-first order, and slices to the requested page.
+        Seeks to the page through the trace index, across rotated archives;
+        filters are matched against the index rather than parsed entries.
         """
         if not self.trace_available:
             return [], 0
-        entries = self._read_all_trace_entries()
-        if action_type:
-            entries = [e for e in entries if e.get("action_type") == action_type]
-        if confidence:
-            entries = [e for e in entries if e.get("confidence") == confidence]
-        total = len(entries)
-        # Reverse so newest is first
-        entries.reverse()
-        start = (page - 1) * per_page
-        end = start + per_page
-        return entries[start:end], total
+        return self._trace_reader().page(
+            (max(page, 1) - 1) * per_page,
+            per_page,
+            action_type=action_type,
+            confidence=confidence,
+        )
 
     def trace_entries_for_session(
         self,
         session_id: str,
         limit: int = 100,
     ) -> list[dict[str, Any]]:
-        """Return trace entries for a specific session, filtered during read."""
+        """Return the first ``limit`` trace entries for a session (oldest first)."""
         if not self.trace_available:
             return []
-        result: list[dict[str, Any]] = []
-        for entry in self._read_all_trace_entries():
-            if entry.get("session_id") == session_id:
-                result.append(entry)
-                if len(result) >= limit:
-                    break
-        return result
-
-    def _read_all_trace_entries(self) -> list[dict[str, Any]]:
-        """Read all trace entries from the JSONL file."""
-        entries: list[dict[str, Any]] = []
-        try:
-            with self._trace_path.open("r", encoding="utf-8") as fh:
-                for line in fh:
-                    line = line.strip()
-                    if not line:
-                        continue
-                    try:
-                        entries.append(json.loads(line))
-                    except json.JSONDecodeError:
-                        continue
-        except OSError:
-            return []
+        entries, _ = self._trace_reader().page(0, limit, newest_first=False, session_id=session_id)
         return entries
 
     def verify_integrity(self) -> tuple[bool, list[str]]:
-        """Verify hash chain integrity of the trace file."""
+        """Verify hash chain integrity of the trace file (from its checkpoint)."""
         if not self.trace_available:
             return True, []
         from atlasbridge.core.autopilot.trace import DecisionTrace
 
-        return DecisionTrace.verify_integrity(self._trace_path)
+        return DecisionTrace.verify_integrity(
+            self._trace_path, checkpoint_file=checkpoint_path(self._trace_path)
+        )
 
     def verify_audit_integrity(self) -> tuple[bool, list[str]]:
-        """Verify hash chain integrity of audit events in the database."""
+        """Verify hash chain integrity of audit events appended since the last check."""
         if not self.db_available:
             return True, []
         assert self._conn is not None
+        result = verify_audit_rows(
+            self._conn,
+            order=self._audit_chain_column(),
+            checkpoint_file=checkpoint_path(self._db_path),
+        )
+        return result.valid, result.errors
 
-        errors: list[str] = []
-        prev_hash = ""
-        rows = self._conn.execute("SELECT * FROM audit_events ORDER BY timestamp ASC").fetchall()
-
-        for i, row in enumerate(rows):
-            row_dict = self._row_to_dict(row)
-            stored_prev = row_dict.get("prev_hash", "")
-            if stored_prev != prev_hash:
-                errors.append(
-                    f"Event {i + 1} (id={row_dict.get('id', '?')}): "
-                    f"prev_hash mismatch — expected {prev_hash!r}, got {stored_prev!r}"
-                )
-            prev_hash = row_dict.get("hash", "")
+    def start_full_audit_verification(self) -> dict[str, Any]:
+        """Re-verify the whole audit chain on a worker thread; return its status.
 
-        return len(errors) == 0, errors
+        Does nothing but report progress if a run is already in progress.
+        """
+        if self._verify_job is None:
+            self._verify_job = VerifyJob(self._verify_audit_full)
+        if self.db_available:
+            self._verify_job.start()
+        return self._verify_job.status()
+
+    def full_audit_verification_status(self) -> dict[str, Any]:
+        if self._verify_job is None:
+            return {"state": "idle", "verified": 0, "total": 0}
+        return self._verify_job.status()
+
+    def _verify_audit_full(self, progress: ProgressFn) -> AuditVerifyResult:
+        # Runs on the job's thread: it gets a connection of its own.
+        conn = sqlite3.connect(f"file:{self._db_path}?mode=ro", uri=True)
+        conn.row_factory = sqlite3.Row
+        try:
+            return verify_audit_rows(
+                conn,
+                order=self._audit_chain_column(),
+                checkpoint_file=checkpoint_path(self._db_path),
+                full=True,
+                progress=progress,
+            )
+        finally:
+            conn.close()
 
     # ------------------------------------------------------------------
     # Export
@@ -330,6 +400,16 @@ class DashboardRepo:
     # Helpers
     # ------------------------------------------------------------------
 
+    def _audit_order_column(self) -> str:
+        """Chain-order column: ``seq``, or ``timestamp`` on a not-yet-migrated DB."""
+        assert self._conn is not None
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(audit_events)")}
+        return "seq" if "seq" in columns else "timestamp"
+
+    def _audit_chain_column(self) -> str:
+        """Integer chain position for verification: ``seq``, else ``rowid``."""
+        return "seq" if self._audit_order_column() == "seq" else "rowid"
+
     @staticmethod
     def _row_to_dict(row: sqlite3.Row) -> dict[str, Any]:
         """Convert a sqlite3.Row to a plain dict with sanitized text fields."""
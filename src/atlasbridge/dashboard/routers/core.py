@@ -6,7 +6,9 @@ Routes registered here:
     GET /settings
     GET /api/stats
     GET /api/sessions
+    GET /api/search
     GET /api/settings
+    GET /api/events/stream
     GET /runtime/capabilities
 """
 
@@ -15,10 +17,11 @@ from __future__ import annotations
 from pathlib import Path
 
 from fastapi import APIRouter, Request
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.responses import HTMLResponse, JSONResponse, StreamingResponse
 from fastapi.templating import Jinja2Templates
 
 from atlasbridge.dashboard._collect import collect_settings
+from atlasbridge.dashboard.live import Cursor, LiveFeed
 from atlasbridge.dashboard.repo import DashboardRepo
 
 
@@ -30,6 +33,7 @@ def make_core_router(
     edition_value: str,
     authority_mode_value: str,
     environment: str,
+    live: LiveFeed,
 ) -> APIRouter:
     """Create the APIRouter containing all Core edition routes."""
     router = APIRouter()
@@ -107,6 +111,28 @@ def make_core_router(
         total = repo.count_sessions(status=status, tool=tool, q=q)
         return JSONResponse({"sessions": sessions, "total": total})
 
+    @router.get("/api/search")
+    async def api_search(request: Request):
+        """Full-text search, best matches first.
+
+        ``q`` is required; ``kind`` (transcript, prompt, audit), ``session_id``,
+        ``limit`` (max 100) and ``offset`` narrow and page the results.
+        """
+        params = request.query_params
+        try:
+            limit = min(max(int(params.get("limit") or 20), 1), 100)
+            offset = max(int(params.get("offset") or 0), 0)
+            result = repo.search(
+                params.get("q") or "",
+                kind=params.get("kind") or None,
+                session_id=params.get("session_id") or None,
+                limit=limit,
+                offset=offset,
+            )
+        except ValueError as exc:
+            return JSONResponse({"error": str(exc)}, status_code=400)
+        return JSONResponse({**result, "limit": limit, "offset": offset})
+
     @router.get("/api/settings")
     async def api_settings():
         return JSONResponse(
@@ -118,6 +144,25 @@ def make_core_router(
             )
         )
 
+    @router.get("/api/events/stream")
+    async def api_event_stream(request: Request):
+        """Push audit events and transcript chunks as Server-Sent Events.
+
+        ``session_id`` follows one session; ``after`` (or the browser's
+        ``Last-Event-ID`` on reconnect) resumes from a previous event id.
+        """
+        session_id = request.query_params.get("session_id") or None
+        after = request.query_params.get("after") or request.headers.get("last-event-id")
+        try:
+            cursor = Cursor.parse(after) if after else None
+        except ValueError:
+            return JSONResponse({"error": f"Invalid cursor: {after!r}"}, status_code=400)
+        return StreamingResponse(
+            live.sse(session_id, cursor),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+
     @router.get("/runtime/capabilities")
     async def runtime_capabilities():
         """Return current runtime edition, authority mode, and capability status."""
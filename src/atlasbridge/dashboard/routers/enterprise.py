@@ -81,8 +81,7 @@ def make_enterprise_router(
 
     @router.get("/traces/{index}", response_class=HTMLResponse)
     async def trace_detail(request: Request, index: int):
-        entries = repo.trace_tail(index + 1)
-        entry = entries[index] if index < len(entries) else None
+        entry = repo.trace_entry(index)
         return templates.TemplateResponse(
             request,
             "trace_detail.html",
@@ -160,4 +159,13 @@ def make_enterprise_router(
             }
         )
 
+    @router.post("/api/integrity/verify/full")
+    async def api_verify_integrity_full():
+        # Re-hashes the whole audit chain on a worker thread; poll GET for progress.
+        return JSONResponse(repo.start_full_audit_verification(), status_code=202)
+
+    @router.get("/api/integrity/verify/full")
+    async def api_verify_integrity_full_status():
+        return JSONResponse(repo.full_audit_verification_status())
+
     return router
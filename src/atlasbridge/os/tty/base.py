@@ -35,6 +35,8 @@ class PTYConfig:
     rows: int = 50
     read_timeout_s: float = 0.05  # Max seconds to block on PTY read
     max_buffer_bytes: int = 4096  # Rolling output buffer size
+    stream_high_water_bytes: int = 256 * 1024  # Unconsumed output before reads pause
+    input_probe_ttl_s: float = 0.1  # Cache lifetime of the blocked-on-read probe
     stall_watchdog_interval_s: float = 1.0  # How often to call check_silence
 
 
@@ -73,10 +75,28 @@ class BaseTTY(ABC):
     def pid(self) -> int:
         """Return the PID of the child process."""
 
+    def input_blocked(self) -> bool | None:
+        """
+        Return True if the child is blocked reading from the terminal.
+
+        Returns None when the platform cannot tell; callers then treat a live
+        process as possibly waiting for input.
+        """
+        return None
+
     # ------------------------------------------------------------------
     # I/O
     # ------------------------------------------------------------------
 
+    @abstractmethod
+    async def read_chunk(self) -> bytes:
+        """
+        Return the next raw byte chunk from the PTY master fd.
+
+        Waits until output is available; returns b"" once the child has
+        exited and all of its output has been read.
+        """
+
     @abstractmethod
     def read_output(self) -> AsyncIterator[bytes]:
         """
@@ -1,24 +1,37 @@
 """
 Linux PTY supervisor using ptyprocess.
 
-Identical to the macOS implementation — ptyprocess is cross-platform POSIX.
-The module exists as a separate file to allow future Linux-specific tuning
-(e.g., cgroup integration, namespace isolation, /proc-based process inspection).
+Shares the macOS implementation — ptyprocess is cross-platform POSIX — and
+adds /proc-based detection of the child blocking on a terminal read.
+The module exists as a separate file to allow further Linux-specific tuning
+(e.g., cgroup integration, namespace isolation).
 """
 
 from __future__ import annotations
 
 from atlasbridge.os.tty.base import PTYConfig
 from atlasbridge.os.tty.macos import MacOSTTY
+from atlasbridge.os.tty.procfs import InputWaitProbe
 
 
 class LinuxTTY(MacOSTTY):
     """
     PTY supervisor for Linux.
 
-    Currently delegates entirely to MacOSTTY (both use ptyprocess).
+    Delegates process and I/O handling to MacOSTTY (both use ptyprocess).
     Linux-specific extensions (cgroups, namespaces) are reserved for v0.4.0+.
     """
 
     def __init__(self, config: PTYConfig, session_id: str) -> None:
         super().__init__(config, session_id)
+        self._input_probe: InputWaitProbe | None = None
+
+    async def start(self) -> None:
+        await super().start()
+        if InputWaitProbe.supported():
+            self._input_probe = InputWaitProbe(self.pid(), ttl_s=self.config.input_probe_ttl_s)
+
+    def input_blocked(self) -> bool | None:
+        if self._input_probe is None or not self.is_alive():
+            return None
+        return self._input_probe.check()
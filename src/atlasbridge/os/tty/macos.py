@@ -13,6 +13,7 @@ import sys
 from collections.abc import AsyncIterator
 
 from atlasbridge.os.tty.base import BaseTTY, PTYConfig
+from atlasbridge.os.tty.stream import PtyStream
 
 
 class MacOSTTY(BaseTTY):
@@ -20,12 +21,14 @@ class MacOSTTY(BaseTTY):
     PTY supervisor for macOS using ptyprocess.
 
     ptyprocess allocates a PTY pair and exec()s the child in the slave end.
-    We read from the master fd asynchronously via asyncio's add_reader.
+    We read from and write to the master fd asynchronously via a PtyStream
+    (asyncio add_reader/add_writer), so a session costs no executor threads.
     """
 
     def __init__(self, config: PTYConfig, session_id: str) -> None:
         super().__init__(config, session_id)
         self._proc = None  # ptyprocess.PtyProcess
+        self._stream: PtyStream | None = None
 
     async def start(self) -> None:
         try:
@@ -38,16 +41,25 @@ class MacOSTTY(BaseTTY):
         env = {**os.environ, **self.config.env} if self.config.env else None
         cwd = self.config.cwd or None
 
-        self._proc = ptyprocess.PtyProcess.spawn(
+        proc = ptyprocess.PtyProcess.spawn(
             self.config.command,
             dimensions=(self.config.rows, self.config.cols),
             env=env,
             cwd=cwd,
         )
+        self._proc = proc
+        self._stream = PtyStream(
+            proc.fd,
+            read_size=self.config.max_buffer_bytes,
+            high_water=self.config.stream_high_water_bytes,
+        )
+        self._stream.start()
 
     async def stop(self, timeout_s: float = 5.0) -> None:
         if self._proc is None:
             return
+        if self._stream is not None:
+            self._stream.close()
         try:
             self._proc.terminate(force=False)
             await asyncio.sleep(min(timeout_s, 2.0))
@@ -64,32 +76,19 @@ class MacOSTTY(BaseTTY):
             return -1
         return self._proc.pid
 
-    async def read_output(self) -> AsyncIterator[bytes]:
-        if self._proc is None:
-            return
-        loop = asyncio.get_event_loop()
-        while self.is_alive():
-            try:
-                chunk = await loop.run_in_executor(None, self._read_chunk)
-                if chunk:
-                    yield chunk
-            except EOFError:
-                break
+    async def read_chunk(self) -> bytes:
+        if self._stream is None:
+            return b""
+        return await self._stream.read()
 
-    def _read_chunk(self) -> bytes:
-        """Blocking read — run in executor to avoid blocking event loop."""
-        if self._proc is None:
-            raise EOFError
-        try:
-            return self._proc.read(self.config.max_buffer_bytes)
-        except EOFError:
-            raise
+    async def read_output(self) -> AsyncIterator[bytes]:
+        while chunk := await self.read_chunk():
+            yield chunk
 
     async def inject_reply(self, data: bytes) -> None:
-        if self._proc is None:
+        if self._stream is None:
             return
-        loop = asyncio.get_event_loop()
-        await loop.run_in_executor(None, self._proc.write, data)
+        await self._stream.write(data)
 
     async def _pty_reader_task(self) -> None:
         async for chunk in self.read_output():
@@ -99,18 +98,18 @@ class MacOSTTY(BaseTTY):
 
     async def _stdin_relay_task(self) -> None:
         """Relay raw stdin bytes to the PTY master fd."""
-        if self._proc is None:
+        if self._stream is None:
             return
         loop = asyncio.get_event_loop()
         while self._running and self.is_alive():
             try:
                 chunk = await loop.run_in_executor(
                     None,
-                    sys.stdin.buffer.read1,
+                    sys.stdin.buffer.read1,  # type: ignore[union-attr]
                     1024,
                 )
                 if chunk:
-                    await loop.run_in_executor(None, self._proc.write, chunk)
+                    await self._stream.write(chunk)
             except (OSError, EOFError):
                 break
 
@@ -0,0 +1,192 @@
+"""
+Linux /proc inspection: is the PTY's foreground process blocked reading input?
+
+Signal 2 of the prompt detector ("TTY blocked on read") needs to know whether
+the CLI is idle waiting for the user, as opposed to computing, sleeping or
+waiting on the network. The probe looks at the foreground process group of
+the child's terminal (``tpgid`` in ``/proc/<pid>/stat``) and decides:
+
+  - any thread runnable or in uninterruptible sleep → busy
+  - ``/proc/<pid>/syscall`` reports ``running``     → busy
+  - main thread in read/readv on a terminal fd      → blocked on input
+  - main thread in epoll_wait on an epoll set that
+    watches a terminal fd (``tfd:`` in fdinfo)      → blocked on input
+  - epoll on other fds, or select/poll (whose wait
+    set lives in process memory)                    → unknown
+  - otherwise (sleep, futex, socket read, …)        → not waiting on input
+
+A readiness wait only counts when the terminal is provably in its wait set;
+an event loop parked on sockets or timers is not waiting for the user.
+
+When ``syscall`` is unreadable (ptrace restrictions) or the architecture is
+unknown, the kernel wait channel (``/proc/<pid>/wchan``) is used instead:
+``n_tty_read`` is a terminal read, readiness waits are unknown. If neither
+source decides, the probe returns None and callers fall back to treating a
+live process as possibly blocked.
+"""
+
+from __future__ import annotations
+
+import os
+import platform
+import time
+
+# Syscall numbers that park a thread waiting for fd readiness or data.
+_READ_SYSCALLS: dict[str, frozenset[int]] = {
+    "x86_64": frozenset({0, 19}),  # read, readv
+    "aarch64": frozenset({63, 65}),
+}
+_EPOLL_SYSCALLS: dict[str, frozenset[int]] = {
+    # epoll_wait, epoll_pwait, epoll_pwait2 (first argument: the epoll fd)
+    "x86_64": frozenset({232, 281, 441}),
+    "aarch64": frozenset({22, 441}),
+}
+_POLL_SYSCALLS: dict[str, frozenset[int]] = {
+    # select, poll, pselect6, ppoll
+    "x86_64": frozenset({7, 23, 270, 271}),
+    "aarch64": frozenset({72, 73}),
+}
+
+# Kernel wait channel of a terminal read. Readiness waits (do_select,
+# do_sys_poll, ep_poll, …) and the generic wait_woken do not say which fds
+# are watched, so they leave the state unknown.
+_TTY_READ_WCHAN = "n_tty_read"
+_UNKNOWN_WCHANS = frozenset(
+    {
+        "wait_woken",
+        "poll_schedule_timeout",
+        "do_select",
+        "core_sys_select",
+        "do_sys_poll",
+        "ep_poll",
+        "do_epoll_wait",
+    }
+)
+
+_ARCH = platform.machine()
+
+
+def _read_proc(path: str) -> str | None:
+    try:
+        with open(path) as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def _stat_fields(stat: str) -> list[str]:
+    """Fields after ``comm`` (which may contain spaces and parentheses)."""
+    return stat[stat.rfind(")") + 2 :].split()
+
+
+def _foreground_pid(pid: int) -> int | None:
+    stat = _read_proc(f"/proc/{pid}/stat")
+    if stat is None:
+        return None
+    fields = _stat_fields(stat)
+    tpgid = int(fields[5]) if len(fields) > 5 else -1
+    if tpgid > 0 and os.path.exists(f"/proc/{tpgid}/stat"):
+        return tpgid
+    return pid
+
+
+def _any_thread_busy(pid: int) -> bool:
+    try:
+        tids = os.listdir(f"/proc/{pid}/task")
+    except OSError:
+        tids = [str(pid)]
+    for tid in tids:
+        stat = _read_proc(f"/proc/{pid}/task/{tid}/stat")
+        if stat is not None and _stat_fields(stat)[0] in ("R", "D"):
+            return True
+    return False
+
+
+def _is_terminal(pid: int, fd: int) -> bool | None:
+    try:
+        target = os.readlink(f"/proc/{pid}/fd/{fd}")
+    except OSError:
+        return None
+    return target.startswith("/dev/pts/") or target.startswith("/dev/tty")
+
+
+def _epoll_watches_terminal(pid: int, epfd: int) -> bool:
+    """True if the epoll instance *epfd* has a terminal fd in its wait set."""
+    fdinfo = _read_proc(f"/proc/{pid}/fdinfo/{epfd}")
+    if fdinfo is None:
+        return False
+    for line in fdinfo.splitlines():
+        if line.startswith("tfd:"):
+            fields = line.split()
+            if len(fields) > 1 and fields[1].isdigit() and _is_terminal(pid, int(fields[1])):
+                return True
+    return False
+
+
+def _from_syscall(pid: int, syscall: str) -> bool | None:
+    parts = syscall.split()
+    if parts[0] == "running":
+        return False
+    try:
+        nr = int(parts[0])
+        fd = int(parts[1], 16) if len(parts) > 1 else -1
+    except ValueError:
+        return None
+    if nr in _READ_SYSCALLS[_ARCH]:
+        return _is_terminal(pid, fd) if fd >= 0 else None
+    if nr in _EPOLL_SYSCALLS[_ARCH]:
+        return True if fd >= 0 and _epoll_watches_terminal(pid, fd) else None
+    if nr in _POLL_SYSCALLS[_ARCH]:
+        return None
+    return False
+
+
+def input_wait_state(pid: int) -> bool | None:
+    """
+    Return True if *pid*'s terminal foreground process is blocked on input.
+
+    Returns None when /proc does not expose enough to decide.
+    """
+    target = _foreground_pid(pid)
+    if target is None:
+        return None
+    if _any_thread_busy(target):
+        return False
+
+    syscall = _read_proc(f"/proc/{target}/syscall")
+    if syscall is not None and syscall.strip() and _ARCH in _READ_SYSCALLS:
+        # Decoded: an undecidable wait stays unknown rather than asking wchan
+        return _from_syscall(target, syscall)
+
+    wchan = _read_proc(f"/proc/{target}/wchan")
+    # Compiler clones carry suffixes, e.g. "poll_schedule_timeout.constprop.0"
+    name = wchan.strip().split(".")[0] if wchan is not None else ""
+    if name in ("", "0", *_UNKNOWN_WCHANS):
+        return None
+    return name == _TTY_READ_WCHAN
+
+
+class InputWaitProbe:
+    """
+    Caches ``input_wait_state(pid)`` for *ttl_s* seconds.
+
+    The daemon asks once per output chunk and once per watchdog tick; within
+    a tick the answer cannot usefully change, so /proc is read at most once.
+    """
+
+    def __init__(self, pid: int, ttl_s: float = 0.1) -> None:
+        self.pid = pid
+        self._ttl_s = ttl_s
+        self._checked_at = -ttl_s
+        self._state: bool | None = None
+
+    @staticmethod
+    def supported() -> bool:
+        return os.path.exists("/proc/self/stat")
+
+    def check(self) -> bool | None:
+        now = time.monotonic()
+        if now - self._checked_at >= self._ttl_s:
+            self._state = input_wait_state(self.pid)
+            self._checked_at = now
+        return self._state
@@ -0,0 +1,159 @@
+"""
+Non-blocking byte stream over a PTY master fd.
+
+The fd is switched to O_NONBLOCK and watched with ``loop.add_reader``: each
+readiness callback does one ``os.read`` and queues the chunk for the
+consumer. No executor threads are involved, so any number of sessions can
+be supervised from the event loop thread alone.
+
+Backpressure: when more than ``high_water`` bytes are queued the reader is
+removed from the loop, so the kernel PTY buffer fills and the child blocks
+on write. Reading resumes once the consumer drains below ``low_water``.
+
+EOF is reported as ``b""``. Linux reports a closed PTY slave as EIO and BSD
+as an empty read; both end the stream, as does any other read error.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+from collections import deque
+
+
+class PtyStream:
+    """
+    Persistent per-session reader/writer for a PTY master fd.
+
+    Usage::
+
+        stream = PtyStream(fd, read_size=4096)
+        stream.start()
+        while chunk := await stream.read():
+            ...
+        stream.close()
+    """
+
+    def __init__(
+        self,
+        fd: int,
+        read_size: int = 4096,
+        high_water: int = 256 * 1024,
+        low_water: int | None = None,
+    ) -> None:
+        self._fd = fd
+        self._read_size = read_size
+        self._high_water = high_water
+        self._low_water = high_water // 4 if low_water is None else low_water
+        self._chunks: deque[bytes] = deque()
+        self._buffered = 0
+        self._eof = False
+        self._reading = False
+        self._waiter: asyncio.Future[None] | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    @property
+    def buffered(self) -> int:
+        """Bytes read from the fd but not yet consumed."""
+        return self._buffered
+
+    @property
+    def paused(self) -> bool:
+        return not self._reading and not self._eof and self._loop is not None
+
+    @property
+    def at_eof(self) -> bool:
+        return self._eof
+
+    def start(self) -> None:
+        """Make the fd non-blocking and begin watching it on the running loop."""
+        self._loop = asyncio.get_running_loop()
+        os.set_blocking(self._fd, False)
+        self._resume()
+
+    def close(self) -> None:
+        """Stop watching the fd. The fd itself is owned by the caller."""
+        self._pause()
+        self._set_eof()
+
+    async def read(self) -> bytes:
+        """Return the next chunk, waiting if none is buffered; ``b""`` at EOF."""
+        while not self._chunks:
+            if self._eof:
+                return b""
+            assert self._loop is not None, "PtyStream.start() not called"
+            self._waiter = self._loop.create_future()
+            try:
+                await self._waiter
+            finally:
+                self._waiter = None
+        chunk = self._chunks.popleft()
+        self._buffered -= len(chunk)
+        if not self._reading and not self._eof and self._buffered <= self._low_water:
+            self._resume()
+        return chunk
+
+    async def write(self, data: bytes) -> None:
+        """Write all of *data*, waiting for writability if the PTY buffer is full."""
+        view = memoryview(data)
+        while view:
+            try:
+                written = os.write(self._fd, view)
+            except BlockingIOError:
+                await self._wait_writable()
+                continue
+            view = view[written:]
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _resume(self) -> None:
+        if not self._reading and self._loop is not None:
+            self._loop.add_reader(self._fd, self._on_readable)
+            self._reading = True
+
+    def _pause(self) -> None:
+        if self._reading and self._loop is not None:
+            self._loop.remove_reader(self._fd)
+            self._reading = False
+
+    def _set_eof(self) -> None:
+        self._eof = True
+        self._wake()
+
+    def _wake(self) -> None:
+        if self._waiter is not None and not self._waiter.done():
+            self._waiter.set_result(None)
+
+    def _on_readable(self) -> None:
+        try:
+            chunk = os.read(self._fd, self._read_size)
+        except (BlockingIOError, InterruptedError):
+            return
+        except OSError:
+            # EIO (Linux EOF) or the fd was closed under us.
+            chunk = b""
+        if not chunk:
+            self._pause()
+            self._set_eof()
+            return
+        self._chunks.append(chunk)
+        self._buffered += len(chunk)
+        if self._buffered >= self._high_water:
+            self._pause()
+        self._wake()
+
+    async def _wait_writable(self) -> None:
+        assert self._loop is not None, "PtyStream.start() not called"
+        ready: asyncio.Future[None] = self._loop.create_future()
+
+        def _on_writable() -> None:
+            if not ready.done():
+                ready.set_result(None)
+
+        self._loop.add_writer(self._fd, _on_writable)
+        try:
+            await ready
+        finally:
+            self._loop.remove_writer(self._fd)
@@ -0,0 +1,152 @@
+"""Tests for the dashboard live event feed (dashboard/live.py)."""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from atlasbridge.core.daemon.changes import ChangeFeed
+from atlasbridge.core.daemon.control import ControlServer
+from atlasbridge.core.store.database import Database
+from atlasbridge.dashboard.live import Cursor, LiveEvent, LiveFeed
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="Unix sockets only")
+
+
+async def _until(predicate, timeout: float = 5.0) -> None:
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not predicate():
+        assert asyncio.get_running_loop().time() < deadline, "condition not met"
+        await asyncio.sleep(0.01)
+
+
+async def _next(sub: Any) -> LiveEvent:
+    return await asyncio.wait_for(anext(sub), 5.0)
+
+
+@pytest.fixture
+def writer(tmp_path: Path):
+    """The daemon's side: a Database whose commits are announced on a ChangeFeed."""
+    db = Database(tmp_path / "atlasbridge.db")
+    db.connect()
+    db.save_session("sess-a", "claude", ["claude"])
+    db.save_session("sess-b", "claude", ["claude"])
+    yield db
+    db.close()
+
+
+@pytest.fixture
+async def daemon(tmp_path: Path, writer: Database):
+    feed = ChangeFeed()
+    writer.add_commit_listener(feed.publish)
+    server = ControlServer(tmp_path)
+    server.register_stream("events.subscribe", feed.subscribe)
+    assert await server.start()
+    yield feed
+    await server.close()
+
+
+class TestCursor:
+    def test_round_trip(self) -> None:
+        assert Cursor.parse(str(Cursor(12, 7))) == Cursor(12, 7)
+
+    @pytest.mark.parametrize("value", ["12", "a:b", "-1:0", ""])
+    def test_invalid(self, value: str) -> None:
+        with pytest.raises(ValueError):
+            Cursor.parse(value)
+
+    def test_sse_frame(self) -> None:
+        event = LiveEvent("audit", Cursor(3, 1), "sess-a", {"event_type": "x"})
+        assert event.to_sse() == 'id: 3:1\nevent: audit\ndata: {"event_type":"x"}\n\n'
+
+
+class TestLiveFeed:
+    async def test_daemon_notices_push_session_events(
+        self, tmp_path: Path, writer: Database, daemon: ChangeFeed
+    ) -> None:
+        # A long poll interval: only the daemon's notices can deliver in time
+        feed = LiveFeed(writer.path, poll_interval=60)
+        sub = feed.subscribe("sess-a")
+        pending = asyncio.ensure_future(anext(sub))
+        await _until(lambda: daemon.subscriber_count == 1)
+
+        writer.append_audit_event("e1", "prompt_detected", {}, session_id="sess-b")
+        writer.append_audit_event("e2", "prompt_detected", {}, session_id="sess-a")
+        writer.save_transcript_chunk("sess-a", "agent", "hello", seq=1)
+
+        first = await asyncio.wait_for(pending, 5.0)
+        second = await _next(sub)
+        assert (first.kind, first.data["id"]) == ("audit", "e2")
+        assert (second.kind, second.data["content"]) == ("transcript", "hello")
+        assert second.cursor == Cursor(2, 1)
+
+        await sub.aclose()
+        assert feed.viewer_count == 0
+        await _until(lambda: daemon.subscriber_count == 0)
+
+    async def test_resume_replays_missed_events(self, writer: Database) -> None:
+        for i in range(3):
+            writer.append_audit_event(f"e{i}", "ev", {}, session_id="sess-a")
+        writer.save_transcript_chunk("sess-a", "agent", "out", seq=1)
+
+        feed = LiveFeed(writer.path, poll_interval=60)
+        sub = feed.subscribe("sess-a", after=Cursor(1, 0))
+        replayed = [await _next(sub) for _ in range(3)]
+        assert [e.data.get("id") for e in replayed[:2]] == ["e1", "e2"]
+        assert replayed[2].kind == "transcript"
+        assert replayed[2].cursor == Cursor(3, 1)
+        await sub.aclose()
+
+    async def test_slow_viewer_overflows_and_resumes(
+        self, writer: Database, daemon: ChangeFeed
+    ) -> None:
+        writer.append_audit_event("e0", "ev", {})
+        feed = LiveFeed(writer.path, poll_interval=60, queue_size=2)
+        slow = feed.subscribe(after=Cursor())
+        assert (await _next(slow)).data["id"] == "e0"
+        # The viewer stops reading while more events arrive than it can queue
+        pending = asyncio.ensure_future(anext(slow))
+        await _until(lambda: daemon.subscriber_count == 1)
+        for i in range(1, 6):
+            writer.append_audit_event(f"e{i}", "ev", {})
+        await _until(lambda: feed.cursor.audit == 6)
+
+        overflow = await asyncio.wait_for(pending, 5.0)
+        assert overflow.kind == "overflow"
+        assert overflow.cursor == Cursor(1, 0)  # the last event it received
+        with pytest.raises(StopAsyncIteration):
+            await anext(slow)
+
+        # Reconnecting from the overflow cursor replays everything missed
+        resumed = feed.subscribe(after=overflow.cursor)
+        assert [(await _next(resumed)).data["id"] for _ in range(5)] == [
+            f"e{i}" for i in range(1, 6)
+        ]
+        await resumed.aclose()
+
+    async def test_without_daemon_checks_for_new_rows(self, writer: Database) -> None:
+        feed = LiveFeed(writer.path, poll_interval=0.05)
+        sub = feed.subscribe()
+        pending = asyncio.ensure_future(anext(sub))
+        await _until(lambda: feed.viewer_count == 1)
+        writer.append_audit_event("e1", "ev", {})
+        assert (await asyncio.wait_for(pending, 5.0)).data["id"] == "e1"
+        await sub.aclose()
+
+    async def test_keepalive_and_sse_body(self, writer: Database) -> None:
+        feed = LiveFeed(writer.path, poll_interval=60, keepalive=0.01)
+        body = feed.sse()
+        assert await _next(body) == "retry: 2000\n\n"
+        assert await _next(body) == ": keep-alive\n\n"
+        await body.aclose()
+        assert feed.viewer_count == 0
+
+    async def test_missing_database(self, tmp_path: Path) -> None:
+        feed = LiveFeed(tmp_path / "absent.db", poll_interval=0.01, keepalive=0.05)
+        sub = feed.subscribe(after=Cursor())
+        assert await _next(sub) is None  # keep-alive; nothing to read
+        await sub.aclose()
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import json
 import sqlite3
 from pathlib import Path
 
@@ -162,6 +163,28 @@ class TestDashboardRepoTrace:
     def test_trace_entry_out_of_range(self, repo):
         assert repo.trace_entry(999) is None
 
+    def test_trace_entry_counts_from_newest(self, repo):
+        assert repo.trace_entry(0)["idempotency_key"] == "key-4"
+        assert repo.trace_entry(3)["idempotency_key"] == "key-1"
+        assert repo.trace_entry(-1) is None
+
+    def test_trace_page_spans_archives(self, db_with_data, trace_file):
+        from atlasbridge.dashboard.repo import DashboardRepo
+
+        # Rotate the fixture trace; new entries go to a fresh active file
+        trace_file.rename(trace_file.with_suffix(".jsonl.1"))
+        trace_file.write_text(
+            json.dumps({"idempotency_key": "key-5", "session_id": "sess-001"}) + "\n"
+        )
+        r = DashboardRepo(db_with_data, trace_file)
+        r.connect()
+        entries, total = r.trace_page(page=1, per_page=2)
+        assert total == 6
+        assert [e["idempotency_key"] for e in entries] == ["key-5", "key-4"]
+        session = r.trace_entries_for_session("sess-001")
+        assert [e["idempotency_key"] for e in session] == ["key-0", "key-1", "key-2", "key-5"]
+        r.close()
+
     def test_verify_integrity(self, repo):
         valid, errors = repo.verify_integrity()
         assert valid
@@ -254,6 +277,28 @@ class TestDashboardRepoAudit:
         assert valid
         assert errors == []
 
+    def test_verify_audit_integrity_resumes_from_checkpoint(self, repo, db_with_data):
+        from atlasbridge.core.audit.checkpoint import checkpoint_path, load_checkpoint
+
+        assert repo.verify_audit_integrity() == (True, [])
+        checkpoint = load_checkpoint(checkpoint_path(db_with_data))
+        assert (checkpoint.position, checkpoint.count) == (5, 5)
+        # The checkpointed event is rewritten: the next run starts over and sees it
+        conn = sqlite3.connect(str(db_with_data))
+        conn.execute("UPDATE audit_events SET hash = 'forged' WHERE id = 'evt-004'")
+        conn.commit()
+        conn.close()
+        valid, errors = repo.verify_audit_integrity()
+        assert not valid
+        assert "evt-004" in errors[0]
+
+    def test_full_audit_verification_job(self, repo):
+        assert repo.full_audit_verification_status()["state"] == "idle"
+        repo.start_full_audit_verification()
+        repo._verify_job.join(5)
+        status = repo.full_audit_verification_status()
+        assert (status["state"], status["valid"], status["verified"]) == ("done", True, 5)
+
 
 class TestReadOnlyGuard:
     def test_read_only_connection_rejects_writes(self, db_with_data):
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import time
 from pathlib import Path
 
 import pytest
@@ -167,6 +168,17 @@ class TestIntegrityApiEndpoint:
         assert r2.status_code == 429
         assert "Too many requests" in r2.json()["error"]
 
+    def test_full_audit_verification(self, client):
+        response = client.post("/api/integrity/verify/full")
+        assert response.status_code == 202
+        assert response.json()["state"] in ("running", "done")
+        for _ in range(100):
+            status = client.get("/api/integrity/verify/full").json()
+            if status["state"] != "running":
+                break
+            time.sleep(0.05)
+        assert (status["state"], status["valid"]) == ("done", True)
+
 
 class TestTimeagoFilter:
     def test_timeago_available_in_templates(self, client):
@@ -314,3 +326,10 @@ class TestEmptyStatesWithFilters:
         response = client.get("/traces?action_type=nonexistent_action")
         assert response.status_code == 200
         assert "No trace entries found" in response.text
+
+
+class TestEventStreamEndpoint:
+    def test_invalid_cursor_rejected(self, client):
+        response = client.get("/api/events/stream?after=not-a-cursor")
+        assert response.status_code == 400
+        assert "Invalid cursor" in response.json()["error"]
@@ -0,0 +1,288 @@
+"""
+Unit tests for CompiledPolicy — the pre-indexed first-match-wins evaluator path.
+
+Covers:
+- Bucket pruning on tool_id, prompt_type, environment, session_tag
+- Prefix-trie pruning on repo
+- First-match-wins order is preserved across buckets
+- evaluate(compiled) returns the same decision as evaluate(policy)
+- Evaluation latency stays flat as the rule count grows
+"""
+
+from __future__ import annotations
+
+import itertools
+import statistics
+import time
+
+import pytest
+
+from atlasbridge.core.policy.compiled import CompiledPolicy, compile_policy
+from atlasbridge.core.policy.evaluator import evaluate
+from atlasbridge.core.policy.model import (
+    AutonomyMode,
+    AutoReplyAction,
+    DenyAction,
+    MatchCriteria,
+    Policy,
+    PolicyRule,
+)
+from atlasbridge.core.policy.model_v1 import MatchCriteriaV1, PolicyRuleV1, PolicyV1
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+def _rule(rule_id: str, value: str = "y", **match_kwargs: object) -> PolicyRuleV1:
+    return PolicyRuleV1(
+        id=rule_id,
+        match=MatchCriteriaV1(**match_kwargs),
+        action=AutoReplyAction(value=value),
+    )
+
+
+def _policy(*rules: PolicyRuleV1) -> PolicyV1:
+    return PolicyV1(
+        policy_version="1",
+        name="compiled-test",
+        autonomy_mode=AutonomyMode.FULL,
+        rules=list(rules),
+    )
+
+
+def _candidate_ids(compiled: CompiledPolicy, **kwargs: str) -> list[str]:
+    ctx = {"tool_id": "*", "prompt_type": "yes_no", "repo": ""}
+    ctx.update(kwargs)
+    return [r.id for r in compiled.candidates(**ctx)]
+
+
+def _eval(policy: object, **kwargs: object):
+    ctx: dict[str, object] = {
+        "prompt_text": "Continue? [y/n]",
+        "prompt_type": "yes_no",
+        "confidence": "high",
+        "prompt_id": "p1",
+        "session_id": "s1",
+    }
+    ctx.update(kwargs)
+    return evaluate(policy=policy, **ctx)  # type: ignore[arg-type]
+
+
+def _scoped_policy(n_rules: int) -> PolicyV1:
+    """n_rules scoped to distinct tools/repos, plus one catch-all at the end."""
+    rules = [
+        _rule(
+            f"r{i}",
+            tool_id=f"tool_{i % 50}",
+            repo=f"/work/repo_{i}",
+            prompt_type=["yes_no"],
+            session_tag=f"tag_{i % 7}",
+        )
+        for i in range(n_rules)
+    ]
+    rules.append(_rule("catch-all", value="n", prompt_type=["yes_no"]))
+    return _policy(*rules)
+
+
+# ---------------------------------------------------------------------------
+# Candidate pruning
+# ---------------------------------------------------------------------------
+
+
+class TestCandidates:
+    def test_tool_id_bucket(self) -> None:
+        compiled = compile_policy(
+            _policy(_rule("a", tool_id="claude_code"), _rule("b", tool_id="gemini"), _rule("c"))
+        )
+        assert _candidate_ids(compiled, tool_id="claude_code") == ["a", "c"]
+        assert _candidate_ids(compiled, tool_id="other") == ["c"]
+
+    def test_prompt_type_bucket_and_wildcard(self) -> None:
+        compiled = compile_policy(
+            _policy(
+                _rule("yn", prompt_type=["yes_no"]),
+                _rule("any", prompt_type=["*"]),
+                _rule("ft", prompt_type=["free_text"]),
+            )
+        )
+        assert _candidate_ids(compiled, prompt_type="yes_no") == ["yn", "any"]
+        assert _candidate_ids(compiled, prompt_type="free_text") == ["any", "ft"]
+
+    def test_environment_and_session_tag_buckets(self) -> None:
+        compiled = compile_policy(
+            _policy(
+                _rule("prod", environment="production"),
+                _rule("ci", session_tag="ci"),
+                _rule("open"),
+            )
+        )
+        assert _candidate_ids(compiled) == ["open"]
+        assert _candidate_ids(compiled, environment="production", session_tag="ci") == [
+            "prod",
+            "ci",
+            "open",
+        ]
+
+    def test_repo_prefix_trie(self) -> None:
+        compiled = compile_policy(
+            _policy(
+                _rule("deep", repo="/home/user/project/sub"),
+                _rule("proj", repo="/home/user/project"),
+                _rule("other", repo="/srv"),
+                _rule("root", repo="/"),
+            )
+        )
+        assert _candidate_ids(compiled, repo="/home/user/project/sub/x") == [
+            "deep",
+            "proj",
+            "root",
+        ]
+        assert _candidate_ids(compiled, repo="/home/user/proj") == ["root"]
+        assert _candidate_ids(compiled, repo="") == []
+
+    def test_any_of_rules_are_always_candidates(self) -> None:
+        compiled = compile_policy(
+            _policy(
+                _rule("gated", tool_id="gemini"),
+                _rule("or", any_of=[MatchCriteriaV1(tool_id="gemini")]),
+                _rule("or-env", environment="prod", any_of=[MatchCriteriaV1(contains="x")]),
+            )
+        )
+        assert _candidate_ids(compiled, tool_id="claude_code") == ["or", "or-env"]
+
+    def test_compile_is_idempotent(self) -> None:
+        compiled = compile_policy(_policy(_rule("a")))
+        assert compile_policy(compiled) is compiled
+        assert compiled.content_hash() == compiled.policy.content_hash()
+        assert compiled.get_rule("a") is compiled.rules[0]
+        assert compiled.get_rule("missing") is None
+
+
+# ---------------------------------------------------------------------------
+# Equivalence with linear evaluation
+# ---------------------------------------------------------------------------
+
+
+class TestEquivalence:
+    def test_first_match_wins_across_buckets(self) -> None:
+        policy = _policy(
+            _rule("wild", value="1", contains="deploy"),
+            _rule("tool", value="2", tool_id="claude_code"),
+        )
+        d = _eval(compile_policy(policy), tool_id="claude_code", prompt_text="deploy? [y/n]")
+        assert d.matched_rule_id == "wild"
+
+    def test_matches_linear_evaluation(self) -> None:
+        policy = _policy(
+            _rule("prod-deny", environment="production", contains="rm -rf"),
+            _rule("ci", session_tag="ci", prompt_type=["yes_no"], max_confidence="medium"),
+            _rule("repo", repo="/work/app", tool_id="claude_code"),
+            _rule(
+                "nested",
+                any_of=[
+                    MatchCriteriaV1(contains=r"proceed\?", contains_is_regex=True),
+                    MatchCriteriaV1(prompt_type=["confirm_enter"]),
+                ],
+                none_of=[MatchCriteriaV1(session_state=["streaming"])],
+            ),
+            _rule("trusted", workspace_trusted=True, min_confidence="medium"),
+            # Top-level environment is ignored by the evaluator when any_of is set
+            _rule("env-or", environment="prod", any_of=[MatchCriteriaV1(contains="build")]),
+        )
+        compiled = compile_policy(policy)
+
+        texts = ["Continue? [y/n]", "rm -rf build? [y/n]", "Proceed? ", "Press Enter", "build"]
+        for text, ptype, conf, tool, repo, tag, env, state, trusted in itertools.product(
+            texts,
+            ["yes_no", "confirm_enter", "free_text"],
+            ["high", "medium", "low"],
+            ["*", "claude_code"],
+            ["", "/work/app/src", "/work/other"],
+            ["", "ci"],
+            ["", "production", "dev"],
+            ["", "streaming"],
+            [False, True],
+        ):
+            kwargs = {
+                "prompt_text": text,
+                "prompt_type": ptype,
+                "confidence": conf,
+                "tool_id": tool,
+                "repo": repo,
+                "session_tag": tag,
+                "environment": env,
+                "session_state": state,
+                "workspace_trusted": trusted,
+            }
+            expected = _eval(policy, **kwargs)
+            actual = _eval(compiled, **kwargs)
+            assert actual.matched_rule_id == expected.matched_rule_id, kwargs
+            assert actual.action_type == expected.action_type
+            assert actual.explanation == expected.explanation
+            assert actual.policy_hash == expected.policy_hash
+
+    def test_v0_policy(self) -> None:
+        policy = Policy(
+            policy_version="0",
+            name="v0",
+            rules=[
+                PolicyRule(
+                    id="tool",
+                    match=MatchCriteria(tool_id="claude_code", tool_name="Bash"),
+                    action=DenyAction(reason="no"),
+                ),
+                PolicyRule(
+                    id="repo",
+                    match=MatchCriteria(repo="/work", prompt_type=["yes_no"]),
+                    action=AutoReplyAction(value="y"),
+                ),
+            ],
+        )
+        compiled = compile_policy(policy)
+        for tool, repo, text in itertools.product(
+            ["*", "claude_code"], ["", "/work/x"], ["tool_use: Bash({})", "Continue? [y/n]"]
+        ):
+            kwargs = {"tool_id": tool, "repo": repo, "prompt_text": text}
+            assert (
+                _eval(compiled, **kwargs).matched_rule_id == _eval(policy, **kwargs).matched_rule_id
+            )
+
+
+# ---------------------------------------------------------------------------
+# Benchmark
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.performance
+class TestCompiledScaling:
+    """Evaluation latency must not grow with the number of out-of-scope rules.
+
+    CI thresholds are absolute and generous to tolerate shared-runner
+    variability; locally, 1000-rule evaluation takes well under 1ms.
+    """
+
+    @staticmethod
+    def _latencies_ms(policy: object, n: int = 200) -> list[float]:
+        ctx = {"tool_id": "tool_3", "repo": "/work/unscoped", "session_tag": "tag_3"}
+        times = []
+        for _ in range(n):
+            start = time.perf_counter()
+            d = _eval(policy, **ctx)
+            times.append((time.perf_counter() - start) * 1000)
+            assert d.matched_rule_id == "catch-all"
+        return times
+
+    @pytest.mark.parametrize("n_rules", [10, 1000, 5000])
+    def test_evaluation_under_ceiling_at_any_rule_count(self, n_rules: int) -> None:
+        times = self._latencies_ms(compile_policy(_scoped_policy(n_rules)))
+        avg = statistics.mean(times)
+        p99 = sorted(times)[int(len(times) * 0.99)]
+        assert avg < 2.0, f"avg latency {avg:.3f}ms with {n_rules} rules exceeds 2ms"
+        assert p99 < 20.0, f"p99 latency {p99:.3f}ms with {n_rules} rules exceeds 20ms CI limit"
+
+    def test_candidate_set_independent_of_rule_count(self) -> None:
+        for n_rules in (10, 1000, 5000):
+            compiled = compile_policy(_scoped_policy(n_rules))
+            ids = _candidate_ids(compiled, tool_id="tool_3", repo="/work/x", session_tag="tag_3")
+            assert ids == ["catch-all"]
@@ -0,0 +1,196 @@
+"""
+Unit tests for the fast evaluation path and on-demand explanation rendering.
+
+Covers:
+- evaluate() records a compact (rule_id, criterion) entry per skipped rule
+- No reason strings are formatted while rules are being checked
+- The explanation is rendered on first access and matches full-mode reasons
+- failure_reasons() renders the same text as the debug evaluator
+- explain_decision() lists skipped rules
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from atlasbridge.core.policy import evaluator
+from atlasbridge.core.policy.evaluator import _evaluate_rule, _evaluate_rule_v1, evaluate
+from atlasbridge.core.policy.explain import explain_decision
+from atlasbridge.core.policy.model import (
+    AutonomyMode,
+    AutoReplyAction,
+    MatchCriteria,
+    Policy,
+    PolicyRule,
+)
+from atlasbridge.core.policy.model_v1 import MatchCriteriaV1, PolicyRuleV1, PolicyV1
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+def _rule(rule_id: str, **match_kwargs: object) -> PolicyRuleV1:
+    return PolicyRuleV1(
+        id=rule_id,
+        description=f"{rule_id} rule",
+        match=MatchCriteriaV1(**match_kwargs),
+        action=AutoReplyAction(value="y"),
+    )
+
+
+def _policy() -> PolicyV1:
+    return PolicyV1(
+        policy_version="1",
+        name="lazy-test",
+        autonomy_mode=AutonomyMode.FULL,
+        rules=[
+            _rule("repo-scoped", repo="/srv"),
+            _rule("or-block", any_of=[MatchCriteriaV1(contains="deploy")]),
+            _rule(
+                "not-block",
+                contains="continue",
+                none_of=[MatchCriteriaV1(prompt_type=["yes_no"])],
+            ),
+            _rule("winner", contains="continue", min_confidence="medium"),
+        ],
+    )
+
+
+def _eval(policy: PolicyV1 | Policy, prompt_text: str = "Continue? [y/n]"):
+    return evaluate(
+        policy=policy,
+        prompt_text=prompt_text,
+        prompt_type="yes_no",
+        confidence="high",
+        prompt_id="p1",
+        session_id="s1",
+        repo="/home/user/app",
+    )
+
+
+# ---------------------------------------------------------------------------
+# Compact record
+# ---------------------------------------------------------------------------
+
+
+class TestFailedCriteria:
+    def test_records_first_failed_criterion_per_skipped_rule(self) -> None:
+        decision = _eval(_policy())
+        assert decision.matched_rule_id == "winner"
+        assert decision.failed_criteria == (
+            ("repo-scoped", "repo"),
+            ("or-block", "any_of"),
+            ("not-block", "none_of[0]"),
+        )
+
+    def test_no_match_records_every_rule(self) -> None:
+        decision = _eval(_policy(), prompt_text="Overwrite? [y/n]")
+        assert decision.matched_rule_id is None
+        assert [rule_id for rule_id, _ in decision.failed_criteria] == [
+            "repo-scoped",
+            "or-block",
+            "not-block",
+            "winner",
+        ]
+
+    def test_v0_policy(self) -> None:
+        policy = Policy(
+            policy_version="0",
+            name="v0",
+            rules=[
+                PolicyRule(
+                    id="bash",
+                    match=MatchCriteria(tool_name="Bash"),
+                    action=AutoReplyAction(value="y"),
+                ),
+            ],
+        )
+        decision = _eval(policy)
+        assert decision.failed_criteria == (("bash", "tool_name"),)
+
+
+# ---------------------------------------------------------------------------
+# On-demand rendering
+# ---------------------------------------------------------------------------
+
+
+class TestLazyRendering:
+    def test_evaluate_does_not_format_reasons(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        explain_flags: list[bool] = []
+        original = evaluator._match_contains
+
+        def spy(*args: object) -> tuple[bool, str]:
+            explain_flags.append(bool(args[-1]))
+            return original(*args)  # type: ignore[arg-type]
+
+        monkeypatch.setattr(evaluator, "_match_contains", spy)
+        decision = _eval(_policy())
+        assert explain_flags and not any(explain_flags)
+
+        explain_flags.clear()
+        assert decision.explanation.startswith("Rule 'winner' matched")
+        assert explain_flags and all(explain_flags)
+
+    def test_explanation_rendered_once(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        calls = 0
+        original = evaluator._explain_match
+
+        def counting(*args: object) -> str:
+            nonlocal calls
+            calls += 1
+            return original(*args)  # type: ignore[arg-type]
+
+        monkeypatch.setattr(evaluator, "_explain_match", counting)
+        decision = _eval(_policy())
+        assert calls == 0
+        first = decision.explanation
+        assert decision.explanation is first
+        assert decision.to_dict()["explanation"] == first
+        assert calls == 1
+
+    def test_explanation_matches_full_reasons(self) -> None:
+        policy = _policy()
+        decision = _eval(policy)
+        result = _evaluate_rule_v1(
+            policy.rules[3],
+            prompt_type="yes_no",
+            confidence="high",
+            excerpt="Continue? [y/n]",
+            tool_id="*",
+            repo="/home/user/app",
+            session_tag="",
+        )
+        passed = "; ".join(r[2:] for r in result.reasons if r.startswith("✓"))
+        assert decision.explanation == f"Rule 'winner' matched — winner rule: {passed}"
+
+    def test_failure_reasons_match_debug_evaluator(self) -> None:
+        decision = _eval(_policy())
+        assert decision.failure_reasons() == [
+            "repo-scoped: ✗ repo: '/home/user/app' does not start with '/srv'",
+            "or-block: ✗ any_of: no sub-block matched",
+            "not-block: ✗ none_of[0]: matched (excluded by NOT condition)",
+        ]
+
+    def test_v0_failure_reason(self) -> None:
+        rule = PolicyRule(
+            id="bash",
+            match=MatchCriteria(tool_name="Bash"),
+            action=AutoReplyAction(value="y"),
+        )
+        decision = _eval(Policy(policy_version="0", name="v0", rules=[rule]))
+        result = _evaluate_rule(
+            rule,
+            prompt_type="yes_no",
+            confidence="high",
+            excerpt="Continue? [y/n]",
+            tool_id="*",
+            repo="/home/user/app",
+        )
+        assert result.failed == "tool_name"
+        assert decision.failure_reasons() == [f"bash: {result.reasons[-1]}"]
+
+    def test_explain_decision_lists_skipped_rules(self) -> None:
+        output = explain_decision(_eval(_policy()))
+        assert "Skipped rules:" in output
+        assert "or-block: ✗ any_of: no sub-block matched" in output
@@ -154,6 +154,11 @@ class TestModelValidation:
         with pytest.raises(Exception, match="matches empty string"):
             MatchCriteria(contains="a*", contains_is_regex=True)
 
+    def test_tool_name_invalid_regex_fails_load(self) -> None:
+        """Used to evaluate as no match; now the policy is rejected when it loads."""
+        with pytest.raises(Exception, match="Invalid regex in tool_name"):
+            MatchCriteria(tool_name="Bash(", contains_is_regex=True)
+
 
 # ---------------------------------------------------------------------------
 # Parser
@@ -174,6 +174,29 @@ class TestMatchCriteriaV1Parsing:
         assert p.content_hash() == p.content_hash()
         assert len(p.content_hash()) == 16
 
+    def test_contains_regex_compiled_at_load(self) -> None:
+        m = MatchCriteriaV1(contains=r"deploy\s+prod", contains_is_regex=True)
+        compiled = m.contains_regex
+        assert compiled is not None
+        assert compiled is m.contains_regex
+        assert compiled.search("DEPLOY  PROD")
+        assert m.model_copy(deep=True).contains_regex is not None
+
+    def test_contains_regex_none_for_substring(self) -> None:
+        assert MatchCriteriaV1(contains="deploy").contains_regex is None
+
+    def test_compiled_regex_excluded_from_content_hash(self) -> None:
+        rule = make_v1_rule("r", contains="x+y", contains_is_regex=True)
+        p = make_v1_policy(rule)
+        hash_before = p.content_hash()
+        _ = p.rules[0].match.contains_regex
+        assert p.content_hash() == hash_before
+        assert "_contains_re" not in p.model_dump_json()
+
+    def test_nested_quantifier_rejected_in_sub_block(self) -> None:
+        with pytest.raises(Exception, match="catastrophic backtracking"):
+            MatchCriteriaV1(none_of=[MatchCriteriaV1(contains="(x+)*y", contains_is_regex=True)])
+
 
 # ---------------------------------------------------------------------------
 # TestAnyOfLogic
@@ -53,10 +53,10 @@ def _verify_chain(db: Database) -> tuple[bool, list[str]]:
     """Inline chain verification using the same algorithm as append_audit_event.
 
     Chain input: prev_hash + event_id + event_type + json(payload)
-    Ordered by:  timestamp ASC (insertion order).
+    Ordered by:  seq ASC (chain order).
     """
     rows = db._db.execute(
-        "SELECT id, event_type, payload, prev_hash, hash FROM audit_events ORDER BY timestamp ASC"
+        "SELECT id, event_type, payload, prev_hash, hash FROM audit_events ORDER BY seq ASC"
     ).fetchall()
     if not rows:
         return True, []
@@ -105,7 +105,7 @@ class TestHashAlgorithm:
     def test_first_event_empty_prev_hash(self, db: Database) -> None:
         AuditWriter(db).session_started("s1", "claude", ["claude"])
         row = db._db.execute(
-            "SELECT prev_hash FROM audit_events ORDER BY timestamp ASC LIMIT 1"
+            "SELECT prev_hash FROM audit_events ORDER BY seq ASC LIMIT 1"
         ).fetchone()
         assert row["prev_hash"] == ""
 
@@ -119,7 +119,7 @@ class TestHashAlgorithm:
         writer = AuditWriter(db)
         writer.prompt_detected("s1", "p1", "yes_no", "high")
         writer.prompt_detected("s1", "p2", "free_text", "low")
-        rows = db._db.execute("SELECT hash FROM audit_events ORDER BY timestamp ASC").fetchall()
+        rows = db._db.execute("SELECT hash FROM audit_events ORDER BY seq ASC").fetchall()
         hashes = [r["hash"] for r in rows]
         assert len(set(hashes)) == 2, "Different events must produce different hashes"
 
@@ -134,9 +134,7 @@ class TestTamperingDetection:
 
     def test_payload_tamper_detected(self, db: Database) -> None:
         _write_events(AuditWriter(db), count=3)
-        first = db._db.execute(
-            "SELECT id FROM audit_events ORDER BY timestamp ASC LIMIT 1"
-        ).fetchone()
+        first = db._db.execute("SELECT id FROM audit_events ORDER BY seq ASC LIMIT 1").fetchone()
         db._db.execute(
             "UPDATE audit_events SET payload = '{\"tampered\":true}' WHERE id = ?",
             (first["id"],),
@@ -148,9 +146,7 @@ class TestTamperingDetection:
 
     def test_event_type_tamper_detected(self, db: Database) -> None:
         _write_events(AuditWriter(db), count=3)
-        first = db._db.execute(
-            "SELECT id FROM audit_events ORDER BY timestamp ASC LIMIT 1"
-        ).fetchone()
+        first = db._db.execute("SELECT id FROM audit_events ORDER BY seq ASC LIMIT 1").fetchone()
         db._db.execute(
             "UPDATE audit_events SET event_type = 'forged_type' WHERE id = ?",
             (first["id"],),
@@ -162,9 +158,7 @@ class TestTamperingDetection:
     def test_hash_field_overwrite_breaks_next_entry(self, db: Database) -> None:
         """Overwriting stored hash must break the next entry's prev_hash linkage."""
         _write_events(AuditWriter(db), count=3)
-        first = db._db.execute(
-            "SELECT id FROM audit_events ORDER BY timestamp ASC LIMIT 1"
-        ).fetchone()
+        first = db._db.execute("SELECT id FROM audit_events ORDER BY seq ASC LIMIT 1").fetchone()
         db._db.execute(
             "UPDATE audit_events SET hash = ? WHERE id = ?",
             ("a" * 64, first["id"]),
@@ -186,7 +180,7 @@ class TestGapAttack:
         _write_events(AuditWriter(db), count=5)
         ids = [
             r["id"]
-            for r in db._db.execute("SELECT id FROM audit_events ORDER BY timestamp ASC").fetchall()
+            for r in db._db.execute("SELECT id FROM audit_events ORDER BY seq ASC").fetchall()
         ]
         middle_id = ids[2]
         db._db.execute("DELETE FROM audit_events WHERE id = ?", (middle_id,))
@@ -197,7 +191,7 @@ class TestGapAttack:
     def test_delete_first_entry_breaks_chain(self, db: Database) -> None:
         _write_events(AuditWriter(db), count=3)
         first_id = db._db.execute(
-            "SELECT id FROM audit_events ORDER BY timestamp ASC LIMIT 1"
+            "SELECT id FROM audit_events ORDER BY seq ASC LIMIT 1"
         ).fetchone()["id"]
         db._db.execute("DELETE FROM audit_events WHERE id = ?", (first_id,))
         db._db.commit()
@@ -219,7 +213,7 @@ class TestTruncationAttack:
         last_ids = [
             r["id"]
             for r in db._db.execute(
-                "SELECT id FROM audit_events ORDER BY timestamp DESC LIMIT 2"
+                "SELECT id FROM audit_events ORDER BY seq DESC LIMIT 2"
             ).fetchall()
         ]
         for eid in last_ids:
@@ -234,7 +228,7 @@ class TestTruncationAttack:
         last_ids = [
             r["id"]
             for r in db._db.execute(
-                "SELECT id FROM audit_events ORDER BY timestamp DESC LIMIT 2"
+                "SELECT id FROM audit_events ORDER BY seq DESC LIMIT 2"
             ).fetchall()
         ]
         for eid in last_ids:
@@ -254,9 +248,7 @@ class TestPhantomInsertionAttack:
 
     def test_phantom_row_with_wrong_hash_breaks_chain(self, db: Database) -> None:
         _write_events(AuditWriter(db), count=2)
-        last = db._db.execute(
-            "SELECT hash FROM audit_events ORDER BY timestamp DESC LIMIT 1"
-        ).fetchone()
+        last = db._db.execute("SELECT hash FROM audit_events ORDER BY seq DESC LIMIT 1").fetchone()
         # Insert phantom with correct prev_hash but fabricated (wrong) hash
         fake_hash = "f" * 64
         phantom_id = secrets.token_hex(12)
@@ -275,7 +267,7 @@ class TestPhantomInsertionAttack:
         """A phantom appended with correct prev_hash but wrong computed hash."""
         _write_events(AuditWriter(db), count=3)
         last_hash = db._db.execute(
-            "SELECT hash FROM audit_events ORDER BY timestamp DESC LIMIT 1"
+            "SELECT hash FROM audit_events ORDER BY seq DESC LIMIT 1"
         ).fetchone()["hash"]
         phantom_id = secrets.token_hex(12)
         # Build fake hash that doesn't match the real chain_input formula
@@ -15,10 +15,12 @@ CORE_ROUTES: set[tuple[str, str]] = {
     # JSON API
     ("GET", "/api/stats"),
     ("GET", "/api/sessions"),
+    ("GET", "/api/search"),
     ("GET", "/api/settings"),
     ("GET", "/api/workspaces"),
     ("GET", "/api/workspaces/{workspace_id}"),
     ("GET", "/api/workspaces/{workspace_id}/sessions"),
+    ("GET", "/api/events/stream"),
     # Workspace mutation routes
     ("POST", "/api/workspaces/scan"),
     ("POST", "/api/workspaces/trust"),
@@ -37,6 +39,8 @@ ENTERPRISE_ONLY_ROUTES: set[tuple[str, str]] = {
     ("GET", "/enterprise/settings"),
     ("GET", "/api/sessions/{session_id}/export"),
     ("POST", "/api/integrity/verify"),
+    ("POST", "/api/integrity/verify/full"),
+    ("GET", "/api/integrity/verify/full"),
 }
 
 # Full set for enterprise edition
@@ -238,23 +238,135 @@ class TestRegexSafety:
                 contains_is_regex=True,
             )
 
-    def test_pathological_regex_excerpt(self):
-        """Nested quantifiers must not cause exponential backtracking."""
+    def test_pathological_regex_rejected_at_load(self):
+        """Nested quantifiers are refused when the policy loads, not timed out per prompt."""
+        with pytest.raises(ValueError, match="catastrophic backtracking"):
+            MatchCriteria(
+                prompt_type=["yes_no"],
+                contains="(a+)+b",
+                contains_is_regex=True,
+            )
+
+    @pytest.mark.parametrize(
+        "pattern",
+        [r"(a*)*b", r"(a|aa)+$", r"(a|a)+b", r"(?:x\w+)*y", r"((ab)*c?)+d"],
+    )
+    def test_nested_quantifier_variants_rejected(self, pattern):
+        with pytest.raises(ValueError, match="catastrophic backtracking"):
+            MatchCriteria(contains=pattern, contains_is_regex=True)
+
+    @pytest.mark.parametrize(
+        "pattern",
+        [
+            r"(ab)+c",
+            r"(a{3})+b",
+            r"\d+\.\d+",
+            r"(?:rm|del)\s+-rf",
+            r"(a++)+b",
+            r"(ab|cd)+x",
+            r"git push.*--force",
+        ],
+    )
+    def test_bounded_patterns_accepted(self, pattern):
+        assert MatchCriteria(contains=pattern, contains_is_regex=True).contains_regex
+
+    @pytest.mark.parametrize(
+        "pattern",
+        [
+            r"\w+\s+",
+            r"\w+\W+",
+            r"\S+\s+\S+",
+            r"git\s+push\s+\S+",
+            r"npm\s+install\s+\S+\s+--save",
+            r"\w+\s*=\s*\w+",
+            r"[a-z]+(-[a-z]+)*",
+            r"(\d+\.)+\d+",
+        ],
+    )
+    def test_disjoint_classes_and_separated_repeats_accepted(self, pattern):
+        """Complementary classes do not overlap, and a mandatory separator breaks ambiguity."""
+        assert MatchCriteria(contains=pattern, contains_is_regex=True).contains_regex
+
+    @pytest.mark.parametrize("pattern", [r"(\d+\.\d+)+", r"(\d+\.)+\S+", r"\s+\S*\s+"])
+    def test_separator_overlap_still_rejected(self, pattern):
+        with pytest.raises(ValueError, match="catastrophic backtracking"):
+            MatchCriteria(contains=pattern, contains_is_regex=True)
+
+    def test_nested_quantifier_in_tool_name_rejected(self):
+        with pytest.raises(ValueError, match="catastrophic backtracking"):
+            MatchCriteria(tool_name="(\\w+)*_x", contains_is_regex=True)
+
+    @pytest.mark.parametrize("pattern", [r"a*a*a*b", r"\w+\d+x", r".*.*x", r"a+(b?)a+c"])
+    def test_adjacent_overlapping_quantifiers_rejected(self, pattern):
+        """Polynomial blowups like a*a*a*b are refused too — there is no match timeout."""
+        with pytest.raises(ValueError, match="catastrophic backtracking"):
+            MatchCriteria(contains=pattern, contains_is_regex=True)
+
+    def test_accepted_regex_on_huge_excerpt_is_fast(self):
+        """Accepted patterns are polynomial; a pathological input stays tractable."""
+        import time
+
         rule = PolicyRule(
             id="r1",
             match=MatchCriteria(
                 prompt_type=["yes_no"],
-                contains="(a+)+b",
+                contains=r"(a|bc)+x",
                 contains_is_regex=True,
             ),
             action=AutoReplyAction(value="y"),
         )
         policy = _make_policy(rules=[rule])
-        # This is a classic ReDoS pattern — should timeout gracefully
-        d = _eval(policy, prompt_text="a" * 50 + "!")
-        # Must not match (no 'b') and must not hang
+        start = time.perf_counter()
+        d = _eval(policy, prompt_text="bc" * 2_000)
+        assert time.perf_counter() - start < 2.0
         assert d.action_type == "require_human"
 
+    def test_deny_regex_not_bypassed_by_padding(self):
+        """A deny regex sees the whole excerpt — padding cannot push the command out of view."""
+        rules = [
+            PolicyRule(
+                id="deny-rm",
+                match=MatchCriteria(contains=r"rm\s+-rf", contains_is_regex=True),
+                action=DenyAction(),
+            ),
+            PolicyRule(
+                id="allow-all",
+                match=MatchCriteria(),
+                action=AutoReplyAction(value="y"),
+            ),
+        ]
+        policy = _make_policy(rules=rules)
+        pad = "x" * 1100
+        d = _eval(
+            policy,
+            prompt_type="tool_use",
+            prompt_text=f'tool_use: Bash({{"command": "echo {pad}; rm -rf /"}})',
+        )
+        assert d.action_type == "deny"
+        assert d.matched_rule_id == "deny-rm"
+
+    def test_regex_evaluation_off_main_thread(self):
+        """No signal handlers are involved, so evaluation works from worker threads."""
+        import threading
+
+        rule = PolicyRule(
+            id="r1",
+            match=MatchCriteria(
+                prompt_type=["yes_no"],
+                contains=r"continue\?",
+                contains_is_regex=True,
+            ),
+            action=AutoReplyAction(value="y"),
+        )
+        policy = _make_policy(rules=[rule])
+        results: list[str] = []
+        thread = threading.Thread(
+            target=lambda: results.append(_eval(policy, prompt_text="Continue?").action_type)
+        )
+        thread.start()
+        thread.join()
+        assert results == ["auto_reply"]
+
 
 # ---------------------------------------------------------------------------
 # 7. Tool and repo prefix matching edge cases
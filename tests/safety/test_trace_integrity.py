@@ -8,6 +8,8 @@ Verifies that:
   4. Empty trace file is valid
   5. Single-entry trace has empty prev_hash
   6. verify_integrity() returns True for valid chain, False for tampered
+  7. A verification checkpoint skips verified lines, but never hides a
+     break after it, a rewritten checkpointed line, or a rotated file
 """
 
 from __future__ import annotations
@@ -17,6 +19,7 @@ from pathlib import Path
 
 import pytest
 
+from atlasbridge.core.audit.checkpoint import checkpoint_path, load_checkpoint
 from atlasbridge.core.autopilot.trace import DecisionTrace, _compute_hash
 from atlasbridge.core.policy.model import (
     AutoReplyAction,
@@ -200,3 +203,63 @@ class TestChainResumeAfterRestart:
         entries = trace2.tail(10)
         assert len(entries) == 3
         assert entries[2]["prev_hash"] == entries[1]["hash"]
+
+
+class TestVerifyCheckpoint:
+    """Incremental verification from a checkpoint."""
+
+    def _tamper(self, trace_path: Path, line: int) -> None:
+        lines = trace_path.read_text().splitlines()
+        entry = json.loads(lines[line])
+        entry["explanation"] = entry["explanation"].upper()  # same length
+        lines[line] = json.dumps(entry)
+        trace_path.write_text("\n".join(lines) + "\n")
+
+    def test_resumes_after_verified_lines(self, trace: DecisionTrace, trace_path: Path) -> None:
+        cp_file = checkpoint_path(trace_path)
+        for i in range(3):
+            trace.record(_make_decision(prompt_id=f"p-{i}"))
+        assert DecisionTrace.verify_integrity(trace_path, checkpoint_file=cp_file) == (True, [])
+        checkpoint = load_checkpoint(cp_file)
+        assert checkpoint is not None
+        assert (checkpoint.position, checkpoint.count) == (trace_path.stat().st_size, 3)
+
+        # Lines before the checkpoint are not re-hashed; a full run still sees them
+        self._tamper(trace_path, 0)
+        trace.record(_make_decision(prompt_id="p-3"))
+        assert DecisionTrace.verify_integrity(trace_path, checkpoint_file=cp_file)[0] is True
+        assert load_checkpoint(cp_file).count == 4
+        valid, errors = DecisionTrace.verify_integrity(
+            trace_path, checkpoint_file=cp_file, full=True
+        )
+        assert not valid
+        assert errors[0].startswith("Line 1: hash mismatch")
+
+    def test_break_after_checkpoint_is_found(self, trace: DecisionTrace, trace_path: Path) -> None:
+        cp_file = checkpoint_path(trace_path)
+        trace.record(_make_decision(prompt_id="p-0"))
+        DecisionTrace.verify_integrity(trace_path, checkpoint_file=cp_file)
+        trace.record(_make_decision(prompt_id="p-1"))
+        trace.record(_make_decision(prompt_id="p-2"))
+        self._tamper(trace_path, 2)
+        valid, errors = DecisionTrace.verify_integrity(trace_path, checkpoint_file=cp_file)
+        assert not valid
+        assert errors[0].startswith("Line 3: hash mismatch")
+        assert load_checkpoint(cp_file).count == 1  # a broken chain is not checkpointed
+
+    def test_rewritten_checkpoint_line_forces_full_run(
+        self, trace: DecisionTrace, trace_path: Path
+    ) -> None:
+        cp_file = checkpoint_path(trace_path)
+        trace.record(_make_decision(prompt_id="p-0"))
+        trace.record(_make_decision(prompt_id="p-1"))
+        DecisionTrace.verify_integrity(trace_path, checkpoint_file=cp_file)
+        # Re-chained from the start with different content: the last hash changes
+        trace_path.unlink()
+        fresh = DecisionTrace(trace_path)
+        fresh.record(_make_decision(prompt_id="p-x", session_id="s-longer-session"))
+        fresh.record(_make_decision(prompt_id="p-y", session_id="s-longer-session"))
+        self._tamper(trace_path, 0)
+        valid, errors = DecisionTrace.verify_integrity(trace_path, checkpoint_file=cp_file)
+        assert not valid
+        assert errors[0].startswith("Line 1:")
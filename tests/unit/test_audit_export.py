@@ -165,3 +165,106 @@ class TestAuditExportCLI:
         assert result.exit_code == 0
         assert result.output.strip() == ""
         db.close()
+
+
+class TestPagedRead:
+    def test_after_seq_and_limit(self, db_with_events: Database) -> None:
+        page = db_with_events.get_audit_events_filtered(after_seq=1, limit=1)
+        assert [r["id"] for r in page] == ["evt-002"]
+
+    def test_filtered_count(self, db_with_events: Database) -> None:
+        assert db_with_events.count_audit_events(session_id="sess-1") == 2
+        assert db_with_events.count_audit_events() == 3
+
+
+class TestStreamingExport:
+    def test_gzip_jsonl_file(self, db_with_events: Database, tmp_path: Path) -> None:
+        import gzip
+
+        from atlasbridge.core.audit.export import ExportOptions, export_audit_to_file
+
+        out = tmp_path / "audit.jsonl.gz"
+        result = export_audit_to_file(db_with_events, out, ExportOptions(gzip=True), page_size=2)
+        assert result.count == 3
+        lines = gzip.decompress(out.read_bytes()).decode().splitlines()
+        assert [json.loads(ln)["id"] for ln in lines] == ["evt-001", "evt-002", "evt-003"]
+        assert not (tmp_path / "audit.jsonl.gz.export-state").exists()
+
+    @pytest.mark.parametrize("fmt", ["jsonl", "csv"])
+    def test_resume_matches_uninterrupted_export(
+        self, db_with_events: Database, tmp_path: Path, fmt: str
+    ) -> None:
+        import gzip
+
+        from atlasbridge.core.audit.export import (
+            ExportOptions,
+            export_audit_to_file,
+            export_state_path,
+        )
+
+        options = ExportOptions(fmt=fmt, gzip=True)
+        expected = tmp_path / f"full.{fmt}.gz"
+        export_audit_to_file(db_with_events, expected, options, page_size=1)
+
+        out = tmp_path / f"partial.{fmt}.gz"
+
+        def interrupt(exported: int, total: int) -> None:
+            if exported == 2:
+                raise KeyboardInterrupt
+
+        with pytest.raises(KeyboardInterrupt):
+            export_audit_to_file(db_with_events, out, options, progress=interrupt, page_size=1)
+        assert export_state_path(out).exists()
+        with out.open("ab") as f:
+            f.write(b"torn page")  # a partial write after the last saved page
+
+        result = export_audit_to_file(db_with_events, out, options, resume=True, page_size=1)
+        assert (result.resumed, result.written, result.count) == (True, 1, 3)
+        assert gzip.decompress(out.read_bytes()) == gzip.decompress(expected.read_bytes())
+
+    def test_resume_requires_same_options(self, db_with_events: Database, tmp_path: Path) -> None:
+        from atlasbridge.core.audit.export import (
+            ExportOptions,
+            ExportResumeError,
+            export_audit_to_file,
+        )
+
+        out = tmp_path / "audit.jsonl"
+
+        def interrupt(exported: int, total: int) -> None:
+            raise KeyboardInterrupt
+
+        with pytest.raises(KeyboardInterrupt):
+            export_audit_to_file(
+                db_with_events, out, ExportOptions(), progress=interrupt, page_size=1
+            )
+        with pytest.raises(ExportResumeError):
+            export_audit_to_file(
+                db_with_events, out, ExportOptions(session_id="sess-1"), resume=True
+            )
+        with pytest.raises(ExportResumeError):
+            export_audit_to_file(db_with_events, out, ExportOptions(fmt="json"), resume=True)
+
+    def test_cli_output_file_and_resume_flag(
+        self, db_with_events: Database, tmp_path: Path
+    ) -> None:
+        from unittest.mock import patch
+
+        from click.testing import CliRunner
+
+        from atlasbridge.cli._audit_cmd import audit_group
+
+        out = tmp_path / "audit.csv"
+        runner = CliRunner()
+        mock_config = type("C", (), {"db_path": db_with_events._path})()
+        with patch("atlasbridge.core.config.load_config", return_value=mock_config):
+            result = runner.invoke(audit_group, ["export", "--format", "csv", "--output", str(out)])
+            assert result.exit_code == 0
+            assert "Exported 3 events" in result.output
+            assert len(list(csv.DictReader(io.StringIO(out.read_text())))) == 3
+
+            result = runner.invoke(
+                audit_group, ["export", "--format", "csv", "--output", str(out), "--resume"]
+            )
+            assert result.exit_code == 1
+            assert "Nothing to resume" in result.output
@@ -264,3 +264,80 @@ class TestSizeBasedRotation:
         size_count = db.archive_oldest_audit_events(archive_size, keep_count=5)
         assert size_count == 2
         assert db.count_audit_events() == 5
+
+
+class TestBatchedArchive:
+    """Archival moves bounded batches and can be re-run after an interruption."""
+
+    def _archive_rows(self, archive_path: Path) -> list[sqlite3.Row]:
+        conn = sqlite3.connect(str(archive_path))
+        conn.row_factory = sqlite3.Row
+        rows = conn.execute("SELECT * FROM audit_events ORDER BY seq").fetchall()
+        conn.close()
+        return rows
+
+    def test_batches_record_chain_boundaries(self, db: Database, tmp_path: Path) -> None:
+        old_ts = (datetime.now(UTC) - timedelta(days=100)).isoformat()
+        for i in range(5):
+            _insert_event_at(db, old_ts, f"event_{i}")
+        _insert_event_at(db, datetime.now(UTC).isoformat(), "recent")
+        seen: list[tuple[int, int]] = []
+
+        archive_path = tmp_path / "audit_archive.1.db"
+        cutoff = (datetime.now(UTC) - timedelta(days=90)).isoformat()
+        archived = db.archive_audit_events(
+            archive_path, cutoff, batch_size=2, progress=lambda n, t: seen.append((n, t))
+        )
+
+        assert archived == 5
+        assert seen == [(2, 5), (4, 5), (5, 5)]
+        rows = self._archive_rows(archive_path)
+        assert [r["seq"] for r in rows] == [1, 2, 3, 4, 5]
+        conn = sqlite3.connect(str(archive_path))
+        boundaries = conn.execute(
+            "SELECT last_seq, last_hash, count FROM archive_checkpoints ORDER BY last_seq"
+        ).fetchall()
+        conn.close()
+        assert [(b[0], b[2]) for b in boundaries] == [(2, 2), (4, 2), (5, 1)]
+        assert boundaries[-1][1] == rows[-1]["hash"]
+        # The chain continues in the main database from the last boundary
+        assert db.get_recent_audit_events(limit=1)[0]["prev_hash"] == boundaries[-1][1]
+
+    def test_interrupted_archive_can_be_rerun(self, db: Database, tmp_path: Path) -> None:
+        for i in range(6):
+            ts = (datetime.now(UTC) - timedelta(hours=10 - i)).isoformat()
+            _insert_event_at(db, ts, f"event_{i}")
+        archive_path = tmp_path / "audit_archive.1.db"
+
+        def interrupt(moved: int, total: int) -> None:
+            raise KeyboardInterrupt
+
+        with pytest.raises(KeyboardInterrupt):
+            db.archive_oldest_audit_events(
+                archive_path, keep_count=1, batch_size=2, progress=interrupt
+            )
+        assert db.count_audit_events() == 4  # the first batch was moved
+
+        assert db.archive_oldest_audit_events(archive_path, keep_count=1, batch_size=2) == 3
+        rows = self._archive_rows(archive_path)
+        assert len(rows) == 5
+        for j in range(1, len(rows)):
+            assert rows[j]["prev_hash"] == rows[j - 1]["hash"]
+
+    def test_archive_without_seq_column_is_upgraded(self, db: Database, tmp_path: Path) -> None:
+        archive_path = tmp_path / "audit_archive.1.db"
+        conn = sqlite3.connect(str(archive_path))
+        conn.execute(
+            "CREATE TABLE audit_events (id TEXT PRIMARY KEY, event_type TEXT NOT NULL, "
+            "session_id TEXT NOT NULL DEFAULT '', prompt_id TEXT NOT NULL DEFAULT '', "
+            "payload TEXT NOT NULL DEFAULT '{}', timestamp TEXT NOT NULL, "
+            "prev_hash TEXT NOT NULL DEFAULT '', hash TEXT NOT NULL DEFAULT '')"
+        )
+        conn.execute("INSERT INTO audit_events (id, event_type, timestamp) VALUES ('a', 'x', 't')")
+        conn.commit()
+        conn.close()
+        _insert_event_at(db, (datetime.now(UTC) - timedelta(days=100)).isoformat())
+
+        cutoff = (datetime.now(UTC) - timedelta(days=90)).isoformat()
+        assert db.archive_audit_events(archive_path, cutoff) == 1
+        assert [r["seq"] for r in self._archive_rows(archive_path)] == [None, 1]
@@ -1,16 +1,22 @@
-"""Tests for audit hash chain verification (verify_audit_chain)."""
+"""Tests for audit hash chain verification (verify_audit_chain, checkpoints, VerifyJob)."""
 
 from __future__ import annotations
 
 import hashlib
 import json
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import pytest
+
+from atlasbridge.core.audit.checkpoint import checkpoint_path, load_checkpoint
 from atlasbridge.core.audit.verify import (
     AuditVerifyResult,
+    VerifyJob,
     format_verify_result,
     verify_audit_chain,
 )
+from atlasbridge.core.store.database import Database
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -74,7 +80,7 @@ class TestVerifyAuditChainValid:
 
     def test_empty_log(self):
         db = MagicMock()
-        db._db.execute.return_value.fetchall.return_value = []
+        db._db.execute.return_value = []
         result = verify_audit_chain(db)
         assert result.valid is True
         assert result.total_events == 0
@@ -84,7 +90,7 @@ class TestVerifyAuditChainValid:
     def test_single_event(self):
         rows = _build_chain(count=1)
         db = MagicMock()
-        db._db.execute.return_value.fetchall.return_value = rows
+        db._db.execute.return_value = rows
         result = verify_audit_chain(db)
         assert result.valid is True
         assert result.total_events == 1
@@ -93,7 +99,7 @@ class TestVerifyAuditChainValid:
     def test_multi_event_chain(self):
         rows = _build_chain(count=5)
         db = MagicMock()
-        db._db.execute.return_value.fetchall.return_value = rows
+        db._db.execute.return_value = rows
         result = verify_audit_chain(db)
         assert result.valid is True
         assert result.total_events == 5
@@ -103,7 +109,7 @@ class TestVerifyAuditChainValid:
     def test_session_scoped(self):
         rows = _build_chain(count=3, session_id="sess-abc")
         db = MagicMock()
-        db._db.execute.return_value.fetchall.return_value = rows
+        db._db.execute.return_value = rows
         result = verify_audit_chain(db, session_id="sess-abc")
         assert result.valid is True
         assert result.total_events == 3
@@ -132,7 +138,7 @@ class TestVerifyAuditChainTampered:
         rows[1] = tampered
 
         db = MagicMock()
-        db._db.execute.return_value.fetchall.return_value = rows
+        db._db.execute.return_value = rows
         result = verify_audit_chain(db)
         assert result.valid is False
         assert len(result.errors) >= 1
@@ -158,7 +164,7 @@ class TestVerifyAuditChainTampered:
         rows[2] = tampered
 
         db = MagicMock()
-        db._db.execute.return_value.fetchall.return_value = rows
+        db._db.execute.return_value = rows
         result = verify_audit_chain(db)
         assert result.valid is False
         assert result.first_break_position == 2
@@ -171,7 +177,7 @@ class TestVerifyAuditChainTampered:
         del rows[1]
 
         db = MagicMock()
-        db._db.execute.return_value.fetchall.return_value = rows
+        db._db.execute.return_value = rows
         result = verify_audit_chain(db)
         assert result.valid is False
         assert len(result.errors) >= 1
@@ -195,7 +201,7 @@ class TestVerifyAuditChainTampered:
         rows[1] = tampered
 
         db = MagicMock()
-        db._db.execute.return_value.fetchall.return_value = rows
+        db._db.execute.return_value = rows
         result = verify_audit_chain(db, session_id="sess-1")
         # Hash mismatch still detected (prev_hash is part of hash input),
         # but no "prev_hash mismatch" error
@@ -222,13 +228,119 @@ class TestVerifyAuditChainTampered:
             rows[idx] = tampered
 
         db = MagicMock()
-        db._db.execute.return_value.fetchall.return_value = rows
+        db._db.execute.return_value = rows
         result = verify_audit_chain(db)
         assert result.valid is False
         assert len(result.errors) >= 2
         assert result.first_break_event_id == "evt-1"
 
 
+class TestVerifyCheckpoints:
+    """Incremental verification against a real database."""
+
+    @pytest.fixture
+    def db(self, tmp_path: Path):
+        db = Database(tmp_path / "atlasbridge.db")
+        db.connect()
+        for i in range(5):
+            db.append_audit_event(f"evt-{i}", "test_event", {"i": i})
+        yield db
+        db.close()
+
+    def _tamper(self, db: Database, seq: int) -> None:
+        db._db.execute("UPDATE audit_events SET payload = '{\"i\":999}' WHERE seq = ?", (seq,))
+        db._db.commit()
+
+    def test_second_run_rehashes_only_new_events(self, db: Database) -> None:
+        cp_file = checkpoint_path(db.path)
+        first = verify_audit_chain(db, checkpoint_file=cp_file)
+        assert (first.valid, first.resumed_events) == (True, 0)
+        assert load_checkpoint(cp_file).position == 5
+
+        db.append_audit_event("evt-5", "test_event", {"i": 5})
+        self._tamper(db, 2)  # evt-1, before the checkpoint: not re-hashed
+        second = verify_audit_chain(db, checkpoint_file=cp_file)
+        assert (second.valid, second.resumed_events, second.total_events) == (True, 5, 6)
+        assert load_checkpoint(cp_file).count == 6
+
+        full = verify_audit_chain(db, checkpoint_file=cp_file, full=True)
+        assert (full.valid, full.first_break_event_id) == (False, "evt-1")
+
+    def test_break_after_checkpoint_is_found(self, db: Database) -> None:
+        cp_file = checkpoint_path(db.path)
+        verify_audit_chain(db, checkpoint_file=cp_file)
+        db.append_audit_event("evt-5", "test_event", {"i": 5})
+        db._db.execute("UPDATE audit_events SET prev_hash = 'forged' WHERE seq = 6")
+        db._db.commit()
+        result = verify_audit_chain(db, checkpoint_file=cp_file)
+        assert not result.valid
+        assert result.first_break_position == 5
+        assert load_checkpoint(cp_file).count == 5  # not advanced past a break
+
+    def test_rewritten_checkpoint_event_forces_full_run(self, db: Database) -> None:
+        cp_file = checkpoint_path(db.path)
+        verify_audit_chain(db, checkpoint_file=cp_file)
+        db._db.execute("UPDATE audit_events SET hash = 'forged' WHERE seq = 5")
+        db._db.commit()
+        result = verify_audit_chain(db, checkpoint_file=cp_file)
+        assert (result.valid, result.resumed_events) == (False, 0)
+
+    def test_checkpoint_survives_pruned_history(self, db: Database) -> None:
+        cp_file = checkpoint_path(db.path)
+        verify_audit_chain(db, checkpoint_file=cp_file)
+        db.append_audit_event("evt-5", "test_event", {"i": 5})
+        # Everything up to the checkpointed event was moved out of the table
+        db._db.execute("DELETE FROM audit_events WHERE seq <= 5")
+        db._db.commit()
+        result = verify_audit_chain(db, checkpoint_file=cp_file)
+        assert (result.valid, result.resumed_events, result.total_events) == (True, 5, 6)
+
+    def test_replaced_database_ignores_checkpoint(self, db: Database, tmp_path: Path) -> None:
+        cp_file = checkpoint_path(db.path)
+        verify_audit_chain(db, checkpoint_file=cp_file)
+        other = Database(tmp_path / "other.db")
+        other.connect()
+        other.append_audit_event("new-0", "test_event", {})
+        try:
+            result = verify_audit_chain(other, checkpoint_file=cp_file)
+        finally:
+            other.close()
+        assert (result.valid, result.resumed_events, result.total_events) == (True, 0, 1)
+
+    def test_session_scope_does_not_checkpoint(self, db: Database) -> None:
+        cp_file = checkpoint_path(db.path)
+        verify_audit_chain(db, session_id="", checkpoint_file=cp_file)
+        verify_audit_chain(db, session_id="sess-x", checkpoint_file=cp_file)
+        assert load_checkpoint(cp_file).count == 5
+
+    def test_progress_and_background_job(self, db: Database) -> None:
+        seen: list[tuple[int, int]] = []
+        verify_audit_chain(db, full=True, progress=lambda done, total: seen.append((done, total)))
+        assert seen[-1] == (5, 5)
+
+        job = VerifyJob(lambda progress: verify_audit_chain(db, full=True, progress=progress))
+        assert job.status()["state"] == "idle"
+        assert job.start()
+        job.join(5)
+        status = job.status()
+        assert (status["state"], status["valid"], status["verified"], status["total"]) == (
+            "done",
+            True,
+            5,
+            5,
+        )
+
+    def test_background_job_failure(self) -> None:
+        def broken(progress):
+            raise OSError("disk gone")
+
+        job = VerifyJob(broken)
+        job.start()
+        job.join(5)
+        assert job.status()["state"] == "failed"
+        assert job.status()["error"] == "disk gone"
+
+
 # ---------------------------------------------------------------------------
 # Tests — format_verify_result
 # ---------------------------------------------------------------------------
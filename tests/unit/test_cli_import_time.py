@@ -0,0 +1,144 @@
+"""
+Import-time tests for the ``atlasbridge`` CLI.
+
+The dashboard and the expert agent run the CLI for single operator actions,
+so hot commands must not pay for modules they never use.
+
+Covers:
+- LazyCommands answers membership and listing without importing anything,
+  imports a command on lookup, and marks it hidden
+- Hot commands, run under ``python -X importtime``, stay clear of the policy
+  models / autopilot engine / TUI (where they do not need them) and within an
+  import-time budget
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+import click
+import pytest
+
+from atlasbridge.cli import main as cli_main
+from atlasbridge.cli._lazy import LazyCommands
+
+# ---------------------------------------------------------------------------
+# LazyCommands
+# ---------------------------------------------------------------------------
+
+
+class TestLazyCommands:
+    @pytest.fixture
+    def commands(self) -> LazyCommands:
+        return LazyCommands(
+            {"version": "atlasbridge.cli._version:version_cmd"},
+            hidden={"version", "extra"},
+        )
+
+    def test_membership_does_not_import(self, commands: LazyCommands) -> None:
+        assert "version" in commands
+        assert "missing" not in commands
+        assert list(commands) == ["version"]
+        assert len(commands) == 1
+        assert not commands.is_loaded("version")
+
+    def test_lookup_imports_and_hides(self, commands: LazyCommands) -> None:
+        from atlasbridge.cli._version import version_cmd
+
+        hidden = version_cmd.hidden
+        try:
+            assert commands["version"] is version_cmd
+            assert commands.is_loaded("version")
+            assert version_cmd.hidden is True
+        finally:
+            version_cmd.hidden = hidden
+        assert commands.get("missing") is None
+
+    def test_eager_commands(self, commands: LazyCommands) -> None:
+        extra = click.Command("extra")
+        commands["extra"] = extra
+        assert extra.hidden is True
+        assert set(commands) == {"version", "extra"}
+        del commands["extra"]
+        assert "extra" not in commands
+
+    def test_root_group_lists_every_subcommand(self) -> None:
+        assert set(cli_main._SUBCOMMANDS) <= set(cli_main.cli.commands)
+        assert cli_main.cli.commands["ui"].hidden is True
+        assert cli_main.cli.commands["version"].hidden is False
+
+
+# ---------------------------------------------------------------------------
+# Import-time budget for hot commands
+# ---------------------------------------------------------------------------
+
+_POLICY = 'policy_version: "0"\nname: "budget"\nrules: []\n'
+
+# Interpreter start-up, paid by every Python process whatever it runs.
+_STARTUP_MODULES = {"site", "encodings", "_frozen_importlib_external", "zipimport"}
+
+_NEVER_HOT = ("atlasbridge.ui", "textual", "atlasbridge.core.autopilot.engine")
+_POLICY_MODULES = ("atlasbridge.core.policy.model", "atlasbridge.core.policy.explain")
+
+# (args, modules that must not be imported, budget in ms).  Budgets are
+# roughly twice the local figure, to tolerate slower CI runners.
+_HOT_COMMANDS = [
+    (["sessions", "reply", "sess-1", "prompt-1", "y"], _NEVER_HOT + _POLICY_MODULES, 700),
+    (["sessions", "message", "sess-1", "hello"], _NEVER_HOT + _POLICY_MODULES, 700),
+    (["autopilot", "disable"], _NEVER_HOT + _POLICY_MODULES, 700),
+    (["policy", "validate", "{policy}"], _NEVER_HOT + ("atlasbridge.core.policy.explain",), 1000),
+]
+
+_ROW = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \| ( *)(\S+)")
+
+
+def _import_profile(args: list[str], home: Path) -> tuple[set[str], float]:
+    """Run the CLI under ``-X importtime``; return imported modules and total ms."""
+    env = {**os.environ, "HOME": str(home), "XDG_CONFIG_HOME": str(home / ".config")}
+    env.pop("ATLASBRIDGE_CONFIG", None)
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "atlasbridge", *args],
+        capture_output=True,
+        text=True,
+        env=env,
+        timeout=60,
+    )
+    modules: set[str] = set()
+    total_us = 0
+    for match in _ROW.finditer(proc.stderr):
+        cumulative, indent, name = int(match[2]), match[3], match[4]
+        modules.add(name)
+        # Modules imported lazily (importlib.import_module) are not reported
+        # themselves, but everything they import is, so summing the
+        # top-level rows still covers the whole command.
+        if not indent and name not in _STARTUP_MODULES:
+            total_us += cumulative
+    return modules, total_us / 1000
+
+
+@pytest.mark.performance
+@pytest.mark.skipif(sys.platform == "win32", reason="POSIX home layout only")
+@pytest.mark.parametrize(
+    ("args", "forbidden", "budget_ms"),
+    _HOT_COMMANDS,
+    ids=[" ".join(args[:2]) for args, _, _ in _HOT_COMMANDS],
+)
+def test_hot_command_import_budget(
+    tmp_path: Path, args: list[str], forbidden: tuple[str, ...], budget_ms: int
+) -> None:
+    policy = tmp_path / "policy.yaml"
+    policy.write_text(_POLICY)
+    args = [a.format(policy=policy) for a in args]
+
+    # Best of three keeps a busy runner from failing the budget.
+    runs = [_import_profile(args, tmp_path) for _ in range(3)]
+    modules = runs[0][0]
+    assert "atlasbridge.cli.main" in modules, "importtime output not captured"
+    loaded = sorted(m for m in modules if m.startswith(forbidden))
+    assert not loaded, f"{' '.join(args[:2])} imported {loaded}"
+    best = min(ms for _, ms in runs)
+    assert best < budget_ms, f"{' '.join(args[:2])} spent {best:.0f}ms importing"
@@ -0,0 +1,287 @@
+"""
+Unit tests for the daemon control socket and multi-session mode.
+
+Covers:
+- call_daemon() round-trips to registered handlers; errors come back as
+  ControlError, a missing daemon as DaemonUnavailableError
+- Stream methods feed items to stream_daemon() until either side leaves;
+  ChangeFeed coalesces commit notices for slow subscribers
+- A second server does not steal a live socket, but replaces a stale one
+- A multi-session DaemonManager runs several PTY sessions as tasks in one
+  process, keeps their input separate, and keeps running after a
+  session exits
+- A single-session daemon rejects sessions.start
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import sys
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from atlasbridge.core.daemon.changes import ChangeFeed
+from atlasbridge.core.daemon.control import (
+    ControlServer,
+    call_daemon,
+    control_socket_path,
+    stream_daemon,
+)
+from atlasbridge.core.daemon.manager import DaemonManager
+from atlasbridge.core.exceptions import ControlError, DaemonUnavailableError, SessionError
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="Unix sockets only")
+
+
+@pytest.fixture
+def data_dir(tmp_path: Path) -> Path:
+    return tmp_path
+
+
+async def _call(data_dir: Path, method: str, params: dict[str, Any] | None = None) -> Any:
+    return await asyncio.to_thread(call_daemon, data_dir, method, params, 5.0)
+
+
+# ---------------------------------------------------------------------------
+# ControlServer
+# ---------------------------------------------------------------------------
+
+
+class TestControlServer:
+    async def test_round_trip(self, data_dir: Path) -> None:
+        server = ControlServer(data_dir)
+
+        async def echo(params: dict[str, Any]) -> dict[str, Any]:
+            return {"echo": params}
+
+        server.register("echo", echo)
+        assert await server.start()
+        try:
+            assert await _call(data_dir, "echo", {"a": 1}) == {"echo": {"a": 1}}
+        finally:
+            await server.close()
+        assert not control_socket_path(data_dir).exists()
+
+    async def test_errors_are_returned(self, data_dir: Path) -> None:
+        server = ControlServer(data_dir)
+
+        async def refuse(params: dict[str, Any]) -> None:
+            raise SessionError("not today")
+
+        async def crash(params: dict[str, Any]) -> None:
+            raise RuntimeError("boom")
+
+        server.register("refuse", refuse)
+        server.register("crash", crash)
+        assert await server.start()
+        try:
+            with pytest.raises(ControlError, match="not today"):
+                await _call(data_dir, "refuse")
+            with pytest.raises(ControlError, match="Internal error: boom"):
+                await _call(data_dir, "crash")
+            with pytest.raises(ControlError, match="Unknown method"):
+                await _call(data_dir, "missing")
+        finally:
+            await server.close()
+
+    async def test_malformed_requests(self, data_dir: Path) -> None:
+        server = ControlServer(data_dir)
+        assert await server.dispatch(["not", "an", "object"]) == {
+            "ok": False,
+            "error": "Malformed request",
+        }
+        response = await server.dispatch({"method": "x", "params": [1]})
+        assert response["ok"] is False
+
+    async def test_live_socket_not_stolen(self, data_dir: Path) -> None:
+        first = ControlServer(data_dir)
+        second = ControlServer(data_dir)
+        assert await first.start()
+        try:
+            assert not await second.start()
+        finally:
+            await first.close()
+
+    async def test_stale_socket_replaced(self, data_dir: Path) -> None:
+        control_socket_path(data_dir).write_text("")
+        server = ControlServer(data_dir)
+        assert await server.start()
+        await server.close()
+
+    def test_no_daemon(self, data_dir: Path) -> None:
+        with pytest.raises(DaemonUnavailableError):
+            call_daemon(data_dir, "daemon.status")
+
+
+class TestControlStreams:
+    async def test_stream_round_trip(self, data_dir: Path) -> None:
+        server = ControlServer(data_dir)
+
+        async def count(params: dict[str, Any]):
+            for i in range(params["n"]):
+                yield {"i": i}
+
+        server.register_stream("count", count)
+        assert await server.start()
+        try:
+            items = [item async for item in stream_daemon(data_dir, "count", {"n": 3})]
+        finally:
+            await server.close()
+        assert items == [{"i": 0}, {"i": 1}, {"i": 2}]
+
+    async def test_stream_error_is_raised(self, data_dir: Path) -> None:
+        server = ControlServer(data_dir)
+
+        async def refuse(params: dict[str, Any]):
+            yield {"first": True}
+            raise SessionError("gone")
+
+        server.register_stream("refuse", refuse)
+        assert await server.start()
+        try:
+            stream = stream_daemon(data_dir, "refuse")
+            assert await anext(stream) == {"first": True}
+            with pytest.raises(ControlError, match="gone"):
+                await anext(stream)
+        finally:
+            await server.close()
+
+    async def test_client_leaving_ends_idle_stream(self, data_dir: Path) -> None:
+        feed = ChangeFeed()
+        server = ControlServer(data_dir)
+        server.register_stream("events.subscribe", feed.subscribe)
+        assert await server.start()
+        try:
+            stream = stream_daemon(data_dir, "events.subscribe")
+            assert await anext(stream) == {"streams": []}
+            assert feed.subscriber_count == 1
+            await stream.aclose()
+            await _until(lambda: feed.subscriber_count == 0)
+        finally:
+            await server.close()
+
+    async def test_stream_without_daemon(self, data_dir: Path) -> None:
+        with pytest.raises(DaemonUnavailableError):
+            await anext(stream_daemon(data_dir, "events.subscribe"))
+
+
+class TestChangeFeed:
+    async def test_notices_coalesce_per_subscriber(self) -> None:
+        feed = ChangeFeed()
+        fast = feed.subscribe()
+        slow = feed.subscribe()
+        assert await anext(fast) == {"streams": []}
+        assert await anext(slow) == {"streams": []}
+
+        feed.publish({"audit"})
+        assert await anext(fast) == {"streams": ["audit"]}
+        feed.publish({"transcript"})
+        feed.publish({"audit"})
+        # The slow subscriber gets one merged notice, not three
+        assert await anext(slow) == {"streams": ["audit", "transcript"]}
+        assert await anext(fast) == {"streams": ["audit", "transcript"]}
+
+        await fast.aclose()
+        await slow.aclose()
+        assert feed.subscriber_count == 0
+
+    async def test_publish_from_worker_thread(self) -> None:
+        feed = ChangeFeed()
+        sub = feed.subscribe()
+        await anext(sub)
+        await asyncio.to_thread(feed.publish, {"audit"})
+        assert await asyncio.wait_for(anext(sub), 5.0) == {"streams": ["audit"]}
+        await sub.aclose()
+
+
+# ---------------------------------------------------------------------------
+# Multi-session DaemonManager
+# ---------------------------------------------------------------------------
+
+
+async def _until(predicate, timeout: float = 5.0) -> None:
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not predicate():
+        assert asyncio.get_running_loop().time() < deadline, "condition not met"
+        await asyncio.sleep(0.02)
+
+
+@pytest.fixture
+async def multi_daemon(data_dir: Path):
+    pytest.importorskip("ptyprocess")
+    manager = DaemonManager({"data_dir": str(data_dir), "channels": {}, "multi_session": True})
+    await manager._init_session_manager()
+    await manager._init_router()
+    manager._running = True
+    await manager._start_control_server()
+    yield manager
+    manager._running = False
+    for task in list(manager._session_tasks.values()):
+        task.cancel()
+    await asyncio.gather(*manager._session_tasks.values(), return_exceptions=True)
+    await manager._control.close()
+
+
+class TestMultiSession:
+    async def test_sessions_run_as_tasks_in_one_process(
+        self, data_dir: Path, multi_daemon: DaemonManager
+    ) -> None:
+        status = await _call(data_dir, "daemon.status")
+        assert status["multi_session"] is True
+        assert status["pid"] == os.getpid()
+
+        first = await _call(data_dir, "sessions.start", {"tool": "claude", "command": ["cat"]})
+        second = await _call(data_dir, "sessions.start", {"tool": "claude", "command": ["cat"]})
+        assert first["session_id"] != second["session_id"]
+        assert first["daemon_pid"] == second["daemon_pid"] == os.getpid()
+        assert first["pid"] != second["pid"]
+        assert set(multi_daemon._session_tasks) == {first["session_id"], second["session_id"]}
+
+        status = await _call(data_dir, "daemon.status")
+        assert sorted(status["sessions"]) == sorted([first["session_id"], second["session_id"]])
+
+    async def test_session_exit_keeps_daemon_running(
+        self, data_dir: Path, multi_daemon: DaemonManager
+    ) -> None:
+        short = await _call(data_dir, "sessions.start", {"tool": "claude", "command": ["true"]})
+        long = await _call(data_dir, "sessions.start", {"tool": "claude", "command": ["cat"]})
+        await _until(lambda: short["session_id"] not in multi_daemon._session_tasks)
+        assert not multi_daemon._shutdown_event.is_set()
+        assert short["session_id"] not in multi_daemon._adapters
+        assert long["session_id"] in multi_daemon._session_tasks
+
+    async def test_reply_reaches_its_own_session(
+        self, data_dir: Path, multi_daemon: DaemonManager
+    ) -> None:
+        first = await _call(data_dir, "sessions.start", {"tool": "claude", "command": ["cat"]})
+        second = await _call(data_dir, "sessions.start", {"tool": "claude", "command": ["cat"]})
+        target = multi_daemon._adapters[second["session_id"]]
+        other = multi_daemon._adapters[first["session_id"]]
+        await target.inject_reply(second["session_id"], "ping", "free_text")
+        await _until(lambda: b"ping" in target._output_buffers.get(second["session_id"], b""))
+        assert b"ping" not in other._output_buffers.get(first["session_id"], b"")
+
+    async def test_bad_requests_rejected(self, data_dir: Path, multi_daemon: DaemonManager) -> None:
+        with pytest.raises(ControlError, match="Failed to launch"):
+            await _call(
+                data_dir,
+                "sessions.start",
+                {"tool": "claude", "command": ["atlasbridge-no-such-binary"]},
+            )
+        assert not multi_daemon._adapters
+        with pytest.raises(ControlError, match="'tool' is required"):
+            await _call(data_dir, "sessions.start", {})
+
+
+async def test_single_session_daemon_rejects_start(data_dir: Path) -> None:
+    manager = DaemonManager({"data_dir": str(data_dir), "channels": {}})
+    manager._running = True
+    await manager._start_control_server()
+    try:
+        with pytest.raises(ControlError, match="not in multi-session mode"):
+            await _call(data_dir, "sessions.start", {"tool": "claude"})
+    finally:
+        await manager._control.close()
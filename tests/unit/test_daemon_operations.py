@@ -0,0 +1,209 @@
+"""
+Unit tests for operator actions served on the daemon control socket.
+
+Covers:
+- Autopilot enable/disable/mode and policy validate/test run in-process
+- Session actions claim rows in the DB and wake the daemon
+- The same actions are served as control-socket methods
+- CLI commands are thin clients of a listening daemon and fall back to
+  running the action themselves
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import sys
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+from click.testing import CliRunner
+
+from atlasbridge.cli.main import cli
+from atlasbridge.core.autopilot.state import AutopilotState
+from atlasbridge.core.daemon import operations
+from atlasbridge.core.daemon.control import ControlServer, call_daemon
+from atlasbridge.core.daemon.wakeup import WAKE_DIRECTIVE
+from atlasbridge.core.exceptions import ControlError, OperationError
+from atlasbridge.core.store.database import Database
+
+_POLICY = """\
+policy_version: "0"
+name: "ops-test"
+autonomy_mode: full
+rules:
+  - id: "yes"
+    match:
+      prompt_type: [yes_no]
+    action:
+      type: auto_reply
+      value: "y"
+"""
+
+
+@pytest.fixture
+def data_dir(tmp_path: Path) -> Path:
+    return tmp_path
+
+
+@pytest.fixture
+def db(tmp_path: Path) -> Any:
+    d = Database(tmp_path / "atlasbridge.db")
+    d.connect()
+    yield d
+    d.close()
+
+
+@pytest.fixture
+def policy_file(data_dir: Path) -> Path:
+    path = data_dir / "policy.yaml"
+    path.write_text(_POLICY)
+    return path
+
+
+class TestAutopilotActions:
+    def test_disable_then_enable(self, data_dir: Path) -> None:
+        result = operations.set_autopilot_enabled(data_dir, False)
+        assert result["changed"] is True
+        assert operations.read_autopilot_state(data_dir) == AutopilotState.PAUSED
+        assert operations.set_autopilot_enabled(data_dir, False)["changed"] is False
+
+        operations.set_autopilot_enabled(data_dir, True)
+        assert operations.read_autopilot_state(data_dir) == AutopilotState.RUNNING
+
+    def test_stopped_is_refused(self, data_dir: Path) -> None:
+        operations.write_autopilot_state(data_dir, AutopilotState.STOPPED)
+        with pytest.raises(OperationError, match="Start the daemon first"):
+            operations.set_autopilot_enabled(data_dir, True)
+
+    def test_set_mode(self, data_dir: Path, policy_file: Path) -> None:
+        result = operations.set_autonomy_mode(data_dir, "off")
+        assert result["mode"] == "off"
+        assert 'autonomy_mode: "off"' in policy_file.read_text()
+        assert operations.validate_policy(str(policy_file))["mode"] == "off"
+
+    def test_set_mode_requires_policy(self, data_dir: Path) -> None:
+        with pytest.raises(OperationError, match="No policy.yaml"):
+            operations.set_autonomy_mode(data_dir, "full")
+
+
+class TestPolicyActions:
+    def test_validate(self, policy_file: Path, tmp_path: Path) -> None:
+        result = operations.validate_policy(str(policy_file))
+        assert result["valid"] is True
+        assert result["name"] == "ops-test"
+        assert result["rules"] == 1
+
+        bad = tmp_path / "bad.yaml"
+        bad.write_text("rules: [")
+        assert operations.validate_policy(str(bad))["valid"] is False
+
+    def test_run_policy_test(self, policy_file: Path) -> None:
+        result = operations.run_policy_test(str(policy_file), "Continue? [y/n]")
+        assert result["action_type"] == "auto_reply"
+        assert result["matched_rule_id"] == "yes"
+        assert "auto_reply" in result["output"]
+
+
+class TestSessionActions:
+    def test_message_queues_directive_and_wakes(self, db: Any) -> None:
+        db.save_session("sess-1234", "claude", ["claude"])
+        db.update_session("sess-1234", status="running")
+        woken: list[str] = []
+
+        result = operations.message_session(db, "sess", "hello", wake=woken.append)
+        assert result["ok"] is True
+        assert result["session_id"] == "sess-1234"
+        assert [r["content"] for r in db.list_pending_directives()] == ["hello"]
+        assert woken == [WAKE_DIRECTIVE]
+
+    def test_message_refuses_ended_session(self, db: Any) -> None:
+        db.save_session("sess-1234", "claude", ["claude"])
+        db.update_session("sess-1234", status="completed")
+        with pytest.raises(OperationError, match="not running"):
+            operations.message_session(db, "sess-1234", "hello", wake=lambda kind: None)
+
+    def test_stop_ended_session_is_soft_failure(self, db: Any) -> None:
+        db.save_session("sess-1234", "claude", ["claude"])
+        db.update_session("sess-1234", status="completed")
+        assert operations.stop_session(db, "sess-1234") == {
+            "ok": False,
+            "error": "Session already completed",
+        }
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Unix sockets only")
+class TestControlMethods:
+    @pytest.fixture
+    async def served(self, data_dir: Path, db: Any):
+        woken: list[str] = []
+        server = ControlServer(data_dir)
+        for method, handler in operations.control_handlers(
+            data_dir, lambda: db, woken.append
+        ).items():
+            server.register(method, handler)
+        assert await server.start()
+        yield woken
+        await server.close()
+
+    @staticmethod
+    async def _call(data_dir: Path, method: str, params: dict[str, Any] | None = None) -> Any:
+        return await asyncio.to_thread(call_daemon, data_dir, method, params, 5.0)
+
+    async def test_autopilot_and_policy(
+        self, data_dir: Path, policy_file: Path, served: list[str]
+    ) -> None:
+        result = await self._call(data_dir, "autopilot.disable")
+        assert result["state"] == "paused"
+        assert operations.read_autopilot_state(data_dir) == AutopilotState.PAUSED
+
+        result = await self._call(data_dir, "policy.validate", {"path": str(policy_file)})
+        assert result["valid"] is True
+
+    async def test_session_message(self, data_dir: Path, db: Any, served: list[str]) -> None:
+        db.save_session("sess-1234", "claude", ["claude"])
+        db.update_session("sess-1234", status="running")
+        result = await self._call(
+            data_dir, "sessions.message", {"session_id": "sess-1234", "text": "hi"}
+        )
+        assert result["ok"] is True
+        assert served == [WAKE_DIRECTIVE]
+
+    async def test_refusals(self, data_dir: Path, served: list[str]) -> None:
+        with pytest.raises(ControlError, match="Session not found"):
+            await self._call(data_dir, "sessions.stop", {"session_id": "missing"})
+        with pytest.raises(ControlError, match="'session_id' is required"):
+            await self._call(data_dir, "sessions.pause", {})
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Unix sockets only")
+class TestCliThinClient:
+    async def test_autopilot_disable_uses_daemon(self, data_dir: Path) -> None:
+        calls: list[str] = []
+
+        async def disable(params: dict[str, Any]) -> dict[str, Any]:
+            calls.append("autopilot.disable")
+            return {"state": "paused", "changed": True, "message": "paused by daemon"}
+
+        server = ControlServer(data_dir)
+        server.register("autopilot.disable", disable)
+        assert await server.start()
+        try:
+            with patch("atlasbridge.core.config.atlasbridge_dir", return_value=data_dir):
+                result = await asyncio.to_thread(CliRunner().invoke, cli, ["autopilot", "disable"])
+        finally:
+            await server.close()
+        assert result.exit_code == 0, result.output
+        assert "paused by daemon" in result.output
+        assert calls == ["autopilot.disable"]
+        # The daemon owns the change; the CLI wrote nothing itself
+        assert operations.read_autopilot_state(data_dir) == AutopilotState.RUNNING
+
+    def test_autopilot_disable_without_daemon(self, data_dir: Path) -> None:
+        with patch("atlasbridge.core.config.atlasbridge_dir", return_value=data_dir):
+            result = CliRunner().invoke(cli, ["autopilot", "disable"])
+        assert result.exit_code == 0
+        assert "Autopilot paused" in result.output
+        assert json.loads((data_dir / "autopilot_state.json").read_text()) == {"state": "paused"}
@@ -0,0 +1,154 @@
+"""
+Unit tests for the daemon wake-up channel.
+
+Covers:
+- notify_daemon() wakes a listening WakeupListener for the matching kind only
+- notify_daemon() is a no-op when no daemon is listening
+- The directive and reply pollers inject as soon as they are woken, well
+  before the fallback poll interval
+- Reply-to-inject latency is recorded from the prompt's resolved_at
+"""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from atlasbridge.core.daemon import manager as manager_mod
+from atlasbridge.core.daemon.manager import DaemonManager
+from atlasbridge.core.daemon.wakeup import (
+    WAKE_DIRECTIVE,
+    WAKE_REPLY,
+    WakeupListener,
+    notify_daemon,
+    wake_socket_path,
+)
+
+# Far above the time a woken poller needs, so a pass cannot come from polling.
+_FALLBACK_S = 30.0
+
+
+@pytest.fixture
+def data_dir(tmp_path: Path) -> Path:
+    return tmp_path
+
+
+# ---------------------------------------------------------------------------
+# Listener / notifier
+# ---------------------------------------------------------------------------
+
+
+class TestWakeupChannel:
+    async def test_notify_wakes_matching_kind(self, data_dir: Path) -> None:
+        listener = WakeupListener(data_dir)
+        assert listener.start()
+        try:
+            assert notify_daemon(data_dir, WAKE_DIRECTIVE)
+            assert await listener.wait(WAKE_DIRECTIVE, timeout=1.0)
+            assert not await listener.wait(WAKE_REPLY, timeout=0.05)
+        finally:
+            listener.close()
+        assert not wake_socket_path(data_dir).exists()
+
+    async def test_signal_during_processing_is_not_lost(self, data_dir: Path) -> None:
+        listener = WakeupListener(data_dir)
+        assert listener.start()
+        try:
+            notify_daemon(data_dir, WAKE_REPLY)
+            assert await listener.wait(WAKE_REPLY, timeout=1.0)
+            notify_daemon(data_dir, WAKE_REPLY)
+            await asyncio.sleep(0.05)
+            assert await listener.wait(WAKE_REPLY, timeout=0)
+        finally:
+            listener.close()
+
+    async def test_start_replaces_stale_socket(self, data_dir: Path) -> None:
+        wake_socket_path(data_dir).write_text("")
+        listener = WakeupListener(data_dir)
+        assert listener.start()
+        listener.close()
+
+    def test_notify_without_listener(self, data_dir: Path) -> None:
+        assert not notify_daemon(data_dir, WAKE_REPLY)
+        assert not notify_daemon(data_dir, "unknown")
+
+
+# ---------------------------------------------------------------------------
+# Pollers
+# ---------------------------------------------------------------------------
+
+
+async def _run_until(manager: DaemonManager, coro, done: asyncio.Event) -> None:
+    task = asyncio.create_task(coro)
+    try:
+        await asyncio.wait_for(done.wait(), timeout=2.0)
+    finally:
+        manager._running = False
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        manager._wakeup.close()
+
+
+class TestPollerWakeup:
+    @pytest.fixture(autouse=True)
+    def _slow_fallback(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(manager_mod, "_DB_POLL_FALLBACK_S", _FALLBACK_S)
+
+    async def test_directive_injected_on_wakeup(self, data_dir: Path) -> None:
+        manager = DaemonManager({"data_dir": str(data_dir), "channels": {}})
+        manager._running = True
+        assert manager._wakeup.start()
+
+        injected = asyncio.Event()
+        adapter = MagicMock()
+        adapter.inject_reply = AsyncMock(side_effect=lambda **_: injected.set())
+        manager._adapters["sess-1"] = adapter
+        manager._db = MagicMock()
+        manager._db.list_pending_directives.side_effect = [
+            [{"id": "d1", "session_id": "sess-1", "content": "go on"}],
+            [],
+        ]
+
+        notify_daemon(data_dir, WAKE_DIRECTIVE)
+        await _run_until(manager, manager._db_directive_poller(), injected)
+
+        adapter.inject_reply.assert_awaited_once_with(
+            session_id="sess-1", value="go on", prompt_type="free_text"
+        )
+        manager._db.mark_directive_processed.assert_called_once_with("d1")
+
+    async def test_reply_injected_on_wakeup_and_latency_recorded(self, data_dir: Path) -> None:
+        manager = DaemonManager({"data_dir": str(data_dir), "channels": {}})
+        manager._running = True
+        assert manager._wakeup.start()
+
+        injected = asyncio.Event()
+        router = MagicMock()
+        router.inject_dashboard_reply = AsyncMock(side_effect=lambda **_: injected.set() or True)
+        manager._router = router
+        resolved_at = (datetime.now(UTC) - timedelta(milliseconds=20)).isoformat()
+        manager._db = MagicMock()
+        manager._db.list_reply_received.return_value = [
+            {
+                "id": "p1",
+                "session_id": "sess-1",
+                "response_normalized": "y",
+                "resolved_at": resolved_at,
+            }
+        ]
+
+        notify_daemon(data_dir, WAKE_REPLY)
+        await _run_until(manager, manager._db_reply_poller(), injected)
+
+        manager._db.update_prompt_status.assert_called_with("p1", "resolved")
+        assert manager._reply_latency_ms.count >= 1
+        assert manager._reply_latency_ms.total / manager._reply_latency_ms.count >= 20
+
+    def test_latency_skipped_without_resolved_at(self) -> None:
+        manager = DaemonManager({"channels": {}})
+        assert manager._observe_reply_latency({"resolved_at": None}) is None
+        assert manager._reply_latency_ms.count == 0
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
 import secrets
+import sqlite3
 import uuid
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
@@ -177,3 +179,191 @@ class TestAuditLog:
             db.append_audit_event(str(uuid.uuid4()), f"ev_{i}", {})
         events = db.get_recent_audit_events(limit=3)
         assert len(events) == 3
+
+    def test_seq_orders_chain_with_identical_timestamps(
+        self, db: Database, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        import atlasbridge.core.store.database as database_mod
+
+        frozen = datetime(2026, 1, 1, tzinfo=UTC)
+
+        class _FrozenDatetime(datetime):
+            @classmethod
+            def now(cls, tz: object = None) -> datetime:  # type: ignore[override]
+                return frozen
+
+        monkeypatch.setattr(database_mod, "datetime", _FrozenDatetime)
+        for i in range(20):
+            db.append_audit_event(f"e{i:02d}", "tick", {"i": i})
+
+        rows = db._db.execute(
+            "SELECT id, seq, prev_hash, hash FROM audit_events ORDER BY seq"
+        ).fetchall()
+        assert [r["id"] for r in rows] == [f"e{i:02d}" for i in range(20)]
+        assert [r["seq"] for r in rows] == list(range(1, 21))
+        for prev, cur in zip(rows, rows[1:], strict=False):
+            assert cur["prev_hash"] == prev["hash"]
+
+    def test_append_does_not_read_tail_after_first(self, db: Database) -> None:
+        db.append_audit_event("first", "ev", {})
+        statements: list[str] = []
+        db._db.set_trace_callback(statements.append)
+        try:
+            db.append_audit_event("second", "ev", {})
+        finally:
+            db._db.set_trace_callback(None)
+        assert not any(s.lstrip().upper().startswith("SELECT") for s in statements)
+
+    def test_tail_resumes_after_reconnect(self, tmp_path: Path) -> None:
+        path = tmp_path / "chain.db"
+        first = Database(path)
+        first.connect()
+        first.append_audit_event("a", "ev", {})
+        first.close()
+
+        second = Database(path)
+        second.connect()
+        second.append_audit_event("b", "ev", {})
+        rows = second.get_audit_events_filtered()
+        assert [r["seq"] for r in rows] == [1, 2]
+        assert rows[1]["prev_hash"] == rows[0]["hash"]
+        second.close()
+
+    def test_concurrent_writer_does_not_fork_chain(self, tmp_path: Path) -> None:
+        path = tmp_path / "chain.db"
+        a = Database(path)
+        b = Database(path)
+        a.connect()
+        b.connect()
+        a.append_audit_event("a1", "ev", {})
+        b.append_audit_event("b1", "ev", {})
+        a.append_audit_event("a2", "ev", {})  # stale cached tail → re-read and retry
+
+        rows = a.get_audit_events_filtered()
+        assert [r["id"] for r in rows] == ["a1", "b1", "a2"]
+        assert rows[2]["prev_hash"] == rows[1]["hash"]
+        a.close()
+        b.close()
+
+    def test_duplicate_event_id_raises(self, db: Database) -> None:
+        db.append_audit_event("dup", "ev", {})
+        with pytest.raises(sqlite3.IntegrityError):
+            db.append_audit_event("dup", "ev", {})
+        db.append_audit_event("next", "ev", {})
+        rows = db.get_audit_events_filtered()
+        assert [r["seq"] for r in rows] == [1, 2]
+
+
+# ---------------------------------------------------------------------------
+# Group commit
+# ---------------------------------------------------------------------------
+
+
+def _committed_count(path: Path, table: str) -> int:
+    """Row count as seen by a separate connection (committed rows only)."""
+    conn = sqlite3.connect(str(path))
+    try:
+        return conn.execute(f"SELECT count(*) FROM {table}").fetchone()[0]  # noqa: S608
+    finally:
+        conn.close()
+
+
+class TestGroupCommit:
+    @pytest.fixture
+    def gdb(self, tmp_path: Path) -> Database:
+        d = Database(tmp_path / "group.db", commit_delay=0.01, commit_batch_size=8)
+        d.connect()
+        yield d
+        d.close()
+
+    async def test_writes_commit_after_deadline(self, gdb: Database) -> None:
+        for i in range(3):
+            gdb.append_audit_event(f"e{i}", "ev", {})
+        # Visible on this connection, not yet to other readers
+        assert len(gdb.get_recent_audit_events()) == 3
+        assert _committed_count(gdb.path, "audit_events") == 0
+
+        await asyncio.sleep(0.05)
+        assert _committed_count(gdb.path, "audit_events") == 3
+        assert gdb.commit_stats.flushes == 1
+        assert gdb.commit_stats.writes == 3
+
+    async def test_flush_is_a_barrier(self, gdb: Database) -> None:
+        sid = _sid()
+        gdb.save_session(sid, "claude", ["claude"])
+        gdb.save_transcript_chunk(sid, "agent", "hello", seq=1)
+        gdb.flush()
+        assert _committed_count(gdb.path, "sessions") == 1
+        assert _committed_count(gdb.path, "transcript_chunks") == 1
+
+    async def test_batch_size_threshold_flushes(self, gdb: Database) -> None:
+        for i in range(8):
+            gdb.append_audit_event(f"e{i}", "ev", {})
+        assert _committed_count(gdb.path, "audit_events") == 8
+        snapshot = gdb.commit_stats.snapshot()
+        assert snapshot["batch_size"]["<=8"] == 1
+        assert sum(snapshot["flush_latency_ms"].values()) == 1
+
+    async def test_chain_stays_ordered_across_batches(self, gdb: Database) -> None:
+        for i in range(20):
+            gdb.append_audit_event(f"e{i:02d}", "ev", {"i": i})
+        gdb.flush()
+        rows = gdb.get_audit_events_filtered()
+        assert [r["id"] for r in rows] == [f"e{i:02d}" for i in range(20)]
+        for prev, cur in zip(rows, rows[1:], strict=False):
+            assert cur["prev_hash"] == prev["hash"]
+
+    async def test_rolled_back_append_does_not_fork_chain(self, tmp_path: Path) -> None:
+        d = Database(tmp_path / "rollback.db", commit_delay=10.0)
+        d.connect()
+        try:
+            d.append_audit_event("e0", "ev", {})
+            d.flush()
+            d.append_audit_event("lost", "ev", {})
+            d._db.rollback()
+            d.append_audit_event("e1", "ev", {})
+            d.flush()
+            rows = d.get_audit_events_filtered()
+            assert [(r["seq"], r["id"]) for r in rows] == [(1, "e0"), (2, "e1")]
+            assert rows[1]["prev_hash"] == rows[0]["hash"]
+        finally:
+            d.close()
+
+    async def test_decide_prompt_commits_immediately(self, gdb: Database) -> None:
+        sid = _sid()
+        gdb.save_session(sid, "claude", ["claude"])
+        gdb.save_prompt("p1", sid, "yes_no", "high", "Continue?", "n1", _expires_at())
+        assert gdb.decide_prompt("p1", "reply_received", "tg:1", "y", "n1") == 1
+        assert _committed_count(gdb.path, "prompts") == 1
+
+    def test_without_running_loop_commits_synchronously(self, tmp_path: Path) -> None:
+        d = Database(tmp_path / "sync.db", commit_delay=1.0)
+        d.connect()
+        d.append_audit_event("e1", "ev", {})
+        assert _committed_count(d.path, "audit_events") == 1
+        d.close()
+
+    async def test_close_flushes_pending_writes(self, tmp_path: Path) -> None:
+        d = Database(tmp_path / "close.db", commit_delay=10.0)
+        d.connect()
+        d.append_audit_event("e1", "ev", {})
+        d.close()
+        assert _committed_count(tmp_path / "close.db", "audit_events") == 1
+
+    async def test_commit_listener_sees_committed_streams(self, gdb: Database) -> None:
+        seen: list[frozenset[str]] = []
+        gdb.add_commit_listener(seen.append)
+        sid = _sid()
+        gdb.save_session(sid, "claude", ["claude"])
+        gdb.append_audit_event("e1", "ev", {}, session_id=sid)
+        gdb.save_transcript_chunk(sid, "agent", "hello", seq=1)
+        assert seen == []  # not committed yet
+
+        gdb.flush()
+        assert seen == [frozenset({"audit", "transcript"})]
+        # Only after the rows are visible to other connections
+        assert _committed_count(gdb.path, "audit_events") == 1
+
+        gdb.save_session(_sid(), "claude", ["claude"])
+        gdb.flush()
+        assert len(seen) == 1  # sessions are not a change stream
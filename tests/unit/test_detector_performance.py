@@ -6,6 +6,7 @@ Acceptance criteria (#67):
    (CI threshold: 100ms to tolerate shared-runner variability)
 3. Pre-compiled regex patterns (no runtime compilation in hot path)
 4. Benchmark results documented
+5. Throughput (MB/s) of the compiled scanner over build-log floods
 """
 
 from __future__ import annotations
@@ -16,13 +17,20 @@ import time
 
 import pytest
 
-from atlasbridge.core.prompt.detector import (
-    _CONFIRM_ENTER_PATTERNS,
-    _FREE_TEXT_PATTERNS,
-    _MULTIPLE_CHOICE_PATTERNS,
-    _YES_NO_PATTERNS,
-    PromptDetector,
-)
+from atlasbridge.adapters.gemini_cli import GeminiPromptDetector
+from atlasbridge.adapters.openai_cli import OpenAIPromptDetector
+from atlasbridge.core.prompt.detector import GENERIC_SCANNER, PromptDetector
+from atlasbridge.core.prompt.models import PromptType
+from atlasbridge.core.prompt.scanner import _AnchorProbe
+
+
+def _throughput_mb_s(detector: PromptDetector, data: bytes, read_size: int = 4096) -> float:
+    """Feed *data* in PTY-sized reads so every byte is actually scanned."""
+    start = time.perf_counter()
+    for i in range(0, len(data), read_size):
+        detector.analyse(data[i : i + read_size])
+    elapsed = time.perf_counter() - start
+    return len(data) / elapsed / 1_000_000
 
 
 @pytest.mark.performance
@@ -188,36 +196,93 @@ class TestFloodLatency:
 class TestPreCompiledPatterns:
     """Verify regex patterns are pre-compiled (not compiled at runtime)."""
 
-    def test_yes_no_patterns_are_compiled(self):
-        for i, pat in enumerate(_YES_NO_PATTERNS):
-            assert isinstance(pat, re.Pattern), (
-                f"YES_NO pattern {i} is {type(pat).__name__}, not compiled"
-            )
-
-    def test_confirm_enter_patterns_are_compiled(self):
-        for i, pat in enumerate(_CONFIRM_ENTER_PATTERNS):
-            assert isinstance(pat, re.Pattern), (
-                f"CONFIRM_ENTER pattern {i} is {type(pat).__name__}, not compiled"
-            )
-
-    def test_multiple_choice_patterns_are_compiled(self):
-        for i, pat in enumerate(_MULTIPLE_CHOICE_PATTERNS):
-            assert isinstance(pat, re.Pattern), (
-                f"MULTIPLE_CHOICE pattern {i} is {type(pat).__name__}, not compiled"
-            )
-
-    def test_free_text_patterns_are_compiled(self):
-        for i, pat in enumerate(_FREE_TEXT_PATTERNS):
+    @pytest.mark.parametrize("tier", GENERIC_SCANNER.tiers, ids=lambda t: t.prompt_type.value)
+    def test_tier_patterns_are_compiled(self, tier):
+        for i, pat in enumerate(tier.patterns):
             assert isinstance(pat, re.Pattern), (
-                f"FREE_TEXT pattern {i} is {type(pat).__name__}, not compiled"
+                f"{tier.prompt_type.value} pattern {i} is {type(pat).__name__}, not compiled"
             )
 
     def test_total_pattern_count(self):
         """Verify expected number of patterns (detect regressions)."""
-        total = (
-            len(_YES_NO_PATTERNS)
-            + len(_CONFIRM_ENTER_PATTERNS)
-            + len(_MULTIPLE_CHOICE_PATTERNS)
-            + len(_FREE_TEXT_PATTERNS)
-        )
+        total = sum(len(tier.rules) for tier in GENERIC_SCANNER.tiers)
         assert total == 16, f"Expected 16 pre-compiled patterns, got {total}"
+
+
+@pytest.mark.performance
+class TestScannerThroughput:
+    """Throughput of the compiled, prefiltered scanner in MB/s.
+
+    Data is fed in 4 KiB reads (the PTY read size), so every byte passes
+    through the scanner — oversized single chunks would be clipped to
+    SCAN_WINDOW_BYTES and overstate throughput.
+
+    Reference numbers (local dev, CPython 3.11, 4 KiB reads):
+      INFO log           ~8 MB/s    (per-pattern scan: ~1.7 MB/s)
+      ANSI-colored log   ~10 MB/s
+      pytest output      ~7.5 MB/s
+
+    CI floors are set well below these to tolerate shared runners.
+    """
+
+    LOG_CHUNK = b"2025-01-15T10:00:00 INFO  processing item 12345 of 99999\r\n" * 1000
+    ANSI_CHUNK = (
+        b"\x1b[36m2025-01-15T10:00:00\x1b[0m \x1b[32mINFO\x1b[0m processing \x1b[1mitem\x1b[0m\r\n"
+    ) * 1000
+    PYTEST_CHUNK = b"tests/unit/test_x.py::TestFoo::test_bar PASSED   [ 45%]\r\n" * 1000
+
+    @pytest.mark.parametrize("chunk", [LOG_CHUNK, ANSI_CHUNK, PYTEST_CHUNK])
+    def test_generic_detector_throughput(self, chunk):
+        mb_s = _throughput_mb_s(PromptDetector(session_id="tput"), chunk)
+        assert mb_s > 3.0, f"generic detector throughput {mb_s:.1f} MB/s below 3 MB/s floor"
+
+    @pytest.mark.parametrize("cls", [GeminiPromptDetector, OpenAIPromptDetector])
+    def test_adapter_detector_throughput(self, cls):
+        mb_s = _throughput_mb_s(cls(session_id="tput"), self.LOG_CHUNK)
+        assert mb_s > 2.0, f"{cls.__name__} throughput {mb_s:.1f} MB/s below 2 MB/s floor"
+
+
+@pytest.mark.performance
+class TestCompiledScanner:
+    """The shared scanner keeps the generic priority order for every detector."""
+
+    def test_generic_tier_order(self):
+        assert [t.prompt_type for t in GENERIC_SCANNER.tiers] == [
+            PromptType.TYPE_YES_NO,
+            PromptType.TYPE_CONFIRM_ENTER,
+            PromptType.TYPE_MULTIPLE_CHOICE,
+            PromptType.TYPE_FREE_TEXT,
+        ]
+
+    @pytest.mark.parametrize("cls", [GeminiPromptDetector, OpenAIPromptDetector])
+    def test_adapter_scanners_extend_generic(self, cls):
+        n = len(GENERIC_SCANNER.tiers)
+        assert cls.scanner.tiers[:n] == GENERIC_SCANNER.tiers
+        assert len(cls.scanner.tiers) > n
+
+    @pytest.mark.parametrize("cls", [GeminiPromptDetector, OpenAIPromptDetector])
+    def test_adapter_anchors_prune_ordinary_output(self, cls):
+        """Everyday log text must not admit adapter-specific regexes."""
+        probe = _AnchorProbe("1. what changed? 2. build: ok. Enter the dir, see docs.\n")
+        n = len(GENERIC_SCANNER.tiers)
+        admitted = [
+            rule.pattern.pattern
+            for tier in cls.scanner.tiers[n:]
+            for rule in tier.rules
+            if probe.admits(rule)
+        ]
+        assert admitted == []
+
+    def test_higher_tier_wins_regardless_of_position(self):
+        """A yes/no prompt later in the chunk beats an earlier free-text match."""
+        det = PromptDetector(session_id="prio")
+        event = det.analyse(b"Enter your name:\nOverwrite config? [y/N]")
+        assert event is not None
+        assert event.prompt_type == PromptType.TYPE_YES_NO
+
+    def test_anchor_prefilter_honours_ignorecase_folding(self):
+        """Unicode case variants that re.IGNORECASE accepts are not prefiltered out."""
+        det = PromptDetector(session_id="fold")
+        event = det.analyse("PRE\u017fS ENTER TO CONTINUE".encode())
+        assert event is not None
+        assert event.prompt_type == PromptType.TYPE_CONFIRM_ENTER
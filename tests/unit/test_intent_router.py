@@ -261,6 +261,13 @@ class TestIntentRouter:
         await intent_router.expire_overdue()
         mock_router.expire_overdue.assert_awaited_once()
 
+    @pytest.mark.asyncio
+    async def test_wait_for_expiry_delegates(self) -> None:
+        mock_router = AsyncMock()
+        intent_router = IntentRouter(prompt_router=mock_router)
+        await intent_router.wait_for_expiry(30.0)
+        mock_router.wait_for_expiry.assert_awaited_once_with(30.0)
+
 
 # ---------------------------------------------------------------------------
 # TestIntentRouterWithPolicy — end-to-end with real policy
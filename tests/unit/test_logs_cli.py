@@ -128,7 +128,9 @@ class TestCmdLogs:
             ),
         ]
         mock_db = MagicMock()
-        mock_db.get_recent_audit_events.return_value = rows
+        mock_db.get_recent_audit_events.side_effect = lambda limit, session_id=None: [
+            r for r in rows if session_id is None or r["session_id"] == session_id
+        ]
 
         with (
             patch("atlasbridge.core.config.load_config") as mock_cfg,
@@ -140,6 +142,7 @@ class TestCmdLogs:
         assert "prompt_created" in output
         # sess999 row should be filtered out
         assert "reply_received" not in output
+        mock_db.get_recent_audit_events.assert_called_once_with(limit=50, session_id="sess001")
 
     def test_json_output(self, tmp_path, capsys):
         from atlasbridge.cli._logs import cmd_logs
@@ -184,3 +187,82 @@ class TestCmdLogs:
         captured = capsys.readouterr()
         data = json.loads(captured.out)
         assert data == []
+
+
+class TestSessionPrefix:
+    def _db(self, tmp_path):
+        from atlasbridge.core.store.database import Database
+
+        db = Database(tmp_path / "logs.db")
+        db.connect()
+        for sid in ("aaaa1111", "aaaa2222", "bbbb3333"):
+            db.save_session(sid, "claude", [])
+        return db
+
+    def test_prefix_resolves_to_one_session(self, tmp_path):
+        from atlasbridge.cli._logs import _resolve_session
+
+        db = self._db(tmp_path)
+        console, _ = _make_console()
+        assert _resolve_session(db, "bbbb", console) == "bbbb3333"
+        assert _resolve_session(db, "", console) == ""
+        assert _resolve_session(db, "gone-session", console) == "gone-session"
+        db.close()
+
+    def test_ambiguous_prefix_stops(self, tmp_path):
+        from atlasbridge.cli._logs import _resolve_session
+
+        db = self._db(tmp_path)
+        console, buf = _make_console()
+        assert _resolve_session(db, "aaaa", console) is None
+        assert "Ambiguous" in buf.getvalue()
+        db.close()
+
+
+class TestFollow:
+    def _db(self, tmp_path, events: int):
+        from atlasbridge.core.store.database import Database
+
+        db = Database(tmp_path / "follow.db")
+        db.connect()
+        for i in range(events):
+            db.append_audit_event(f"evt{i}", "ev", {}, session_id="s1" if i % 2 else "s2")
+        return db
+
+    def test_emit_after_reads_only_past_cursor(self, tmp_path):
+        from atlasbridge.cli import _logs
+
+        db = self._db(tmp_path, 7)
+        batches: list[list[str]] = []
+        with patch.object(_logs, "_READ_BATCH", 2):
+            cursor = _logs._emit_after(
+                db, "s1", 2, lambda events: batches.append([e["id"] for e in events])
+            )
+        assert batches == [["evt3", "evt5"]]
+        assert cursor == 6
+        assert _logs._emit_after(db, "s1", cursor, batches.append) == 6
+        assert len(batches) == 1
+        db.close()
+
+    async def test_follow_without_daemon_polls_from_cursor(self, tmp_path):
+        import asyncio
+
+        from atlasbridge.cli._logs import _follow
+
+        db = self._db(tmp_path, 3)
+        seen: list[str] = []
+
+        def emit(events):
+            seen.extend(e["id"] for e in events)
+
+        task = asyncio.create_task(_follow(db, None, 3, emit, poll_interval=0.01))
+        await asyncio.sleep(0.05)
+        assert seen == []
+        db.append_audit_event("evt3", "ev", {})
+        for _ in range(100):
+            if seen:
+                break
+            await asyncio.sleep(0.01)
+        task.cancel()
+        assert seen == ["evt3"]
+        db.close()
@@ -404,6 +404,77 @@ class TestCRUDAfterMigration:
         db.close()
 
 
+class TestAuditSeqMigration:
+    def test_existing_events_backfilled_in_chain_order(self, tmp_path: Path) -> None:
+        db_path = tmp_path / "v9.db"
+        conn = sqlite3.connect(str(db_path))
+        run_migrations(conn, db_path)
+        for index in ("idx_audit_seq", "idx_audit_session_seq", "idx_audit_event_type_seq"):
+            conn.execute(f"DROP INDEX {index}")
+        conn.execute("ALTER TABLE audit_events DROP COLUMN seq")
+        conn.execute("PRAGMA user_version = 9")
+        for event_id, ts in (("b", "2025-01-01T00:00:01"), ("a", "2025-01-01T00:00:00")):
+            conn.execute(
+                "INSERT INTO audit_events (id, event_type, timestamp) VALUES (?, 'ev', ?)",
+                (event_id, ts),
+            )
+        conn.commit()
+        conn.close()
+
+        db = Database(db_path)
+        db.connect()
+        rows = db._db.execute("SELECT id, seq FROM audit_events ORDER BY seq").fetchall()
+        assert [(r["id"], r["seq"]) for r in rows] == [("a", 1), ("b", 2)]
+
+        db.append_audit_event("c", "ev", {})
+        last = db.get_recent_audit_events(limit=1)[0]
+        assert last["seq"] == 3
+        db.close()
+
+
+class TestAuditIndexesMigration:
+    def test_v10_db_gets_session_and_type_indexes(self, tmp_path: Path) -> None:
+        db_path = tmp_path / "v10.db"
+        conn = sqlite3.connect(str(db_path))
+        run_migrations(conn, db_path)
+        conn.execute("DROP INDEX idx_audit_session_seq")
+        conn.execute("DROP INDEX idx_audit_event_type_seq")
+        conn.execute("PRAGMA user_version = 10")
+        conn.commit()
+        conn.close()
+
+        db = Database(db_path)
+        db.connect()
+        indexes = {
+            r["name"] for r in db._db.execute("SELECT name FROM sqlite_master WHERE type = 'index'")
+        }
+        assert {"idx_audit_session_seq", "idx_audit_event_type_seq"} <= indexes
+        db.close()
+
+    @pytest.mark.parametrize(
+        ("sql", "index"),
+        [
+            (
+                "SELECT * FROM audit_events WHERE session_id = ? ORDER BY seq DESC LIMIT 5",
+                "idx_audit_session_seq",
+            ),
+            (
+                "SELECT * FROM audit_events WHERE event_type = ? ORDER BY seq LIMIT 5",
+                "idx_audit_event_type_seq",
+            ),
+        ],
+    )
+    def test_scoped_queries_use_index_without_sort(
+        self, tmp_path: Path, sql: str, index: str
+    ) -> None:
+        db = Database(tmp_path / "plan.db")
+        db.connect()
+        plan = " ".join(r["detail"] for r in db._db.execute(f"EXPLAIN QUERY PLAN {sql}", ("x",)))
+        assert index in plan
+        assert "TEMP B-TREE" not in plan
+        db.close()
+
+
 # ---------------------------------------------------------------------------
 # Tests: run_migrations directly
 # ---------------------------------------------------------------------------
@@ -434,3 +505,26 @@ class TestRunMigrationsDirect:
         v2 = get_user_version(conn)
         assert v1 == v2 == LATEST_SCHEMA_VERSION
         conn.close()
+
+
+class TestSearchIndexMigration:
+    def test_v11_db_is_backfilled(self, tmp_path: Path) -> None:
+        db_path = tmp_path / "v11.db"
+        db = Database(db_path)
+        db.connect()
+        db.save_session("sess-1", "claude", ["claude"])
+        db.save_transcript_chunk("sess-1", "agent", "rebuilding the widget cache", seq=1)
+        db.close()
+        conn = sqlite3.connect(str(db_path))
+        conn.execute("DROP TABLE search_index")
+        conn.execute("PRAGMA user_version = 11")
+        conn.commit()
+        conn.close()
+
+        db = Database(db_path)
+        db.connect()
+        assert get_user_version(db._db) == LATEST_SCHEMA_VERSION
+        hits, total = db.search("widget")
+        assert total == 1
+        assert hits[0].session_id == "sess-1"
+        db.close()
@@ -15,7 +15,8 @@ from atlasbridge.core.interaction.output_forwarder import (
     MAX_OUTPUT_CHARS,
     OutputForwarder,
 )
-from atlasbridge.core.security.redactor import SecretRedactor
+from atlasbridge.core.prompt.sanitize import OutputPipeline
+from atlasbridge.core.security.redactor import SecretRedactor, StreamingRedactor
 
 
 def _make_channel() -> MagicMock:
@@ -303,6 +304,33 @@ class TestSecretRedaction:
         sent = ch.send_output_editable.call_args[0][0]
         assert "sk-ABCD" in sent
 
+    @pytest.mark.asyncio
+    async def test_pipeline_redacts_secret_split_across_reads(self) -> None:
+        ch = _make_channel()
+        fwd = OutputForwarder(ch, "sess-001")
+        pipeline = OutputPipeline(redactor=StreamingRedactor(SecretRedactor()))
+        pipeline.subscribe(fwd.feed_chunk)
+        pipeline.feed(b"Exporting credentials... OPENAI_KEY sk-ABCDEFGHIJ")
+        pipeline.feed(b"KLMNOPQRSTuvwxyz1234567890xx\n")
+        pipeline.flush()
+        await fwd._flush()
+        sent = ch.send_output_editable.call_args[0][0]
+        assert "[REDACTED]" in sent
+        assert "KLMNOP" not in sent
+        assert "Exporting credentials" in sent
+
+    @pytest.mark.asyncio
+    async def test_pipeline_redaction_disabled_via_config(self) -> None:
+        ch = _make_channel()
+        cfg = StreamingConfig(redact_secrets=False)
+        fwd = OutputForwarder(ch, "sess-001", streaming_config=cfg)
+        pipeline = OutputPipeline(redactor=StreamingRedactor(SecretRedactor()))
+        pipeline.subscribe(fwd.feed_chunk)
+        pipeline.feed(b"Token: sk-ABCDEFGHIJKLMNOPQRSTuvwxyz1234567890xx\n")
+        await fwd._flush()
+        sent = ch.send_output_editable.call_args[0][0]
+        assert "sk-ABCD" in sent
+
 
 class TestMessageEditing:
     @pytest.mark.asyncio
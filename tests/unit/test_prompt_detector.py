@@ -9,9 +9,12 @@ import pytest
 from atlasbridge.core.prompt.detector import (
     CONTENT_DEDUP_WINDOW_S,
     ECHO_SUPPRESS_MS,
+    SCAN_WINDOW_BYTES,
+    TAIL_WINDOW_CHARS,
     PromptDetector,
 )
-from atlasbridge.core.prompt.models import Confidence, PromptType
+from atlasbridge.core.prompt.models import Confidence, PromptEvent, PromptType
+from atlasbridge.core.prompt.sanitize import SanitizedChunk
 
 SESSION = "test-session-abc123"
 
@@ -395,3 +398,131 @@ class TestContentDedup:
         assert d._state.stable_excerpt != ""
         d.mark_injected()
         assert d._state.stable_excerpt == ""
+
+
+# ---------------------------------------------------------------------------
+# Incremental scanning — decoder state and bounded tail across chunks
+# ---------------------------------------------------------------------------
+
+
+class TestIncrementalScanning:
+    def test_utf8_split_across_chunks(self, detector: PromptDetector) -> None:
+        data = "Überschreiben? [y/N]".encode()
+        assert detector.analyse(data[:1]) is None
+        event = detector.analyse(data[1:])
+        assert event is not None
+        assert event.prompt_type == PromptType.TYPE_YES_NO
+        assert "\ufffd" not in event.excerpt
+
+    def test_ansi_split_across_chunks(self, detector: PromptDetector) -> None:
+        assert detector.analyse(b"Delete all files? \x1b[3") is None
+        event = detector.analyse(b"1m[y/N]\x1b[0m")
+        assert event is not None
+        assert event.prompt_type == PromptType.TYPE_YES_NO
+        assert "1m" not in event.excerpt
+
+    def test_menu_completed_by_later_chunk(self) -> None:
+        d = PromptDetector(session_id="tail-menu")
+        assert d.analyse(b"Do you trust the files in this folder?\n") is None
+        event = d.analyse("❯ 1. Yes, trust this folder".encode())
+        assert event is not None
+        assert event.prompt_type == PromptType.TYPE_MULTIPLE_CHOICE
+
+    def test_old_menu_not_redetected_by_unrelated_output(self) -> None:
+        d = PromptDetector(session_id="tail-stale")
+        menu = b"Choose an option:\n1) Install\n2) Update\n3) Remove\n"
+        assert d.analyse(menu) is not None
+        assert d.analyse(b"Working on it...\n") is None
+
+    def test_items_split_by_unrelated_output_are_not_a_menu(self) -> None:
+        """Numbered log lines separated by other output must not form a menu."""
+        d = PromptDetector(session_id="tail-split")
+        assert d.analyse(b"1. Reading files\n") is None
+        assert d.analyse(b"Compiling module foo\n") is None
+        assert d.analyse(b"2. Writing output\n") is None
+
+    def test_menu_items_in_separate_chunks(self) -> None:
+        d = PromptDetector(session_id="tail-items")
+        assert d.analyse(b"Pick a mode:\n") is None
+        assert d.analyse(b"1. Fast\n") is None
+        event = d.analyse(b"2. Safe\n")
+        assert event is not None
+        assert event.prompt_type == PromptType.TYPE_MULTIPLE_CHOICE
+
+    def test_menu_reads_without_trailing_newline(self) -> None:
+        """Chunks join on a newline, so an item read after the question starts a line."""
+        d = PromptDetector(session_id="tail-join")
+        assert d.analyse(b"Pick a mode:") is None
+        assert d.analyse(b"1. Fast") is None
+        event = d.analyse(b"2. Safe")
+        assert event is not None
+        assert event.prompt_type == PromptType.TYPE_MULTIPLE_CHOICE
+        assert d._state.tail == "Pick a mode:\n1. Fast\n2. Safe"
+
+    def test_decoded_chunk_window_counts_bytes(self) -> None:
+        d = PromptDetector(session_id="chunk-bytes")
+        scanned: list[str] = []
+        analyse_text = d._analyse_text
+
+        def spy(text: str, meaningful: bool, tty_blocked: bool) -> PromptEvent | None:
+            scanned.append(text)
+            return analyse_text(text, meaningful, tty_blocked)
+
+        d._analyse_text = spy  # type: ignore[method-assign]
+        event = d.analyse_chunk(
+            SanitizedChunk.from_bytes(("é" * SCAN_WINDOW_BYTES + "Overwrite? [y/N]").encode())
+        )
+        assert event is not None
+        assert event.prompt_type == PromptType.TYPE_YES_NO
+        assert len(scanned[0].encode()) <= SCAN_WINDOW_BYTES
+        assert "\ufffd" not in scanned[0]
+
+    def test_oversized_chunk_keeps_tail(self) -> None:
+        d = PromptDetector(session_id="tail-clip")
+        assert d.analyse(b"Do you trust the files in this folder?\n") is None
+        event = d.analyse(b"#" * (SCAN_WINDOW_BYTES * 2) + "\n❯ 1. Yes, trust".encode())
+        assert event is not None
+        assert event.prompt_type == PromptType.TYPE_MULTIPLE_CHOICE
+
+    def test_oversized_chunk_clipped_at_safe_boundary(self, detector: PromptDetector) -> None:
+        line = b"\x1b[38;5;12mcolored output line\x1b[0m\n"
+        chunk = line * (SCAN_WINDOW_BYTES // len(line) + 50)
+        for offset in range(len(line)):
+            detector.analyse(chunk[offset:])
+            assert "38;5" not in detector._state.tail
+            assert "[0m" not in detector._state.tail
+
+    def test_tail_is_bounded(self, detector: PromptDetector) -> None:
+        for _ in range(50):
+            detector.analyse(b"output line " * 100)
+        assert len(detector._state.tail) <= TAIL_WINDOW_CHARS
+
+    def test_prompt_at_end_of_oversized_chunk(self, detector: PromptDetector) -> None:
+        chunk = b"log line\n" * 100_000 + b"Overwrite config? [y/N]"
+        assert len(chunk) > SCAN_WINDOW_BYTES
+        event = detector.analyse(chunk)
+        assert event is not None
+        assert event.prompt_type == PromptType.TYPE_YES_NO
+
+    def test_oversized_chunk_cost_is_constant(self) -> None:
+        small = PromptDetector(session_id="small")
+        large = PromptDetector(session_id="large")
+        small_chunk = b"x" * SCAN_WINDOW_BYTES
+        large_chunk = b"x" * (SCAN_WINDOW_BYTES * 256)
+
+        def best_of(det: PromptDetector, chunk: bytes) -> float:
+            times = []
+            for _ in range(20):
+                start = time.perf_counter()
+                det.analyse(chunk)
+                times.append(time.perf_counter() - start)
+            return min(times)
+
+        # A 1 MiB chunk must not cost ~256x a 4 KiB one; allow slicing overhead.
+        assert best_of(large, large_chunk) < best_of(small, small_chunk) * 20
+
+    def test_injection_clears_tail(self) -> None:
+        d = PromptDetector(session_id="tail-clear")
+        d.analyse(b"Do you trust the files in this folder?\n")
+        d.mark_injected()
+        assert d._state.tail == ""
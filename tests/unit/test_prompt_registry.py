@@ -0,0 +1,157 @@
+"""Unit tests for atlasbridge.core.prompt.registry — live/retired prompts and deadline heap."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from atlasbridge.core.prompt.models import Confidence, PromptEvent, PromptStatus, PromptType
+from atlasbridge.core.prompt.registry import PromptRegistry
+from atlasbridge.core.prompt.state import PromptStateMachine
+
+
+def _machine(ttl_seconds: int = 300) -> PromptStateMachine:
+    sm = PromptStateMachine(
+        event=PromptEvent.create(
+            session_id="test-session",
+            prompt_type=PromptType.TYPE_YES_NO,
+            confidence=Confidence.HIGH,
+            excerpt="Continue?",
+            ttl_seconds=ttl_seconds,
+        )
+    )
+    sm.transition(PromptStatus.ROUTED)
+    sm.transition(PromptStatus.AWAITING_REPLY)
+    return sm
+
+
+def _resolve(sm: PromptStateMachine) -> None:
+    sm.transition(PromptStatus.REPLY_RECEIVED)
+    sm.transition(PromptStatus.INJECTED)
+    sm.transition(PromptStatus.RESOLVED)
+
+
+def _overdue(sm: PromptStateMachine, seconds: float = 1.0) -> PromptStateMachine:
+    sm.expires_at = datetime.now(UTC) - timedelta(seconds=seconds)
+    return sm
+
+
+class TestRetirement:
+    def test_resolved_machine_leaves_live_set(self) -> None:
+        registry = PromptRegistry()
+        sm = _machine()
+        registry.add(sm)
+        assert registry.live_count == 1
+
+        _resolve(sm)
+        assert registry.live_count == 0
+        assert registry.get(sm.event.prompt_id) is sm  # duplicate replies still recognised
+        assert list(registry.live()) == []
+
+    def test_retired_machines_are_bounded(self) -> None:
+        registry = PromptRegistry(retired_max=3)
+        machines = [_machine() for _ in range(5)]
+        for sm in machines:
+            registry.add(sm)
+            _resolve(sm)
+        assert len(registry) == 3
+        assert machines[0].event.prompt_id not in registry
+        assert machines[4].event.prompt_id in registry
+
+    def test_lookup_refreshes_retired_entry(self) -> None:
+        registry = PromptRegistry(retired_max=2)
+        a, b, c = _machine(), _machine(), _machine()
+        for sm in (a, b):
+            registry.add(sm)
+            _resolve(sm)
+        registry.get(a.event.prompt_id)
+        registry.add(c)
+        _resolve(c)
+        assert a.event.prompt_id in registry
+        assert b.event.prompt_id not in registry
+
+    def test_terminal_machine_is_retired_on_add(self) -> None:
+        registry = PromptRegistry()
+        sm = _machine()
+        _resolve(sm)
+        registry[sm.event.prompt_id] = sm
+        assert registry.live_count == 0
+        assert registry[sm.event.prompt_id] is sm
+        assert registry.next_deadline() is None
+
+    def test_existing_on_transition_still_called(self) -> None:
+        seen: list[PromptStatus] = []
+        sm = _machine()
+        sm.on_transition = lambda old, new: seen.append(new)
+        PromptRegistry().add(sm)
+        _resolve(sm)
+        assert seen[-1] == PromptStatus.RESOLVED
+
+    def test_key_must_match_prompt_id(self) -> None:
+        with pytest.raises(ValueError):
+            PromptRegistry()["other"] = _machine()
+
+
+class TestExpiry:
+    def test_only_due_machines_expire(self) -> None:
+        registry = PromptRegistry()
+        due, later = _overdue(_machine()), _machine()
+        registry.add(later)
+        registry.add(due)
+
+        assert registry.expire_due() == [due]
+        assert due.status == PromptStatus.EXPIRED
+        assert later.status == PromptStatus.AWAITING_REPLY
+        assert registry.next_deadline() == later.expires_at
+        assert registry.expire_due() == []
+
+    def test_expires_in_deadline_order(self) -> None:
+        registry = PromptRegistry()
+        machines = [_overdue(_machine(), seconds=s) for s in (1, 3, 2)]
+        for sm in machines:
+            registry.add(sm)
+        assert registry.expire_due() == [machines[1], machines[2], machines[0]]
+        assert registry.live_count == 0
+
+    def test_resolved_machine_is_not_expired(self) -> None:
+        registry = PromptRegistry()
+        sm = _overdue(_machine())
+        registry.add(sm)
+        _resolve(sm)
+        assert registry.next_deadline() is None
+        assert registry.expire_due() == []
+        assert sm.status == PromptStatus.RESOLVED
+
+    def test_reschedule_moves_deadline(self) -> None:
+        registry = PromptRegistry()
+        sm = _machine()
+        registry.add(sm)
+        assert registry.expire_due() == []
+        registry.reschedule(_overdue(sm))
+        assert registry.expire_due() == [sm]
+
+    def test_forced_expiry_is_retired(self) -> None:
+        registry = PromptRegistry()
+        sm = _overdue(_machine())
+        registry.add(sm)
+        sm.transition(PromptStatus.REPLY_RECEIVED)
+        assert sm.expire_if_due()  # forced: no transition callback
+        assert registry.next_deadline() is None
+        assert registry.live_count == 0
+
+    def test_earlier_deadline_notifies(self) -> None:
+        calls: list[None] = []
+        registry = PromptRegistry(on_earlier_deadline=lambda: calls.append(None))
+        registry.add(_machine(ttl_seconds=300))
+        registry.add(_machine(ttl_seconds=600))
+        registry.add(_machine(ttl_seconds=60))
+        assert len(calls) == 2
+
+    def test_stale_heap_entries_are_compacted(self) -> None:
+        registry = PromptRegistry()
+        for _ in range(500):
+            sm = _machine()
+            registry.add(sm)
+            _resolve(sm)
+        assert len(registry._deadlines) <= 2 * registry.live_count + 65
@@ -0,0 +1,124 @@
+"""
+Unit tests for PtyStream — the add_reader-based PTY master reader/writer.
+
+Covers:
+- Chunks written by the child side are delivered in order
+- Reads pause above the high-water mark and resume below the low-water mark
+- Closing the slave end (child exit) is reported as b"" after buffered output
+- Writes reach the slave end
+- MacOSTTY/LinuxTTY read and inject without touching the default executor
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import sys
+from collections.abc import Iterator
+
+import pytest
+
+from atlasbridge.os.tty.stream import PtyStream
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="POSIX PTY only")
+
+
+@pytest.fixture
+def pty_pair() -> Iterator[tuple[int, int]]:
+    master, slave = os.openpty()
+    try:
+        yield master, slave
+    finally:
+        for fd in (master, slave):
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+
+
+async def _read_n(stream: PtyStream, n: int) -> bytes:
+    data = b""
+    while len(data) < n:
+        chunk = await asyncio.wait_for(stream.read(), timeout=2.0)
+        assert chunk, "unexpected EOF"
+        data += chunk
+    return data
+
+
+class TestPtyStream:
+    async def test_reads_child_output(self, pty_pair: tuple[int, int]) -> None:
+        master, slave = pty_pair
+        stream = PtyStream(master)
+        stream.start()
+        os.write(slave, b"hello")
+        assert await _read_n(stream, 5) == b"hello"
+        os.write(slave, b"again")
+        assert await _read_n(stream, 5) == b"again"
+        stream.close()
+
+    async def test_backpressure_pauses_and_resumes(self, pty_pair: tuple[int, int]) -> None:
+        master, slave = pty_pair
+        stream = PtyStream(master, read_size=64, high_water=128, low_water=32)
+        stream.start()
+        os.write(slave, b"x" * 512)
+        for _ in range(50):
+            await asyncio.sleep(0.01)
+            if stream.paused:
+                break
+        assert stream.paused
+        assert 128 <= stream.buffered < 512
+
+        data = await _read_n(stream, 512)
+        assert data == b"x" * 512
+        assert not stream.paused
+        stream.close()
+
+    async def test_slave_close_is_eof_after_buffered_output(
+        self, pty_pair: tuple[int, int]
+    ) -> None:
+        master, slave = pty_pair
+        stream = PtyStream(master)
+        stream.start()
+        os.write(slave, b"bye")
+        assert await _read_n(stream, 3) == b"bye"
+        os.close(slave)
+        assert await asyncio.wait_for(stream.read(), timeout=2.0) == b""
+        assert stream.at_eof
+
+    async def test_write_reaches_slave(self, pty_pair: tuple[int, int]) -> None:
+        master, slave = pty_pair
+        stream = PtyStream(master)
+        stream.start()
+        await stream.write(b"y\r")
+        await asyncio.sleep(0.05)
+        assert os.read(slave, 16) in (b"y\r", b"y\n")
+        stream.close()
+
+
+class TestTTYWithoutExecutor:
+    async def test_read_and_inject_use_no_threads(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        pytest.importorskip("ptyprocess")
+        from atlasbridge.os.tty import get_tty_class
+        from atlasbridge.os.tty.base import PTYConfig
+
+        loop = asyncio.get_running_loop()
+
+        def _no_executor(*args: object, **kwargs: object) -> None:
+            raise AssertionError("run_in_executor must not be used for PTY I/O")
+
+        monkeypatch.setattr(loop, "run_in_executor", _no_executor)
+
+        tty = get_tty_class()(PTYConfig(command=["cat"]), "sess-1")
+        await tty.start()
+        try:
+            await tty.inject_reply(b"ping\r")
+            output = b""
+            while b"ping" not in output:
+                chunk = await asyncio.wait_for(tty.read_chunk(), timeout=5.0)
+                assert chunk, "unexpected EOF"
+                output += chunk
+        finally:
+            await tty.stop(timeout_s=0.1)
+        # Output buffered before stop() is still delivered, then EOF
+        while await asyncio.wait_for(tty.read_chunk(), timeout=1.0):
+            pass
@@ -448,9 +448,47 @@ class TestExpireOverdue:
 
         sm = router._machines[event.prompt_id]
         sm.expires_at = datetime.now(UTC) - timedelta(seconds=1)
+        router._machines.reschedule(sm)
 
         await router.expire_overdue()
         assert sm.status == PromptStatus.EXPIRED
+        assert router._machines.live_count == 0
+
+    @pytest.mark.asyncio
+    async def test_wait_for_expiry_wakes_at_deadline(
+        self,
+        router: PromptRouter,
+        session: Session,
+    ) -> None:
+        import time
+
+        event = PromptEvent.create(
+            session_id=session.session_id,
+            prompt_type=PromptType.TYPE_YES_NO,
+            confidence=Confidence.HIGH,
+            excerpt="Continue? [y/N]",
+            ttl_seconds=0,
+        )
+        started = time.monotonic()
+        await router.route_event(event)
+        await router.wait_for_expiry(5.0)
+        assert time.monotonic() - started < 1.0
+
+        await router.expire_overdue()
+        assert router._machines[event.prompt_id].status == PromptStatus.EXPIRED
+
+    @pytest.mark.asyncio
+    async def test_wait_for_expiry_rearms_on_earlier_prompt(
+        self,
+        router: PromptRouter,
+        session: Session,
+    ) -> None:
+        import asyncio
+
+        waiter = asyncio.create_task(router.wait_for_expiry(5.0))
+        await asyncio.sleep(0)
+        await router.route_event(_event(session.session_id))
+        await asyncio.wait_for(waiter, 1.0)
 
 
 # ---------------------------------------------------------------------------
@@ -1361,6 +1399,28 @@ class TestAutopilotInjection:
         await router.inject_autopilot_reply(event, "y")
         adapter.inject_reply.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_autopilot_inject_flushes_store_first(
+        self, session_manager: SessionManager, mock_channel: AsyncMock
+    ) -> None:
+        calls: list[str] = []
+        adapter = AsyncMock()
+        adapter.inject_reply.side_effect = lambda **_: calls.append("inject")
+        store = _mock_store()
+        store.flush.side_effect = lambda: calls.append("flush")
+        s = _session()
+        session_manager.register(s)
+        router = PromptRouter(
+            session_manager=session_manager,
+            channel=mock_channel,
+            adapter_map={s.session_id: adapter},
+            store=store,
+        )
+        event = _event(s.session_id)
+        self._prepare_sm(router, event)
+        await router.inject_autopilot_reply(event, "y")
+        assert calls == ["flush", "inject"]
+
     @pytest.mark.asyncio
     async def test_autopilot_inject_no_adapter_escalates(
         self, session_manager: SessionManager, mock_channel: AsyncMock
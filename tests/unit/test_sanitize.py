@@ -2,12 +2,20 @@
 
 from __future__ import annotations
 
+import pytest
+
+from atlasbridge.core.prompt.detector import PromptDetector
 from atlasbridge.core.prompt.sanitize import (
+    OutputPipeline,
+    SanitizedChunk,
+    StreamSanitizer,
     extract_choices,
     is_meaningful,
+    is_meaningful_text,
     sanitize_terminal_output,
     strip_ansi,
 )
+from atlasbridge.core.security.redactor import SecretRedactor, StreamingRedactor
 
 # ---------------------------------------------------------------------------
 # strip_ansi
@@ -120,6 +128,121 @@ class TestSanitizeTerminalOutput:
         assert result == "hello world"
 
 
+# ---------------------------------------------------------------------------
+# StreamSanitizer
+# ---------------------------------------------------------------------------
+
+
+class TestStreamSanitizer:
+    def test_utf8_split_across_reads(self) -> None:
+        s = StreamSanitizer()
+        data = "Löschen?".encode()
+        cut = data.index(b"\xc3") + 1
+        assert s.feed(data[:cut]) == "L"
+        assert s.feed(data[cut:]) == "öschen?"
+
+    def test_csi_split_across_reads(self) -> None:
+        s = StreamSanitizer()
+        assert s.feed(b"ok \x1b[3") == "ok "
+        assert s.feed(b"1mred\x1b[0m") == "red"
+
+    def test_lone_escape_held_back(self) -> None:
+        s = StreamSanitizer()
+        assert s.feed(b"abc\x1b") == "abc"
+        assert s.feed(b"[0mdef") == "def"
+
+    def test_osc_split_across_reads(self) -> None:
+        s = StreamSanitizer()
+        assert s.feed(b"\x1b]0;Win") == ""
+        assert s.feed(b"dow Title\x07prompt") == "prompt"
+
+    def test_complete_sequences_not_held(self) -> None:
+        s = StreamSanitizer()
+        assert s.feed(b"\x1b[32mgreen\x1b[0m") == "green"
+
+    def test_reset_drops_carry(self) -> None:
+        s = StreamSanitizer()
+        s.feed(b"x\x1b[3")
+        s.reset()
+        assert s.feed(b"plain") == "plain"
+
+
+# ---------------------------------------------------------------------------
+# OutputPipeline
+# ---------------------------------------------------------------------------
+
+
+class TestOutputPipeline:
+    @pytest.mark.parametrize(
+        "text",
+        ["", "  ", "ab", "a b", "...", "a  b\n c", "\t\t123", "é é é", "✓ ok", "x" * 10_000],
+    )
+    def test_meaningful_text_matches_is_meaningful(self, text: str) -> None:
+        assert is_meaningful_text(text) == is_meaningful(text)
+
+    def test_decodes_once_and_fans_out(self) -> None:
+        pipeline = OutputPipeline()
+        seen_a: list[SanitizedChunk] = []
+        seen_b: list[SanitizedChunk] = []
+        pipeline.subscribe(seen_a.append)
+        pipeline.subscribe(seen_b.append)
+
+        chunk = pipeline.feed(b"\x1b[32mBuilding target\x1b[0m\n")
+        assert chunk.text == "Building target\n"
+        assert chunk.meaningful
+        assert seen_a == [chunk] and seen_b == [chunk]
+        assert seen_a[0] is seen_b[0]
+
+    def test_split_escape_and_utf8_carried_over(self) -> None:
+        pipeline = OutputPipeline()
+        first = pipeline.feed(b"ok \xe2\x9c")
+        second = pipeline.feed(b"\x93 done\x1b[3")
+        third = pipeline.feed(b"1mred")
+        assert first.text + second.text + third.text == "ok ✓ donered"
+
+    def test_junk_chunk_not_meaningful(self) -> None:
+        assert not OutputPipeline().feed(b"\x1b[?25l\r\n").meaningful
+
+    def test_chunk_is_immutable(self) -> None:
+        chunk = SanitizedChunk.from_bytes(b"hello")
+        with pytest.raises(AttributeError):
+            chunk.text = "other"  # type: ignore[misc]
+
+    def test_without_redactor_chunks_are_unredacted(self) -> None:
+        pipeline = OutputPipeline()
+        assert pipeline.feed(b"hello world").redacted is None
+        assert pipeline.flush() is None
+
+    def test_redactor_output_lags_and_flushes(self) -> None:
+        pipeline = OutputPipeline(redactor=StreamingRedactor(SecretRedactor(), carry_chars=32))
+        seen: list[SanitizedChunk] = []
+        pipeline.subscribe(seen.append)
+        first = pipeline.feed(b"short line\n")
+        assert first.text == "short line\n"
+        assert first.redacted == ""
+        tail = pipeline.flush()
+        assert tail is not None and tail.redacted == "short line\n"
+        assert not tail.meaningful and tail.raw == b""
+        assert seen == [first, tail]
+        assert pipeline.flush() is None
+
+    def test_detector_analyse_chunk_matches_analyse(self) -> None:
+        stream = [b"Compiling...\n", b"\x1b[1mDelete all files? \x1b[0m", b"[y/N] "]
+        direct = PromptDetector("s1")
+        shared = PromptDetector("s2")
+        pipeline = OutputPipeline()
+        events = []
+        for raw in stream:
+            expected = direct.analyse(raw)
+            actual = shared.analyse_chunk(pipeline.feed(raw))
+            assert (expected is None) == (actual is None)
+            if expected is not None and actual is not None:
+                assert actual.prompt_type == expected.prompt_type
+                assert actual.excerpt == expected.excerpt
+                events.append(actual)
+        assert len(events) == 1
+
+
 # ---------------------------------------------------------------------------
 # extract_choices
 # ---------------------------------------------------------------------------
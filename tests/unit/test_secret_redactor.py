@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import random
+import time
+
 import pytest
 
-from atlasbridge.core.security.redactor import SecretRedactor, get_redactor
+from atlasbridge.core.security.redactor import SecretRedactor, StreamingRedactor, get_redactor
 
 # ---------------------------------------------------------------------------
 # Pattern coverage — every known format must be caught
@@ -213,3 +216,172 @@ class TestOutputForwarderIntegration:
         result = OutputForwarder._redact(text)
         assert "AKIA" not in result
         assert "[REDACTED]" in result
+
+
+# ---------------------------------------------------------------------------
+# Differential — anchored engine vs. plain sequential substitution
+# ---------------------------------------------------------------------------
+
+
+def _reference_redact(r: SecretRedactor, text: str, labeled: bool = False) -> str:
+    """The original engine: every pattern's sub() over the whole text, in order."""
+    for pattern in r._patterns:
+        replacement = f"[REDACTED:{pattern.label}]" if labeled else "[REDACTED]"
+        text = pattern.regex.sub(replacement, text)
+    return text
+
+
+_FRAGMENTS = [
+    "123456789:" + "A" * 35,
+    "xoxb-" + "a1" * 6,
+    "xapp-" + "b2" * 11,
+    "sk-" + "c" * 24,
+    "sk-ant-" + "d" * 24,
+    "ghp_" + "e" * 36,
+    "AKIA" + "F" * 16,
+    "AWS_SECRET_ACCESS_KEY=" + "g" * 40,
+    "AIza" + "h" * 35,
+    "f" * 64,
+    "Bearer abc.def",
+    "BEARER xyz",
+    "password=hunter2hunter2",
+    "PASSWORD: 'longsecretvalue'",
+    "api_key=" + "k" * 10,
+    "API_SECRET=" + "m" * 10,
+    "Token:" + "n" * 12,
+    "pa\u017f\u017fword=" + "p" * 10,  # long s: matches (?i)s
+    "to\u212aen=" + "q" * 10,  # Kelvin sign: matches (?i)k
+    "ap\u0130_key=" + "r" * 10,  # dotted capital I
+    "password: sk-" + "s" * 22,  # overlapping patterns
+    "[REDACTED]",
+    "[REDACTED:slack-token]",
+    "sk-short",
+    "commit " + "0" * 40,
+    "12:00:01",
+    " ",
+    "\n",
+    "=",
+    ":",
+    "build ok",
+    "\u00e9",
+]
+
+
+def _stream(stream: StreamingRedactor, text: str, sizes: list[int]) -> str:
+    out, pos, i = [], 0, 0
+    while pos < len(text):
+        size = sizes[i % len(sizes)]
+        out.append(stream.feed(text[pos : pos + size]))
+        pos += size
+        i += 1
+    out.append(stream.flush())
+    return "".join(out)
+
+
+class TestStreamingRedactor:
+    def test_secret_split_across_chunks(self) -> None:
+        stream = StreamingRedactor(SecretRedactor(), carry_chars=32)
+        key = "sk-" + "a" * 30
+        out = stream.feed("building...\n" + "log line\n" * 10 + key[:12])
+        out += stream.feed(key[12:] + " done\n" + "tail line\n" * 10)
+        out += stream.flush()
+        assert "aaaa" not in out
+        assert "[REDACTED]" in out
+
+    def test_lookbehind_prefix_kept_with_value(self) -> None:
+        r = SecretRedactor()
+        text = "x " * 40 + "AWS_SECRET_ACCESS_KEY " + "g" * 40 + " y" * 40
+        for size in range(1, 80, 7):
+            assert _stream(StreamingRedactor(r, carry_chars=32), text, [size]) == r.redact(text)
+
+    def test_long_hex_straddling_window(self) -> None:
+        r = SecretRedactor()
+        text = "digest " + "ab" * 100 + " ok\n" * 20
+        out = _stream(StreamingRedactor(r, carry_chars=32), text, [50])
+        assert out == r.redact(text)
+        assert "abab" not in out
+
+    def test_holds_tail_until_flush(self) -> None:
+        stream = StreamingRedactor(SecretRedactor(), carry_chars=64)
+        assert stream.feed("short output") == ""
+        assert stream.pending
+        assert stream.flush() == "short output"
+        assert not stream.pending
+        assert stream.flush() == ""
+
+    def test_unbroken_token_carry_is_bounded(self) -> None:
+        stream = StreamingRedactor(SecretRedactor(), carry_chars=16)
+        released = "".join(stream.feed("x" * 100) for _ in range(10))
+        assert len(released) >= 1000 - 16 * 16
+
+    @pytest.mark.parametrize("sep", ["\n", " "])
+    def test_matches_whole_text_redaction(self, sep: str) -> None:
+        rng = random.Random(2024)  # noqa: S311 — deterministic test data
+        r = SecretRedactor()
+        for _ in range(500):
+            text = sep.join(rng.choice(_FRAGMENTS) for _ in range(rng.randint(1, 40)))
+            sizes = [rng.randint(1, 200) for _ in range(8)]
+            stream = StreamingRedactor(r, carry_chars=rng.choice([64, 256]))
+            assert _stream(stream, text, sizes) == r.redact(text), (text, sizes)
+
+
+class TestDifferential:
+    @pytest.mark.parametrize("labeled", [False, True])
+    def test_matches_reference_on_random_text(self, labeled: bool) -> None:
+        rng = random.Random(1234)  # noqa: S311 — deterministic test data
+        r = SecretRedactor(custom_patterns=[r"CORP-\d{6}"])
+        fragments = [*_FRAGMENTS, "CORP-123456"]
+        for _ in range(3000):
+            text = "".join(rng.choice(fragments) for _ in range(rng.randint(1, 8)))
+            actual = r.redact_labeled(text) if labeled else r.redact(text)
+            assert actual == _reference_redact(r, text, labeled), text
+
+    def test_contains_secret_matches_reference(self) -> None:
+        rng = random.Random(99)  # noqa: S311 — deterministic test data
+        r = SecretRedactor()
+        for _ in range(2000):
+            text = "".join(rng.choice(_FRAGMENTS) for _ in range(rng.randint(1, 4)))
+            expected = any(p.regex.search(text) for p in r._patterns)
+            assert r.contains_secret(text) is expected, text
+
+
+def _ci_log(lines: int = 20_000) -> str:
+    rng = random.Random(7)  # noqa: S311 — deterministic test data
+    templates = [
+        "[{i:06d}] INFO  Step {i}: pytest tests/unit/test_mod_{m}.py::TestX::test_y PASSED",
+        "2026-10-16T12:00:{s:02d}Z npm WARN deprecated package@{m}.0.0: use something else",
+        "    at Object.<anonymous> (/home/runner/work/app/src/file{m}.js:{i}:{s})",
+        "Downloading https://files.pythonhosted.org/packages/ab/cd/pkg-{i}.tar.gz (123 kB)",
+        "commit {h} Merge pull request #{i}",
+    ]
+    return "\n".join(
+        rng.choice(templates).format(i=i, m=i % 50, s=i % 60, h=f"{rng.getrandbits(160):040x}")
+        for i in range(lines)
+    )
+
+
+@pytest.mark.performance
+class TestRedactionBenchmark:
+    """Redacting a secret-free CI log must be well ahead of per-pattern substitution.
+
+    Locally the anchored engine is ~6x faster; the CI threshold is 2x.
+    """
+
+    def test_ci_log_faster_than_reference(self) -> None:
+        log = _ci_log()
+        chunks = [log[i : i + 4096] for i in range(0, len(log), 4096)]
+        r = SecretRedactor()
+
+        def best_of(fn, runs: int = 3) -> float:
+            times = []
+            for _ in range(runs):
+                start = time.perf_counter()
+                for chunk in chunks:
+                    fn(chunk)
+                times.append(time.perf_counter() - start)
+            return min(times)
+
+        reference = best_of(lambda c: _reference_redact(r, c))
+        anchored = best_of(r.redact)
+        assert [r.redact(c) for c in chunks] == [_reference_redact(r, c) for c in chunks]
+        assert anchored * 2 < reference, f"{anchored * 1000:.1f}ms vs {reference * 1000:.1f}ms"
@@ -4,6 +4,7 @@ Tests for `atlasbridge sessions` CLI commands.
 Covers:
   - sessions list (default invocation, --json, --all, empty DB, no DB)
   - sessions show (full ID, short ID, ambiguous, not found, --json)
+  - sessions search (table, paging hint, --json, empty query)
   - sessions --help (backward compat with CI smoke test)
   - cmd_sessions_list / cmd_sessions_show unit tests via Rich Console
 """
@@ -102,6 +103,10 @@ def _mock_db(
     db.get_session.return_value = session
     db.list_prompts_for_session.return_value = prompts or []
     db.close = MagicMock()
+    # Prefix lookup over whatever list_sessions is set to return
+    db.find_session_ids.side_effect = lambda prefix, limit=2: [
+        r["id"] for r in db.list_sessions.return_value if r["id"].startswith(prefix)
+    ][:limit]
     return db
 
 
@@ -303,3 +308,39 @@ class TestCmdSessionsListDirect:
         assert isinstance(data, list)
         assert len(data) == 1
         assert data[0]["tool"] == "claude"
+
+
+class TestSessionsSearch:
+    def _db(self, tmp_path):
+        from atlasbridge.core.store.database import Database
+
+        db = Database(tmp_path / "search.db")
+        db.connect()
+        db.save_session(_SESSION_A["id"], "claude", ["claude"])
+        for i in range(3):
+            db.save_transcript_chunk(_SESSION_A["id"], "agent", f"lint warning {i}", seq=i + 1)
+        return db
+
+    def test_table_and_paging_hint(self, runner: CliRunner, tmp_path) -> None:
+        with _patch_open_db(self._db(tmp_path)):
+            result = runner.invoke(cli, ["sessions", "search", "lint", "--limit", "2"])
+        assert result.exit_code == 0
+        assert "transcript" in result.output
+        assert "aaaa1111" in result.output
+        assert "--offset 2" in result.output
+
+    def test_json_output(self, runner: CliRunner, tmp_path) -> None:
+        with _patch_open_db(self._db(tmp_path)):
+            result = runner.invoke(
+                cli, ["sessions", "search", "warning", "--session", "aaaa", "--json"]
+            )
+        assert result.exit_code == 0
+        data = json.loads(result.output)
+        assert data["total"] == 3
+        assert {r["session_id"] for r in data["results"]} == {_SESSION_A["id"]}
+
+    def test_empty_query(self, runner: CliRunner, tmp_path) -> None:
+        with _patch_open_db(self._db(tmp_path)):
+            result = runner.invoke(cli, ["sessions", "search", "  "])
+        assert result.exit_code != 0
+        assert "Empty search query" in result.output
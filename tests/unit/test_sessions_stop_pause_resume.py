@@ -72,6 +72,10 @@ def _mock_db(session: _FakeRow | None = None) -> MagicMock:
     db.list_sessions.return_value = [session] if session else []
     db.update_session = MagicMock()
     db.close = MagicMock()
+    # Prefix lookup over whatever list_sessions is set to return
+    db.find_session_ids.side_effect = lambda prefix, limit=2: [
+        r["id"] for r in db.list_sessions.return_value if r["id"].startswith(prefix)
+    ][:limit]
     return db
 
 
@@ -0,0 +1,152 @@
+"""Unit tests for atlasbridge.core.store.stats — trigger-maintained counters."""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from atlasbridge.core.store.database import Database
+from atlasbridge.core.store.migrations import LATEST_SCHEMA_VERSION, get_user_version
+from atlasbridge.core.store.stats import has_stats
+
+
+@pytest.fixture
+def db(tmp_path: Path) -> Database:
+    d = Database(tmp_path / "atlasbridge.db")
+    d.connect()
+    yield d
+    d.close()
+
+
+def _prompt(db: Database, prompt_id: str, session_id: str, prompt_type: str = "yes_no") -> None:
+    expires = (datetime.now(UTC) + timedelta(minutes=10)).strftime("%Y-%m-%d %H:%M:%S")
+    db.save_prompt(prompt_id, session_id, prompt_type, "high", "Continue?", "n", expires)
+
+
+def _counted(db: Database) -> dict[str, int]:
+    """The same totals, counted the slow way."""
+    one = lambda sql: db._db.execute(sql).fetchone()[0]  # noqa: E731
+    return {
+        "sessions": one("SELECT count(*) FROM sessions"),
+        "prompts": one("SELECT count(*) FROM prompts"),
+        "audit_events": one("SELECT count(*) FROM audit_events"),
+        "active_sessions": one(
+            "SELECT count(*) FROM sessions WHERE status NOT IN ('completed', 'crashed', 'canceled')"
+        ),
+    }
+
+
+class TestTriggers:
+    def test_counters_follow_writes(self, db: Database) -> None:
+        db.save_session("s1", "claude", ["claude"])
+        db.save_session("s2", "claude", ["claude"])
+        db.update_session("s1", status="running")
+        db.update_session("s2", status="completed")
+        _prompt(db, "p1", "s1")
+        _prompt(db, "p2", "s1", prompt_type="free_text")
+        db.append_audit_event("e1", "session_started", {}, session_id="s1")
+
+        stats = db.get_stats()
+        assert {k: stats[k] for k in _counted(db)} == _counted(db)
+        assert stats["sessions_by_status"] == {"running": 1, "completed": 1}
+        assert stats["prompts_by_type"] == {"yes_no": 1, "free_text": 1}
+
+    def test_same_status_update_is_not_counted(self, db: Database) -> None:
+        db.save_session("s1", "claude", ["claude"])
+        db.update_session("s1", status="starting")
+        assert db.get_stats()["sessions_by_status"] == {"starting": 1}
+
+    def test_archived_audit_events_are_subtracted(self, db: Database, tmp_path: Path) -> None:
+        for i in range(3):
+            db.append_audit_event(f"e{i}", "x", {})
+        db.archive_oldest_audit_events(tmp_path / "archive.db", keep_count=1)
+        assert db.get_stats()["audit_events"] == 1
+
+    def test_rolled_back_write_leaves_counters(self, db: Database) -> None:
+        db.save_session("s1", "claude", ["claude"])
+        db._db.execute("INSERT INTO sessions (id) VALUES ('s2')")
+        db._db.rollback()
+        assert db.get_stats()["sessions"] == 1
+
+
+class TestRebuild:
+    def test_rebuild_corrects_drift(self, db: Database) -> None:
+        db.save_session("s1", "claude", ["claude"])
+        db.append_audit_event("e1", "x", {})
+        db._db.execute("UPDATE stats SET value = 7 WHERE scope = 'audit'")
+        db._db.execute("DELETE FROM stats WHERE scope = 'session_status'")
+        db._db.commit()
+
+        drift = db.rebuild_stats()
+        assert drift == {("audit", "total"): -6, ("session_status", "starting"): 1}
+        assert db.rebuild_stats() == {}
+        assert db.get_stats()["audit_events"] == 1
+
+    def test_v12_db_is_backfilled(self, tmp_path: Path) -> None:
+        db_path = tmp_path / "v12.db"
+        db = Database(db_path)
+        db.connect()
+        db.save_session("s1", "claude", ["claude"])
+        db.append_audit_event("e1", "x", {})
+        db.close()
+        conn = sqlite3.connect(str(db_path))
+        for (name,) in conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'trigger' AND name LIKE 'trg_stats_%'"
+        ).fetchall():
+            conn.execute(f"DROP TRIGGER {name}")
+        conn.execute("DROP TABLE stats")
+        conn.execute("PRAGMA user_version = 12")
+        conn.commit()
+        assert not has_stats(conn)
+        conn.close()
+
+        db = Database(db_path)
+        db.connect()
+        assert get_user_version(db._db) == LATEST_SCHEMA_VERSION
+        assert db.get_stats()["sessions"] == 1
+        assert db.get_stats()["audit_events"] == 1
+        db.close()
+
+
+class TestDashboardRepoCounters:
+    def test_stats_and_status_count_from_counters(self, db: Database, tmp_path: Path) -> None:
+        from atlasbridge.dashboard.repo import DashboardRepo
+
+        db.save_session("s1", "claude", ["claude"])
+        db.save_session("s2", "claude", ["claude"])
+        db.update_session("s2", status="crashed")
+        db.flush()
+        repo = DashboardRepo(db.path, tmp_path / "trace.jsonl")
+        repo.connect()
+        try:
+            assert repo.get_stats()["active_sessions"] == 1
+            assert repo.count_sessions() == 2
+            assert repo.count_sessions(status="crashed") == 1
+            assert repo.count_sessions(status="crashed", q="s2") == 1  # scanned
+        finally:
+            repo.close()
+
+
+class TestDbStatsCLI:
+    def test_rebuild_reports_drift(self, db: Database, tmp_path: Path) -> None:
+        from unittest.mock import patch
+
+        from click.testing import CliRunner
+
+        from atlasbridge.cli._db import db_group
+
+        db.append_audit_event("e1", "x", {})
+        db._db.execute("UPDATE stats SET value = 5 WHERE scope = 'audit'")
+        db._db.commit()
+
+        runner = CliRunner()
+        with patch("atlasbridge.core.config.atlasbridge_dir", return_value=tmp_path):
+            result = runner.invoke(db_group, ["stats", "--rebuild", "--json"])
+        assert result.exit_code == 0
+        data = json.loads(result.output)
+        assert data["audit_events"] == 1
+        assert data["drift"] == {"audit:total": -4}
@@ -0,0 +1,221 @@
+"""
+Unit tests for the decision trace sidecar index (core/autopilot/trace_index.py).
+
+Covers:
+- record() appends one index record per line; rotation moves indexes with archives
+- TraceReader tail / pagination / filters span the active file and archives
+- Reads seek to the requested entries instead of parsing the whole trace
+- Missing, partial and stale indexes fall back to the trace file, and the
+  writer repairs them when it next opens the trace
+- The chain-head checkpoint lets a writer resume without reading the trace,
+  and is ignored (last line read backwards) when it does not match the file
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from atlasbridge.core.autopilot import trace as trace_module
+from atlasbridge.core.autopilot import trace_index
+from atlasbridge.core.autopilot.trace import DecisionTrace, _read_last_line, head_path
+from atlasbridge.core.autopilot.trace_index import (
+    TraceReader,
+    archive_path,
+    index_path,
+    sync_index,
+)
+from atlasbridge.core.policy.model import (
+    AutoReplyAction,
+    PolicyDecision,
+    RequireHumanAction,
+)
+
+_RECORD_SIZE = trace_index._RECORD.size
+
+
+def _decision(i: int, session_id: str = "s1", escalate: bool = False) -> PolicyDecision:
+    return PolicyDecision(
+        prompt_id=f"p{i}",
+        session_id=session_id,
+        policy_hash="abc123",
+        matched_rule_id="r1",
+        action=RequireHumanAction() if escalate else AutoReplyAction(value="y"),
+        explanation="test",
+        confidence="low" if escalate else "high",
+        prompt_type="yes_no",
+        autonomy_mode="full",
+    )
+
+
+def _prompt_ids(entries: list[dict]) -> list[str]:
+    return [e["prompt_id"] for e in entries]
+
+
+@pytest.fixture
+def trace_path(tmp_path: Path) -> Path:
+    """Ten decisions; every third one escalates, even ones are for session s2."""
+    path = tmp_path / "decisions.jsonl"
+    trace = DecisionTrace(path)
+    for i in range(10):
+        trace.record(_decision(i, session_id="s2" if i % 2 == 0 else "s1", escalate=i % 3 == 0))
+    return path
+
+
+class TestIndexWriter:
+    def test_one_record_per_line(self, trace_path: Path) -> None:
+        assert index_path(trace_path).stat().st_size == 10 * _RECORD_SIZE
+        assert sync_index(trace_path) == (trace_path.stat().st_size, 10)
+
+    def test_rotation_moves_index_with_archive(self, tmp_path: Path) -> None:
+        path = tmp_path / "decisions.jsonl"
+        trace = DecisionTrace(path, max_bytes=1)
+        for i in range(3):
+            trace.record(_decision(i))
+        for p in (path, archive_path(path, 1), archive_path(path, 2)):
+            assert index_path(p).stat().st_size == _RECORD_SIZE
+        assert _prompt_ids(TraceReader(archive_path(path, 2), archives=0).tail()) == ["p0"]
+
+    def test_rotation_never_pairs_archive_with_stale_index(self, tmp_path: Path) -> None:
+        path = tmp_path / "decisions.jsonl"
+        trace = DecisionTrace(path, max_bytes=1)
+        trace.record(_decision(0))
+        index_path(path).unlink()
+        # A leftover index for .jsonl.1 must not survive the rotation
+        index_path(archive_path(path, 1)).write_bytes(b"\0" * _RECORD_SIZE * 4)
+        trace.record(_decision(1))
+        assert not index_path(archive_path(path, 1)).exists()
+        assert _prompt_ids(trace.tail()) == ["p0", "p1"]
+
+    def test_foreign_lines_are_indexed_on_next_record(self, trace_path: Path) -> None:
+        trace = DecisionTrace(trace_path)
+        with trace_path.open("a") as fh:
+            fh.write(json.dumps({"prompt_id": "external", "session_id": "s9"}) + "\n")
+        trace.record(_decision(10))
+        assert index_path(trace_path).stat().st_size == 12 * _RECORD_SIZE
+        entries, total = TraceReader(trace_path).page(session_id="s9")
+        assert (total, _prompt_ids(entries)) == (1, ["external"])
+
+
+class TestTraceReader:
+    def test_tail_and_pages(self, trace_path: Path) -> None:
+        reader = TraceReader(trace_path)
+        assert _prompt_ids(reader.tail(3)) == ["p7", "p8", "p9"]
+        entries, total = reader.page(4, 3)
+        assert (total, _prompt_ids(entries)) == (10, ["p5", "p4", "p3"])
+        entries, _ = reader.page(8, 5, newest_first=False)
+        assert _prompt_ids(entries) == ["p8", "p9"]
+        assert reader.page(20, 5) == ([], 10)
+
+    def test_filters(self, trace_path: Path) -> None:
+        reader = TraceReader(trace_path)
+        entries, total = reader.page(0, 2, action_type="require_human")
+        assert (total, _prompt_ids(entries)) == (4, ["p9", "p6"])
+        entries, total = reader.page(0, 10, session_id="s2", confidence="low")
+        assert (total, _prompt_ids(entries)) == (2, ["p6", "p0"])
+        entries, total = reader.page(1, 2, newest_first=False, session_id="s1")
+        assert (total, _prompt_ids(entries)) == (5, ["p3", "p5"])
+        assert reader.page(session_id="nobody") == ([], 0)
+
+    def test_spans_archives(self, tmp_path: Path) -> None:
+        path = tmp_path / "decisions.jsonl"
+        trace = DecisionTrace(path, max_bytes=1)
+        for i in range(5):
+            trace.record(_decision(i))
+        reader = TraceReader(path)
+        # p0 rotated out past MAX_ARCHIVES
+        assert _prompt_ids(reader.tail(10)) == ["p1", "p2", "p3", "p4"]
+        entries, total = reader.page(1, 2)
+        assert (total, _prompt_ids(entries)) == (4, ["p3", "p2"])
+
+    def test_reads_only_the_page(self, trace_path: Path, monkeypatch) -> None:
+        parsed: list[bytes] = []
+        real_loads = json.loads
+
+        def counting_loads(data, *args, **kwargs):
+            parsed.append(data)
+            return real_loads(data, *args, **kwargs)
+
+        monkeypatch.setattr(trace_index.json, "loads", counting_loads)
+        TraceReader(trace_path).tail(2)
+        assert len(parsed) == 2
+
+    def test_missing_index_reads_the_trace(self, trace_path: Path) -> None:
+        index_path(trace_path).unlink()
+        entries, total = TraceReader(trace_path).page(0, 2, session_id="s2")
+        assert (total, _prompt_ids(entries)) == (5, ["p8", "p6"])
+        assert not index_path(trace_path).exists()  # readers never write
+
+    def test_partial_record_and_line_are_ignored(self, trace_path: Path) -> None:
+        with index_path(trace_path).open("ab") as idx:
+            idx.write(b"\0" * 5)
+        with trace_path.open("a") as fh:
+            fh.write('{"prompt_id": "half')
+        assert _prompt_ids(TraceReader(trace_path).tail(1)) == ["p9"]
+
+    def test_stale_index_is_ignored_and_rebuilt(self, tmp_path: Path, trace_path: Path) -> None:
+        # The trace is replaced by a shorter one; the old index no longer fits it
+        other = tmp_path / "other.jsonl"
+        DecisionTrace(other).record(_decision(42))
+        other.replace(trace_path)
+        assert _prompt_ids(TraceReader(trace_path).tail()) == ["p42"]
+
+        DecisionTrace(trace_path)
+        assert index_path(trace_path).stat().st_size == _RECORD_SIZE
+
+    def test_no_trace(self, tmp_path: Path) -> None:
+        assert TraceReader(tmp_path / "absent.jsonl").page() == ([], 0)
+
+
+class TestChainHead:
+    def test_checkpoint_tracks_the_file(self, trace_path: Path) -> None:
+        head = json.loads(head_path(trace_path).read_text())
+        last = json.loads(trace_path.read_text().splitlines()[-1])
+        assert head == {"hash": last["hash"], "offset": trace_path.stat().st_size, "entries": 10}
+
+    def test_startup_does_not_read_the_trace(self, trace_path: Path, monkeypatch) -> None:
+        expected = json.loads(head_path(trace_path).read_text())["hash"]
+
+        def no_reads(path: Path, chunk_size: int = 4096) -> bytes:
+            raise AssertionError("trace read at startup")
+
+        monkeypatch.setattr(trace_module, "_read_last_line", no_reads)
+        trace = DecisionTrace(trace_path)
+        assert (trace._last_hash, trace.entry_count) == (expected, 10)
+        trace.record(_decision(10))
+        assert DecisionTrace.verify_integrity(trace_path) == (True, [])
+
+    @pytest.mark.parametrize("damage", ["append", "corrupt", "delete"])
+    def test_mismatched_checkpoint_falls_back(self, trace_path: Path, damage: str) -> None:
+        if damage == "append":
+            # A line from another writer, after the checkpoint was saved
+            with trace_path.open("a") as fh:
+                fh.write(json.dumps({"prompt_id": "x", "hash": "h-x", "prev_hash": ""}) + "\n")
+        elif damage == "corrupt":
+            head_path(trace_path).write_text('{"hash": ')
+        else:
+            head_path(trace_path).unlink()
+        last = json.loads(trace_path.read_text().splitlines()[-1])
+        trace = DecisionTrace(trace_path)
+        assert trace._last_hash == last["hash"]
+        assert trace.entry_count == (11 if damage == "append" else 10)
+
+    def test_rotation_restarts_the_chain(self, tmp_path: Path) -> None:
+        path = tmp_path / "decisions.jsonl"
+        trace = DecisionTrace(path, max_bytes=1)
+        trace.record(_decision(0))
+        trace.record(_decision(1))  # rotates first
+        head = json.loads(head_path(path).read_text())
+        assert head["entries"] == 1
+        assert json.loads(path.read_text())["prev_hash"] == ""
+
+    def test_read_last_line_backwards(self, tmp_path: Path) -> None:
+        path = tmp_path / "lines.jsonl"
+        path.write_bytes(b"first\n" + b"x" * 50 + b"\n\n  \n")
+        assert _read_last_line(path, chunk_size=8) == b"x" * 50
+        path.write_bytes(b"only line, no newline")
+        assert _read_last_line(path, chunk_size=4) == b"only line, no newline"
+        path.write_bytes(b"")
+        assert _read_last_line(path) == b""
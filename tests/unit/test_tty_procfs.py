@@ -0,0 +1,190 @@
+"""
+Unit tests for Linux /proc blocked-on-read detection (Signal 2).
+
+Covers:
+- A child reading its terminal, or in epoll_wait on it, is reported as blocked
+- Busy, sleeping and pipe-reading children are not
+- Readiness waits that cannot be tied to the terminal are unknown
+- The probe caches its answer for one tick
+- ClaudeCodeAdapter.await_input_state uses the probe, falling back to
+  is_alive() where the platform cannot tell, and only shortens Signal 3
+  once a terminal wait is confirmed
+"""
+
+from __future__ import annotations
+
+import asyncio
+import subprocess
+import sys
+import time
+from collections.abc import Callable, Iterator
+from unittest.mock import MagicMock
+
+import pytest
+
+from atlasbridge.adapters.claude_code import ClaudeCodeAdapter
+from atlasbridge.core.prompt.detector import PromptDetector
+from atlasbridge.os.tty import procfs
+from atlasbridge.os.tty.procfs import InputWaitProbe, input_wait_state
+
+linux_only = pytest.mark.skipif(
+    not sys.platform.startswith("linux") or procfs._ARCH not in procfs._READ_SYSCALLS,
+    reason="requires Linux /proc on a known architecture",
+)
+
+
+def _settle(
+    check: Callable[[], bool | None], expected: bool | None, timeout: float = 3.0
+) -> bool | None:
+    """Poll until *check* returns *expected* (processes need a moment to park)."""
+    deadline = time.monotonic() + timeout
+    state = check()
+    while state is not expected and time.monotonic() < deadline:
+        time.sleep(0.02)
+        state = check()
+    return state
+
+
+@pytest.fixture
+def spawn_pty() -> Iterator[Callable[[list[str]], int]]:
+    ptyprocess = pytest.importorskip("ptyprocess")
+    procs = []
+
+    def _spawn(argv: list[str]) -> int:
+        proc = ptyprocess.PtyProcess.spawn(argv)
+        procs.append(proc)
+        return int(proc.pid)
+
+    yield _spawn
+    for proc in procs:
+        proc.terminate(force=True)
+
+
+@linux_only
+class TestInputWaitState:
+    def test_terminal_read_is_blocked(self, spawn_pty: Callable[[list[str]], int]) -> None:
+        pid = spawn_pty(["cat"])
+        assert _settle(lambda: input_wait_state(pid), True) is True
+
+    def test_busy_loop_is_not_blocked(self, spawn_pty: Callable[[list[str]], int]) -> None:
+        pid = spawn_pty([sys.executable, "-c", "while True: pass"])
+        time.sleep(0.2)
+        assert input_wait_state(pid) is False
+
+    def test_sleep_is_not_blocked(self, spawn_pty: Callable[[list[str]], int]) -> None:
+        pid = spawn_pty(["sleep", "30"])
+        assert _settle(lambda: input_wait_state(pid), False) is False
+
+    def test_pipe_read_is_not_blocked(self) -> None:
+        proc = subprocess.Popen(["cat"], stdin=subprocess.PIPE, stdout=subprocess.DEVNULL)
+        try:
+            time.sleep(0.2)
+            assert input_wait_state(proc.pid) is False
+        finally:
+            proc.kill()
+            proc.wait()
+
+    def test_epoll_on_terminal_is_blocked(self, spawn_pty: Callable[[list[str]], int]) -> None:
+        code = "import select; e = select.epoll(); e.register(0, select.EPOLLIN); e.poll()"
+        pid = spawn_pty([sys.executable, "-c", code])
+        assert _settle(lambda: input_wait_state(pid), True) is True
+
+    def test_epoll_without_terminal_is_unknown(self, spawn_pty: Callable[[list[str]], int]) -> None:
+        code = (
+            "import os, select; r, w = os.pipe(); e = select.epoll(); "
+            "e.register(r, select.EPOLLIN); e.poll()"
+        )
+        pid = spawn_pty([sys.executable, "-c", code])
+        assert _settle(lambda: input_wait_state(pid), None) is None
+
+    def test_poll_is_unknown(self, spawn_pty: Callable[[list[str]], int]) -> None:
+        code = "import select; p = select.poll(); p.register(0, select.POLLIN); p.poll()"
+        pid = spawn_pty([sys.executable, "-c", code])
+        assert _settle(lambda: input_wait_state(pid), None) is None
+
+    def test_missing_process(self) -> None:
+        assert input_wait_state(2**22 + 12345) is None
+
+
+class TestWchanFallback:
+    @pytest.mark.parametrize(
+        ("wchan", "expected"),
+        [
+            ("n_tty_read", True),
+            ("do_sys_poll", None),
+            ("poll_schedule_timeout.constprop.0", None),
+            ("hrtimer_nanosleep", False),
+        ],
+    )
+    def test_wchan_when_syscall_unreadable(
+        self, monkeypatch: pytest.MonkeyPatch, wchan: str, expected: bool | None
+    ) -> None:
+        files = {"stat": "42 (cli) S 1 42 42 34816 -1 4194560", "wchan": wchan}
+        monkeypatch.setattr(procfs, "_read_proc", lambda path: files.get(path.rsplit("/", 1)[1]))
+        monkeypatch.setattr(procfs.os, "listdir", lambda path: ["42"])
+        assert input_wait_state(42) is expected
+
+
+class TestInputWaitProbe:
+    def test_caches_within_ttl(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        calls: list[int] = []
+
+        def fake_state(pid: int) -> bool:
+            calls.append(pid)
+            return True
+
+        monkeypatch.setattr(procfs, "input_wait_state", fake_state)
+        probe = InputWaitProbe(42, ttl_s=60.0)
+        assert probe.check() is True
+        assert probe.check() is True
+        assert calls == [42]
+
+        probe = InputWaitProbe(42, ttl_s=0.0)
+        probe.check()
+        probe.check()
+        assert calls == [42, 42, 42]
+
+
+class TestAwaitInputState:
+    @staticmethod
+    def _adapter(blocked: bool | None, alive: bool = True) -> ClaudeCodeAdapter:
+        adapter = ClaudeCodeAdapter()
+        tty = MagicMock()
+        tty.input_blocked.return_value = blocked
+        tty.is_alive.return_value = alive
+        adapter._supervisors["s1"] = tty
+        return adapter
+
+    async def test_uses_probe(self) -> None:
+        assert await self._adapter(blocked=True).await_input_state("s1") is True
+        assert await self._adapter(blocked=False).await_input_state("s1") is False
+
+    async def test_falls_back_to_is_alive(self) -> None:
+        assert await self._adapter(blocked=None).await_input_state("s1") is True
+        assert await self._adapter(blocked=None, alive=False).await_input_state("s1") is False
+
+    async def test_unknown_session(self) -> None:
+        assert await ClaudeCodeAdapter().await_input_state("missing") is False
+
+    @pytest.mark.parametrize("blocked", [None, False])
+    async def test_unconfirmed_wait_keeps_silence_threshold(self, blocked: bool | None) -> None:
+        adapter = self._adapter(blocked=blocked)
+        adapter._detectors["s1"] = PromptDetector("s1")
+        await adapter.await_input_state("s1")
+        assert adapter._detectors["s1"].silence_threshold_s == 3.0
+
+    @linux_only
+    async def test_confirmed_terminal_read_shortens_silence_threshold(self) -> None:
+        pytest.importorskip("ptyprocess")
+        adapter = ClaudeCodeAdapter()
+        await adapter.start_session("s1", ["cat"])
+        try:
+            detector = adapter.get_detector("s1")
+            assert detector is not None
+            assert detector.silence_threshold_s == 3.0
+            deadline = time.monotonic() + 3.0
+            while not await adapter.await_input_state("s1") and time.monotonic() < deadline:
+                await asyncio.sleep(0.02)
+            assert detector.silence_threshold_s < 3.0
+        finally:
+            await adapter.terminate_session("s1", timeout_s=0.1)